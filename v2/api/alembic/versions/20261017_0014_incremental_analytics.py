@@ -0,0 +1,80 @@
+"""incremental analytics aggregates
+
+Revision ID: 20261017_0014
+Revises: 20260510_0013
+Create Date: 2026-10-17
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "20261017_0014"
+down_revision: str | None = "20260510_0013"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def timestamp_columns() -> list[sa.Column]:
+    return [
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+    ]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_analytics_aggregates",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        sa.Column("payload", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        *timestamp_columns(),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+            name=op.f("fk_user_analytics_aggregates_user_id_users"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_user_analytics_aggregates")),
+        sa.UniqueConstraint("user_id", name="uq_user_analytics_aggregates_user"),
+    )
+
+    op.create_table(
+        "round_analytics_contributions",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        sa.Column("round_id", sa.Uuid(), nullable=False),
+        sa.Column("payload", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        *timestamp_columns(),
+        sa.ForeignKeyConstraint(
+            ["round_id"],
+            ["rounds.id"],
+            name=op.f("fk_round_analytics_contributions_round_id_rounds"),
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+            name=op.f("fk_round_analytics_contributions_user_id_users"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_round_analytics_contributions")),
+        sa.UniqueConstraint("round_id", name="uq_round_analytics_contributions_round"),
+    )
+    op.create_index(
+        "ix_round_analytics_contributions_user",
+        "round_analytics_contributions",
+        ["user_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_round_analytics_contributions_user",
+        table_name="round_analytics_contributions",
+    )
+    op.drop_table("round_analytics_contributions")
+    op.drop_table("user_analytics_aggregates")
@@ -0,0 +1,55 @@
+"""round social counters
+
+Revision ID: 20261017_0015
+Revises: 20261017_0014
+Create Date: 2026-10-17
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "20261017_0015"
+down_revision: str | None = "20261017_0014"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "round_social_counters",
+        sa.Column("round_id", sa.Uuid(), nullable=False),
+        sa.Column("like_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("comment_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["round_id"],
+            ["rounds.id"],
+            name=op.f("fk_round_social_counters_round_id_rounds"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("round_id", name=op.f("pk_round_social_counters")),
+    )
+    op.execute(
+        """
+        INSERT INTO round_social_counters (round_id, like_count, comment_count, updated_at)
+        SELECT
+            rounds.id,
+            (SELECT count(*) FROM round_likes WHERE round_likes.round_id = rounds.id),
+            (
+                SELECT count(*)
+                FROM round_comments
+                WHERE round_comments.round_id = rounds.id AND round_comments.status = 'active'
+            ),
+            now()
+        FROM rounds
+        WHERE EXISTS (SELECT 1 FROM round_likes WHERE round_likes.round_id = rounds.id)
+           OR EXISTS (SELECT 1 FROM round_comments WHERE round_comments.round_id = rounds.id)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("round_social_counters")
@@ -0,0 +1,50 @@
+"""shot value club column
+
+Revision ID: 20261017_0016
+Revises: 20261017_0015
+Create Date: 2026-10-17
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "20261017_0016"
+down_revision: str | None = "20261017_0015"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("shot_values", sa.Column("club", sa.Text(), nullable=True))
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        op.execute("UPDATE shot_values SET club = payload ->> 'club'")
+    else:
+        _backfill_club(bind)
+    op.create_index("ix_shot_values_user_club", "shot_values", ["user_id", "club"])
+
+
+def _backfill_club(bind: sa.engine.Connection) -> None:
+    shot_values = sa.table(
+        "shot_values",
+        sa.column("id", sa.Uuid()),
+        sa.column("club", sa.Text()),
+        sa.column("payload", sa.JSON()),
+    )
+    rows = bind.execute(sa.select(shot_values.c.id, shot_values.c.payload)).all()
+    for shot_value_id, payload in rows:
+        club = (payload or {}).get("club")
+        if club is not None:
+            bind.execute(
+                shot_values.update()
+                .where(shot_values.c.id == shot_value_id)
+                .values(club=club)
+            )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_shot_values_user_club", table_name="shot_values")
+    op.drop_column("shot_values", "club")
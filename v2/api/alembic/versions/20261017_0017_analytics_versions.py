@@ -0,0 +1,45 @@
+"""per-user analytics versions
+
+Revision ID: 20261017_0017
+Revises: 20261017_0016
+Create Date: 2026-10-17
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "20261017_0017"
+down_revision: str | None = "20261017_0016"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_analytics_versions",
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        sa.Column("version", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+            name=op.f("fk_user_analytics_versions_user_id_users"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("user_id", name=op.f("pk_user_analytics_versions")),
+    )
+    op.add_column(
+        "analysis_snapshots",
+        sa.Column("analytics_version", sa.Integer(), nullable=True),
+    )
+    op.alter_column("analysis_jobs", "round_id", existing_type=sa.Uuid(), nullable=True)
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM analysis_jobs WHERE round_id IS NULL")
+    op.alter_column("analysis_jobs", "round_id", existing_type=sa.Uuid(), nullable=False)
+    op.drop_column("analysis_snapshots", "analytics_version")
+    op.drop_table("user_analytics_versions")
@@ -0,0 +1,29 @@
+"""expected table content hash
+
+Revision ID: 20261017_0018
+Revises: 20261017_0017
+Create Date: 2026-10-17
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "20261017_0018"
+down_revision: str | None = "20261017_0017"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Existing round baselines keep their inline payload until their round is
+    # recalculated; rows without a hash are never used as a sliding-window seed.
+    op.add_column("expected_score_tables", sa.Column("content_hash", sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM expected_score_tables WHERE scope_type = 'round_baseline_content'")
+    op.execute("DELETE FROM expected_score_tables WHERE content_hash IS NOT NULL")
+    op.drop_column("expected_score_tables", "content_hash")
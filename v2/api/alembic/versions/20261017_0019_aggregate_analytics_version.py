@@ -0,0 +1,30 @@
+"""user analytics aggregate version
+
+Revision ID: 20261017_0019
+Revises: 20261017_0018
+Create Date: 2026-10-17
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "20261017_0019"
+down_revision: str | None = "20261017_0018"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Existing aggregates start at version 0, so their snapshots read as stale until
+    # the next recalculation stamps them.
+    op.add_column(
+        "user_analytics_aggregates",
+        sa.Column("analytics_version", sa.Integer(), server_default="0", nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("user_analytics_aggregates", "analytics_version")
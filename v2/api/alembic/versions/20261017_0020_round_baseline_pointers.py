@@ -0,0 +1,110 @@
+"""round baseline pointers
+
+Revision ID: 20261017_0020
+Revises: 20261017_0019
+Create Date: 2026-10-17
+"""
+
+import hashlib
+import json
+import uuid
+from collections.abc import Sequence
+from datetime import UTC, datetime
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "20261017_0020"
+down_revision: str | None = "20261017_0019"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+BASELINE_CONTENT_SCOPE_TYPE = "round_baseline_content"
+
+expected_score_tables = sa.table(
+    "expected_score_tables",
+    sa.column("id", sa.Uuid()),
+    sa.column("user_id", sa.Uuid()),
+    sa.column("scope_type", sa.Text()),
+    sa.column("scope_key", sa.Text()),
+    sa.column("content_hash", sa.Text()),
+    sa.column("sample_count", sa.Integer()),
+    sa.column("table_payload", sa.JSON()),
+    sa.column("created_at", sa.DateTime(timezone=True)),
+    sa.column("updated_at", sa.DateTime(timezone=True)),
+)
+
+
+def upgrade() -> None:
+    # round_baseline rows now point at a shared round_baseline_content row through
+    # content_hash, and their table_payload only records the window's round ids.
+    # Move the inline tables of rows stored before that into content rows. The moved
+    # rows carry no window ids, so they are never used as a sliding-window seed.
+    bind = op.get_bind()
+    tables = expected_score_tables
+    rows = bind.execute(
+        sa.select(tables.c.id, tables.c.user_id, tables.c.sample_count, tables.c.table_payload)
+        .where(tables.c.scope_type == "round_baseline", tables.c.content_hash.is_(None))
+    ).all()
+    existing = {
+        (user_id, scope_key)
+        for user_id, scope_key in bind.execute(
+            sa.select(tables.c.user_id, tables.c.scope_key).where(
+                tables.c.scope_type == BASELINE_CONTENT_SCOPE_TYPE
+            )
+        ).all()
+    }
+    now = datetime.now(UTC)
+    for table_id, user_id, sample_count, payload in rows:
+        content_hash = _content_hash(payload or {})
+        if (user_id, content_hash) not in existing:
+            bind.execute(
+                tables.insert().values(
+                    id=uuid.uuid4(),
+                    user_id=user_id,
+                    scope_type=BASELINE_CONTENT_SCOPE_TYPE,
+                    scope_key=content_hash,
+                    sample_count=sample_count,
+                    table_payload=payload or {},
+                    created_at=now,
+                    updated_at=now,
+                )
+            )
+            existing.add((user_id, content_hash))
+        bind.execute(
+            tables.update()
+            .where(tables.c.id == table_id)
+            .values(content_hash=content_hash, table_payload={}, updated_at=now)
+        )
+
+
+def _content_hash(payload: dict) -> str:
+    return hashlib.sha256(
+        json.dumps(payload, sort_keys=True, separators=(",", ":")).encode()
+    ).hexdigest()
+
+
+def downgrade() -> None:
+    # Put the expected table back inline so 0018's downgrade can drop the content rows.
+    bind = op.get_bind()
+    tables = expected_score_tables
+    contents = {
+        (user_id, scope_key): payload
+        for user_id, scope_key, payload in bind.execute(
+            sa.select(tables.c.user_id, tables.c.scope_key, tables.c.table_payload).where(
+                tables.c.scope_type == BASELINE_CONTENT_SCOPE_TYPE
+            )
+        ).all()
+    }
+    rows = bind.execute(
+        sa.select(tables.c.id, tables.c.user_id, tables.c.content_hash).where(
+            tables.c.scope_type == "round_baseline", tables.c.content_hash.is_not(None)
+        )
+    ).all()
+    for table_id, user_id, content_hash in rows:
+        bind.execute(
+            tables.update()
+            .where(tables.c.id == table_id)
+            .values(content_hash=None, table_payload=contents.get((user_id, content_hash), {}))
+        )
@@ -9,24 +9,18 @@ from app.core.config import Settings, get_settings
 from app.core.security import hash_session_token
 from app.db.session import get_db
 from app.models import User, UserSession
+from app.services.session_cache import load_cached_session_user, remember_session_user
 
 DbSession = Annotated[Session, Depends(get_db)]
 AppSettings = Annotated[Settings, Depends(get_settings)]
 
 
-def get_current_user(
-    request: Request,
-    db: DbSession,
-    settings: AppSettings,
-) -> User:
-    session_token = request.cookies.get(settings.session_cookie_name)
-    if not session_token:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Not authenticated",
-        )
-
+def _session_user(db: Session, settings: Settings, session_token: str) -> User | None:
     token_hash = hash_session_token(session_token, settings.secret_key)
+    user = load_cached_session_user(db, token_hash, settings=settings)
+    if user is not None:
+        return user
+
     session = db.scalars(
         select(UserSession)
         .join(User)
@@ -37,14 +31,32 @@ def get_current_user(
             User.status == "active",
         )
     ).first()
-
     if session is None:
+        return None
+    remember_session_user(token_hash, session, settings=settings)
+    return session.user
+
+
+def get_current_user(
+    request: Request,
+    db: DbSession,
+    settings: AppSettings,
+) -> User:
+    session_token = request.cookies.get(settings.session_cookie_name)
+    if not session_token:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+        )
+
+    user = _session_user(db, settings, session_token)
+    if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid session",
         )
 
-    return session.user
+    return user
 
 
 CurrentUser = Annotated[User, Depends(get_current_user)]
@@ -59,18 +71,7 @@ def get_optional_current_user(
     if not session_token:
         return None
 
-    token_hash = hash_session_token(session_token, settings.secret_key)
-    session = db.scalars(
-        select(UserSession)
-        .join(User)
-        .where(
-            UserSession.session_token_hash == token_hash,
-            UserSession.revoked_at.is_(None),
-            UserSession.expires_at > datetime.now(UTC),
-            User.status == "active",
-        )
-    ).first()
-    return session.user if session is not None else None
+    return _session_user(db, settings, session_token)
 
 
 OptionalCurrentUser = Annotated[User | None, Depends(get_optional_current_user)]
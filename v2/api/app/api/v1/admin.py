@@ -1,3 +1,4 @@
+from pathlib import Path
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, status
@@ -5,8 +6,16 @@ from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 
 from app.api.deps import AppSettings, CurrentAdmin, DbSession
+from app.core.instrumentation import route_stats
 from app.models import AnalysisJob, Round, SourceFile, UploadReview, User
-from app.services.analysis_jobs import enqueue_round_analysis_job
+from app.services.analysis_jobs import (
+    AnalysisJobNotFoundError,
+    enqueue_round_analysis_job,
+    retry_analysis_job,
+)
+from app.services.analytics import recalculate_user_rounds
+from app.services.social import reconcile_round_counters
+from app.services.upload_storage import collect_unreferenced_blobs
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
@@ -54,7 +63,7 @@ def list_failed_analysis_jobs(
 ) -> dict[str, list[dict[str, object]]]:
     rows = db.execute(
         select(AnalysisJob, Round, User)
-        .join(Round, Round.id == AnalysisJob.round_id)
+        .outerjoin(Round, Round.id == AnalysisJob.round_id)
         .join(User, User.id == AnalysisJob.user_id)
         .where(AnalysisJob.status == "failed")
         .order_by(AnalysisJob.created_at.desc())
@@ -78,7 +87,7 @@ def retry_failed_analysis_job(
 ) -> dict[str, dict[str, object]]:
     row = db.execute(
         select(AnalysisJob, Round, User)
-        .join(Round, Round.id == AnalysisJob.round_id)
+        .outerjoin(Round, Round.id == AnalysisJob.round_id)
         .join(User, User.id == AnalysisJob.user_id)
         .where(AnalysisJob.id == job_id)
     ).first()
@@ -87,7 +96,15 @@ def retry_failed_analysis_job(
 
     job, round_, user = row
     retried_job = job
-    if job.status == "failed":
+    if job.status == "failed" and round_ is None:
+        try:
+            retried_job = retry_analysis_job(db, owner=user, job_id=job.id, settings=settings)
+        except AnalysisJobNotFoundError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Job not found",
+            ) from exc
+    elif job.status == "failed":
         retried_job = enqueue_round_analysis_job(db, owner=user, round_=round_, settings=settings)
 
     return {
@@ -95,10 +112,62 @@ def retry_failed_analysis_job(
     }
 
 
+@router.post("/analytics/users/{user_id}/recalculate")
+def backfill_user_analytics(
+    user_id: UUID,
+    db: DbSession,
+    settings: AppSettings,
+    _admin: CurrentAdmin,
+) -> dict[str, dict[str, object]]:
+    """Recalculate all of one user's rounds in a single batch, e.g. after an analytics change."""
+    user = db.get(User, user_id)
+    if user is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    result = recalculate_user_rounds(
+        db,
+        owner=user,
+        incremental=settings.analysis_incremental_enabled,
+    )
+    return {"data": {"user_id": user.id, "recalculated_rounds": len(result["rounds"])}}
+
+
+@router.post("/social/counters/reconcile")
+def reconcile_social_counters(
+    db: DbSession,
+    _admin: CurrentAdmin,
+) -> dict[str, dict[str, int]]:
+    return {"data": reconcile_round_counters(db)}
+
+
+@router.post("/uploads/blobs/collect")
+def collect_upload_blobs(
+    db: DbSession,
+    settings: AppSettings,
+    _admin: CurrentAdmin,
+) -> dict[str, dict[str, int]]:
+    """Delete stored upload blobs no source file references any more."""
+    return {
+        "data": collect_unreferenced_blobs(
+            db,
+            Path(settings.upload_storage_dir),
+            grace_seconds=settings.upload_blob_gc_grace_seconds,
+        )
+    }
+
+
+@router.get("/performance/routes")
+def list_slowest_routes(
+    _admin: CurrentAdmin,
+    limit: int = 20,
+) -> dict[str, list[dict[str, object]]]:
+    """Routes with the highest average duration seen by this API process."""
+    return {"data": route_stats.slowest(min(max(limit, 1), 100))}
+
+
 def _analysis_job_payload(
     *,
     job: AnalysisJob,
-    round_: Round,
+    round_: Round | None,
     user: User,
 ) -> dict[str, object]:
     return {
@@ -106,8 +175,8 @@ def _analysis_job_payload(
         "user_id": job.user_id,
         "user_email": user.email,
         "round_id": job.round_id,
-        "course_name": round_.course_name,
-        "play_date": round_.play_date,
+        "course_name": round_.course_name if round_ is not None else None,
+        "play_date": round_.play_date if round_ is not None else None,
         "kind": job.kind,
         "status": job.status,
         "rq_job_id": job.rq_job_id,
@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
 
 from app.api.deps import AppSettings, CurrentUser, DbSession
 from app.models import AnalysisJob, Round
@@ -26,6 +26,7 @@ from app.schemas.round import (
 from app.services.analysis_jobs import (
     AnalysisJobNotFoundError,
     enqueue_round_analysis_job,
+    enqueue_trend_snapshot_job,
     get_analysis_job,
     get_latest_round_analysis_job,
     retry_analysis_job,
@@ -51,12 +52,14 @@ from app.services.round_drafts import (
 )
 from app.services.rounds import (
     RoundNotFoundError,
-    dashboard_summary,
+    dashboard_etag,
+    dashboard_summary_from_document,
     delete_round,
     get_round_detail,
     list_round_holes,
     list_round_shots,
     list_rounds,
+    load_dashboard_document,
     update_hole,
     update_round,
     update_shot,
@@ -415,22 +418,41 @@ def patch_shot(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Shot not found") from exc
 
 
-@analytics_router.get("/analytics/summary")
+@analytics_router.get("/analytics/summary", response_model=None)
 def read_dashboard_summary(
     db: DbSession,
     current_user: CurrentUser,
+    settings: AppSettings,
+    request: Request,
+    response: Response,
     locale: str = Query(default="ko", pattern="^(ko|en)$"),
-) -> dict[str, DashboardSummaryResponse]:
-    return {"data": dashboard_summary(db, owner=current_user, locale=locale)}
+) -> dict[str, DashboardSummaryResponse] | Response:
+    document, stale = load_dashboard_document(db, owner=current_user)
+    if stale:
+        # The trend snapshot job refreshes the dashboard document as well.
+        enqueue_trend_snapshot_job(db, owner=current_user, settings=settings)
+    if document is not None:
+        etag = dashboard_etag(document, locale=locale)
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        response.headers.update(headers)
+    return {
+        "data": dashboard_summary_from_document(document, stale=stale, locale=locale),
+    }
 
 
 @analytics_router.get("/analytics/trends")
 def read_analytics_trends(
     db: DbSession,
     current_user: CurrentUser,
+    settings: AppSettings,
     locale: str = Query(default="ko", pattern="^(ko|en)$"),
 ) -> dict[str, AnalyticsTrendResponse]:
-    return {"data": AnalyticsTrendResponse(**get_trends(db, owner=current_user, locale=locale))}
+    trends = get_trends(db, owner=current_user, locale=locale)
+    if trends["stale"]:
+        enqueue_trend_snapshot_job(db, owner=current_user, settings=settings)
+    return {"data": AnalyticsTrendResponse(**trends)}
 
 
 @analytics_router.get("/analytics/rounds/{round_id}")
@@ -3,8 +3,10 @@ from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, File, HTTPException, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
 
 from app.api.deps import AppSettings, CurrentUser, DbSession
+from app.models.constants import UPLOAD_REVIEW_STATUS_PENDING
 from app.schemas.upload import (
     JobResponse,
     UploadCommitRequest,
@@ -14,12 +16,13 @@ from app.schemas.upload import (
     UploadReviewUpdateRequest,
     UploadRoundFileResponse,
 )
-from app.services.analysis_jobs import enqueue_round_analysis_job
+from app.services.analysis_jobs import enqueue_round_analysis_job, enqueue_upload_parse_job
 from app.services.uploads import (
     UploadError,
     UploadNotFoundError,
     UploadNotReadyError,
     commit_upload_review,
+    create_pending_round_file_upload,
     create_round_file_upload,
     get_upload_job,
     get_upload_review,
@@ -42,6 +45,9 @@ async def upload_round_file(
     settings: AppSettings,
     file: Annotated[UploadFile, File()],
 ) -> dict[str, UploadRoundFileResponse]:
+    if settings.upload_async_enabled:
+        return await _accept_round_file(db, current_user, settings, file)
+
     content = await file.read()
     try:
         review = create_round_file_upload(
@@ -73,6 +79,55 @@ async def upload_round_file(
     }
 
 
+async def _accept_round_file(
+    db: DbSession,
+    current_user: CurrentUser,
+    settings: AppSettings,
+    file: UploadFile,
+) -> dict[str, UploadRoundFileResponse]:
+    # Store the body and hand parsing to the worker; the client polls /jobs/{job_id}.
+    # Content already parsed for this user comes back parsed, keyed by its review id.
+    try:
+        review = await run_in_threadpool(
+            create_pending_round_file_upload,
+            db,
+            owner=current_user,
+            filename=file.filename or "round.txt",
+            content_type=file.content_type,
+            stream=file.file,
+            settings=settings,
+        )
+    except UploadError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    job_id = review.id
+    if review.status == UPLOAD_REVIEW_STATUS_PENDING:
+        job = await run_in_threadpool(
+            enqueue_upload_parse_job,
+            db,
+            owner=current_user,
+            review=review,
+            settings=settings,
+        )
+        job_id = job.id
+
+    logger.info(
+        "upload accepted",
+        extra={
+            "job_id": str(job_id),
+            "source_file_id": str(review.source_file_id),
+            "status": review.status,
+        },
+    )
+    return {
+        "data": UploadRoundFileResponse(
+            source_file_id=review.source_file_id,
+            upload_review_id=review.id,
+            status=review.status,
+            job_id=job_id,
+        )
+    }
+
+
 @router.get("/uploads/{upload_review_id}/review")
 def read_upload_review(
     upload_review_id: UUID,
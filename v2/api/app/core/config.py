@@ -19,7 +19,23 @@ class Settings(BaseSettings):
         default=True,
         validation_alias="ANALYSIS_INLINE_FALLBACK",
     )
+    analysis_incremental_enabled: bool = Field(
+        default=True,
+        validation_alias="ANALYSIS_INCREMENTAL_ENABLED",
+    )
     analysis_queue_name: str = Field(default="analysis", validation_alias="ANALYSIS_QUEUE_NAME")
+    bulk_copy_enabled: bool = Field(default=False, validation_alias="BULK_COPY_ENABLED")
+    bulk_copy_min_rows: int = Field(default=1_000, validation_alias="BULK_COPY_MIN_ROWS")
+    recompute_max_workers: int = Field(default=0, validation_alias="RECOMPUTE_MAX_WORKERS")
+    recompute_claim_limit: int = Field(default=500, validation_alias="RECOMPUTE_CLAIM_LIMIT")
+    follow_graph_redis_enabled: bool = Field(
+        default=False,
+        validation_alias="FOLLOW_GRAPH_REDIS_ENABLED",
+    )
+    follow_graph_cache_ttl_seconds: int = Field(
+        default=300,
+        validation_alias="FOLLOW_GRAPH_CACHE_TTL_SECONDS",
+    )
     secret_key: str = Field(default="change-me", validation_alias="SECRET_KEY")
     session_cookie_name: str = Field(
         default="lalagolf_session",
@@ -27,13 +43,28 @@ class Settings(BaseSettings):
     )
     session_cookie_secure: bool = Field(default=False, validation_alias="SESSION_COOKIE_SECURE")
     session_lifetime_days: int = Field(default=30, validation_alias="SESSION_LIFETIME_DAYS")
+    session_cache_ttl_seconds: int = Field(default=30, validation_alias="SESSION_CACHE_TTL_SECONDS")
+    session_cache_max_entries: int = Field(
+        default=10_000,
+        validation_alias="SESSION_CACHE_MAX_ENTRIES",
+    )
+    session_cache_redis_enabled: bool = Field(
+        default=False,
+        validation_alias="SESSION_CACHE_REDIS_ENABLED",
+    )
     request_id_header: str = Field(default="X-Request-ID", validation_alias="REQUEST_ID_HEADER")
     log_level: str = Field(default="INFO", validation_alias="LOG_LEVEL")
+    server_timing_enabled: bool = Field(default=True, validation_alias="SERVER_TIMING_ENABLED")
     upload_storage_dir: str = Field(
         default="storage/uploads",
         validation_alias="UPLOAD_STORAGE_DIR",
     )
     upload_max_bytes: int = Field(default=1_000_000, validation_alias="UPLOAD_MAX_BYTES")
+    upload_async_enabled: bool = Field(default=False, validation_alias="UPLOAD_ASYNC_ENABLED")
+    upload_blob_gc_grace_seconds: int = Field(
+        default=86_400,
+        validation_alias="UPLOAD_BLOB_GC_GRACE_SECONDS",
+    )
     cors_origins: str = Field(
         default="http://localhost:2323,http://127.0.0.1:2323",
         validation_alias="CORS_ORIGINS",
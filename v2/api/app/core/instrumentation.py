@@ -0,0 +1,198 @@
+import functools
+import threading
+import time
+from collections.abc import Callable
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, ParamSpec, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+SLOWEST_STATEMENT_MAX_CHARS = 300
+ROUTE_STATS_MAX_ENTRIES = 500
+QUERY_START_INFO_KEY = "instrumentation.query_start"
+# Requests that match no route (404s, scanners) share one entry instead of their raw URL.
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+@dataclass
+class RequestMetrics:
+    sql_count: int = 0
+    sql_ms: float = 0.0
+    slowest_sql_ms: float = 0.0
+    slowest_sql: str | None = None
+    analytics_ms: float = 0.0
+    # analytics_core functions may call each other; only the outermost call is timed.
+    analytics_depth: int = 0
+
+    def log_fields(self) -> dict[str, Any]:
+        return {
+            "sql_count": self.sql_count,
+            "sql_ms": round(self.sql_ms, 2),
+            "slowest_sql_ms": round(self.slowest_sql_ms, 2),
+            "slowest_sql": self.slowest_sql,
+            "analytics_ms": round(self.analytics_ms, 2),
+        }
+
+    def server_timing(self, total_ms: float) -> str:
+        return ", ".join(
+            (
+                f'db;dur={self.sql_ms:.2f};desc="{self.sql_count} queries"',
+                f"analytics;dur={self.analytics_ms:.2f}",
+                f"total;dur={total_ms:.2f}",
+            )
+        )
+
+
+@dataclass
+class RouteStats:
+    method: str
+    route: str
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    total_sql_count: int = 0
+    max_sql_count: int = 0
+    total_sql_ms: float = 0.0
+    total_analytics_ms: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "method": self.method,
+            "route": self.route,
+            "count": self.count,
+            "avg_ms": round(self.total_ms / self.count, 2),
+            "max_ms": round(self.max_ms, 2),
+            "avg_sql_count": round(self.total_sql_count / self.count, 2),
+            "max_sql_count": self.max_sql_count,
+            "avg_sql_ms": round(self.total_sql_ms / self.count, 2),
+            "avg_analytics_ms": round(self.total_analytics_ms / self.count, 2),
+        }
+
+
+class RouteStatsRegistry:
+    """Per-process running totals of request timings, keyed by route template."""
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._stats: dict[tuple[str, str], RouteStats] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        method: str,
+        route: str,
+        *,
+        duration_ms: float,
+        metrics: RequestMetrics,
+    ) -> None:
+        with self._lock:
+            stats = self._stats.get((method, route))
+            if stats is None:
+                if len(self._stats) >= self.max_entries:
+                    return
+                stats = self._stats[(method, route)] = RouteStats(method=method, route=route)
+            stats.count += 1
+            stats.total_ms += duration_ms
+            stats.max_ms = max(stats.max_ms, duration_ms)
+            stats.total_sql_count += metrics.sql_count
+            stats.max_sql_count = max(stats.max_sql_count, metrics.sql_count)
+            stats.total_sql_ms += metrics.sql_ms
+            stats.total_analytics_ms += metrics.analytics_ms
+
+    def slowest(self, limit: int) -> list[dict[str, Any]]:
+        with self._lock:
+            rows = [stats.as_dict() for stats in self._stats.values()]
+        rows.sort(key=lambda row: row["avg_ms"], reverse=True)
+        return rows[:limit]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+route_stats = RouteStatsRegistry(ROUTE_STATS_MAX_ENTRIES)
+_current_metrics: ContextVar[RequestMetrics | None] = ContextVar(
+    "request_metrics",
+    default=None,
+)
+
+
+def start_request_metrics() -> RequestMetrics:
+    """Attach fresh metrics to the current context.
+
+    Sync endpoints run in a worker thread with a copy of this context, so they
+    update the same object.
+    """
+    metrics = RequestMetrics()
+    _current_metrics.set(metrics)
+    return metrics
+
+
+def current_request_metrics() -> RequestMetrics | None:
+    return _current_metrics.get()
+
+
+def timed_analytics(func: Callable[P, R]) -> Callable[P, R]:
+    """Count the wall time of an analytics_core call towards the current request."""
+
+    @functools.wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        metrics = _current_metrics.get()
+        if metrics is None or metrics.analytics_depth:
+            return func(*args, **kwargs)
+        metrics.analytics_depth += 1
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            metrics.analytics_depth -= 1
+            metrics.analytics_ms += (time.perf_counter() - start) * 1000
+
+    return wrapper
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_query_timer(
+    conn: Any,
+    _cursor: Any,
+    _statement: str,
+    _parameters: Any,
+    _context: Any,
+    _executemany: bool,
+) -> None:
+    if _current_metrics.get() is not None:
+        conn.info.setdefault(QUERY_START_INFO_KEY, []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _record_query(
+    conn: Any,
+    _cursor: Any,
+    statement: str,
+    _parameters: Any,
+    _context: Any,
+    _executemany: bool,
+) -> None:
+    metrics = _current_metrics.get()
+    starts = conn.info.get(QUERY_START_INFO_KEY)
+    if metrics is None or not starts:
+        return
+    elapsed_ms = (time.perf_counter() - starts.pop()) * 1000
+    metrics.sql_count += 1
+    metrics.sql_ms += elapsed_ms
+    if elapsed_ms >= metrics.slowest_sql_ms:
+        metrics.slowest_sql_ms = elapsed_ms
+        metrics.slowest_sql = " ".join(statement.split())[:SLOWEST_STATEMENT_MAX_CHARS]
+
+
+@event.listens_for(Engine, "handle_error")
+def _discard_query_timer(context: Any) -> None:
+    # after_cursor_execute never fires for a failed statement; drop its start time so
+    # it does not linger on the pooled connection.
+    if context.connection is not None:
+        context.connection.info.pop(QUERY_START_INFO_KEY, None)
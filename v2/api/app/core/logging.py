@@ -6,6 +6,7 @@ from collections.abc import Awaitable, Callable
 from fastapi import Request, Response
 
 from app.core.config import Settings
+from app.core.instrumentation import UNMATCHED_ROUTE, route_stats, start_request_metrics
 
 logger = logging.getLogger("lalagolf.api")
 
@@ -17,6 +18,7 @@ async def request_logging_middleware(
 ) -> Response:
     request_id = request.headers.get(settings.request_id_header) or uuid.uuid4().hex
     request.state.request_id = request_id
+    metrics = start_request_metrics()
     start = time.perf_counter()
     response: Response | None = None
 
@@ -26,15 +28,27 @@ async def request_logging_middleware(
     finally:
         elapsed_ms = round((time.perf_counter() - start) * 1000, 2)
         status_code = response.status_code if response is not None else 500
+        route = request.scope.get("route")
+        route_path = getattr(route, "path", None) or UNMATCHED_ROUTE
+        route_stats.record(
+            request.method,
+            route_path,
+            duration_ms=elapsed_ms,
+            metrics=metrics,
+        )
         logger.info(
             "request completed",
             extra={
                 "request_id": request_id,
                 "method": request.method,
                 "path": request.url.path,
+                "route": route_path,
                 "status_code": status_code,
                 "duration_ms": elapsed_ms,
+                **metrics.log_fields(),
             },
         )
         if response is not None:
             response.headers[settings.request_id_header] = request_id
+            if settings.server_timing_enabled:
+                response.headers["Server-Timing"] = metrics.server_timing(elapsed_ms)
@@ -0,0 +1,16 @@
+from functools import lru_cache
+from typing import Any
+
+
+@lru_cache(maxsize=8)
+def shared_redis_client(redis_url: str) -> Any | None:
+    """Return this process's Redis client for ``redis_url``, or None without redis-py.
+
+    The client owns a connection pool, so callers share it instead of building a new
+    pool per lookup. redis-py resets the pool in a forked child.
+    """
+    try:
+        from redis import Redis
+    except ImportError:
+        return None
+    return Redis.from_url(redis_url)
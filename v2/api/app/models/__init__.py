@@ -3,15 +3,24 @@ from app.models.analytics import (
     AnalysisSnapshot,
     ExpectedScoreTable,
     Insight,
+    RoundAnalyticsContribution,
     RoundMetric,
     ShotValue,
+    UserAnalyticsAggregate,
+    UserAnalyticsVersion,
 )
 from app.models.chat import LlmMessage, LlmThread
 from app.models.migration import MigrationIdMap, MigrationIssue, MigrationRun
 from app.models.practice import GoalEvaluation, PracticeDiaryEntry, PracticePlan, RoundGoal
 from app.models.round import Course, Hole, Round, RoundCompanion, Shot
 from app.models.share import ShareLink
-from app.models.social import CompanionAccountLink, Follow, RoundComment, RoundLike
+from app.models.social import (
+    CompanionAccountLink,
+    Follow,
+    RoundComment,
+    RoundLike,
+    RoundSocialCounter,
+)
 from app.models.upload import SourceFile, UploadReview
 from app.models.user import User, UserProfile, UserSession
 
@@ -32,18 +41,22 @@ __all__ = [
     "MigrationRun",
     "PracticeDiaryEntry",
     "PracticePlan",
+    "RoundAnalyticsContribution",
     "RoundMetric",
     "Round",
     "RoundGoal",
     "RoundCompanion",
     "RoundComment",
     "RoundLike",
+    "RoundSocialCounter",
     "Shot",
     "ShotValue",
     "ShareLink",
     "SourceFile",
     "UploadReview",
     "User",
+    "UserAnalyticsAggregate",
+    "UserAnalyticsVersion",
     "UserProfile",
     "UserSession",
 ]
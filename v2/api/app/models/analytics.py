@@ -6,7 +6,7 @@ from sqlalchemy import JSON, CheckConstraint, DateTime, ForeignKey, Index, Text,
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
-from app.models.mixins import TimestampMixin, UUIDPrimaryKeyMixin
+from app.models.mixins import TimestampMixin, UUIDPrimaryKeyMixin, utc_now
 
 
 class RoundMetric(UUIDPrimaryKeyMixin, TimestampMixin, Base):
@@ -45,6 +45,7 @@ class ExpectedScoreTable(UUIDPrimaryKeyMixin, TimestampMixin, Base):
     )
     scope_type: Mapped[str] = mapped_column(Text, nullable=False)
     scope_key: Mapped[str] = mapped_column(Text, nullable=False)
+    content_hash: Mapped[str | None] = mapped_column(Text, nullable=True)
     sample_count: Mapped[int] = mapped_column(default=0, nullable=False)
     table_payload: Mapped[dict[str, Any]] = mapped_column(JSON, default=dict, nullable=False)
 
@@ -55,6 +56,7 @@ class ShotValue(UUIDPrimaryKeyMixin, TimestampMixin, Base):
         UniqueConstraint("shot_id", name="uq_shot_values_shot_id"),
         Index("ix_shot_values_user_round", "user_id", "round_id"),
         Index("ix_shot_values_user_category", "user_id", "category"),
+        Index("ix_shot_values_user_club", "user_id", "club"),
     )
 
     user_id: Mapped[uuid.UUID] = mapped_column(
@@ -74,6 +76,7 @@ class ShotValue(UUIDPrimaryKeyMixin, TimestampMixin, Base):
         nullable=False,
     )
     category: Mapped[str] = mapped_column(Text, nullable=False)
+    club: Mapped[str | None] = mapped_column(Text, nullable=True)
     expected_before: Mapped[float | None] = mapped_column(nullable=True)
     expected_after: Mapped[float | None] = mapped_column(nullable=True)
     shot_cost: Mapped[int] = mapped_column(default=1, nullable=False)
@@ -129,6 +132,54 @@ class AnalysisSnapshot(UUIDPrimaryKeyMixin, TimestampMixin, Base):
     )
     scope_type: Mapped[str] = mapped_column(Text, nullable=False)
     scope_key: Mapped[str] = mapped_column(Text, nullable=False)
+    analytics_version: Mapped[int | None] = mapped_column(nullable=True)
+    payload: Mapped[dict[str, Any]] = mapped_column(JSON, default=dict, nullable=False)
+
+
+class UserAnalyticsVersion(Base):
+    __tablename__ = "user_analytics_versions"
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    version: Mapped[int] = mapped_column(default=0, server_default="0", nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=utc_now,
+        onupdate=utc_now,
+        nullable=False,
+    )
+
+
+class UserAnalyticsAggregate(UUIDPrimaryKeyMixin, TimestampMixin, Base):
+    __tablename__ = "user_analytics_aggregates"
+    __table_args__ = (UniqueConstraint("user_id", name="uq_user_analytics_aggregates_user"),)
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    # Analytics version at which the counters last covered every live round.
+    analytics_version: Mapped[int] = mapped_column(default=0, server_default="0", nullable=False)
+    payload: Mapped[dict[str, Any]] = mapped_column(JSON, default=dict, nullable=False)
+
+
+class RoundAnalyticsContribution(UUIDPrimaryKeyMixin, TimestampMixin, Base):
+    __tablename__ = "round_analytics_contributions"
+    __table_args__ = (
+        UniqueConstraint("round_id", name="uq_round_analytics_contributions_round"),
+        Index("ix_round_analytics_contributions_user", "user_id"),
+    )
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    round_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("rounds.id", ondelete="CASCADE"),
+        nullable=False,
+    )
     payload: Mapped[dict[str, Any]] = mapped_column(JSON, default=dict, nullable=False)
 
 
@@ -148,9 +199,9 @@ class AnalysisJob(UUIDPrimaryKeyMixin, TimestampMixin, Base):
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
     )
-    round_id: Mapped[uuid.UUID] = mapped_column(
+    round_id: Mapped[uuid.UUID | None] = mapped_column(
         ForeignKey("rounds.id", ondelete="CASCADE"),
-        nullable=False,
+        nullable=True,
     )
     kind: Mapped[str] = mapped_column(Text, default="round_recalculation", nullable=False)
     status: Mapped[str] = mapped_column(Text, default="queued", nullable=False)
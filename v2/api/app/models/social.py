@@ -5,7 +5,7 @@ from sqlalchemy import CheckConstraint, DateTime, ForeignKey, Index, Text, Uniqu
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
-from app.models.mixins import TimestampMixin, UUIDPrimaryKeyMixin
+from app.models.mixins import TimestampMixin, UUIDPrimaryKeyMixin, utc_now
 
 
 class Follow(TimestampMixin, Base):
@@ -60,6 +60,23 @@ class RoundLike(TimestampMixin, Base):
     )
 
 
+class RoundSocialCounter(Base):
+    __tablename__ = "round_social_counters"
+
+    round_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("rounds.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    like_count: Mapped[int] = mapped_column(default=0, server_default="0", nullable=False)
+    comment_count: Mapped[int] = mapped_column(default=0, server_default="0", nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=utc_now,
+        onupdate=utc_now,
+        nullable=False,
+    )
+
+
 class RoundComment(UUIDPrimaryKeyMixin, TimestampMixin, Base):
     __tablename__ = "round_comments"
     __table_args__ = (
@@ -143,7 +143,7 @@ class DraftMetaUpdate(BaseModel):
 
 class AnalysisJobResponse(BaseModel):
     id: UUID
-    round_id: UUID
+    round_id: UUID | None = None
     kind: str
     status: str
     rq_job_id: str | None = None
@@ -159,6 +159,7 @@ class DashboardSummaryResponse(BaseModel):
     recent_rounds: list[RoundListItem]
     score_trend: list[dict]
     priority_insights: list[dict]
+    stale: bool = False
 
 
 class InsightResponse(BaseModel):
@@ -190,6 +191,8 @@ class AnalyticsTrendResponse(BaseModel):
     item_summary: list[dict] = Field(default_factory=list)
     shot_quality_summary: dict = Field(default_factory=dict)
     insights: list[InsightResponse]
+    analytics_version: int | None = None
+    stale: bool = False
 
 
 class RoundAnalyticsResponse(BaseModel):
@@ -5,16 +5,30 @@ from datetime import UTC, datetime
 from typing import Any
 
 from redis import Redis
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
 
 from app.core.config import Settings, get_settings
 from app.db.session import SessionLocal
-from app.models import AnalysisJob, Round, User
-from app.models.constants import COMPUTED_STATUS_FAILED, COMPUTED_STATUS_PENDING
-from app.services.analytics import recalculate_round_metrics
+from app.models import AnalysisJob, Round, UploadReview, User
+from app.models.constants import (
+    COMPUTED_STATUS_FAILED,
+    COMPUTED_STATUS_PENDING,
+    SOURCE_FILE_STATUS_UPLOADED,
+    UPLOAD_REVIEW_STATUS_FAILED,
+    UPLOAD_REVIEW_STATUS_PENDING,
+)
+from app.services.analytics import rebuild_trend_snapshot, recalculate_round_metrics
+from app.services.analytics_versions import current_analytics_version
+from app.services.rounds import refresh_dashboard_document
+from app.services.uploads import (
+    UPLOAD_PARSE_JOB_KIND,
+    UploadNotFoundError,
+    parse_pending_upload_review,
+)
 
 ANALYSIS_JOB_KIND_ROUND_RECALCULATION = "round_recalculation"
+ANALYSIS_JOB_KIND_TREND_SNAPSHOT = "trend_snapshot"
 
 
 class AnalysisJobNotFoundError(Exception):
@@ -73,6 +87,84 @@ def enqueue_round_analysis_job(
     return job
 
 
+def enqueue_trend_snapshot_job(
+    db: Session,
+    *,
+    owner: User,
+    settings: Settings,
+) -> AnalysisJob:
+    """Queue one rebuild of the user's trend snapshot and dashboard document.
+
+    A pending rebuild is reused.
+    """
+    existing_job = db.scalars(
+        select(AnalysisJob)
+        .where(
+            AnalysisJob.user_id == owner.id,
+            AnalysisJob.kind == ANALYSIS_JOB_KIND_TREND_SNAPSHOT,
+            AnalysisJob.status.in_(("queued", "running")),
+        )
+        .order_by(AnalysisJob.created_at.desc())
+        .limit(1)
+    ).first()
+    if existing_job is not None:
+        return existing_job
+
+    job = AnalysisJob(
+        user_id=owner.id,
+        round_id=None,
+        kind=ANALYSIS_JOB_KIND_TREND_SNAPSHOT,
+        status="queued",
+        payload={"analytics_version": current_analytics_version(db, owner.id)},
+    )
+    db.add(job)
+    db.flush()
+
+    rq_job_id = _try_enqueue_rq_job(job.id, settings=settings)
+    if rq_job_id is not None:
+        job.rq_job_id = rq_job_id
+    db.commit()
+    db.refresh(job)
+    if rq_job_id is None:
+        _maybe_run_inline(db, job.id, settings=settings)
+        db.refresh(job)
+    return job
+
+
+def enqueue_upload_parse_job(
+    db: Session,
+    *,
+    owner: User,
+    review: UploadReview,
+    settings: Settings,
+) -> AnalysisJob:
+    """Queue parsing of a pending upload review for the worker.
+
+    The job commits together with any uncommitted review changes, and only then is
+    handed to RQ, so a review is never left pending without a job. A job RQ did not
+    take stays queued for the pool scheduler or ``enqueue_pending_analysis_jobs_once``.
+    """
+    job = AnalysisJob(
+        user_id=owner.id,
+        round_id=None,
+        kind=UPLOAD_PARSE_JOB_KIND,
+        status="queued",
+        payload={"upload_review_id": str(review.id)},
+    )
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+
+    rq_job_id = _try_enqueue_rq_job(job.id, settings=settings)
+    if rq_job_id is not None:
+        job.rq_job_id = rq_job_id
+        db.commit()
+    else:
+        _maybe_run_inline(db, job.id, settings=settings)
+    db.refresh(job)
+    return job
+
+
 def get_analysis_job(db: Session, *, owner: User, job_id: uuid.UUID) -> AnalysisJob:
     job = db.scalars(
         select(AnalysisJob).where(AnalysisJob.id == job_id, AnalysisJob.user_id == owner.id)
@@ -113,6 +205,10 @@ def retry_analysis_job(
     job = get_analysis_job(db, owner=owner, job_id=job_id)
     if job.status in {"queued", "running", "succeeded"}:
         return job
+    if job.kind == ANALYSIS_JOB_KIND_TREND_SNAPSHOT:
+        return enqueue_trend_snapshot_job(db, owner=owner, settings=settings)
+    if job.kind == UPLOAD_PARSE_JOB_KIND:
+        return _retry_upload_parse_job(db, owner=owner, job=job, settings=settings)
 
     round_ = db.get(Round, job.round_id)
     if round_ is None or round_.user_id != owner.id or round_.deleted_at is not None:
@@ -120,6 +216,25 @@ def retry_analysis_job(
     return enqueue_round_analysis_job(db, owner=owner, round_=round_, settings=settings)
 
 
+def _retry_upload_parse_job(
+    db: Session,
+    *,
+    owner: User,
+    job: AnalysisJob,
+    settings: Settings,
+) -> AnalysisJob:
+    review = db.get(UploadReview, uuid.UUID(job.payload["upload_review_id"]))
+    if review is None or review.user_id != owner.id:
+        raise AnalysisJobNotFoundError
+    if review.status not in {UPLOAD_REVIEW_STATUS_PENDING, UPLOAD_REVIEW_STATUS_FAILED}:
+        return job
+    review.status = UPLOAD_REVIEW_STATUS_PENDING
+    if review.source_file is not None:
+        review.source_file.status = SOURCE_FILE_STATUS_UPLOADED
+        review.source_file.parse_error = None
+    return enqueue_upload_parse_job(db, owner=owner, review=review, settings=settings)
+
+
 def run_analysis_job(job_id: str) -> dict[str, Any]:
     job_uuid = uuid.UUID(job_id)
     with SessionLocal() as db:
@@ -130,12 +245,13 @@ def run_analysis_job_in_session(db: Session, job_id: uuid.UUID) -> dict[str, Any
     job = db.get(AnalysisJob, job_id)
     if job is None:
         raise AnalysisJobNotFoundError
+    if not _claim_analysis_job(db, job_id):
+        return {"job_id": str(job_id), "status": job.status, "skipped": True}
 
-    job.status = "running"
-    job.attempts += 1
-    job.started_at = datetime.now(UTC)
-    job.error_message = None
-    db.commit()
+    if job.kind == ANALYSIS_JOB_KIND_TREND_SNAPSHOT:
+        return _run_trend_snapshot_job(db, job)
+    if job.kind == UPLOAD_PARSE_JOB_KIND:
+        return _run_upload_parse_job(db, job)
 
     owner = db.get(User, job.user_id)
     round_ = db.get(Round, job.round_id)
@@ -148,7 +264,12 @@ def run_analysis_job_in_session(db: Session, job_id: uuid.UUID) -> dict[str, Any
 
     round_id = round_.id
     try:
-        result = recalculate_round_metrics(db, owner=owner, round_id=round_id)
+        result = recalculate_round_metrics(
+            db,
+            owner=owner,
+            round_id=round_id,
+            incremental=get_settings().analysis_incremental_enabled,
+        )
     except Exception as exc:
         db.rollback()
         failed_job = db.get(AnalysisJob, job_id)
@@ -171,6 +292,104 @@ def run_analysis_job_in_session(db: Session, job_id: uuid.UUID) -> dict[str, Any
             **(completed_job.payload or {}),
             "result": _json_safe_payload(result),
         }
+    refresh_dashboard_document(db, owner=owner)
+    db.commit()
+    return {"job_id": str(job_id), "status": "succeeded", **result}
+
+
+def _claim_analysis_job(db: Session, job_id: uuid.UUID) -> bool:
+    """Mark a queued job running; ``False`` when another runner already claimed it.
+
+    The inline fallback, the RQ worker and the pool scheduler can all see the same
+    queued job, so the status check and the update happen in one statement.
+    """
+    result = db.execute(
+        update(AnalysisJob)
+        .where(AnalysisJob.id == job_id, AnalysisJob.status == "queued")
+        .values(
+            status="running",
+            attempts=AnalysisJob.attempts + 1,
+            started_at=datetime.now(UTC),
+            error_message=None,
+        )
+    )
+    db.commit()
+    return result.rowcount == 1
+
+
+def _run_trend_snapshot_job(db: Session, job: AnalysisJob) -> dict[str, Any]:
+    job_id = job.id
+    owner = db.get(User, job.user_id)
+    if owner is None:
+        job.status = "failed"
+        job.error_message = "Analysis job owner no longer exists"
+        job.finished_at = datetime.now(UTC)
+        db.commit()
+        return {"job_id": str(job_id), "status": job.status}
+
+    try:
+        snapshot = rebuild_trend_snapshot(
+            db,
+            owner=owner,
+            incremental=get_settings().analysis_incremental_enabled,
+        )
+        # Recalculated rounds change the dashboard's recent rounds and KPIs as well.
+        refresh_dashboard_document(db, owner=owner)
+        db.commit()
+    except Exception as exc:
+        db.rollback()
+        failed_job = db.get(AnalysisJob, job_id)
+        if failed_job is not None:
+            failed_job.status = "failed"
+            failed_job.error_message = str(exc)
+            failed_job.finished_at = datetime.now(UTC)
+        db.commit()
+        raise
+
+    result = {"analytics_version": snapshot.analytics_version}
+    completed_job = db.get(AnalysisJob, job_id)
+    if completed_job is not None:
+        completed_job.status = "succeeded"
+        completed_job.error_message = None
+        completed_job.finished_at = datetime.now(UTC)
+        completed_job.payload = {**(completed_job.payload or {}), "result": result}
+    db.commit()
+    return {"job_id": str(job_id), "status": "succeeded", **result}
+
+
+def _run_upload_parse_job(db: Session, job: AnalysisJob) -> dict[str, Any]:
+    job_id = job.id
+    review_id = uuid.UUID(job.payload["upload_review_id"])
+    try:
+        review = parse_pending_upload_review(
+            db,
+            upload_review_id=review_id,
+            settings=get_settings(),
+        )
+    except UploadNotFoundError:
+        db.rollback()
+        job.status = "failed"
+        job.error_message = "Upload review or its stored file no longer exists"
+        job.finished_at = datetime.now(UTC)
+        db.commit()
+        return {"job_id": str(job_id), "status": job.status}
+    except Exception as exc:
+        db.rollback()
+        failed_job = db.get(AnalysisJob, job_id)
+        if failed_job is not None:
+            failed_job.status = "failed"
+            failed_job.error_message = str(exc)
+            failed_job.finished_at = datetime.now(UTC)
+        db.commit()
+        raise
+
+    result = {"upload_review_id": str(review.id), "review_status": review.status}
+    completed_job = db.get(AnalysisJob, job_id)
+    if completed_job is not None:
+        completed_job.status = "succeeded"
+        completed_job.error_message = None
+        completed_job.finished_at = datetime.now(UTC)
+        completed_job.payload = {**(completed_job.payload or {}), "result": result}
     db.commit()
     return {"job_id": str(job_id), "status": "succeeded", **result}
 
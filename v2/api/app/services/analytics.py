@@ -1,33 +1,87 @@
+import copy
+import hashlib
+import json
 import uuid
-from collections import defaultdict
+from collections import defaultdict, deque
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any
 
-from lalagolf_analytics_core.boundary import (
-    shot_values_to_persistence_rows,
-    upload_preview_to_analytics_payload,
-)
-from lalagolf_analytics_core.insights import build_insight_unit, dedupe_insights
-from lalagolf_analytics_core.shot_model import normalize_shot_states
-from lalagolf_analytics_core.upload_normalizer import normalize_upload_content
-from sqlalchemy import and_, or_, select
+from lalagolf_analytics_core import boundary as core_boundary
+from lalagolf_analytics_core import insights as core_insights
+from lalagolf_analytics_core import shot_model as core_shot_model
+from lalagolf_analytics_core import upload_normalizer as core_upload_normalizer
+from sqlalchemy import and_, case, func, insert, or_, select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session, selectinload
 
+from app.core.instrumentation import timed_analytics
 from app.models import (
     AnalysisSnapshot,
     ExpectedScoreTable,
     Hole,
     Insight,
     Round,
+    RoundAnalyticsContribution,
     RoundMetric,
     Shot,
     ShotValue,
     User,
+    UserAnalyticsAggregate,
+)
+from app.models.constants import (
+    COMPUTED_STATUS_FAILED,
+    COMPUTED_STATUS_PENDING,
+    COMPUTED_STATUS_READY,
+    COMPUTED_STATUS_STALE,
 )
-from app.models.constants import COMPUTED_STATUS_FAILED, COMPUTED_STATUS_READY
+from app.services.analytics_versions import current_analytics_version
+from app.services.bulk_writes import bulk_delete, bulk_insert
 from app.services.insight_i18n import render_insight_payload
 
+# analytics_core entry points, timed towards the current request's instrumentation.
+build_insight_unit = timed_analytics(core_insights.build_insight_unit)
+dedupe_insights = timed_analytics(core_insights.dedupe_insights)
+normalize_shot_states = timed_analytics(core_shot_model.normalize_shot_states)
+normalize_upload_content = timed_analytics(core_upload_normalizer.normalize_upload_content)
+shot_values_to_persistence_rows = timed_analytics(core_boundary.shot_values_to_persistence_rows)
+upload_preview_to_analytics_payload = timed_analytics(
+    core_boundary.upload_preview_to_analytics_payload
+)
+
 PRIOR_BASELINE_ROUND_LIMIT = 10
+# A round_baseline row does not hold its expected table: content_hash points at one
+# shared round_baseline_content row per distinct table, and table_payload only lists
+# the window's round ids. Migration 20261017_0020 moved older inline tables over.
+BASELINE_CONTENT_SCOPE_TYPE = "round_baseline_content"
+COUNTER_EPSILON = 1e-9
+QUALITY_RISK_COUNTERS = (
+    "reproducible_count",
+    "technical_miss_count",
+    "lucky_result_count",
+    "strategy_issue_count",
+    "high_risk_count",
+    "driver_tee_shot_count",
+    "driver_result_c_count",
+)
+GRADES = ("A", "B", "C")
+ITEM_COUNTERS = (
+    "count",
+    "total_shot_value",
+    "result_c_count",
+    "feel_c_count",
+    "penalty_count",
+    "made_count",
+    "ok_count",
+    "recovered_count",
+    "failed_recovery_count",
+    "ob_count",
+    "hazard_count",
+    "good_feel_penalty_count",
+    "up_and_down_chance_count",
+    "up_and_down_success_count",
+)
 
 
 def parse_upload_preview(raw_content: str, *, file_name: str) -> dict[str, Any]:
@@ -51,15 +105,49 @@ class AnalyticsNotFoundError(Exception):
     pass
 
 
-def recalculate_round_metrics(db: Session, *, owner: User, round_id: uuid.UUID) -> dict[str, Any]:
+def recalculate_round_metrics(
+    db: Session,
+    *,
+    owner: User,
+    round_id: uuid.UUID,
+    incremental: bool = True,
+) -> dict[str, Any]:
+    """Recalculate one round and refresh the user's insights and trend snapshot.
+
+    In incremental mode the user's running aggregate is updated with the delta of
+    this round only; otherwise the snapshot is rebuilt from the full history.
+    """
     round_ = _get_round(db, owner=owner, round_id=round_id)
     try:
         _replace_round_metrics(db, round_)
-        expected_table = _recalculate_round_prior_expected_table(db, owner=owner, round_=round_)
-        _replace_shot_values(db, owner=owner, round_=round_, expected_table=expected_table)
-        active_insights = _replace_insights(db, owner=owner)
-        round_.computed_status = COMPUTED_STATUS_READY
-        _replace_snapshot(db, owner=owner, insights=active_insights)
+        expected_table, expected = _recalculate_round_prior_expected_table(
+            db,
+            owner=owner,
+            round_=round_,
+            incremental=incremental,
+        )
+        shot_values = _replace_shot_values(
+            db,
+            owner=owner,
+            round_=round_,
+            expected=expected,
+            source_scope=expected_table.scope_key,
+        )
+        if incremental:
+            aggregate = _apply_round_contribution(
+                db,
+                owner=owner,
+                round_=round_,
+                shot_values=shot_values,
+            )
+            active_insights = _replace_insights(db, owner=owner, incremental=True)
+            round_.computed_status = COMPUTED_STATUS_READY
+            _replace_snapshot(db, owner=owner, insights=active_insights, aggregate=aggregate)
+        else:
+            _discard_user_aggregate(db, owner)
+            active_insights = _replace_insights(db, owner=owner)
+            round_.computed_status = COMPUTED_STATUS_READY
+            _replace_snapshot(db, owner=owner, insights=active_insights)
         db.commit()
     except Exception as exc:
         db.rollback()
@@ -84,51 +172,113 @@ def recalculate_round_metrics(db: Session, *, owner: User, round_id: uuid.UUID)
 
 
 def get_trends(db: Session, *, owner: User, locale: str | None = None) -> dict[str, Any]:
+    """Serve the stored trend snapshot without recomputing history or writing.
+
+    A snapshot older than the user's analytics version is still returned, flagged
+    ``stale``, so the caller can queue ``rebuild_trend_snapshot``. A user without any
+    snapshot yet gets an empty one, also flagged ``stale``.
+    """
     snapshot = _latest_trend_snapshot(db, owner)
-    if snapshot is not None:
+    if snapshot is None:
+        payload = _trend_payload_from_counters({}, score_trend=[])
+        payload["analytics_version"] = None
+        payload["stale"] = True
+    else:
         payload = dict(snapshot.payload)
-        payload["insights"] = [
-            _insight_response(insight, locale=locale) for insight in _active_insights(db, owner)
-        ]
-        return payload
+        payload["analytics_version"] = snapshot.analytics_version
+        payload["stale"] = snapshot.analytics_version != current_analytics_version(db, owner.id)
+    payload["insights"] = [
+        _insight_response(insight, locale=locale) for insight in _active_insights(db, owner)
+    ]
+    return payload
 
-    rounds = _owned_rounds(db, owner)
-    insights = _active_insights(db, owner)
-    shot_values = db.scalars(select(ShotValue).where(ShotValue.user_id == owner.id)).all()
 
-    payload = _trend_payload(rounds, shot_values)
-    payload["insights"] = [_insight_response(insight, locale=locale) for insight in insights]
-    return payload
+def rebuild_trend_snapshot(
+    db: Session,
+    *,
+    owner: User,
+    incremental: bool = True,
+) -> AnalysisSnapshot:
+    """Rebuild the trend snapshot, first recalculating the owner's pending or stale rounds.
+
+    A snapshot built around unrecalculated rounds keeps the version its counters last
+    covered, so without recalculating them the rebuilt snapshot would stay stale.
+    """
+    round_ids = _unrecalculated_round_ids(db, owner)
+    if round_ids:
+        recalculate_user_rounds(db, owner=owner, round_ids=round_ids, incremental=incremental)
+        recalculated = _latest_trend_snapshot(db, owner)
+        if recalculated is not None:
+            return recalculated
+    snapshot = _replace_snapshot(
+        db,
+        owner=owner,
+        insights=_active_insights(db, owner),
+        aggregate=_user_aggregate(db, owner, for_update=True),
+    )
+    db.commit()
+    return snapshot
 
 
-def _trend_payload(rounds: list[Round], shot_values: list[ShotValue]) -> dict[str, Any]:
-    category_totals: dict[str, dict[str, Any]] = defaultdict(
-        lambda: {"category": "", "count": 0, "total_shot_value": 0.0}
+def _trend_payload(db: Session, owner: User) -> dict[str, Any]:
+    """Build the trend payload from the full history, without the running aggregate."""
+    return _trend_payload_from_counters(
+        _full_history_counters(db, owner),
+        score_trend=_score_trend(_score_trend_rounds(db, owner)),
     )
-    for value in shot_values:
-        bucket = category_totals[value.category]
-        bucket["category"] = value.category
-        bucket["count"] += 1
-        bucket["total_shot_value"] += value.shot_value or 0
 
+
+def _full_history_counters(db: Session, owner: User) -> dict[str, Any]:
+    """Trend counters of every live round, in the running aggregate's layout.
+
+    KPIs, categories and shot-quality counters are aggregated in SQL. Only the
+    analysis items classify shot by shot, so they are summed from the stored round
+    contributions; rounds without a current one are recomputed alone.
+    """
+    items = _contribution_window(
+        db,
+        owner=owner,
+        conditions=(Round.user_id == owner.id, Round.deleted_at.is_(None)),
+        limit=None,
+    ).get("items")
+    return {
+        "rounds": _round_kpi_counters_by_query(db, owner),
+        "categories": _category_counters_by_query(db, owner),
+        "items": items or {},
+        **_shot_quality_counters_by_query(db, owner),
+    }
+
+
+def _trend_payload_from_counters(
+    counters: dict[str, Any],
+    *,
+    score_trend: list[dict[str, Any]],
+) -> dict[str, Any]:
     category_summary = []
-    for row in category_totals.values():
-        count = row["count"]
-        total = row["total_shot_value"]
+    for category, row in (counters.get("categories") or {}).items():
+        count = int(row.get("count") or 0)
+        total = float(row.get("total_shot_value") or 0)
         category_summary.append(
             {
-                **row,
+                "category": category,
+                "count": count,
+                "total_shot_value": round(total, 3),
                 "avg_shot_value": round(total / count, 3) if count else 0,
             }
         )
     category_summary.sort(key=lambda item: item["total_shot_value"])
 
     return {
-        "kpis": _kpis(rounds),
-        "score_trend": _score_trend(rounds),
+        "kpis": _kpis_from_counters(counters.get("rounds") or {}),
+        "score_trend": score_trend,
         "category_summary": category_summary,
-        "item_summary": _analysis_item_summary(rounds, shot_values),
-        "shot_quality_summary": _shot_quality_summary_for_rounds(rounds),
+        "item_summary": _analysis_item_rows(
+            counters.get("items") or {},
+            quality_denominator=int(counters.get("quality_denominator") or 0),
+        ),
+        "shot_quality_summary": _shot_quality_summary_from_counters(
+            counters.get("quality") or {}
+        ),
         "insights": [],
     }
 
@@ -180,31 +330,31 @@ def get_round_analytics(
 def compare_analytics(db: Session, *, owner: User, group_by: str = "category") -> dict[str, Any]:
     if group_by not in {"category", "club"}:
         group_by = "category"
-    shot_values = db.scalars(select(ShotValue).where(ShotValue.user_id == owner.id)).all()
-    buckets: dict[str, dict[str, Any]] = defaultdict(
-        lambda: {"label": "", "count": 0, "total": 0.0}
-    )
-    for value in shot_values:
-        label = (
-            value.category
-            if group_by == "category"
-            else str(value.payload.get("club") or "unknown")
+    label = (
+        ShotValue.category
+        if group_by == "category"
+        else func.coalesce(func.nullif(ShotValue.club, ""), "unknown")
+    ).label("label")
+    grouped = db.execute(
+        select(
+            label,
+            func.count().label("sample_count"),
+            func.coalesce(func.sum(ShotValue.shot_value), 0.0).label("total"),
         )
-        bucket = buckets[label]
-        bucket["label"] = label
-        bucket["count"] += 1
-        bucket["total"] += value.shot_value or 0
+        .where(ShotValue.user_id == owner.id)
+        .group_by(label)
+    ).all()
 
     rows = [
         {
-            "label": bucket["label"],
-            "sample_count": bucket["count"],
-            "total_shot_value": round(bucket["total"], 3),
-            "avg_shot_value": round(bucket["total"] / bucket["count"], 3)
-            if bucket["count"]
+            "label": row.label,
+            "sample_count": row.sample_count,
+            "total_shot_value": round(float(row.total), 3),
+            "avg_shot_value": round(float(row.total) / row.sample_count, 3)
+            if row.sample_count
             else 0,
         }
-        for bucket in buckets.values()
+        for row in grouped
     ]
     rows.sort(key=lambda item: item["total_shot_value"])
     return {"group_by": group_by, "rows": rows}
@@ -265,6 +415,117 @@ def active_priority_insights(
     ]
 
 
+def discard_round_contribution(db: Session, *, owner: User, round_id: uuid.UUID) -> None:
+    """Subtract a deleted round from the user's running aggregate.
+
+    The caller owns the transaction; nothing is committed here.
+    """
+    contribution = db.scalars(
+        select(RoundAnalyticsContribution).where(
+            RoundAnalyticsContribution.user_id == owner.id,
+            RoundAnalyticsContribution.round_id == round_id,
+        )
+    ).first()
+    if contribution is None:
+        return
+    aggregate = _user_aggregate(db, owner, for_update=True)
+    if aggregate is not None:
+        counters = copy.deepcopy(aggregate.payload or {})
+        _merge_counters(counters, contribution.payload or {}, sign=-1)
+        aggregate.payload = counters
+    db.delete(contribution)
+
+
+def recalculate_user_rounds(
+    db: Session,
+    *,
+    owner: User,
+    round_ids: Iterable[uuid.UUID] | None = None,
+    incremental: bool = True,
+) -> dict[str, Any]:
+    """Recalculate many rounds of one user in a single chronological sweep.
+
+    The history is loaded once and every round's prior baseline comes from a
+    sliding window over the preceding rounds. Metrics and shot values are written
+    in bulk, and insights and the trend snapshot are refreshed once at the end.
+    """
+    rounds = _owned_rounds(db, owner)
+    rounds_by_id = {round_.id: round_ for round_ in rounds}
+    target_ids = set(rounds_by_id) if round_ids is None else set(round_ids)
+    if not target_ids <= set(rounds_by_id):
+        raise AnalyticsNotFoundError
+    targets = [round_ for round_ in rounds if round_.id in target_ids]
+
+    try:
+        baselines = _store_round_baselines(
+            db,
+            owner=owner,
+            windows=_sliding_prior_windows(rounds, target_ids),
+        )
+        metric_rows: list[dict[str, Any]] = []
+        value_rows: list[dict[str, Any]] = []
+        for round_ in targets:
+            table, payload = baselines[round_.id]
+            metric_rows.extend(_round_metric_rows(round_))
+            value_rows.extend(
+                _shot_value_rows(owner, round_, expected=payload, source_scope=table.scope_key)
+            )
+            round_.computed_status = COMPUTED_STATUS_READY
+
+        bulk_delete(db, RoundMetric, RoundMetric.round_id.in_(target_ids))
+        bulk_delete(db, ShotValue, ShotValue.round_id.in_(target_ids))
+        bulk_insert(db, RoundMetric, metric_rows)
+        bulk_insert(db, ShotValue, value_rows)
+
+        if incremental:
+            shot_values = [ShotValue(**row) for row in value_rows]
+            aggregate = _rebuild_user_aggregate(
+                db,
+                owner=owner,
+                rounds=rounds,
+                contributions={
+                    round_.id: _merge_counters({}, _counters_for_rounds([round_], shot_values))
+                    for round_ in targets
+                },
+            )
+            db.flush()
+            active_insights = _replace_insights(db, owner=owner, incremental=True)
+            _replace_snapshot(db, owner=owner, insights=active_insights, aggregate=aggregate)
+        else:
+            _discard_user_aggregate(db, owner)
+            db.flush()
+            active_insights = _replace_insights(db, owner=owner)
+            _replace_snapshot(db, owner=owner, insights=active_insights)
+        db.commit()
+    except Exception as exc:
+        db.rollback()
+        db.query(Round).filter(Round.id.in_(target_ids)).update(
+            {Round.computed_status: COMPUTED_STATUS_FAILED},
+            synchronize_session=False,
+        )
+        db.add(
+            AnalysisSnapshot(
+                user_id=owner.id,
+                scope_type="job_error",
+                scope_key=f"user:{owner.id}",
+                payload={
+                    "job": "recalculate_user_rounds",
+                    "round_ids": [str(round_.id) for round_ in targets],
+                    "error": str(exc),
+                },
+            )
+        )
+        db.commit()
+        raise
+
+    return {
+        "rounds": [
+            {"round_id": round_.id, "computed_status": round_.computed_status}
+            for round_ in targets
+        ]
+    }
+
+
 def _get_round(db: Session, *, owner: User, round_id: uuid.UUID) -> Round:
     round_ = db.scalars(
         select(Round)
@@ -295,24 +556,28 @@ def _prior_rounds_for_baseline(
     rounds = db.scalars(
         select(Round)
         .options(selectinload(Round.holes).selectinload(Hole.shots))
-        .where(
-            Round.user_id == owner.id,
-            Round.deleted_at.is_(None),
-            Round.id != round_.id,
-            or_(
-                Round.play_date < round_.play_date,
-                and_(
-                    Round.play_date == round_.play_date,
-                    Round.created_at < round_.created_at,
-                ),
-            ),
-        )
+        .where(*_prior_round_conditions(owner, round_))
         .order_by(Round.play_date.desc(), Round.created_at.desc())
         .limit(limit)
     ).all()
     return list(reversed(rounds))
 
 
+def _prior_round_conditions(owner: User, round_: Round) -> tuple[Any, ...]:
+    return (
+        Round.user_id == owner.id,
+        Round.deleted_at.is_(None),
+        Round.id != round_.id,
+        or_(
+            Round.play_date < round_.play_date,
+            and_(
+                Round.play_date == round_.play_date,
+                Round.created_at < round_.created_at,
+            ),
+        ),
+    )
+
+
 def _recent_rounds(
     db: Session,
     owner: User,
@@ -329,24 +594,37 @@ def _recent_rounds(
     return list(reversed(rounds))
 
 
-def _replace_round_metrics(db: Session, round_: Round) -> list[RoundMetric]:
-    db.query(RoundMetric).filter(RoundMetric.round_id == round_.id).delete()
+def _rounds_with_shots(db: Session, round_ids: list[uuid.UUID]) -> list[Round]:
+    if not round_ids:
+        return []
+    return db.scalars(
+        select(Round)
+        .options(selectinload(Round.holes).selectinload(Hole.shots))
+        .where(Round.id.in_(round_ids))
+    ).all()
+
+
+def _replace_round_metrics(db: Session, round_: Round) -> list[dict[str, Any]]:
+    rows = _round_metric_rows(round_)
+    bulk_delete(db, RoundMetric, RoundMetric.round_id == round_.id)
+    bulk_insert(db, RoundMetric, rows)
+    return rows
+
+
+def _round_metric_rows(round_: Round) -> list[dict[str, Any]]:
     holes = sorted(round_.holes, key=lambda item: item.hole_number)
-    metrics = _round_metric_payloads(holes)
-    rows = [
-        RoundMetric(
-            user_id=round_.user_id,
-            round_id=round_.id,
-            category=metric["category"],
-            metric_key=metric["metric_key"],
-            value=metric["value"],
-            sample_count=metric["sample_count"],
-            payload=metric,
-        )
-        for metric in metrics
+    return [
+        {
+            "user_id": round_.user_id,
+            "round_id": round_.id,
+            "category": metric["category"],
+            "metric_key": metric["metric_key"],
+            "value": metric["value"],
+            "sample_count": metric["sample_count"],
+            "payload": metric,
+        }
+        for metric in _round_metric_payloads(holes)
     ]
-    db.add_all(rows)
-    return rows
 
 
 def _round_metric_payloads(holes: list[Hole]) -> list[dict[str, Any]]:
@@ -409,52 +687,284 @@ def _recalculate_round_prior_expected_table(
     *,
     owner: User,
     round_: Round,
-) -> ExpectedScoreTable:
-    rounds = _prior_rounds_for_baseline(db, owner=owner, round_=round_)
-    payload, sample_count = _expected_table_payload(rounds)
-    scope_key = _round_prior_baseline_scope_key(round_)
+    incremental: bool = False,
+) -> tuple[ExpectedScoreTable, dict[str, Any]]:
+    window_rows = db.execute(
+        select(
+            Round.id,
+            Round.computed_status,
+            RoundAnalyticsContribution.updated_at.label("contribution_updated_at"),
+        )
+        .outerjoin(
+            RoundAnalyticsContribution,
+            RoundAnalyticsContribution.round_id == Round.id,
+        )
+        .where(*_prior_round_conditions(owner, round_))
+        .order_by(Round.play_date.desc(), Round.created_at.desc())
+        .limit(PRIOR_BASELINE_ROUND_LIMIT + 1)
+    ).all()
+    counters = None
+    if incremental:
+        counters = _slide_prior_window(db, owner=owner, window_rows=window_rows)
+        if counters is None:
+            window = _contribution_window(
+                db,
+                owner=owner,
+                conditions=_prior_round_conditions(owner, round_),
+            )
+            counters = window.get("expected") or {}
+    else:
+        counters = _expected_window_counters(
+            _prior_rounds_for_baseline(db, owner=owner, round_=round_)
+        )
+    window_ids = [row.id for row in window_rows[:PRIOR_BASELINE_ROUND_LIMIT]]
+    return _store_round_baselines(db, owner=owner, windows={round_.id: (counters, window_ids)})[
+        round_.id
+    ]
 
-    table = db.scalars(
+
+def _slide_prior_window(
+    db: Session,
+    *,
+    owner: User,
+    window_rows: list[Any],
+) -> dict[str, Any] | None:
+    """Derive a prior window from the previous round's stored one.
+
+    ``window_rows`` are the round's prior rounds, newest first, plus the one that just
+    fell out of the window. The previous round's window is shifted by adding the
+    newest round's contribution and subtracting the dropped one. ``None`` means that
+    window can no longer be trusted: it covered other rounds, or one of its rounds
+    was recalculated after it was stored.
+    """
+    if not window_rows:
+        return {}
+    if any(
+        row.computed_status != COMPUTED_STATUS_READY or row.contribution_updated_at is None
+        for row in window_rows
+    ):
+        return None
+    newest = window_rows[0]
+    previous_window = window_rows[1 : PRIOR_BASELINE_ROUND_LIMIT + 1]
+    previous = db.scalars(
         select(ExpectedScoreTable).where(
             ExpectedScoreTable.user_id == owner.id,
             ExpectedScoreTable.scope_type == "round_baseline",
-            ExpectedScoreTable.scope_key == scope_key,
+            ExpectedScoreTable.scope_key == _round_prior_baseline_scope_key(newest.id),
         )
     ).first()
-    if table is None:
-        table = ExpectedScoreTable(
-            user_id=owner.id,
-            scope_type="round_baseline",
-            scope_key=scope_key,
+    if previous is None or previous.content_hash is None:
+        return None
+    if (previous.table_payload or {}).get("window_round_ids") != [
+        str(row.id) for row in previous_window
+    ]:
+        return None
+    stored_at = _as_utc(previous.updated_at)
+    if any(_as_utc(row.contribution_updated_at) > stored_at for row in previous_window):
+        return None
+    content = db.scalars(
+        select(ExpectedScoreTable).where(
+            ExpectedScoreTable.user_id == owner.id,
+            ExpectedScoreTable.scope_type == BASELINE_CONTENT_SCOPE_TYPE,
+            ExpectedScoreTable.scope_key == previous.content_hash,
         )
-        db.add(table)
-    table.sample_count = sample_count
-    table.table_payload = payload
-    return table
+    ).first()
+    if content is None:
+        return None
+
+    dropped_id = (
+        window_rows[PRIOR_BASELINE_ROUND_LIMIT].id
+        if len(window_rows) > PRIOR_BASELINE_ROUND_LIMIT
+        else None
+    )
+    contributions = dict(
+        db.execute(
+            select(RoundAnalyticsContribution.round_id, RoundAnalyticsContribution.payload).where(
+                RoundAnalyticsContribution.round_id.in_(
+                    [newest.id] if dropped_id is None else [newest.id, dropped_id]
+                )
+            )
+        ).all()
+    )
+    counters = _expected_counters_from_payload(content.table_payload)
+    _merge_counters(counters, contributions[newest.id].get("expected") or {})
+    if dropped_id is not None:
+        _merge_counters(counters, contributions[dropped_id].get("expected") or {}, sign=-1)
+    return counters
+
+
+def _sliding_prior_windows(
+    rounds: list[Round],
+    target_ids: set[uuid.UUID],
+    *,
+    limit: int = PRIOR_BASELINE_ROUND_LIMIT,
+) -> dict[uuid.UUID, tuple[dict[str, Any], list[uuid.UUID]]]:
+    """Prior-window counters and round ids (newest first) for ``target_ids``.
+
+    ``rounds`` must be sorted chronologically.
+    """
+    window: deque[tuple[uuid.UUID, dict[str, Any]]] = deque()
+    window_counters: dict[str, Any] = {}
+    windows = {}
+    for round_ in rounds:
+        if round_.id in target_ids:
+            windows[round_.id] = (
+                copy.deepcopy(window_counters),
+                [round_id for round_id, _counters in reversed(window)],
+            )
+        counters = _expected_counters(round_)
+        window.append((round_.id, counters))
+        _merge_counters(window_counters, counters)
+        if len(window) > limit:
+            _merge_counters(window_counters, window.popleft()[1], sign=-1)
+    return windows
+
+
+def _store_round_baselines(
+    db: Session,
+    *,
+    owner: User,
+    windows: dict[uuid.UUID, tuple[dict[str, Any], list[uuid.UUID]]],
+) -> dict[uuid.UUID, tuple[ExpectedScoreTable, dict[str, Any]]]:
+    """Point each round's baseline row at a shared, content-addressed expected table.
+
+    Rounds whose prior windows produce the same table share one payload row; payload
+    rows that no round points at any more are dropped.
+    """
+    baselines = {}
+    for round_id, (counters, window_ids) in windows.items():
+        payload, sample_count = _expected_payload_from_counters(counters)
+        baselines[round_id] = (payload, sample_count, _expected_content_hash(payload), window_ids)
+    if not baselines:
+        return {}
+
+    hashes = {content_hash for _payload, _count, content_hash, _ids in baselines.values()}
+    contents = {
+        table.scope_key: table
+        for table in db.scalars(
+            select(ExpectedScoreTable).where(
+                ExpectedScoreTable.user_id == owner.id,
+                ExpectedScoreTable.scope_type == BASELINE_CONTENT_SCOPE_TYPE,
+                ExpectedScoreTable.scope_key.in_(hashes),
+            )
+        ).all()
+    }
+    scope_keys = {round_id: _round_prior_baseline_scope_key(round_id) for round_id in baselines}
+    pointers = {
+        table.scope_key: table
+        for table in db.scalars(
+            select(ExpectedScoreTable).where(
+                ExpectedScoreTable.user_id == owner.id,
+                ExpectedScoreTable.scope_type == "round_baseline",
+                ExpectedScoreTable.scope_key.in_(scope_keys.values()),
+            )
+        ).all()
+    }
+
+    stored = {}
+    for round_id, (payload, sample_count, content_hash, window_ids) in baselines.items():
+        if content_hash not in contents:
+            contents[content_hash] = ExpectedScoreTable(
+                user_id=owner.id,
+                scope_type=BASELINE_CONTENT_SCOPE_TYPE,
+                scope_key=content_hash,
+                sample_count=sample_count,
+                table_payload=payload,
+            )
+            db.add(contents[content_hash])
+        pointer = pointers.get(scope_keys[round_id])
+        if pointer is None:
+            pointer = ExpectedScoreTable(
+                user_id=owner.id,
+                scope_type="round_baseline",
+                scope_key=scope_keys[round_id],
+            )
+            db.add(pointer)
+        pointer.content_hash = content_hash
+        pointer.sample_count = sample_count
+        pointer.table_payload = {"window_round_ids": [str(window_id) for window_id in window_ids]}
+        stored[round_id] = (pointer, payload)
+
+    db.flush()
+    bulk_delete(
+        db,
+        ExpectedScoreTable,
+        ExpectedScoreTable.user_id == owner.id,
+        ExpectedScoreTable.scope_type == BASELINE_CONTENT_SCOPE_TYPE,
+        ExpectedScoreTable.scope_key.not_in(
+            select(ExpectedScoreTable.content_hash).where(
+                ExpectedScoreTable.user_id == owner.id,
+                ExpectedScoreTable.scope_type == "round_baseline",
+                ExpectedScoreTable.content_hash.is_not(None),
+            )
+        ),
+    )
+    return stored
 
 
 def _expected_table_payload(rounds: list[Round]) -> tuple[dict[str, Any], int]:
-    category_samples: dict[str, list[int]] = defaultdict(list)
+    return _expected_payload_from_counters(_expected_window_counters(rounds))
+
+
+def _expected_window_counters(rounds: list[Round]) -> dict[str, Any]:
+    counters: dict[str, Any] = {}
     for round_ in rounds:
-        for hole in round_.holes:
-            remaining = hole.score or 0
-            for shot in sorted(hole.shots, key=lambda item: item.shot_number):
-                category_samples[_shot_category(shot, hole)].append(max(remaining, 0))
-                remaining -= (shot.score_cost or 1) + (shot.penalty_strokes or 0)
+        _merge_counters(counters, _expected_counters(round_))
+    return counters
 
+
+def _expected_counters(round_: Round) -> dict[str, dict[str, int]]:
+    counters: dict[str, dict[str, int]] = defaultdict(
+        lambda: {"sample_count": 0, "remaining_total": 0}
+    )
+    for hole in round_.holes:
+        remaining = hole.score or 0
+        for shot in sorted(hole.shots, key=lambda item: item.shot_number):
+            bucket = counters[_shot_category(shot, hole)]
+            bucket["sample_count"] += 1
+            bucket["remaining_total"] += max(remaining, 0)
+            remaining -= (shot.score_cost or 1) + (shot.penalty_strokes or 0)
+    return dict(counters)
+
+
+def _expected_payload_from_counters(
+    counters: dict[str, dict[str, Any]],
+) -> tuple[dict[str, Any], int]:
     payload = {
         category: {
-            "expected_strokes": round(sum(values) / len(values), 3),
-            "sample_count": len(values),
+            "expected_strokes": round(values.get("remaining_total", 0) / values["sample_count"], 3),
+            "sample_count": values["sample_count"],
+            "remaining_total": values.get("remaining_total", 0),
         }
-        for category, values in category_samples.items()
+        for category, values in counters.items()
+        if values.get("sample_count")
     }
-    sample_count = sum(len(values) for values in category_samples.values())
+    sample_count = sum(values["sample_count"] for values in payload.values())
     return payload, sample_count
 
 
-def _round_prior_baseline_scope_key(round_: Round) -> str:
-    return f"round:{round_.id}:prior_recent:{PRIOR_BASELINE_ROUND_LIMIT}"
+def _expected_counters_from_payload(payload: dict[str, Any]) -> dict[str, Any]:
+    return {
+        category: {
+            "sample_count": values["sample_count"],
+            "remaining_total": values.get("remaining_total", 0),
+        }
+        for category, values in payload.items()
+    }
+
+
+def _expected_content_hash(payload: dict[str, Any]) -> str:
+    return hashlib.sha256(
+        json.dumps(payload, sort_keys=True, separators=(",", ":")).encode()
+    ).hexdigest()
+
+
+def _round_prior_baseline_scope_key(round_id: uuid.UUID) -> str:
+    return f"round:{round_id}:prior_recent:{PRIOR_BASELINE_ROUND_LIMIT}"
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value if value.tzinfo is not None else value.replace(tzinfo=UTC)
 
 
 def _replace_shot_values(
@@ -462,19 +972,24 @@ def _replace_shot_values(
     *,
     owner: User,
     round_: Round,
-    expected_table: ExpectedScoreTable | None = None,
+    expected: dict[str, Any],
+    source_scope: str | None,
 ) -> list[ShotValue]:
-    db.query(ShotValue).filter(ShotValue.round_id == round_.id).delete()
-    table = expected_table or db.scalars(
-        select(ExpectedScoreTable).where(
-            ExpectedScoreTable.user_id == owner.id,
-            ExpectedScoreTable.scope_type == "user",
-            ExpectedScoreTable.scope_key == "all",
-        )
-    ).first()
-    expected = table.table_payload if table else {}
-    source_scope = table.scope_key if table else None
-    rows: list[ShotValue] = []
+    rows = _shot_value_rows(owner, round_, expected=expected, source_scope=source_scope)
+    bulk_delete(db, ShotValue, ShotValue.round_id == round_.id)
+    bulk_insert(db, ShotValue, rows)
+    # Transient copies for the in-memory counters; the rows themselves are already written.
+    return [ShotValue(**row) for row in rows]
+
+
+def _shot_value_rows(
+    owner: User,
+    round_: Round,
+    *,
+    expected: dict[str, Any],
+    source_scope: str | None,
+) -> list[dict[str, Any]]:
+    rows: list[dict[str, Any]] = []
     for hole in sorted(round_.holes, key=lambda item: item.hole_number):
         for shot in sorted(hole.shots, key=lambda item: item.shot_number):
             category = _shot_category(shot, hole)
@@ -488,21 +1003,22 @@ def _replace_shot_values(
                 else None
             )
             rows.append(
-                ShotValue(
-                    user_id=owner.id,
-                    round_id=round_.id,
-                    hole_id=hole.id,
-                    shot_id=shot.id,
-                    category=category,
-                    expected_before=expected_before,
-                    expected_after=expected_after,
-                    shot_cost=shot_cost,
-                    shot_value=shot_value,
-                    expected_lookup_level="category",
-                    expected_sample_count=category_expected.get("sample_count") or 0,
-                    expected_source_scope=source_scope,
-                    expected_confidence=_confidence(category_expected.get("sample_count") or 0),
-                    payload={
+                {
+                    "user_id": owner.id,
+                    "round_id": round_.id,
+                    "hole_id": hole.id,
+                    "shot_id": shot.id,
+                    "category": category,
+                    "club": shot.club,
+                    "expected_before": expected_before,
+                    "expected_after": expected_after,
+                    "shot_cost": shot_cost,
+                    "shot_value": shot_value,
+                    "expected_lookup_level": "category",
+                    "expected_sample_count": category_expected.get("sample_count") or 0,
+                    "expected_source_scope": source_scope,
+                    "expected_confidence": _confidence(category_expected.get("sample_count") or 0),
+                    "payload": {
                         "hole_number": hole.hole_number,
                         "shot_number": shot.shot_number,
                         "club": shot.club,
@@ -514,14 +1030,21 @@ def _replace_shot_values(
                         "result_grade": shot.result_grade,
                         "penalty_type": shot.penalty_type,
                     },
-                )
+                }
             )
-    db.add_all(rows)
     return rows
 
 
-def _replace_insights(db: Session, *, owner: User) -> list[Insight]:
-    candidates = _build_insight_candidates(db, owner)
+def _replace_insights(db: Session, *, owner: User, incremental: bool = False) -> list[Insight]:
+    if incremental:
+        window = _contribution_window(
+            db,
+            owner=owner,
+            conditions=(Round.user_id == owner.id, Round.deleted_at.is_(None)),
+        )
+        candidates = _insight_candidates_from_counters(window)
+    else:
+        candidates = _build_insight_candidates(db, owner)
     selected = _select_dashboard_insights(candidates, limit=3)
     selected_keys = {str(item["dedupe_key"]) for item in selected}
 
@@ -579,22 +1102,19 @@ def _select_dashboard_insights(
 def _build_insight_candidates(db: Session, owner: User) -> list[dict[str, Any]]:
     rounds = _recent_rounds(db, owner)
     round_ids = [round_.id for round_ in rounds]
-    shot_values = (
-        db.scalars(
-            select(ShotValue).where(
-                ShotValue.user_id == owner.id,
-                ShotValue.round_id.in_(round_ids),
-            )
-        ).all()
-        if round_ids
-        else []
-    )
+    shot_values = _shot_value_facts(db, owner, round_ids=round_ids) if round_ids else []
+    return _insight_candidates_from_counters(_counters_for_rounds(rounds, shot_values))
+
+
+def _insight_candidates_from_counters(counters: dict[str, Any]) -> list[dict[str, Any]]:
     candidates: list[dict[str, Any]] = []
-    penalties = sum(hole.penalties for round_ in rounds for hole in round_.holes)
-    putts = [hole.putts for round_ in rounds for hole in round_.holes if hole.putts is not None]
-    three_putts = sum(1 for putt in putts if putt >= 3)
-    avg_score = _kpis(rounds).get("average_score")
-    quality = _shot_quality_summary_for_rounds(rounds)
+    holes = counters.get("holes") or {}
+    penalties = int(holes.get("penalties") or 0)
+    putt_count = int(holes.get("putt_hole_count") or 0)
+    three_putts = int(holes.get("three_putt_count") or 0)
+    round_count = int((counters.get("rounds") or {}).get("round_count") or 0)
+    avg_score = _kpis_from_counters(counters.get("rounds") or {}).get("average_score")
+    quality = _shot_quality_summary_from_counters(counters.get("quality") or {})
     risk = quality.get("risk") or {}
 
     if penalties:
@@ -609,12 +1129,12 @@ def _build_insight_candidates(db: Session, owner: User) -> list[dict[str, Any]]:
                 evidence=f"총 {penalties}타 페널티가 기록됐습니다.",
                 impact="페널티는 회복 샷까지 비용을 키웁니다.",
                 next_action="위험 홀이 보이면 티샷 목표 폭과 세이프 클럽 기준을 먼저 정하세요.",
-                confidence=_confidence(sum(1 for round_ in rounds for hole in round_.holes)),
+                confidence=_confidence(int(holes.get("hole_count") or 0)),
                 priority_score=float(penalties),
             )
         )
-    if putts and three_putts:
-        rate = three_putts / len(putts)
+    if putt_count and three_putts:
+        rate = three_putts / putt_count
         candidates.append(
             build_insight_unit(
                 scope_type="window",
@@ -623,10 +1143,10 @@ def _build_insight_candidates(db: Session, owner: User) -> list[dict[str, Any]]:
                 root_cause="three_putt",
                 primary_evidence_metric="three_putt_rate",
                 problem="3퍼트 위험",
-                evidence=f"{len(putts)}개 퍼트 기록 중 3퍼트 이상 {three_putts}개.",
+                evidence=f"{putt_count}개 퍼트 기록 중 3퍼트 이상 {three_putts}개.",
                 impact="3퍼트는 파 세이브 흐름을 끊습니다.",
                 next_action="6-12m 래그 퍼트 거리감과 1-2m 마무리 퍼트를 묶어서 점검하세요.",
-                confidence=_confidence(len(putts)),
+                confidence=_confidence(putt_count),
                 priority_score=rate * 4,
             )
         )
@@ -677,7 +1197,7 @@ def _build_insight_candidates(db: Session, owner: User) -> list[dict[str, Any]]:
                 priority_score=min(strategy_issue_count, 10) / 3,
             )
         )
-    category_losses = _category_losses(shot_values)
+    category_losses = _category_losses(counters.get("categories") or {})
     for category, payload in category_losses[:3]:
         if payload["total"] >= 0:
             continue
@@ -709,7 +1229,7 @@ def _build_insight_candidates(db: Session, owner: User) -> list[dict[str, Any]]:
                 evidence=f"평균 스코어 {avg_score}타.",
                 impact="이 기준선에서 손실 카테고리를 좁힙니다.",
                 next_action="라운드를 더 누적한 뒤 카테고리별 shot value 신뢰도를 올리세요.",
-                confidence=_confidence(len(rounds)),
+                confidence=_confidence(round_count),
                 priority_score=0.2,
             )
         )
@@ -729,129 +1249,324 @@ def _category_label_ko(category: str) -> str:
     }.get(category, category)
 
 
-def _analysis_item_summary(
-    rounds: list[Round],
-    shot_values: list[ShotValue],
-) -> list[dict[str, Any]]:
-    shot_value_by_id = {value.shot_id: value for value in shot_values}
-    buckets: dict[tuple[str, str], dict[str, Any]] = defaultdict(
-        lambda: {
-            "group": "",
-            "item": "",
+@dataclass(slots=True)
+class ShotSummaryBatch:
+    """Shots of a set of rounds, normalized once into parallel columns.
+
+    Club, lie and grade strings are upper-cased up front and the hole-level facts the
+    counters need (made putt, up-and-down, strokes remaining) are resolved per shot,
+    so ``_summarize_shot_batch`` never walks the ORM graph again.
+    """
+
+    shot_ids: list[uuid.UUID] = field(default_factory=list)
+    clubs: list[str] = field(default_factory=list)
+    club_groups: list[str] = field(default_factory=list)
+    distances: list[int | None] = field(default_factory=list)
+    start_lies: list[str] = field(default_factory=list)
+    recovery_lies: list[bool] = field(default_factory=list)
+    end_lies: list[str] = field(default_factory=list)
+    feel_grades: list[str] = field(default_factory=list)
+    result_grades: list[str] = field(default_factory=list)
+    penalty_strokes: list[int] = field(default_factory=list)
+    penalty_types: list[str] = field(default_factory=list)
+    tee_shots: list[bool] = field(default_factory=list)
+    putts: list[bool] = field(default_factory=list)
+    quality_samples: list[bool] = field(default_factory=list)
+    putt_ok: list[bool] = field(default_factory=list)
+    putt_made: list[bool] = field(default_factory=list)
+    up_and_down: list[bool] = field(default_factory=list)
+    categories: list[str] = field(default_factory=list)
+    remaining: list[int] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.shot_ids)
+
+
+def _shot_summary_batch(rounds: list[Round]) -> ShotSummaryBatch:
+    batch = ShotSummaryBatch()
+    for round_ in rounds:
+        for hole in round_.holes:
+            remaining_by_shot: dict[int, int] = {}
+            remaining = hole.score or 0
+            for shot in sorted(hole.shots, key=lambda item: item.shot_number):
+                remaining_by_shot[id(shot)] = max(remaining, 0)
+                remaining -= (shot.score_cost or 1) + (shot.penalty_strokes or 0)
+
+            clubs = [(shot.club_normalized or shot.club or "").upper() for shot in hole.shots]
+            hole_putts = [
+                shot for shot, club in zip(hole.shots, clubs, strict=True) if club in {"P", "PT"}
+            ]
+            last_putt = max(hole_putts, key=lambda item: item.shot_number) if hole_putts else None
+            is_tee_hole = hole.par in {4, 5}
+            up_and_down = hole.score is not None and hole.score <= hole.par
+
+            for shot, club in zip(hole.shots, clubs, strict=True):
+                penalty_strokes = shot.penalty_strokes or 0
+                is_tee = shot.shot_number == 1 and is_tee_hole
+                recovery_lie = shot.start_lie in {"R", "B", "H", "O"}
+                putt_ok = "OK" in (shot.raw_text or "").upper().split() or shot.score_cost > 1
+                batch.shot_ids.append(shot.id)
+                batch.clubs.append(club)
+                batch.club_groups.append(_club_group(club))
+                batch.distances.append(shot.distance)
+                batch.start_lies.append((shot.start_lie or "").upper())
+                batch.recovery_lies.append(recovery_lie)
+                batch.end_lies.append((shot.end_lie or "").upper())
+                batch.feel_grades.append((shot.feel_grade or "").upper())
+                batch.result_grades.append((shot.result_grade or "").upper())
+                batch.penalty_strokes.append(penalty_strokes)
+                batch.penalty_types.append((shot.penalty_type or "").upper())
+                batch.tee_shots.append(is_tee)
+                batch.putts.append(club in {"P", "PT"} or "PUTT" in club)
+                batch.quality_samples.append(shot.club_normalized != "P" and shot.club != "P")
+                batch.putt_ok.append(putt_ok)
+                batch.putt_made.append(shot is last_putt and not putt_ok)
+                batch.up_and_down.append(up_and_down)
+                batch.categories.append(
+                    _classify_shot_category(
+                        club,
+                        penalty_strokes=penalty_strokes,
+                        is_tee=is_tee,
+                        recovery_lie=recovery_lie,
+                        distance=shot.distance,
+                    )
+                )
+                batch.remaining.append(remaining_by_shot[id(shot)])
+    return batch
+
+
+def _summarize_shot_batch(
+    batch: ShotSummaryBatch,
+    shot_values: Iterable[Any],
+) -> dict[str, Any]:
+    """Fill the quality, item, denominator and expected counters in one pass."""
+    values_by_shot = {value.shot_id: value.shot_value or 0 for value in shot_values}
+    quality = _empty_shot_quality_counters()
+    items: dict[str, dict[str, dict[str, Any]]] = {}
+    expected: dict[str, dict[str, int]] = {}
+    quality_denominator = 0
+
+    for index in range(len(batch)):
+        club = batch.clubs[index]
+        feel_grade = batch.feel_grades[index]
+        result_grade = batch.result_grades[index]
+        penalty_strokes = batch.penalty_strokes[index]
+        is_tee = batch.tee_shots[index]
+        feel = feel_grade if feel_grade in GRADES else None
+        result = result_grade if result_grade in GRADES else None
+
+        if club not in {"P", "PT"}:
+            quality_denominator += 1
+
+        category_bucket = expected.get(batch.categories[index])
+        if category_bucket is None:
+            category_bucket = expected[batch.categories[index]] = {
+                "sample_count": 0,
+                "remaining_total": 0,
+            }
+        category_bucket["sample_count"] += 1
+        category_bucket["remaining_total"] += batch.remaining[index]
+
+        if batch.quality_samples[index]:
+            distance = batch.distances[index]
+            _count_quality_sample(
+                quality,
+                club=club,
+                club_group=batch.club_groups[index],
+                feel=feel,
+                result=result,
+                penalized=bool(penalty_strokes),
+                is_tee=is_tee,
+                under_90=None if distance is None else distance < 90,
+            )
+
+        shot_value = values_by_shot.get(batch.shot_ids[index], 0)
+        for group, item in _batch_analysis_items(batch, index):
+            group_items = items.get(group)
+            if group_items is None:
+                group_items = items[group] = {}
+            bucket = group_items.get(item)
+            if bucket is None:
+                bucket = group_items[item] = {key: 0 for key in ITEM_COUNTERS}
+                bucket["total_shot_value"] = 0.0
+                bucket["primary_clubs"] = {}
+            bucket["count"] += 1
+            bucket["total_shot_value"] += shot_value
+            if result_grade == "C":
+                bucket["result_c_count"] += 1
+            if feel_grade == "C":
+                bucket["feel_c_count"] += 1
+            if penalty_strokes:
+                bucket["penalty_count"] += 1
+            if group == "putting":
+                if batch.putt_ok[index]:
+                    bucket["ok_count"] += 1
+                elif batch.putt_made[index]:
+                    bucket["made_count"] += 1
+            if group == "recovery":
+                if batch.end_lies[index] not in {"R", "B", "H", "O"}:
+                    bucket["recovered_count"] += 1
+                else:
+                    bucket["failed_recovery_count"] += 1
+            if group == "penalty_impact":
+                if batch.penalty_types[index] == "OB":
+                    bucket["ob_count"] += 1
+                if batch.penalty_types[index] == "H":
+                    bucket["hazard_count"] += 1
+                if feel_grade in {"A", "B"}:
+                    bucket["good_feel_penalty_count"] += 1
+            if group == "shot_quality":
+                club_group = batch.club_groups[index]
+                bucket["primary_clubs"][club_group] = bucket["primary_clubs"].get(club_group, 0) + 1
+            if group == "short_game":
+                bucket["up_and_down_chance_count"] += 1
+                if batch.up_and_down[index]:
+                    bucket["up_and_down_success_count"] += 1
+
+    return {
+        "quality": quality,
+        "items": items,
+        "quality_denominator": quality_denominator,
+        "expected": _merge_counters({}, expected),
+    }
+
+
+def _count_quality_sample(
+    quality: dict[str, Any],
+    *,
+    club: str,
+    club_group: str,
+    feel: str | None,
+    result: str | None,
+    penalized: bool,
+    is_tee: bool,
+    under_90: bool | None,
+    count: int = 1,
+) -> None:
+    """Add ``count`` identical shot-quality samples to the ``quality`` counters."""
+    risk = quality["risk"]
+    quality["sample_count"] += count
+    if feel:
+        quality["feel"][feel] += count
+    if result:
+        quality["result"][result] += count
+    if feel and result:
+        quality["matrix"][feel][result] += count
+        if feel in {"A", "B"} and result in {"A", "B"}:
+            risk["reproducible_count"] += count
+        if feel == "C" and result == "C":
+            risk["technical_miss_count"] += count
+        if feel == "C" and result in {"A", "B"}:
+            risk["lucky_result_count"] += count
+        if feel in {"A", "B"} and result == "C":
+            risk["strategy_issue_count"] += count
+    if result == "C" or penalized:
+        risk["high_risk_count"] += count
+    if is_tee:
+        if result:
+            quality["tee_result"][result] += count
+        if club == "D":
+            risk["driver_tee_shot_count"] += count
+            if result == "C":
+                risk["driver_result_c_count"] += count
+    if under_90 is not None and result:
+        if under_90:
+            quality["under_90_result"][result] += count
+        else:
+            quality["over_90_result"][result] += count
+    club_bucket = quality["club_groups"].get(club_group)
+    if club_bucket is None:
+        club_bucket = quality["club_groups"][club_group] = {
             "count": 0,
-            "total_shot_value": 0.0,
-            "result_c_count": 0,
-            "feel_c_count": 0,
+            "feel": _grade_bucket(),
+            "result": _grade_bucket(),
             "penalty_count": 0,
-            "made_count": 0,
-            "ok_count": 0,
-            "recovered_count": 0,
-            "failed_recovery_count": 0,
-            "ob_count": 0,
-            "hazard_count": 0,
-            "good_feel_penalty_count": 0,
-            "primary_clubs": defaultdict(int),
-            "up_and_down_chance_count": 0,
-            "up_and_down_success_count": 0,
         }
-    )
-    for round_ in rounds:
-        for hole in round_.holes:
-            for shot in hole.shots:
-                for group, item in _analysis_items_for_shot(shot, hole):
-                    bucket = buckets[(group, item)]
-                    bucket["group"] = group
-                    bucket["item"] = item
-                    bucket["count"] += 1
-                    shot_value = shot_value_by_id.get(shot.id)
-                    bucket["total_shot_value"] += shot_value.shot_value if shot_value else 0
-                    if (shot.result_grade or "").upper() == "C":
-                        bucket["result_c_count"] += 1
-                    if (shot.feel_grade or "").upper() == "C":
-                        bucket["feel_c_count"] += 1
-                    if shot.penalty_strokes:
-                        bucket["penalty_count"] += 1
-                    if group == "putting":
-                        if _putt_ok(shot):
-                            bucket["ok_count"] += 1
-                        elif _putt_made(shot, hole):
-                            bucket["made_count"] += 1
-                    if group == "recovery":
-                        if _recovery_success(shot):
-                            bucket["recovered_count"] += 1
-                        else:
-                            bucket["failed_recovery_count"] += 1
-                    if group == "penalty_impact":
-                        penalty_type = (shot.penalty_type or "").upper()
-                        if penalty_type == "OB":
-                            bucket["ob_count"] += 1
-                        if penalty_type == "H":
-                            bucket["hazard_count"] += 1
-                        if (shot.feel_grade or "").upper() in {"A", "B"}:
-                            bucket["good_feel_penalty_count"] += 1
-                    if group == "shot_quality":
-                        bucket["primary_clubs"][_club_group(shot.club_normalized or shot.club)] += 1
-                    if group == "short_game":
-                        bucket["up_and_down_chance_count"] += 1
-                        if _up_and_down_success(hole):
-                            bucket["up_and_down_success_count"] += 1
+    club_bucket["count"] += count
+    if feel:
+        club_bucket["feel"][feel] += count
+    if result:
+        club_bucket["result"][result] += count
+    if penalized:
+        club_bucket["penalty_count"] += count
+
+
+def _analysis_item_rows(
+    counters: dict[str, dict[str, dict[str, Any]]],
+    *,
+    quality_denominator: int,
+) -> list[dict[str, Any]]:
     rows = []
-    for bucket in buckets.values():
-        count = bucket["count"]
-        rows.append(
-            {
-                **bucket,
-                "total_shot_value": round(bucket["total_shot_value"], 3),
-                "avg_shot_value": round(bucket["total_shot_value"] / count, 3)
-                if count
-                else 0,
-                "result_c_rate": _safe_rate(bucket["result_c_count"], count),
-                "feel_c_rate": _safe_rate(bucket["feel_c_count"], count),
-                "penalty_rate": _safe_rate(bucket["penalty_count"], count),
-                "made_rate": _safe_rate(bucket["made_count"], count),
-                "ok_rate": _safe_rate(bucket["ok_count"], count),
-                "recovered_rate": _safe_rate(bucket["recovered_count"], count),
-                "failed_recovery_rate": _safe_rate(bucket["failed_recovery_count"], count),
-                "ob_rate": _safe_rate(bucket["ob_count"], count),
-                "hazard_rate": _safe_rate(bucket["hazard_count"], count),
-                "good_feel_penalty_rate": _safe_rate(bucket["good_feel_penalty_count"], count),
-                "item_rate": _safe_rate(count, _quality_denominator(rounds))
-                if bucket["group"] == "shot_quality"
-                else None,
-                "primary_club_group": _top_bucket(bucket["primary_clubs"]),
-                "up_and_down_success_rate": _safe_rate(
-                    bucket["up_and_down_success_count"],
-                    bucket["up_and_down_chance_count"],
-                ),
-            }
-        )
+    for group, items in counters.items():
+        for item, values in items.items():
+            bucket: dict[str, Any] = {"group": group, "item": item}
+            bucket.update({key: values.get(key) or 0 for key in ITEM_COUNTERS})
+            bucket["primary_clubs"] = dict(values.get("primary_clubs") or {})
+            count = bucket["count"]
+            if not count:
+                continue
+            rows.append(
+                {
+                    **bucket,
+                    "total_shot_value": round(bucket["total_shot_value"], 3),
+                    "avg_shot_value": round(bucket["total_shot_value"] / count, 3),
+                    "result_c_rate": _safe_rate(bucket["result_c_count"], count),
+                    "feel_c_rate": _safe_rate(bucket["feel_c_count"], count),
+                    "penalty_rate": _safe_rate(bucket["penalty_count"], count),
+                    "made_rate": _safe_rate(bucket["made_count"], count),
+                    "ok_rate": _safe_rate(bucket["ok_count"], count),
+                    "recovered_rate": _safe_rate(bucket["recovered_count"], count),
+                    "failed_recovery_rate": _safe_rate(bucket["failed_recovery_count"], count),
+                    "ob_rate": _safe_rate(bucket["ob_count"], count),
+                    "hazard_rate": _safe_rate(bucket["hazard_count"], count),
+                    "good_feel_penalty_rate": _safe_rate(
+                        bucket["good_feel_penalty_count"],
+                        count,
+                    ),
+                    "item_rate": _safe_rate(count, quality_denominator)
+                    if group == "shot_quality"
+                    else None,
+                    "primary_club_group": _top_bucket(bucket["primary_clubs"]),
+                    "up_and_down_success_rate": _safe_rate(
+                        bucket["up_and_down_success_count"],
+                        bucket["up_and_down_chance_count"],
+                    ),
+                }
+            )
     rows.sort(key=lambda item: (item["group"], item["total_shot_value"]))
     return rows
 
 
-def _analysis_items_for_shot(shot: Shot, hole: Hole) -> list[tuple[str, str]]:
-    club = (shot.club_normalized or shot.club or "").upper()
+def _batch_analysis_items(batch: ShotSummaryBatch, index: int) -> list[tuple[str, str]]:
+    club = batch.clubs[index]
+    distance = batch.distances[index]
     items: list[tuple[str, str]] = []
-    if club in {"P", "PT"} or "PUTT" in club:
-        items.append(("putting", _putting_item(shot.distance)))
-    elif shot.shot_number == 1 and hole.par in {4, 5}:
+    if batch.putts[index]:
+        items.append(("putting", _putting_item(distance)))
+    elif batch.tee_shots[index]:
         items.append(("off_the_tee", _tee_item(club)))
-        if shot.penalty_strokes:
-            items.append(("penalty_impact", _penalty_item(shot, is_tee=True)))
-    elif shot.penalty_strokes:
-        items.append(("penalty_impact", _penalty_item(shot, is_tee=False)))
-    elif shot.distance is not None and shot.distance < 40:
-        items.append(("short_game", _short_game_item(shot)))
-    elif shot.start_lie in {"R", "B", "H", "O"}:
-        items.append(("recovery", _recovery_item(shot)))
-    elif shot.distance is not None and shot.distance < 90:
-        items.append(("control_shot", _control_shot_item(shot.distance)))
-    elif shot.distance is not None and shot.distance >= 90:
+        if batch.penalty_strokes[index]:
+            items.append(
+                ("penalty_impact", _penalty_item(batch.penalty_types[index], is_tee=True))
+            )
+    elif batch.penalty_strokes[index]:
+        items.append(("penalty_impact", _penalty_item(batch.penalty_types[index], is_tee=False)))
+    elif distance is not None and distance < 40:
+        items.append(("short_game", _short_game_item(batch.start_lies[index], distance)))
+    elif batch.recovery_lies[index]:
+        items.append(("recovery", _recovery_item(batch.start_lies[index], distance)))
+    elif distance is not None and distance < 90:
+        items.append(("control_shot", _control_shot_item(distance)))
+    elif distance is not None and distance >= 90:
         items.append(("iron_shot", _iron_item(club)))
     else:
         items.append(("control_shot", "unknown_distance"))
 
-    quality_item = _quality_item(shot)
+    quality_item = _quality_item(
+        batch.feel_grades[index],
+        batch.result_grades[index],
+        penalty_strokes=batch.penalty_strokes[index],
+    )
     if quality_item:
         items.append(("shot_quality", quality_item))
     return items
@@ -871,26 +1586,9 @@ def _putting_item(distance: int | None) -> str:
     return "putt_20_plus"
 
 
-def _putt_ok(shot: Shot) -> bool:
-    raw_text = (shot.raw_text or "").upper()
-    return "OK" in raw_text.split() or shot.score_cost > 1
-
-
-def _putt_made(shot: Shot, hole: Hole) -> bool:
-    putts = [
-        item
-        for item in hole.shots
-        if (item.club_normalized or item.club or "").upper() in {"P", "PT"}
-    ]
-    if not putts:
-        return False
-    return shot.id == max(putts, key=lambda item: item.shot_number).id and not _putt_ok(shot)
-
-
-def _short_game_item(shot: Shot) -> str:
-    if (shot.start_lie or "").upper() == "B":
+def _short_game_item(start_lie: str, distance: int | None) -> str:
+    if start_lie == "B":
         return "greenside_bunker"
-    distance = shot.distance
     if distance is None:
         return "short_unknown"
     if distance < 10:
@@ -900,10 +1598,6 @@ def _short_game_item(shot: Shot) -> str:
     return "long_approach"
 
 
-def _up_and_down_success(hole: Hole) -> bool:
-    return hole.score is not None and hole.score <= hole.par
-
-
 def _control_shot_item(distance: int | None) -> str:
     if distance is None:
         return "control_unknown"
@@ -936,10 +1630,9 @@ def _tee_item(club: str) -> str:
     return "other_tee"
 
 
-def _recovery_item(shot: Shot) -> str:
-    start_lie = (shot.start_lie or "").upper()
+def _recovery_item(start_lie: str, distance: int | None) -> str:
     if start_lie == "B":
-        if shot.distance is not None and shot.distance < 40:
+        if distance is not None and distance < 40:
             return "greenside_bunker"
         return "fairway_bunker"
     if start_lie == "R":
@@ -947,12 +1640,7 @@ def _recovery_item(shot: Shot) -> str:
     return "other_recovery"
 
 
-def _recovery_success(shot: Shot) -> bool:
-    return (shot.end_lie or "").upper() not in {"R", "B", "H", "O"}
-
-
-def _penalty_item(shot: Shot, *, is_tee: bool) -> str:
-    penalty_type = (shot.penalty_type or "").upper()
+def _penalty_item(penalty_type: str, *, is_tee: bool) -> str:
     prefix = "tee" if is_tee else "non_tee"
     if penalty_type == "OB":
         return f"{prefix}_ob"
@@ -961,10 +1649,8 @@ def _penalty_item(shot: Shot, *, is_tee: bool) -> str:
     return f"{prefix}_other_penalty"
 
 
-def _quality_item(shot: Shot) -> str | None:
-    feel = (shot.feel_grade or "").upper()
-    result = (shot.result_grade or "").upper()
-    if result == "C" or shot.penalty_strokes:
+def _quality_item(feel: str, result: str, *, penalty_strokes: int) -> str | None:
+    if result == "C" or penalty_strokes:
         if feel in {"A", "B"} and result == "C":
             return "strategy_issue"
         if feel == "C" and result == "C":
@@ -977,16 +1663,6 @@ def _quality_item(shot: Shot) -> str | None:
     return None
 
 
-def _quality_denominator(rounds: list[Round]) -> int:
-    return sum(
-        1
-        for round_ in rounds
-        for hole in round_.holes
-        for shot in hole.shots
-        if (shot.club_normalized or shot.club or "").upper() not in {"P", "PT"}
-    )
-
-
 def _top_bucket(values: dict[str, int]) -> str | None:
     if not values:
         return None
@@ -994,81 +1670,30 @@ def _top_bucket(values: dict[str, int]) -> str | None:
 
 
 def _shot_quality_summary_for_rounds(rounds: list[Round]) -> dict[str, Any]:
-    shots = [
-        shot
-        for round_ in rounds
-        for hole in round_.holes
-        for shot in hole.shots
-        if shot.club_normalized != "P" and shot.club != "P"
-    ]
-    feel_counts = _grade_counts(shot.feel_grade for shot in shots)
-    result_counts = _grade_counts(shot.result_grade for shot in shots)
-    matrix = {feel: {result: 0 for result in ("A", "B", "C")} for feel in ("A", "B", "C")}
-    club_groups: dict[str, dict[str, Any]] = defaultdict(
-        lambda: {
-            "club_group": "",
-            "count": 0,
-            "feel": {"A": 0, "B": 0, "C": 0},
-            "result": {"A": 0, "B": 0, "C": 0},
-            "penalty_count": 0,
-        }
-    )
-    risk = {
-        "reproducible_count": 0,
-        "technical_miss_count": 0,
-        "lucky_result_count": 0,
-        "strategy_issue_count": 0,
-        "high_risk_count": 0,
-        "driver_tee_shot_count": 0,
-        "driver_result_c_count": 0,
+    summary = _summarize_shot_batch(_shot_summary_batch(rounds), ())
+    return _shot_quality_summary_from_counters(summary["quality"])
+
+
+def _empty_shot_quality_counters() -> dict[str, Any]:
+    return {
+        "sample_count": 0,
+        "feel": _grade_bucket(),
+        "result": _grade_bucket(),
+        "matrix": {feel: _grade_bucket() for feel in GRADES},
+        "risk": {key: 0 for key in QUALITY_RISK_COUNTERS},
+        "tee_result": _grade_bucket(),
+        "under_90_result": _grade_bucket(),
+        "over_90_result": _grade_bucket(),
+        "club_groups": {},
     }
-    tee_result_counts = {"A": 0, "B": 0, "C": 0}
-    under_90_result_counts = {"A": 0, "B": 0, "C": 0}
-    over_90_result_counts = {"A": 0, "B": 0, "C": 0}
 
-    for round_ in rounds:
-        for hole in round_.holes:
-            for shot in hole.shots:
-                if shot.club_normalized == "P" or shot.club == "P":
-                    continue
-                feel = _grade(shot.feel_grade)
-                result = _grade(shot.result_grade)
-                if feel and result:
-                    matrix[feel][result] += 1
-                    if feel in {"A", "B"} and result in {"A", "B"}:
-                        risk["reproducible_count"] += 1
-                    if feel == "C" and result == "C":
-                        risk["technical_miss_count"] += 1
-                    if feel == "C" and result in {"A", "B"}:
-                        risk["lucky_result_count"] += 1
-                    if feel in {"A", "B"} and result == "C":
-                        risk["strategy_issue_count"] += 1
-                if result == "C" or shot.penalty_strokes:
-                    risk["high_risk_count"] += 1
-                if shot.shot_number == 1 and hole.par in {4, 5}:
-                    if result:
-                        tee_result_counts[result] += 1
-                    if (shot.club_normalized or shot.club or "").upper() == "D":
-                        risk["driver_tee_shot_count"] += 1
-                        if result == "C":
-                            risk["driver_result_c_count"] += 1
-                if shot.distance is not None and result:
-                    if shot.distance < 90:
-                        under_90_result_counts[result] += 1
-                    else:
-                        over_90_result_counts[result] += 1
-                group = _club_group(shot.club_normalized or shot.club)
-                bucket = club_groups[group]
-                bucket["club_group"] = group
-                bucket["count"] += 1
-                if feel:
-                    bucket["feel"][feel] += 1
-                if result:
-                    bucket["result"][result] += 1
-                if shot.penalty_strokes:
-                    bucket["penalty_count"] += 1
-
-    total = len(shots)
+
+def _shot_quality_summary_from_counters(counters: dict[str, Any]) -> dict[str, Any]:
+    total = int(counters.get("sample_count") or 0)
+    matrix = counters.get("matrix") or {}
+    risk: dict[str, Any] = {
+        key: int((counters.get("risk") or {}).get(key) or 0) for key in QUALITY_RISK_COUNTERS
+    }
     risk["driver_result_c_rate"] = _safe_rate(
         risk["driver_result_c_count"],
         risk["driver_tee_shot_count"],
@@ -1078,18 +1703,34 @@ def _shot_quality_summary_for_rounds(rounds: list[Round]) -> dict[str, Any]:
     risk["lucky_result_rate"] = _safe_rate(risk["lucky_result_count"], total)
     risk["high_risk_rate"] = _safe_rate(risk["high_risk_count"], total)
 
+    club_groups = counters.get("club_groups") or {}
     return {
         "sample_count": total,
-        "feel_distribution": _distribution(feel_counts),
-        "result_distribution": _distribution(result_counts),
-        "feel_result_matrix": matrix,
+        "feel_distribution": _distribution(_grade_bucket(counters.get("feel"))),
+        "result_distribution": _distribution(_grade_bucket(counters.get("result"))),
+        "feel_result_matrix": {
+            feel: _grade_bucket(matrix.get(feel)) for feel in ("A", "B", "C")
+        },
         "risk": risk,
-        "tee_result_distribution": _distribution(tee_result_counts),
-        "under_90_result_distribution": _distribution(under_90_result_counts),
-        "over_90_result_distribution": _distribution(over_90_result_counts),
+        "tee_result_distribution": _distribution(_grade_bucket(counters.get("tee_result"))),
+        "under_90_result_distribution": _distribution(
+            _grade_bucket(counters.get("under_90_result"))
+        ),
+        "over_90_result_distribution": _distribution(
+            _grade_bucket(counters.get("over_90_result"))
+        ),
         "club_groups": [
-            _club_group_summary(bucket)
-            for bucket in sorted(club_groups.values(), key=lambda item: item["club_group"])
+            _club_group_summary(
+                {
+                    "club_group": group,
+                    "count": int(club_groups[group].get("count") or 0),
+                    "feel": _grade_bucket(club_groups[group].get("feel")),
+                    "result": _grade_bucket(club_groups[group].get("result")),
+                    "penalty_count": int(club_groups[group].get("penalty_count") or 0),
+                }
+            )
+            for group in sorted(club_groups)
+            if club_groups[group].get("count")
         ],
     }
 
@@ -1104,13 +1745,9 @@ def _club_group_summary(bucket: dict[str, Any]) -> dict[str, Any]:
     }
 
 
-def _grade_counts(values: Any) -> dict[str, int]:
-    counts = {"A": 0, "B": 0, "C": 0}
-    for value in values:
-        grade = _grade(value)
-        if grade:
-            counts[grade] += 1
-    return counts
+def _grade_bucket(counts: dict[str, int] | None = None) -> dict[str, int]:
+    counts = counts or {}
+    return {grade: int(counts.get(grade) or 0) for grade in GRADES}
 
 
 def _distribution(counts: dict[str, int]) -> dict[str, Any]:
@@ -1122,11 +1759,6 @@ def _distribution(counts: dict[str, int]) -> dict[str, Any]:
     }
 
 
-def _grade(value: str | None) -> str | None:
-    normalized = (value or "").upper()
-    return normalized if normalized in {"A", "B", "C"} else None
-
-
 def _club_group(club: str | None) -> str:
     normalized = (club or "").upper()
     if normalized == "D":
@@ -1154,12 +1786,29 @@ def _number_or_none(value: object) -> float | None:
     return float(value) if isinstance(value, int | float) else None
 
 
-def _replace_snapshot(db: Session, *, owner: User, insights: list[Insight]) -> AnalysisSnapshot:
+def _replace_snapshot(
+    db: Session,
+    *,
+    owner: User,
+    insights: list[Insight],
+    aggregate: UserAnalyticsAggregate | None = None,
+) -> AnalysisSnapshot:
     db.flush()
-    rounds = _owned_rounds(db, owner)
-    shot_values = db.scalars(select(ShotValue).where(ShotValue.user_id == owner.id)).all()
-    payload = _trend_payload(rounds, shot_values)
+    if aggregate is not None:
+        payload = _trend_payload_from_counters(
+            aggregate.payload or {},
+            score_trend=_score_trend(_score_trend_rounds(db, owner)),
+        )
+    else:
+        payload = _trend_payload(db, owner)
     payload["insight_ids"] = [str(insight.id) for insight in insights]
+    analytics_version = current_analytics_version(db, owner.id)
+    if aggregate is not None:
+        if _has_unrecalculated_rounds(db, owner):
+            # Edits to these rounds are not in the counters yet; keep the version the
+            # aggregate last fully covered so the snapshot reads as stale.
+            analytics_version = aggregate.analytics_version or 0
+        aggregate.analytics_version = analytics_version
     db.query(AnalysisSnapshot).filter(
         AnalysisSnapshot.user_id == owner.id,
         AnalysisSnapshot.scope_type == "analytics_trends",
@@ -1169,14 +1818,38 @@ def _replace_snapshot(db: Session, *, owner: User, insights: list[Insight]) -> A
         user_id=owner.id,
         scope_type="analytics_trends",
         scope_key="all",
+        analytics_version=analytics_version,
         payload=payload,
     )
     db.add(snapshot)
     return snapshot
 
 
+def _has_unrecalculated_rounds(db: Session, owner: User) -> bool:
+    return bool(_unrecalculated_round_ids(db, owner, limit=1))
+
+
+def _unrecalculated_round_ids(
+    db: Session,
+    owner: User,
+    *,
+    limit: int | None = None,
+) -> list[uuid.UUID]:
+    return list(
+        db.scalars(
+            select(Round.id)
+            .where(
+                Round.user_id == owner.id,
+                Round.deleted_at.is_(None),
+                Round.computed_status.in_((COMPUTED_STATUS_PENDING, COMPUTED_STATUS_STALE)),
+            )
+            .limit(limit)
+        ).all()
+    )
+
+
 def _latest_trend_snapshot(db: Session, owner: User) -> AnalysisSnapshot | None:
-    snapshot = db.scalars(
+    return db.scalars(
         select(AnalysisSnapshot)
         .where(
             AnalysisSnapshot.user_id == owner.id,
@@ -1186,17 +1859,6 @@ def _latest_trend_snapshot(db: Session, owner: User) -> AnalysisSnapshot | None:
         .order_by(AnalysisSnapshot.created_at.desc())
         .limit(1)
     ).first()
-    if snapshot is None:
-        return None
-    changed_round_id = db.scalar(
-        select(Round.id)
-        .where(
-            Round.user_id == owner.id,
-            Round.updated_at > snapshot.created_at,
-        )
-        .limit(1)
-    )
-    return None if changed_round_id is not None else snapshot
 
 
 def _active_insights(db: Session, owner: User) -> list[Insight]:
@@ -1243,45 +1905,540 @@ def _score_trend(rounds: list[Round]) -> list[dict[str, Any]]:
     ][-10:]
 
 
-def _kpis(rounds: list[Round]) -> dict[str, Any]:
-    completed = [round_ for round_ in rounds if round_.total_score is not None]
-    scores = [round_.total_score for round_ in completed if round_.total_score is not None]
-    putt_totals = [
-        sum(hole.putts for hole in round_.holes if hole.putts is not None)
-        for round_ in rounds
-        if any(hole.putts is not None for hole in round_.holes)
-    ]
-    return {
+def _round_kpi_counters(rounds: list[Round]) -> dict[str, Any]:
+    counters: dict[str, Any] = {
         "round_count": len(rounds),
-        "average_score": round(sum(scores) / len(scores), 1) if scores else None,
+        "completed_count": 0,
+        "score_total": 0,
+        "score_counts": defaultdict(int),
+        "putt_round_count": 0,
+        "putts_total": 0,
+    }
+    for round_ in rounds:
+        if round_.total_score is not None:
+            counters["completed_count"] += 1
+            counters["score_total"] += round_.total_score
+            counters["score_counts"][str(round_.total_score)] += 1
+        putts = [hole.putts for hole in round_.holes if hole.putts is not None]
+        if putts:
+            counters["putt_round_count"] += 1
+            counters["putts_total"] += sum(putts)
+    counters["score_counts"] = dict(counters["score_counts"])
+    return counters
+
+
+def _round_kpi_counters_by_query(db: Session, owner: User) -> dict[str, Any]:
+    """``_round_kpi_counters`` for every live round, grouped in SQL."""
+    live = (Round.user_id == owner.id, Round.deleted_at.is_(None))
+    totals = db.execute(
+        select(
+            func.count(Round.id).label("round_count"),
+            func.count(Round.total_score).label("completed_count"),
+            func.coalesce(func.sum(Round.total_score), 0).label("score_total"),
+        ).where(*live)
+    ).one()
+    score_counts = db.execute(
+        select(Round.total_score, func.count())
+        .where(*live, Round.total_score.is_not(None))
+        .group_by(Round.total_score)
+    ).all()
+    round_putts = (
+        select(func.sum(Hole.putts).label("putts"))
+        .join(Round, Round.id == Hole.round_id)
+        .where(*live, Hole.putts.is_not(None))
+        .group_by(Hole.round_id)
+        .subquery()
+    )
+    putts = db.execute(
+        select(
+            func.count().label("putt_round_count"),
+            func.coalesce(func.sum(round_putts.c.putts), 0).label("putts_total"),
+        )
+    ).one()
+    return {
+        "round_count": totals.round_count,
+        "completed_count": totals.completed_count,
+        "score_total": int(totals.score_total),
+        "score_counts": {str(score): count for score, count in score_counts},
+        "putt_round_count": putts.putt_round_count,
+        "putts_total": int(putts.putts_total),
+    }
+
+
+def _kpis_from_counters(counters: dict[str, Any]) -> dict[str, Any]:
+    completed = int(counters.get("completed_count") or 0)
+    putt_rounds = int(counters.get("putt_round_count") or 0)
+    scores = [int(score) for score, count in (counters.get("score_counts") or {}).items() if count]
+    return {
+        "round_count": int(counters.get("round_count") or 0),
+        "average_score": (
+            round((counters.get("score_total") or 0) / completed, 1) if completed else None
+        ),
         "best_score": min(scores) if scores else None,
-        "average_putts": round(sum(putt_totals) / len(putt_totals), 1) if putt_totals else None,
+        "average_putts": (
+            round((counters.get("putts_total") or 0) / putt_rounds, 1) if putt_rounds else None
+        ),
+    }
+
+
+def _hole_counters(rounds: list[Round]) -> dict[str, int]:
+    holes = [hole for round_ in rounds for hole in round_.holes]
+    putts = [hole.putts for hole in holes if hole.putts is not None]
+    return {
+        "hole_count": len(holes),
+        "penalties": sum(hole.penalties for hole in holes),
+        "putt_hole_count": len(putts),
+        "three_putt_count": sum(1 for putt in putts if putt >= 3),
     }
 
 
-def _category_losses(shot_values: list[ShotValue]) -> list[tuple[str, dict[str, Any]]]:
-    buckets: dict[str, dict[str, Any]] = defaultdict(lambda: {"count": 0, "total": 0.0})
+def _category_counters(shot_values: Iterable[ShotValue]) -> dict[str, dict[str, Any]]:
+    counters: dict[str, dict[str, Any]] = defaultdict(
+        lambda: {"count": 0, "total_shot_value": 0.0}
+    )
     for value in shot_values:
-        buckets[value.category]["count"] += 1
-        buckets[value.category]["total"] += value.shot_value or 0
-    return sorted(buckets.items(), key=lambda item: item[1]["total"])
+        counters[value.category]["count"] += 1
+        counters[value.category]["total_shot_value"] += value.shot_value or 0
+    return dict(counters)
+
+
+def _category_counters_by_query(db: Session, owner: User) -> dict[str, dict[str, Any]]:
+    rows = db.execute(
+        select(
+            ShotValue.category,
+            func.count().label("count"),
+            func.coalesce(func.sum(ShotValue.shot_value), 0.0).label("total_shot_value"),
+        )
+        .join(Round, Round.id == ShotValue.round_id)
+        .where(ShotValue.user_id == owner.id, Round.deleted_at.is_(None))
+        .group_by(ShotValue.category)
+    ).all()
+    return {
+        row.category: {"count": row.count, "total_shot_value": float(row.total_shot_value)}
+        for row in rows
+    }
+
+
+def _shot_quality_counters_by_query(db: Session, owner: User) -> dict[str, Any]:
+    """Shot-quality counters and their denominator for every live round.
+
+    Shots are grouped in SQL by every input the quality counters branch on, so Python
+    only folds one row per distinct combination.
+    """
+    club = func.upper(func.coalesce(func.nullif(Shot.club_normalized, ""), Shot.club, ""))
+    keys = (
+        club.label("club"),
+        func.upper(func.coalesce(Shot.feel_grade, "")).label("feel"),
+        func.upper(func.coalesce(Shot.result_grade, "")).label("result"),
+        (func.coalesce(Shot.penalty_strokes, 0) != 0).label("penalized"),
+        and_(Shot.shot_number == 1, Hole.par.in_((4, 5))).label("is_tee"),
+        case(
+            (Shot.distance.is_(None), None),
+            (Shot.distance < 90, True),
+            else_=False,
+        ).label("under_90"),
+        and_(
+            func.coalesce(Shot.club_normalized, "") != "P",
+            func.coalesce(Shot.club, "") != "P",
+        ).label("quality_sample"),
+    )
+    rows = db.execute(
+        select(*keys, func.count().label("count"))
+        .join(Hole, Hole.id == Shot.hole_id)
+        .join(Round, Round.id == Shot.round_id)
+        .where(Round.user_id == owner.id, Round.deleted_at.is_(None))
+        .group_by(*(key.element for key in keys))
+    ).all()
+    quality = _empty_shot_quality_counters()
+    quality_denominator = 0
+    for row in rows:
+        if row.club not in {"P", "PT"}:
+            quality_denominator += row.count
+        if not row.quality_sample:
+            continue
+        _count_quality_sample(
+            quality,
+            club=row.club,
+            club_group=_club_group(row.club),
+            feel=row.feel if row.feel in GRADES else None,
+            result=row.result if row.result in GRADES else None,
+            penalized=bool(row.penalized),
+            is_tee=bool(row.is_tee),
+            under_90=None if row.under_90 is None else bool(row.under_90),
+            count=row.count,
+        )
+    return {"quality": quality, "quality_denominator": quality_denominator}
+
+
+def _shot_value_facts(
+    db: Session,
+    owner: User,
+    *,
+    round_ids: list[uuid.UUID] | None = None,
+) -> list[Any]:
+    """Lightweight (shot_id, round_id, category, shot_value) rows for one user."""
+    query = select(
+        ShotValue.shot_id,
+        ShotValue.round_id,
+        ShotValue.category,
+        ShotValue.shot_value,
+    ).where(ShotValue.user_id == owner.id)
+    if round_ids is not None:
+        query = query.where(ShotValue.round_id.in_(round_ids))
+    return db.execute(query).all()
+
+
+def _category_losses(
+    categories: dict[str, dict[str, Any]],
+) -> list[tuple[str, dict[str, Any]]]:
+    buckets = [
+        (
+            category,
+            {
+                "count": int(values.get("count") or 0),
+                "total": float(values.get("total_shot_value") or 0),
+            },
+        )
+        for category, values in categories.items()
+        if values.get("count")
+    ]
+    return sorted(buckets, key=lambda item: item[1]["total"])
+
+
+def _counters_for_rounds(
+    rounds: list[Round],
+    shot_values: Iterable[Any],
+    *,
+    categories: dict[str, dict[str, Any]] | None = None,
+) -> dict[str, Any]:
+    """Additive analytics counters for a set of rounds.
+
+    Every leaf is a count or a sum, so the counters of disjoint round sets can be
+    merged and subtracted with ``_merge_counters``. Callers that already grouped the
+    category sums in SQL for exactly these rounds pass them as ``categories``.
+    """
+    round_ids = {round_.id for round_ in rounds}
+    values = [value for value in shot_values if value.round_id in round_ids]
+    summary = _summarize_shot_batch(_shot_summary_batch(rounds), values)
+    return {
+        "rounds": _round_kpi_counters(rounds),
+        "holes": _hole_counters(rounds),
+        "categories": _category_counters(values) if categories is None else categories,
+        "expected": summary["expected"],
+        "quality": summary["quality"],
+        "items": summary["items"],
+        "quality_denominator": summary["quality_denominator"],
+    }
+
+
+def _merge_counters(
+    target: dict[str, Any],
+    delta: dict[str, Any],
+    *,
+    sign: int = 1,
+) -> dict[str, Any]:
+    for key, value in delta.items():
+        if isinstance(value, dict):
+            child = _merge_counters(dict(target.get(key) or {}), value, sign=sign)
+            if child:
+                target[key] = child
+            else:
+                target.pop(key, None)
+            continue
+        total = (target.get(key) or 0) + sign * (value or 0)
+        if abs(total) < COUNTER_EPSILON:
+            target.pop(key, None)
+        else:
+            target[key] = total
+    return target
+
+
+def _user_aggregate(
+    db: Session,
+    owner: User,
+    *,
+    for_update: bool = False,
+) -> UserAnalyticsAggregate | None:
+    query = select(UserAnalyticsAggregate).where(UserAnalyticsAggregate.user_id == owner.id)
+    if for_update:
+        query = query.with_for_update().execution_options(populate_existing=True)
+    return db.scalars(query).first()
+
+
+def _locked_user_aggregate(db: Session, owner: User) -> tuple[UserAnalyticsAggregate, bool]:
+    """Lock the user's aggregate row until commit, creating it when missing.
+
+    Jobs for the same user (RQ, the inline fallback, the batch pool) serialize on this
+    row, so each merges its delta into the counters the previous one committed.
+    Returns the row and whether this call created it.
+    """
+    created = _insert_user_aggregate(db, owner)
+    aggregate = db.scalars(
+        select(UserAnalyticsAggregate)
+        .where(UserAnalyticsAggregate.user_id == owner.id)
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    ).one()
+    return aggregate, created
+
+
+def _insert_user_aggregate(db: Session, owner: User) -> bool:
+    """Insert an empty aggregate row unless one exists; return whether this call did."""
+    connection = db.connection()
+    table = UserAnalyticsAggregate.__table__
+    values = {"user_id": owner.id, "payload": {}, "analytics_version": 0}
+    dialect = connection.dialect.name
+    if dialect in {"postgresql", "sqlite"}:
+        dialect_insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        result = connection.execute(
+            dialect_insert(table).values(**values).on_conflict_do_nothing(
+                index_elements=[table.c.user_id]
+            )
+        )
+        return bool(result.rowcount)
+    if _user_aggregate(db, owner) is not None:
+        return False
+    connection.execute(table.insert().values(**values))
+    return True
+
+
+def _apply_round_contribution(
+    db: Session,
+    *,
+    owner: User,
+    round_: Round,
+    shot_values: list[ShotValue],
+) -> UserAnalyticsAggregate:
+    aggregate = _sync_user_aggregate(db, owner=owner, skip_round_id=round_.id)
+    counters = copy.deepcopy(aggregate.payload or {})
+    contribution = db.scalars(
+        select(RoundAnalyticsContribution).where(
+            RoundAnalyticsContribution.round_id == round_.id
+        )
+    ).first()
+    if contribution is None:
+        contribution = RoundAnalyticsContribution(user_id=owner.id, round_id=round_.id)
+        db.add(contribution)
+    else:
+        _merge_counters(counters, contribution.payload or {}, sign=-1)
+    contribution.payload = _merge_counters({}, _counters_for_rounds([round_], shot_values))
+    _merge_counters(counters, contribution.payload)
+    aggregate.payload = counters
+    return aggregate
+
+
+def _sync_user_aggregate(
+    db: Session,
+    *,
+    owner: User,
+    skip_round_id: uuid.UUID | None = None,
+) -> UserAnalyticsAggregate:
+    """Bring the running aggregate in line with the user's live rounds.
+
+    Contributions of soft-deleted rounds are subtracted and rounds that were never
+    folded in are added. A missing aggregate is rebuilt once from the full history.
+    The aggregate row stays locked until the caller commits.
+    """
+    aggregate, created = _locked_user_aggregate(db, owner)
+    if created:
+        db.query(RoundAnalyticsContribution).filter(
+            RoundAnalyticsContribution.user_id == owner.id
+        ).delete(synchronize_session=False)
+    counters = copy.deepcopy(aggregate.payload or {})
+
+    retired = db.scalars(
+        select(RoundAnalyticsContribution)
+        .join(Round, Round.id == RoundAnalyticsContribution.round_id)
+        .where(
+            RoundAnalyticsContribution.user_id == owner.id,
+            Round.deleted_at.is_not(None),
+        )
+    ).all()
+    for contribution in retired:
+        _merge_counters(counters, contribution.payload or {}, sign=-1)
+        db.delete(contribution)
+
+    missing_query = (
+        select(Round.id)
+        .outerjoin(
+            RoundAnalyticsContribution,
+            RoundAnalyticsContribution.round_id == Round.id,
+        )
+        .where(
+            Round.user_id == owner.id,
+            Round.deleted_at.is_(None),
+            RoundAnalyticsContribution.id.is_(None),
+        )
+    )
+    if skip_round_id is not None:
+        missing_query = missing_query.where(Round.id != skip_round_id)
+    missing_ids = list(db.scalars(missing_query).all())
+    if missing_ids:
+        shot_values = db.scalars(
+            select(ShotValue).where(ShotValue.round_id.in_(missing_ids))
+        ).all()
+        for missing_round in _rounds_with_shots(db, missing_ids):
+            payload = _merge_counters({}, _counters_for_rounds([missing_round], shot_values))
+            db.add(
+                RoundAnalyticsContribution(
+                    user_id=owner.id,
+                    round_id=missing_round.id,
+                    payload=payload,
+                )
+            )
+            _merge_counters(counters, payload)
+
+    aggregate.payload = counters
+    return aggregate
+
+
+def _rebuild_user_aggregate(
+    db: Session,
+    *,
+    owner: User,
+    rounds: list[Round],
+    contributions: dict[uuid.UUID, dict[str, Any]],
+) -> UserAnalyticsAggregate:
+    """Rebuild the running aggregate from fresh ``contributions`` plus stored ones.
+
+    Live rounds without a stored or fresh contribution are computed from
+    ``rounds`` and their shot values; contributions of deleted rounds are dropped.
+    """
+    aggregate, _ = _locked_user_aggregate(db, owner)
+    stored = dict(
+        db.execute(
+            select(RoundAnalyticsContribution.round_id, RoundAnalyticsContribution.payload).where(
+                RoundAnalyticsContribution.user_id == owner.id
+            )
+        ).all()
+    )
+    live_ids = {round_.id for round_ in rounds}
+    missing = [
+        round_ for round_ in rounds if round_.id not in contributions and round_.id not in stored
+    ]
+    if missing:
+        shot_values = db.scalars(
+            select(ShotValue).where(ShotValue.round_id.in_([round_.id for round_ in missing]))
+        ).all()
+        for round_ in missing:
+            contributions[round_.id] = _merge_counters(
+                {},
+                _counters_for_rounds([round_], shot_values),
+            )
+
+    stale_ids = (set(stored) & set(contributions)) | (set(stored) - live_ids)
+    if stale_ids:
+        db.query(RoundAnalyticsContribution).filter(
+            RoundAnalyticsContribution.round_id.in_(stale_ids)
+        ).delete(synchronize_session=False)
+    if contributions:
+        db.execute(
+            insert(RoundAnalyticsContribution),
+            [
+                {"user_id": owner.id, "round_id": round_id, "payload": payload}
+                for round_id, payload in contributions.items()
+            ],
+        )
+
+    counters: dict[str, Any] = {}
+    for round_ in rounds:
+        _merge_counters(counters, contributions.get(round_.id) or stored.get(round_.id) or {})
+    aggregate.payload = counters
+    return aggregate
+
+
+def _discard_user_aggregate(db: Session, owner: User) -> None:
+    db.query(RoundAnalyticsContribution).filter(
+        RoundAnalyticsContribution.user_id == owner.id
+    ).delete(synchronize_session=False)
+    db.query(UserAnalyticsAggregate).filter(
+        UserAnalyticsAggregate.user_id == owner.id
+    ).delete(synchronize_session=False)
+
+
+def _contribution_window(
+    db: Session,
+    *,
+    owner: User,
+    conditions: tuple[Any, ...],
+    limit: int | None = PRIOR_BASELINE_ROUND_LIMIT,
+) -> dict[str, Any]:
+    """Sum stored round contributions for the most recent rounds matching ``conditions``.
+
+    ``limit=None`` sums every matching round.
+
+    Rounds whose contribution is missing or out of date are recomputed from their
+    holes and shots, so only those rounds are loaded.
+    """
+    rows = db.execute(
+        select(Round.id, Round.computed_status, RoundAnalyticsContribution.payload)
+        .outerjoin(
+            RoundAnalyticsContribution,
+            RoundAnalyticsContribution.round_id == Round.id,
+        )
+        .where(*conditions)
+        .order_by(Round.play_date.desc(), Round.created_at.desc())
+        .limit(limit)
+    ).all()
+    counters: dict[str, Any] = {}
+    reload_ids = []
+    for round_id, computed_status, payload in rows:
+        if payload is None or computed_status != COMPUTED_STATUS_READY:
+            reload_ids.append(round_id)
+        else:
+            _merge_counters(counters, payload)
+    if reload_ids:
+        rounds = _rounds_with_shots(db, reload_ids)
+        shot_values = db.scalars(select(ShotValue).where(ShotValue.round_id.in_(reload_ids))).all()
+        _merge_counters(counters, _counters_for_rounds(rounds, shot_values))
+    return counters
+
+
+def _score_trend_rounds(db: Session, owner: User) -> list[Round]:
+    rounds = db.scalars(
+        select(Round)
+        .where(
+            Round.user_id == owner.id,
+            Round.deleted_at.is_(None),
+            Round.total_score.is_not(None),
+        )
+        .order_by(Round.play_date.desc(), Round.created_at.desc())
+        .limit(10)
+    ).all()
+    return list(reversed(rounds))
 
 
 def _shot_category(shot: Shot, hole: Hole) -> str:
-    club = (shot.club_normalized or shot.club or "").upper()
-    if shot.penalty_strokes:
+    return _classify_shot_category(
+        (shot.club_normalized or shot.club or "").upper(),
+        penalty_strokes=shot.penalty_strokes or 0,
+        is_tee=shot.shot_number == 1 and hole.par in {4, 5},
+        recovery_lie=shot.start_lie in {"R", "B", "H", "O"},
+        distance=shot.distance,
+    )
+
+
+def _classify_shot_category(
+    club: str,
+    *,
+    penalty_strokes: int,
+    is_tee: bool,
+    recovery_lie: bool,
+    distance: int | None,
+) -> str:
+    if penalty_strokes:
         return "penalty_impact"
     if club in {"P", "PT"} or "PUTT" in club:
         return "putting"
-    if shot.shot_number == 1 and hole.par in {4, 5}:
+    if is_tee:
         return "off_the_tee"
-    if shot.start_lie in {"R", "B", "H", "O"}:
+    if recovery_lie:
         return "recovery"
-    if shot.distance is not None and shot.distance < 40:
+    if distance is not None and distance < 40:
         return "short_game"
-    if shot.distance is not None and shot.distance < 90:
+    if distance is not None and distance < 90:
         return "control_shot"
-    if shot.distance is not None and shot.distance >= 90:
+    if distance is not None and distance >= 90:
         return "iron_shot"
     return "control_shot"
 
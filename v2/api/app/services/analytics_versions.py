@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import uuid
+from collections.abc import Iterable
+from typing import Any
+
+from sqlalchemy import event, inspect, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.db.session import SessionLocal
+from app.models import AnalysisSnapshot, Hole, Insight, Round, Shot, UserAnalyticsVersion
+from app.models.mixins import utc_now
+
+# Snapshot scope of the per-user dashboard document built in app.services.rounds.
+DASHBOARD_SCOPE_TYPE = "dashboard_summary"
+VERSIONED_MODELS = (Round, Hole, Shot, Insight)
+# Bookkeeping columns the analytics pipeline writes itself, and the sharing and
+# notes columns of a round; changing them does not change what a trend snapshot
+# would contain. The dashboard lists sharing state and is refreshed by its writers.
+VERSION_NEUTRAL_ATTRIBUTES = frozenset(
+    {
+        "computed_status",
+        "updated_at",
+        "visibility",
+        "share_course",
+        "share_exact_date",
+        "social_published_at",
+        "notes_private",
+        "notes_public",
+    }
+)
+
+
+def current_analytics_version(db: Session, user_id: uuid.UUID) -> int:
+    version = db.scalar(
+        select(UserAnalyticsVersion.version).where(UserAnalyticsVersion.user_id == user_id)
+    )
+    return version or 0
+
+
+def bump_analytics_versions(db: Session, user_ids: Iterable[uuid.UUID]) -> None:
+    """Increment each user's analytics version inside the caller's transaction."""
+    connection = db.connection()
+    table = UserAnalyticsVersion.__table__
+    now = utc_now()
+    dialect = connection.dialect.name
+    for user_id in sorted(set(user_ids)):
+        if dialect in {"postgresql", "sqlite"}:
+            dialect_insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+            statement = dialect_insert(table).values(user_id=user_id, version=1, updated_at=now)
+            connection.execute(
+                statement.on_conflict_do_update(
+                    index_elements=[table.c.user_id],
+                    set_={"version": table.c.version + 1, "updated_at": now},
+                )
+            )
+            continue
+        result = connection.execute(
+            update(table)
+            .where(table.c.user_id == user_id)
+            .values(version=table.c.version + 1, updated_at=now)
+        )
+        if not result.rowcount:
+            connection.execute(table.insert().values(user_id=user_id, version=1, updated_at=now))
+
+
+def invalidate_dashboard_documents(db: Session, user_ids: Iterable[uuid.UUID]) -> None:
+    """Mark the users' dashboard documents stale without bumping their analytics version."""
+    table = AnalysisSnapshot.__table__
+    db.connection().execute(
+        update(table)
+        .where(
+            table.c.user_id.in_(sorted(set(user_ids))),
+            table.c.scope_type == DASHBOARD_SCOPE_TYPE,
+        )
+        .values(analytics_version=None)
+    )
+
+
+def track_analytics_versions(session_factory: sessionmaker[Session]) -> None:
+    """Bump analytics versions on every flush of the sessions ``session_factory`` makes.
+
+    The listener is attached per session factory rather than to ``Session`` itself,
+    so only sessions that write user analytics scan their pending changes. The app's
+    ``SessionLocal``, shared by the API, the worker and the scripts, is tracked below.
+    """
+    if not event.contains(session_factory, "before_flush", _bump_versions_before_flush):
+        event.listen(session_factory, "before_flush", _bump_versions_before_flush)
+
+
+def _bump_versions_before_flush(session: Session, _flush_context: Any, _instances: Any) -> None:
+    user_ids = _versioned_user_ids(session)
+    if user_ids:
+        bump_analytics_versions(session, user_ids)
+    # A round's status is version neutral, but the dashboard lists it.
+    status_user_ids = _status_changed_user_ids(session) - user_ids
+    if status_user_ids:
+        invalidate_dashboard_documents(session, status_user_ids)
+
+
+def _versioned_user_ids(session: Session) -> set[uuid.UUID]:
+    user_ids = {
+        instance.user_id
+        for instance in (*session.new, *session.deleted)
+        if isinstance(instance, VERSIONED_MODELS) and instance.user_id is not None
+    }
+    for instance in session.dirty:
+        if isinstance(instance, VERSIONED_MODELS) and _has_versioned_changes(instance):
+            user_ids.add(instance.user_id)
+    return user_ids
+
+
+def _status_changed_user_ids(session: Session) -> set[uuid.UUID]:
+    return {
+        instance.user_id
+        for instance in session.dirty
+        if isinstance(instance, Round)
+        and inspect(instance).attrs.computed_status.history.has_changes()
+    }
+
+
+def _has_versioned_changes(instance: Any) -> bool:
+    state = inspect(instance)
+    return any(
+        attribute.key not in VERSION_NEUTRAL_ATTRIBUTES and attribute.history.has_changes()
+        for attribute in state.attrs
+    )
+
+
+track_analytics_versions(SessionLocal)
@@ -12,6 +12,7 @@ from app.core.security import (
     verify_password,
 )
 from app.models import User, UserProfile, UserSession
+from app.services.session_cache import invalidate_session_token
 
 
 class DuplicateEmailError(Exception):
@@ -128,3 +129,4 @@ def revoke_session(db: Session, *, token: str, settings: Settings) -> None:
     if session is not None:
         session.revoked_at = datetime.now(UTC)
         db.commit()
+    invalidate_session_token(token_hash, settings=settings)
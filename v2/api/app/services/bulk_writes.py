@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import JSON, Column, ColumnElement, Table, delete, insert
+from sqlalchemy.orm import Session
+
+from app.core.config import Settings, get_settings
+from app.db.base import Base
+from app.services.analytics_versions import VERSIONED_MODELS, bump_analytics_versions
+
+
+def bulk_insert(
+    db: Session,
+    model: type[Base],
+    rows: Sequence[dict[str, Any]],
+    *,
+    settings: Settings | None = None,
+) -> None:
+    """Write ``rows`` in one executemany (or one COPY on Postgres) inside the caller's
+    transaction.
+
+    Nothing is added to the session, so the usual ORM flush hooks do not run; the
+    analytics version of every affected user is bumped here instead.
+    """
+    if not rows:
+        return
+    settings = settings or get_settings()
+    connection = db.connection()
+    if (
+        settings.bulk_copy_enabled
+        and connection.dialect.name == "postgresql"
+        and len(rows) >= settings.bulk_copy_min_rows
+    ):
+        _copy_rows(db, model.__table__, rows)
+    else:
+        db.execute(insert(model), list(rows))
+    if issubclass(model, VERSIONED_MODELS):
+        bump_analytics_versions(db, {row["user_id"] for row in rows})
+
+
+def bulk_delete(db: Session, model: type[Base], *criteria: ColumnElement[bool]) -> int:
+    """Delete every matching row with one statement.
+
+    The session is not synchronized; callers expire any relationship collection that
+    still holds the deleted instances.
+    """
+    result = db.execute(
+        delete(model).where(*criteria),
+        execution_options={"synchronize_session": False},
+    )
+    return result.rowcount or 0
+
+
+def _copy_rows(db: Session, table: Table, rows: Sequence[dict[str, Any]]) -> None:
+    connection = db.connection()
+    preparer = connection.dialect.identifier_preparer
+    # Columns left to a server default are omitted so Postgres fills them in.
+    columns = [
+        column
+        for column in table.columns
+        if any(column.key in row for row in rows) or column.default is not None
+    ]
+    statement = "COPY {} ({}) FROM STDIN".format(
+        preparer.format_table(table),
+        ", ".join(preparer.format_column(column) for column in columns),
+    )
+    driver_connection = connection.connection.driver_connection
+    with driver_connection.cursor() as cursor, cursor.copy(statement) as copy:
+        for row in rows:
+            copy.write_row([_copy_value(column, row) for column in columns])
+
+
+def _copy_value(column: Column[Any], row: dict[str, Any]) -> Any:
+    if column.key in row:
+        value = row[column.key]
+    elif column.default is None:
+        value = None
+    elif column.default.is_callable:
+        value = column.default.arg(None)
+    else:
+        value = column.default.arg
+    if value is not None and isinstance(column.type, JSON):
+        return json.dumps(value)
+    return value
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import hashlib
+import os
+import uuid
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import date
 from pathlib import Path
 from typing import Any
 
-from sqlalchemy import func, select
+from sqlalchemy import func, insert, select
 from sqlalchemy.orm import Session
 
 from app.core.security import hash_password
@@ -27,6 +30,9 @@ from app.models.constants import (
     VISIBILITY_PRIVATE,
 )
 from app.services.analytics import build_shot_facts_from_upload_preview, parse_upload_preview
+from app.services.analytics_versions import bump_analytics_versions
+
+PARALLEL_PREPARE_MIN_FILES = 8
 
 
 class EarlyImportError(Exception):
@@ -48,6 +54,26 @@ class EarlyImportResult:
     shot_fact_count: int
 
 
+@dataclass(frozen=True)
+class PreparedRawRound:
+    file_path: Path
+    content_hash: str = ""
+    file_size: int = 0
+    parsed_round: dict[str, Any] | None = None
+    warnings: list[dict[str, Any]] | None = None
+    play_date: date | None = None
+    course_name: str = ""
+    shot_fact_count: int = 0
+    error: Exception | None = None
+
+
+@dataclass(frozen=True)
+class BulkImportOutcome:
+    file_path: Path
+    result: EarlyImportResult | None = None
+    error: Exception | None = None
+
+
 def ensure_import_owner(
     db: Session,
     *,
@@ -77,133 +103,116 @@ def import_raw_round_file(
     file_path: Path,
     storage_prefix: str = "migration/raw",
 ) -> EarlyImportResult:
-    raw_content = file_path.read_text(encoding="utf-8")
-    content_hash = hashlib.sha256(raw_content.encode("utf-8")).hexdigest()
-    existing_result = _existing_import_result(db, owner=owner, content_hash=content_hash)
-    if existing_result is not None:
-        return existing_result
-
-    parse_result = parse_upload_preview(raw_content, file_name=file_path.name)
-    parsed_round = parse_result["parsed_round"]
-    warnings = parse_result["warnings"]
-
-    play_date = _required_play_date(parsed_round)
-    course_name = _required_text(parsed_round.get("course_name"), "course_name")
-    holes = parsed_round.get("holes") or []
-    if not holes:
-        raise EarlyImportError("parsed round has no holes")
-
-    source_file = SourceFile(
-        user_id=owner.id,
-        filename=file_path.name,
-        content_type="text/plain",
-        storage_key=f"{storage_prefix}/{file_path.name}",
-        file_size=len(raw_content.encode("utf-8")),
-        content_hash=content_hash,
-        status=SOURCE_FILE_STATUS_COMMITTED,
-    )
-    db.add(source_file)
-    db.flush()
+    return import_raw_round_files(
+        db,
+        owner=owner,
+        file_paths=[file_path],
+        storage_prefix=storage_prefix,
+        max_workers=1,
+    )[0]
 
-    upload_review = UploadReview(
-        user_id=owner.id,
-        source_file_id=source_file.id,
-        status=UPLOAD_REVIEW_STATUS_COMMITTED,
-        parsed_round=parsed_round,
-        warnings=warnings,
-        user_edits={},
-    )
-    db.add(upload_review)
-    db.flush()
 
-    round_ = Round(
-        user_id=owner.id,
-        source_file_id=source_file.id,
-        course_name=course_name,
-        play_date=play_date,
-        total_score=parsed_round.get("total_score"),
-        total_par=parsed_round.get("total_par"),
-        score_to_par=parsed_round.get("score_to_par"),
-        hole_count=parsed_round.get("hole_count") or len(holes),
-        visibility=VISIBILITY_PRIVATE,
-        share_course=False,
-        share_exact_date=False,
-        computed_status=COMPUTED_STATUS_PENDING,
+def import_raw_round_files(
+    db: Session,
+    *,
+    owner: User,
+    file_paths: list[Path],
+    storage_prefix: str = "migration/raw",
+    max_workers: int | None = None,
+) -> list[EarlyImportResult]:
+    outcomes = bulk_import_raw_round_files(
+        db,
+        owner=owner,
+        file_paths=file_paths,
+        storage_prefix=storage_prefix,
+        max_workers=max_workers,
     )
-    db.add(round_)
-    db.flush()
+    for outcome in outcomes:
+        if outcome.error is not None:
+            raise outcome.error
+    return [outcome.result for outcome in outcomes]
 
-    for companion_name in parsed_round.get("companions", []):
-        db.add(RoundCompanion(round_id=round_.id, user_id=owner.id, name=companion_name))
 
-    shot_count = 0
-    for hole_payload in holes:
-        hole = Hole(
-            user_id=owner.id,
-            round_id=round_.id,
-            hole_number=hole_payload.get("hole_number"),
-            par=hole_payload.get("par"),
-            score=hole_payload.get("score"),
-            putts=hole_payload.get("putts"),
-            gir=hole_payload.get("gir"),
-            penalties=hole_payload.get("penalties") or 0,
-        )
-        db.add(hole)
-        db.flush()
+def bulk_import_raw_round_files(
+    db: Session,
+    *,
+    owner: User,
+    file_paths: list[Path],
+    storage_prefix: str = "migration/raw",
+    max_workers: int | None = None,
+) -> list[BulkImportOutcome]:
+    """Import raw round files in three stages and report one outcome per path.
+
+    Files are read, hashed and parsed in a process pool, already imported
+    content hashes are resolved with a single query, and the remaining rounds
+    are written with batched inserts using client-generated ids.
+    """
+    prepared_files = _prepare_raw_round_files(file_paths, max_workers=max_workers)
+    existing_results = _existing_import_results(
+        db,
+        owner=owner,
+        content_hashes={
+            prepared.content_hash for prepared in prepared_files if prepared.error is None
+        },
+    )
 
-        for shot_payload in hole_payload.get("shots", []):
-            shot_count += 1
-            db.add(
-                Shot(
-                    user_id=owner.id,
-                    round_id=round_.id,
-                    hole_id=hole.id,
-                    shot_number=shot_payload.get("shot_number"),
-                    club=shot_payload.get("club"),
-                    club_normalized=shot_payload.get("club_normalized"),
-                    distance=shot_payload.get("distance"),
-                    start_lie=shot_payload.get("start_lie"),
-                    end_lie=shot_payload.get("end_lie"),
-                    result_grade=shot_payload.get("result_grade"),
-                    feel_grade=shot_payload.get("feel_grade"),
-                    penalty_type=shot_payload.get("penalty_type"),
-                    penalty_strokes=shot_payload.get("penalty_strokes") or 0,
-                    score_cost=shot_payload.get("score_cost") or 1,
-                    raw_text=shot_payload.get("raw_text"),
-                )
+    rows: dict[str, list[dict[str, Any]]] = {
+        "source_files": [],
+        "upload_reviews": [],
+        "rounds": [],
+        "companions": [],
+        "holes": [],
+        "shots": [],
+    }
+    results_by_hash = dict(existing_results)
+    outcomes = []
+    for prepared in prepared_files:
+        if prepared.error is not None:
+            outcomes.append(BulkImportOutcome(file_path=prepared.file_path, error=prepared.error))
+            continue
+        result = results_by_hash.get(prepared.content_hash)
+        if result is None:
+            result = _stage_prepared_round(
+                rows,
+                owner=owner,
+                prepared=prepared,
+                storage_prefix=storage_prefix,
             )
-
-    upload_review.committed_round_id = round_.id
-    shot_facts = build_shot_facts_from_upload_preview(parsed_round, round_ref=str(round_.id))
-    db.flush()
-
-    return EarlyImportResult(
-        source_file_id=str(source_file.id),
-        upload_review_id=str(upload_review.id),
-        round_id=str(round_.id),
-        course_name=course_name,
+            results_by_hash[prepared.content_hash] = result
+        outcomes.append(BulkImportOutcome(file_path=prepared.file_path, result=result))
+
+    _insert_staged_rows(db, rows)
+    if rows["rounds"]:
+        # Core inserts skip the ORM flush hooks that normally bump the version.
+        bump_analytics_versions(db, {owner.id})
+    return outcomes
+
+
+def prepare_raw_round_file(file_path: Path) -> PreparedRawRound:
+    try:
+        raw_content = file_path.read_text(encoding="utf-8")
+        parse_result = parse_upload_preview(raw_content, file_name=file_path.name)
+        parsed_round = parse_result["parsed_round"]
+        play_date = _required_play_date(parsed_round)
+        course_name = _required_text(parsed_round.get("course_name"), "course_name")
+        if not parsed_round.get("holes"):
+            raise EarlyImportError("parsed round has no holes")
+        shot_facts = build_shot_facts_from_upload_preview(parsed_round, round_ref=file_path.name)
+    except (EarlyImportError, OSError, ValueError) as exc:
+        return PreparedRawRound(file_path=file_path, error=exc)
+
+    return PreparedRawRound(
+        file_path=file_path,
+        content_hash=hashlib.sha256(raw_content.encode("utf-8")).hexdigest(),
+        file_size=len(raw_content.encode("utf-8")),
+        parsed_round=parsed_round,
+        warnings=parse_result["warnings"],
         play_date=play_date,
-        total_score=parsed_round["total_score"],
-        total_par=parsed_round["total_par"],
-        hole_count=parsed_round["hole_count"],
-        shot_count=shot_count,
-        warning_count=len(warnings),
+        course_name=course_name,
         shot_fact_count=len(shot_facts),
     )
 
 
-def import_raw_round_files(
-    db: Session,
-    *,
-    owner: User,
-    file_paths: list[Path],
-) -> list[EarlyImportResult]:
-    results = []
-    for file_path in file_paths:
-        results.append(import_raw_round_file(db, owner=owner, file_path=file_path))
-    return results
-
-
 def result_to_report_row(result: EarlyImportResult) -> dict[str, Any]:
     return {
         "round_id": result.round_id,
@@ -221,47 +230,204 @@ def result_to_report_row(result: EarlyImportResult) -> dict[str, Any]:
     }
 
 
-def _existing_import_result(
+def _prepare_raw_round_files(
+    file_paths: list[Path],
+    *,
+    max_workers: int | None,
+) -> list[PreparedRawRound]:
+    if max_workers is None:
+        max_workers = 1
+        if len(file_paths) >= PARALLEL_PREPARE_MIN_FILES:
+            max_workers = min(os.cpu_count() or 1, len(file_paths))
+    if max_workers <= 1:
+        return [prepare_raw_round_file(file_path) for file_path in file_paths]
+
+    chunksize = max(1, len(file_paths) // (max_workers * 4))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(prepare_raw_round_file, file_paths, chunksize=chunksize))
+
+
+def _existing_import_results(
     db: Session,
     *,
     owner: User,
-    content_hash: str,
-) -> EarlyImportResult | None:
-    source_file = db.scalars(
-        select(SourceFile).where(
+    content_hashes: set[str],
+) -> dict[str, EarlyImportResult]:
+    if not content_hashes:
+        return {}
+
+    shot_count = (
+        select(func.count(Shot.id))
+        .where(Shot.round_id == Round.id)
+        .correlate(Round)
+        .scalar_subquery()
+    )
+    rows = db.execute(
+        select(
+            SourceFile.content_hash,
+            SourceFile.id,
+            UploadReview.id,
+            UploadReview.warnings,
+            Round,
+            shot_count,
+        )
+        .join(UploadReview, UploadReview.source_file_id == SourceFile.id)
+        .join(Round, Round.id == UploadReview.committed_round_id)
+        .where(
             SourceFile.user_id == owner.id,
-            SourceFile.content_hash == content_hash,
+            SourceFile.content_hash.in_(content_hashes),
         )
-    ).first()
-    if source_file is None:
-        return None
+        .order_by(SourceFile.created_at, UploadReview.created_at)
+    ).all()
+
+    results: dict[str, EarlyImportResult] = {}
+    for content_hash, source_file_id, upload_review_id, warnings, round_, round_shot_count in rows:
+        if content_hash in results:
+            continue
+        results[content_hash] = EarlyImportResult(
+            source_file_id=str(source_file_id),
+            upload_review_id=str(upload_review_id),
+            round_id=str(round_.id),
+            course_name=round_.course_name,
+            play_date=round_.play_date,
+            total_score=round_.total_score or 0,
+            total_par=round_.total_par or 0,
+            hole_count=round_.hole_count,
+            shot_count=round_shot_count or 0,
+            warning_count=len(warnings or []),
+            shot_fact_count=round_shot_count or 0,
+        )
+    return results
 
-    upload_review = db.scalars(
-        select(UploadReview).where(UploadReview.source_file_id == source_file.id)
-    ).first()
-    if upload_review is None or upload_review.committed_round_id is None:
-        return None
 
-    round_ = db.get(Round, upload_review.committed_round_id)
-    if round_ is None:
-        return None
+def _stage_prepared_round(
+    rows: dict[str, list[dict[str, Any]]],
+    *,
+    owner: User,
+    prepared: PreparedRawRound,
+    storage_prefix: str,
+) -> EarlyImportResult:
+    parsed_round = prepared.parsed_round or {}
+    holes = parsed_round.get("holes") or []
+    source_file_id = uuid.uuid4()
+    upload_review_id = uuid.uuid4()
+    round_id = uuid.uuid4()
+
+    rows["source_files"].append(
+        {
+            "id": source_file_id,
+            "user_id": owner.id,
+            "filename": prepared.file_path.name,
+            "content_type": "text/plain",
+            "storage_key": f"{storage_prefix}/{prepared.file_path.name}",
+            "file_size": prepared.file_size,
+            "content_hash": prepared.content_hash,
+            "status": SOURCE_FILE_STATUS_COMMITTED,
+        }
+    )
+    rows["upload_reviews"].append(
+        {
+            "id": upload_review_id,
+            "user_id": owner.id,
+            "source_file_id": source_file_id,
+            "status": UPLOAD_REVIEW_STATUS_COMMITTED,
+            "parsed_round": parsed_round,
+            "warnings": prepared.warnings or [],
+            "user_edits": {},
+            "committed_round_id": round_id,
+        }
+    )
+    rows["rounds"].append(
+        {
+            "id": round_id,
+            "user_id": owner.id,
+            "source_file_id": source_file_id,
+            "course_name": prepared.course_name,
+            "play_date": prepared.play_date,
+            "total_score": parsed_round.get("total_score"),
+            "total_par": parsed_round.get("total_par"),
+            "score_to_par": parsed_round.get("score_to_par"),
+            "hole_count": parsed_round.get("hole_count") or len(holes),
+            "visibility": VISIBILITY_PRIVATE,
+            "share_course": False,
+            "share_exact_date": False,
+            "computed_status": COMPUTED_STATUS_PENDING,
+        }
+    )
+    for companion_name in parsed_round.get("companions", []):
+        rows["companions"].append(
+            {"id": uuid.uuid4(), "round_id": round_id, "user_id": owner.id, "name": companion_name}
+        )
+
+    shot_count = 0
+    for hole_payload in holes:
+        hole_id = uuid.uuid4()
+        rows["holes"].append(
+            {
+                "id": hole_id,
+                "user_id": owner.id,
+                "round_id": round_id,
+                "hole_number": hole_payload.get("hole_number"),
+                "par": hole_payload.get("par"),
+                "score": hole_payload.get("score"),
+                "putts": hole_payload.get("putts"),
+                "gir": hole_payload.get("gir"),
+                "penalties": hole_payload.get("penalties") or 0,
+            }
+        )
+        for shot_payload in hole_payload.get("shots", []):
+            shot_count += 1
+            rows["shots"].append(
+                {
+                    "id": uuid.uuid4(),
+                    "user_id": owner.id,
+                    "round_id": round_id,
+                    "hole_id": hole_id,
+                    "shot_number": shot_payload.get("shot_number"),
+                    "club": shot_payload.get("club"),
+                    "club_normalized": shot_payload.get("club_normalized"),
+                    "distance": shot_payload.get("distance"),
+                    "start_lie": shot_payload.get("start_lie"),
+                    "end_lie": shot_payload.get("end_lie"),
+                    "result_grade": shot_payload.get("result_grade"),
+                    "feel_grade": shot_payload.get("feel_grade"),
+                    "penalty_type": shot_payload.get("penalty_type"),
+                    "penalty_strokes": shot_payload.get("penalty_strokes") or 0,
+                    "score_cost": shot_payload.get("score_cost") or 1,
+                    "raw_text": shot_payload.get("raw_text"),
+                }
+            )
 
-    shot_count = db.scalar(select(func.count(Shot.id)).where(Shot.round_id == round_.id)) or 0
     return EarlyImportResult(
-        source_file_id=str(source_file.id),
-        upload_review_id=str(upload_review.id),
-        round_id=str(round_.id),
-        course_name=round_.course_name,
-        play_date=round_.play_date,
-        total_score=round_.total_score or 0,
-        total_par=round_.total_par or 0,
-        hole_count=round_.hole_count,
+        source_file_id=str(source_file_id),
+        upload_review_id=str(upload_review_id),
+        round_id=str(round_id),
+        course_name=prepared.course_name,
+        play_date=prepared.play_date,
+        total_score=parsed_round["total_score"],
+        total_par=parsed_round["total_par"],
+        hole_count=parsed_round["hole_count"],
         shot_count=shot_count,
-        warning_count=len(upload_review.warnings or []),
-        shot_fact_count=shot_count,
+        warning_count=len(prepared.warnings or []),
+        shot_fact_count=prepared.shot_fact_count,
     )
 
 
+def _insert_staged_rows(db: Session, rows: dict[str, list[dict[str, Any]]]) -> None:
+    # Parents first: every foreign key already points at a client-generated id.
+    db.flush()
+    for model, key in (
+        (SourceFile, "source_files"),
+        (Round, "rounds"),
+        (UploadReview, "upload_reviews"),
+        (RoundCompanion, "companions"),
+        (Hole, "holes"),
+        (Shot, "shots"),
+    ):
+        if rows[key]:
+            db.execute(insert(model), rows[key])
+
+
 def _required_play_date(parsed_round: dict[str, Any]) -> date:
     value = parsed_round.get("play_date")
     if not value:
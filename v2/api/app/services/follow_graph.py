@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import uuid
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from app.core.config import Settings, get_settings
+from app.core.redis_client import shared_redis_client
+from app.models import Follow
+
+SESSION_CACHE_KEY = "follow_graph.following"
+REDIS_KEY_PREFIX = "follow_graph:following:"
+REDIS_GENERATION_KEY_PREFIX = "follow_graph:generation:"
+# Redis cannot store an empty set, so every cached set carries this marker member.
+REDIS_PRESENT_MARKER = "-"
+
+
+def accepted_following_ids(
+    db: Session,
+    viewer_id: uuid.UUID,
+    *,
+    settings: Settings | None = None,
+) -> frozenset[uuid.UUID]:
+    """Return the users ``viewer_id`` follows with an accepted relationship.
+
+    The set is loaded at most once per transaction (a read-only request never leaves
+    its first one), optionally backed by a Redis set shared between workers.
+    """
+    cache: dict[uuid.UUID, frozenset[uuid.UUID]] = db.info.setdefault(SESSION_CACHE_KEY, {})
+    following = cache.get(viewer_id)
+    if following is not None:
+        return following
+
+    settings = settings or get_settings()
+    following, generation = _read_redis_following(viewer_id, settings=settings)
+    if following is None:
+        following = frozenset(
+            db.scalars(
+                select(Follow.following_id).where(
+                    Follow.follower_id == viewer_id,
+                    Follow.status == "accepted",
+                )
+            )
+        )
+        _write_redis_following(viewer_id, following, generation=generation, settings=settings)
+    cache[viewer_id] = following
+    return following
+
+
+def is_following(
+    db: Session,
+    *,
+    follower_id: uuid.UUID,
+    following_id: uuid.UUID,
+) -> bool:
+    return following_id in accepted_following_ids(db, follower_id)
+
+
+def invalidate_following(
+    db: Session,
+    follower_id: uuid.UUID,
+    *,
+    settings: Settings | None = None,
+) -> None:
+    """Drop the cached follow set of ``follower_id``; call after the change commits.
+
+    Redis sets are keyed by a per-viewer generation that this bumps. A reader that
+    loaded the old rows before the commit writes them under the previous generation,
+    which nobody reads any more, instead of repopulating the live key.
+    """
+    db.info.get(SESSION_CACHE_KEY, {}).pop(follower_id, None)
+    settings = settings or get_settings()
+    client = _redis_client(settings)
+    if client is None:
+        return
+    try:
+        client.incr(_redis_generation_key(follower_id))
+    except Exception:
+        return
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _reset_session_cache(session: Session) -> None:
+    session.info.pop(SESSION_CACHE_KEY, None)
+
+
+def _redis_key(viewer_id: uuid.UUID, generation: int) -> str:
+    return f"{REDIS_KEY_PREFIX}{viewer_id}:{generation}"
+
+
+def _redis_generation_key(viewer_id: uuid.UUID) -> str:
+    # Never expires: a reset generation could resurrect a set that is still cached.
+    return f"{REDIS_GENERATION_KEY_PREFIX}{viewer_id}"
+
+
+def _redis_client(settings: Settings):
+    if not settings.follow_graph_redis_enabled:
+        return None
+    return shared_redis_client(settings.redis_url)
+
+
+def _read_redis_following(
+    viewer_id: uuid.UUID,
+    *,
+    settings: Settings,
+) -> tuple[frozenset[uuid.UUID] | None, int | None]:
+    """Return the cached set (or None) and the generation a fresh set is stored under."""
+    client = _redis_client(settings)
+    if client is None:
+        return None, None
+    try:
+        generation = int(client.get(_redis_generation_key(viewer_id)) or 0)
+        members = client.smembers(_redis_key(viewer_id, generation))
+    except Exception:
+        return None, None
+    values = {
+        member.decode() if isinstance(member, bytes) else str(member) for member in members
+    }
+    if REDIS_PRESENT_MARKER not in values:
+        return None, generation
+    values.discard(REDIS_PRESENT_MARKER)
+    return frozenset(uuid.UUID(value) for value in values), generation
+
+
+def _write_redis_following(
+    viewer_id: uuid.UUID,
+    following: frozenset[uuid.UUID],
+    *,
+    generation: int | None,
+    settings: Settings,
+) -> None:
+    client = _redis_client(settings)
+    if client is None or generation is None:
+        return
+    key = _redis_key(viewer_id, generation)
+    try:
+        pipeline = client.pipeline()
+        pipeline.delete(key)
+        pipeline.sadd(key, REDIS_PRESENT_MARKER, *(str(user_id) for user_id in following))
+        pipeline.expire(key, settings.follow_graph_cache_ttl_seconds)
+        pipeline.execute()
+    except Exception:
+        return
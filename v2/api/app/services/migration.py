@@ -8,6 +8,7 @@ from typing import Any
 from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
+from app.core.config import get_settings
 from app.models import (
     Hole,
     MigrationIdMap,
@@ -20,11 +21,10 @@ from app.models import (
     User,
 )
 from app.models.constants import VISIBILITY_PRIVATE
-from app.services.analytics import recalculate_round_metrics
+from app.services.analytics import recalculate_user_rounds
 from app.services.early_import import (
-    EarlyImportError,
+    bulk_import_raw_round_files,
     ensure_import_owner,
-    import_raw_round_file,
     result_to_report_row,
 )
 
@@ -50,30 +50,31 @@ def import_raw_files_for_run(
     file_paths: list[Path],
 ) -> dict[str, Any]:
     rows = []
-    for file_path in file_paths:
-        try:
-            result = import_raw_round_file(db, owner=owner, file_path=file_path)
-            row = result_to_report_row(result)
-            rows.append(row)
-            _upsert_id_map(
-                db,
-                run=run,
-                owner=owner,
-                entity_type="round",
-                v1_id=file_path.name,
-                v2_id=uuid.UUID(result.round_id),
-                payload=row,
-            )
-        except (EarlyImportError, OSError, ValueError) as exc:
+    outcomes = bulk_import_raw_round_files(db, owner=owner, file_paths=file_paths)
+    for outcome in outcomes:
+        if outcome.error is not None:
             _record_issue(
                 db,
                 run=run,
                 owner=owner,
                 severity="error",
                 code="raw_import_failed",
-                message=str(exc),
-                payload={"file": str(file_path)},
+                message=str(outcome.error),
+                payload={"file": str(outcome.file_path)},
             )
+            continue
+
+        row = result_to_report_row(outcome.result)
+        rows.append(row)
+        _upsert_id_map(
+            db,
+            run=run,
+            owner=owner,
+            entity_type="round",
+            v1_id=outcome.file_path.name,
+            v2_id=uuid.UUID(outcome.result.round_id),
+            payload=row,
+        )
 
     run.summary = {**(run.summary or {}), "imported_rounds": len(rows)}
     run.status = "imported"
@@ -83,20 +84,53 @@ def import_raw_files_for_run(
 
 def recalculate_imported_rounds(db: Session, *, owner: User, run: MigrationRun) -> dict[str, Any]:
     maps = db.scalars(
-        select(MigrationIdMap).where(
+        select(MigrationIdMap)
+        .where(
             MigrationIdMap.migration_run_id == run.id,
             MigrationIdMap.entity_type == "round",
         )
+        .order_by(MigrationIdMap.created_at.asc(), MigrationIdMap.v1_id.asc())
     ).all()
-    rows = []
+    live_ids: set[uuid.UUID] = set()
+    if maps:
+        live_ids = set(
+            db.scalars(
+                select(Round.id).where(
+                    Round.id.in_([mapping.v2_id for mapping in maps]),
+                    Round.user_id == owner.id,
+                    Round.deleted_at.is_(None),
+                )
+            ).all()
+        )
     for mapping in maps:
-        result = recalculate_round_metrics(db, owner=owner, round_id=mapping.v2_id)
-        rows.append(
-            {
-                "round_id": str(result["round_id"]),
-                "computed_status": result["computed_status"],
-            }
+        if mapping.v2_id not in live_ids:
+            _record_issue(
+                db,
+                run=run,
+                owner=owner,
+                severity="warning",
+                code="round_not_recalculated",
+                message="Mapped v2 round is missing or deleted",
+                payload={"v1_id": mapping.v1_id, "v2_round_id": str(mapping.v2_id)},
+            )
+
+    statuses: dict[uuid.UUID, str] = {}
+    if live_ids:
+        result = recalculate_user_rounds(
+            db,
+            owner=owner,
+            round_ids=live_ids,
+            incremental=get_settings().analysis_incremental_enabled,
         )
+        statuses = {row["round_id"]: row["computed_status"] for row in result["rounds"]}
+    rows = [
+        {
+            "round_id": str(mapping.v2_id),
+            "computed_status": statuses[mapping.v2_id],
+        }
+        for mapping in maps
+        if mapping.v2_id in statuses
+    ]
 
     run.summary = {**(run.summary or {}), "recalculated_rounds": len(rows)}
     run.status = "recalculated"
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import os
+import uuid
+from collections.abc import Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
+from typing import Any
+
+from sqlalchemy import exists, select
+from sqlalchemy.orm import Session, aliased, sessionmaker
+
+from app.core.config import Settings, get_settings
+from app.db.session import SessionLocal, engine
+from app.models import AnalysisJob, Round
+from app.models.constants import COMPUTED_STATUS_PENDING
+from app.services.analysis_jobs import (
+    ANALYSIS_JOB_KIND_ROUND_RECALCULATION,
+    run_analysis_job_in_session,
+)
+from app.services.bulk_writes import bulk_insert
+
+ShardRunner = Callable[[list[str]], list[dict[str, Any]]]
+
+
+def queue_pending_round_jobs(db: Session, *, limit: int) -> int:
+    """Queue a recalculation job for every pending round that has none in flight.
+
+    Bulk imports leave their rounds pending without jobs; this hands them to the
+    scheduler. The caller owns the transaction.
+    """
+    active_job = exists().where(
+        AnalysisJob.round_id == Round.id,
+        AnalysisJob.status.in_(("queued", "running")),
+    )
+    rounds = db.execute(
+        select(Round.id, Round.user_id)
+        .where(
+            Round.computed_status == COMPUTED_STATUS_PENDING,
+            Round.deleted_at.is_(None),
+            ~active_job,
+        )
+        .order_by(Round.created_at.asc())
+        .limit(limit)
+    ).all()
+    bulk_insert(
+        db,
+        AnalysisJob,
+        [
+            {
+                "user_id": user_id,
+                "round_id": round_id,
+                "kind": ANALYSIS_JOB_KIND_ROUND_RECALCULATION,
+                "status": "queued",
+                "payload": {"round_id": str(round_id)},
+            }
+            for round_id, user_id in rounds
+        ],
+    )
+    return len(rounds)
+
+
+def pending_job_shards(
+    db: Session,
+    *,
+    limit: int,
+    exclude_user_ids: Iterable[uuid.UUID] = (),
+) -> dict[uuid.UUID, list[uuid.UUID]]:
+    """Group the oldest queued jobs not handed to RQ by user, oldest first per user.
+
+    Users with a job already running elsewhere, e.g. inline in the API, are left out
+    so that their jobs stay serialized.
+    """
+    running_job = aliased(AnalysisJob)
+    user_running = exists().where(
+        running_job.user_id == AnalysisJob.user_id,
+        running_job.status == "running",
+    )
+    query = (
+        select(AnalysisJob.id, AnalysisJob.user_id)
+        .where(
+            AnalysisJob.status == "queued",
+            AnalysisJob.rq_job_id.is_(None),
+            ~user_running,
+        )
+        .order_by(AnalysisJob.created_at.asc())
+        .limit(limit)
+    )
+    excluded = list(exclude_user_ids)
+    if excluded:
+        query = query.where(AnalysisJob.user_id.not_in(excluded))
+    shards: dict[uuid.UUID, list[uuid.UUID]] = {}
+    for job_id, user_id in db.execute(query):
+        shards.setdefault(user_id, []).append(job_id)
+    return shards
+
+
+def run_job_shard(
+    job_ids: list[str],
+    *,
+    session_factory: sessionmaker[Session] | None = None,
+) -> list[dict[str, Any]]:
+    """Run one user's jobs in order in a single session.
+
+    A failing job is already recorded as failed by the job runner, so the rest of
+    the shard still runs. Jobs another runner claimed first are skipped.
+    """
+    session_factory = session_factory or SessionLocal
+    results = []
+    with session_factory() as db:
+        for job_id in job_ids:
+            try:
+                results.append(run_analysis_job_in_session(db, uuid.UUID(job_id)))
+            except Exception as exc:
+                db.rollback()
+                results.append({"job_id": job_id, "status": "failed", "error": str(exc)})
+    return results
+
+
+def run_pending_analysis_jobs(
+    settings: Settings | None = None,
+    *,
+    executor: Executor | None = None,
+    shard_runner: ShardRunner = run_job_shard,
+    session_factory: sessionmaker[Session] | None = None,
+) -> int:
+    """Drain queued analysis jobs across a process pool and return how many ran.
+
+    Jobs are sharded by user: each user has at most one shard in flight, so one
+    user's jobs stay serialized while different users run concurrently. Run a
+    single scheduler per database; RQ-enqueued jobs are left to the RQ worker.
+    """
+    settings = settings or get_settings()
+    session_factory = session_factory or SessionLocal
+    if executor is None:
+        with create_recompute_executor(settings) as pool:
+            return run_pending_analysis_jobs(
+                settings,
+                executor=pool,
+                shard_runner=shard_runner,
+                session_factory=session_factory,
+            )
+
+    with session_factory() as db:
+        queue_pending_round_jobs(db, limit=settings.recompute_claim_limit)
+        db.commit()
+
+    in_flight: dict[Future[list[dict[str, Any]]], uuid.UUID] = {}
+    # A job that could not even be marked running stays queued; never resubmit it.
+    submitted: set[uuid.UUID] = set()
+    completed = 0
+    while True:
+        with session_factory() as db:
+            shards = pending_job_shards(
+                db,
+                limit=settings.recompute_claim_limit,
+                exclude_user_ids=set(in_flight.values()),
+            )
+        for user_id, job_ids in shards.items():
+            job_ids = [job_id for job_id in job_ids if job_id not in submitted]
+            if not job_ids:
+                continue
+            submitted.update(job_ids)
+            future = executor.submit(shard_runner, [str(job_id) for job_id in job_ids])
+            in_flight[future] = user_id
+        if not in_flight:
+            return completed
+        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+        for future in done:
+            del in_flight[future]
+            completed += sum(1 for result in future.result() if not result.get("skipped"))
+
+
+def recompute_max_workers(settings: Settings) -> int:
+    return settings.recompute_max_workers or os.cpu_count() or 1
+
+
+def create_recompute_executor(settings: Settings) -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(
+        max_workers=recompute_max_workers(settings),
+        initializer=_reset_inherited_engine,
+    )
+
+
+def _reset_inherited_engine() -> None:
+    # Forked children must not reuse the parent's pooled connections.
+    engine.dispose(close=False)
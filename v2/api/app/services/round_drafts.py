@@ -13,6 +13,7 @@ from app.models.constants import (
     VISIBILITY_PRIVATE,
 )
 from app.services.analysis_jobs import enqueue_round_analysis_job
+from app.services.bulk_writes import bulk_delete, bulk_insert
 
 
 class DraftAlreadyExistsError(Exception):
@@ -142,10 +143,10 @@ def upsert_hole_shots(
 
     hole.par = par
 
-    for existing in list(hole.shots):
-        db.delete(existing)
-    db.flush()
+    bulk_delete(db, Shot, Shot.hole_id == hole.id)
+    db.expire(hole, ["shots"])
 
+    shot_rows: list[dict[str, Any]] = []
     total_penalties = 0
     for idx, shot_input in enumerate(shots, start=1):
         code = shot_input.get("code")
@@ -159,25 +160,26 @@ def upsert_hole_shots(
             parts.append(code)
         raw_text = " ".join(parts)
 
-        db.add(
-            Shot(
-                round_id=round_.id,
-                hole_id=hole.id,
-                user_id=owner.id,
-                shot_number=idx,
-                club=shot_input["club"],
-                club_normalized=shot_input["club"],
-                distance=shot_input.get("distance"),
-                end_lie=end_lie,
-                feel_grade=shot_input["feel"],
-                result_grade=shot_input["result"],
-                penalty_type=code if code in {"H", "UN", "OB"} else None,
-                penalty_strokes=penalty_strokes,
-                score_cost=1,
-                raw_text=raw_text,
-            )
+        shot_rows.append(
+            {
+                "round_id": round_.id,
+                "hole_id": hole.id,
+                "user_id": owner.id,
+                "shot_number": idx,
+                "club": shot_input["club"],
+                "club_normalized": shot_input["club"],
+                "distance": shot_input.get("distance"),
+                "end_lie": end_lie,
+                "feel_grade": shot_input["feel"],
+                "result_grade": shot_input["result"],
+                "penalty_type": code if code in {"H", "UN", "OB"} else None,
+                "penalty_strokes": penalty_strokes,
+                "score_cost": 1,
+                "raw_text": raw_text,
+            }
         )
         total_penalties += penalty_strokes
+    bulk_insert(db, Shot, shot_rows)
 
     hole.score = (len(shots) + total_penalties) if shots else None
     hole.penalties = total_penalties
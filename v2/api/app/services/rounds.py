@@ -1,12 +1,25 @@
+import hashlib
+import json
 import uuid
 from datetime import UTC, datetime
+from typing import Any
 
 from sqlalchemy import Select, func, select
 from sqlalchemy.orm import Session, selectinload
 
-from app.models import Hole, Round, RoundCompanion, Shot, UploadReview, User
+from app.models import (
+    AnalysisSnapshot,
+    Hole,
+    Round,
+    RoundCompanion,
+    Shot,
+    UploadReview,
+    User,
+    UserAnalyticsVersion,
+)
 from app.models.constants import (
     COMPUTED_STATUS_PENDING,
+    COMPUTED_STATUS_READY,
     COMPUTED_STATUS_STALE,
     VISIBILITY_FOLLOWERS,
     VISIBILITY_PUBLIC,
@@ -19,9 +32,14 @@ from app.schemas.round import (
     RoundListResponse,
     ShotResponse,
 )
-from app.services.analytics import active_priority_insights
+from app.services.analytics import active_priority_insights, discard_round_contribution
+from app.services.analytics_versions import DASHBOARD_SCOPE_TYPE, current_analytics_version
 from app.services.social import SocialNotFoundError, load_viewable_round
 
+DASHBOARD_SCOPE_KEY = "all"
+# The first locale is the default, matching the Korean-first insight renderer.
+DASHBOARD_LOCALES = ("ko", "en")
+
 
 class RoundNotFoundError(Exception):
     pass
@@ -120,6 +138,9 @@ def update_round(
         "notes_private",
     }:
         _mark_round_stale(round_)
+    if changed_fields & {"visibility", "share_exact_date"}:
+        # Sharing does not bump the analytics version, but recent rounds show it.
+        refresh_dashboard_document(db, owner=owner)
     db.commit()
     db.refresh(round_)
     return _round_detail(_get_round(db, owner=owner, round_id=round_id), viewer=owner)
@@ -129,6 +150,7 @@ def delete_round(db: Session, *, owner: User, round_id: uuid.UUID) -> None:
     round_ = _get_round(db, owner=owner, round_id=round_id)
     round_.deleted_at = datetime.now(UTC)
     _mark_round_stale(round_)
+    discard_round_contribution(db, owner=owner, round_id=round_.id)
     db.commit()
 
 
@@ -199,57 +221,174 @@ def update_shot(db: Session, *, owner: User, shot_id: uuid.UUID, values: dict) -
     return _shot_response(shot)
 
 
-def dashboard_summary(
+def load_dashboard_document(
     db: Session,
     *,
     owner: User,
+) -> tuple[AnalysisSnapshot | None, bool]:
+    """Return the user's precomputed dashboard and whether it is stale, without writing.
+
+    The document and the user's current analytics version come back in one row, so a
+    dashboard costs a single read. A stale or missing document is rebuilt by the worker.
+    """
+    row = db.execute(
+        select(AnalysisSnapshot, UserAnalyticsVersion.version)
+        .outerjoin(
+            UserAnalyticsVersion,
+            UserAnalyticsVersion.user_id == AnalysisSnapshot.user_id,
+        )
+        .where(
+            AnalysisSnapshot.user_id == owner.id,
+            AnalysisSnapshot.scope_type == DASHBOARD_SCOPE_TYPE,
+            AnalysisSnapshot.scope_key == DASHBOARD_SCOPE_KEY,
+        )
+        .order_by(AnalysisSnapshot.updated_at.desc())
+        .limit(1)
+    ).first()
+    if row is None:
+        return None, True
+    document, version = row
+    return document, document.analytics_version != (version or 0)
+
+
+def refresh_dashboard_document(db: Session, *, owner: User) -> AnalysisSnapshot:
+    """Rebuild the stored dashboard document; the caller owns the transaction."""
+    db.flush()
+    payload = _build_dashboard_payload(db, owner=owner)
+    payload["etag"] = hashlib.sha256(
+        json.dumps(payload, sort_keys=True, default=str).encode()
+    ).hexdigest()[:32]
+    document = db.scalars(
+        select(AnalysisSnapshot)
+        .where(
+            AnalysisSnapshot.user_id == owner.id,
+            AnalysisSnapshot.scope_type == DASHBOARD_SCOPE_TYPE,
+            AnalysisSnapshot.scope_key == DASHBOARD_SCOPE_KEY,
+        )
+        .order_by(AnalysisSnapshot.updated_at.desc())
+        .execution_options(populate_existing=True)
+    ).first()
+    if document is None:
+        document = AnalysisSnapshot(
+            user_id=owner.id,
+            scope_type=DASHBOARD_SCOPE_TYPE,
+            scope_key=DASHBOARD_SCOPE_KEY,
+        )
+        db.add(document)
+    document.payload = payload
+    document.analytics_version = current_analytics_version(db, owner.id)
+    db.flush()
+    return document
+
+
+def dashboard_summary_from_document(
+    document: AnalysisSnapshot | None,
+    *,
+    stale: bool = False,
     locale: str | None = None,
 ) -> DashboardSummaryResponse:
-    recent = list_rounds(db, owner=owner, limit=5).items
-    all_rounds = db.scalars(
-        _rounds_select(owner)
-        .options(selectinload(Round.companions))
-        .order_by(Round.play_date.asc(), Round.created_at.asc())
-    ).all()
+    if document is None:
+        return DashboardSummaryResponse(
+            kpis={
+                "round_count": 0,
+                "average_score": None,
+                "best_score": None,
+                "average_putts": None,
+            },
+            recent_rounds=[],
+            score_trend=[],
+            priority_insights=[],
+            stale=stale,
+        )
+    payload = document.payload
+    return DashboardSummaryResponse(
+        kpis=payload["kpis"],
+        recent_rounds=payload["recent_rounds"],
+        score_trend=payload["score_trend"],
+        priority_insights=payload["priority_insights"][_dashboard_locale(locale)],
+        stale=stale,
+    )
+
+
+def dashboard_etag(document: AnalysisSnapshot, *, locale: str | None = None) -> str:
+    return f'W/"{document.payload["etag"]}-{_dashboard_locale(locale)}"'
+
+
+def _dashboard_locale(locale: str | None) -> str:
+    return locale if locale in DASHBOARD_LOCALES else DASHBOARD_LOCALES[0]
 
-    completed = [round_ for round_ in all_rounds if round_.total_score is not None]
+
+def _build_dashboard_payload(db: Session, *, owner: User) -> dict[str, Any]:
+    # Every KPI comes from an aggregate query; no round relationships are loaded.
+    recent = list_rounds(db, owner=owner, limit=5).items
+    owned = (Round.user_id == owner.id, Round.deleted_at.is_(None))
+    totals = db.execute(
+        select(
+            func.count(Round.id).label("round_count"),
+            func.count(Round.total_score).label("completed_count"),
+            func.coalesce(func.sum(Round.total_score), 0).label("score_total"),
+            func.min(Round.total_score).filter(Round.total_score != 0).label("best_score"),
+            func.count(Round.id)
+            .filter(Round.computed_status != COMPUTED_STATUS_READY)
+            .label("stale_count"),
+        ).where(*owned)
+    ).one()
     average_score = (
-        round(sum(round_.total_score or 0 for round_ in completed) / len(completed), 1)
-        if completed
-        else None
+        round(totals.score_total / totals.completed_count, 1) if totals.completed_count else None
     )
-    best_score = min(
-        (round_.total_score for round_ in completed if round_.total_score),
-        default=None,
-    )
-    average_putts = _average_putts(all_rounds)
     score_trend = [
         {
-            "round_id": str(round_.id),
-            "play_date": round_.play_date.isoformat(),
-            "course_name": round_.course_name,
-            "total_score": round_.total_score,
-            "score_to_par": round_.score_to_par,
+            "round_id": str(row.id),
+            "play_date": row.play_date.isoformat(),
+            "course_name": row.course_name,
+            "total_score": row.total_score,
+            "score_to_par": row.score_to_par,
         }
-        for round_ in completed[-10:]
+        for row in reversed(
+            db.execute(
+                select(
+                    Round.id,
+                    Round.play_date,
+                    Round.course_name,
+                    Round.total_score,
+                    Round.score_to_par,
+                )
+                .where(*owned, Round.total_score.is_not(None))
+                .order_by(Round.play_date.desc(), Round.created_at.desc())
+                .limit(10)
+            ).all()
+        )
     ]
 
-    return DashboardSummaryResponse(
-        kpis={
-            "round_count": len(all_rounds),
+    return {
+        "kpis": {
+            "round_count": totals.round_count,
             "average_score": average_score,
-            "best_score": best_score,
-            "average_putts": average_putts,
+            "best_score": totals.best_score,
+            "average_putts": _average_putts(db, owner=owner),
         },
-        recent_rounds=recent,
-        score_trend=score_trend,
-        priority_insights=active_priority_insights(
-            db,
-            owner=owner,
-            locale=locale,
-        )
-        or _priority_insights(all_rounds, average_score, locale=locale),
-    )
+        "recent_rounds": [item.model_dump(mode="json") for item in recent],
+        "score_trend": score_trend,
+        "priority_insights": {
+            locale: [
+                _json_safe_insight(insight)
+                for insight in active_priority_insights(db, owner=owner, locale=locale)
+                or _priority_insights(
+                    round_count=totals.round_count,
+                    stale_count=totals.stale_count,
+                    average_score=average_score,
+                    locale=locale,
+                )
+            ]
+            for locale in DASHBOARD_LOCALES
+        },
+    }
+
+
+def _json_safe_insight(insight: dict[str, Any]) -> dict[str, Any]:
+    return {
+        key: str(value) if isinstance(value, uuid.UUID) else value for key, value in insight.items()
+    }
 
 
 def _rounds_select(owner: User) -> Select[tuple[Round]]:
@@ -412,23 +551,32 @@ def _round_metrics(round_: Round) -> dict:
     }
 
 
-def _average_putts(rounds: list[Round]) -> float | None:
-    totals = []
-    for round_ in rounds:
-        putts = [hole.putts for hole in round_.holes if hole.putts is not None]
-        if putts:
-            totals.append(sum(putts))
-    return round(sum(totals) / len(totals), 1) if totals else None
+def _average_putts(db: Session, *, owner: User) -> float | None:
+    """Average per-round putt total over the rounds that recorded any putts."""
+    round_putts = (
+        select(func.sum(Hole.putts).label("putts"))
+        .join(Round, Round.id == Hole.round_id)
+        .where(
+            Round.user_id == owner.id,
+            Round.deleted_at.is_(None),
+            Hole.putts.is_not(None),
+        )
+        .group_by(Hole.round_id)
+        .subquery()
+    )
+    row = db.execute(select(func.count(), func.coalesce(func.sum(round_putts.c.putts), 0))).one()
+    putt_round_count, putts_total = row
+    return round(putts_total / putt_round_count, 1) if putt_round_count else None
 
 
 def _priority_insights(
-    rounds: list[Round],
-    average_score: float | None,
     *,
+    round_count: int,
+    stale_count: int,
+    average_score: float | None,
     locale: str | None = None,
 ) -> list[dict]:
     insights = []
-    stale_count = sum(1 for round_ in rounds if round_.computed_status != "ready")
     if stale_count:
         if locale == "en":
             insights.append(
@@ -458,7 +606,7 @@ def _priority_insights(
                     "evidence": f"Your saved-round average score is {average_score}.",
                     "impact": "The MVP first tracks score and putting trends reliably.",
                     "next_action": "Upload more rounds, then enable shot-value analysis.",
-                    "confidence": "low" if len(rounds) < 5 else "medium",
+                    "confidence": "low" if round_count < 5 else "medium",
                 }
             )
         else:
@@ -468,7 +616,7 @@ def _priority_insights(
                     "evidence": f"현재 저장된 라운드 평균은 {average_score}타입니다.",
                     "impact": "초기 MVP에서는 스코어와 퍼팅 흐름부터 안정적으로 추적합니다.",
                     "next_action": "라운드를 더 업로드한 뒤 샷 가치 분석을 활성화합니다.",
-                    "confidence": "low" if len(rounds) < 5 else "medium",
+                    "confidence": "low" if round_count < 5 else "medium",
                 }
             )
     return insights[:3]
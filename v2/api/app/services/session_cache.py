@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from app.core.config import Settings, get_settings
+from app.core.redis_client import shared_redis_client
+from app.models import User, UserSession
+
+# The password hash is deliberately left out; it lazy-loads if a caller needs it.
+CACHED_USER_FIELDS = (
+    "id",
+    "email",
+    "display_name",
+    "handle",
+    "avatar_url",
+    "role",
+    "status",
+    "deleted_at",
+    "created_at",
+    "updated_at",
+)
+REDIS_TOKEN_KEY_PREFIX = "auth_session:token:"
+REDIS_USER_KEY_PREFIX = "auth_session:user:"
+CHANGED_USERS_INFO_KEY = "session_cache.changed_user_ids"
+
+
+class LRUSessionCache:
+    """Bounded in-process map of session token hash -> cached user state."""
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._tokens_by_user: dict[uuid.UUID, set[str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, token_hash: str) -> dict[str, Any] | None:
+        with self._lock:
+            entry = self._entries.get(token_hash)
+            if entry is None:
+                return None
+            deadline, state = entry
+            if deadline <= time.time():
+                self._discard(token_hash)
+                return None
+            self._entries.move_to_end(token_hash)
+            return dict(state)
+
+    def set(self, token_hash: str, state: dict[str, Any], *, deadline: float) -> None:
+        with self._lock:
+            self._discard(token_hash)
+            self._entries[token_hash] = (deadline, dict(state))
+            self._tokens_by_user.setdefault(state["id"], set()).add(token_hash)
+            while len(self._entries) > self.max_entries:
+                self._discard(next(iter(self._entries)))
+
+    def invalidate_token(self, token_hash: str) -> None:
+        with self._lock:
+            self._discard(token_hash)
+
+    def invalidate_user(self, user_id: uuid.UUID) -> None:
+        with self._lock:
+            for token_hash in list(self._tokens_by_user.get(user_id, ())):
+                self._discard(token_hash)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._tokens_by_user.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _discard(self, token_hash: str) -> None:
+        entry = self._entries.pop(token_hash, None)
+        if entry is None:
+            return
+        user_id = entry[1]["id"]
+        tokens = self._tokens_by_user.get(user_id)
+        if tokens is not None:
+            tokens.discard(token_hash)
+            if not tokens:
+                del self._tokens_by_user[user_id]
+
+
+_local_cache = LRUSessionCache(get_settings().session_cache_max_entries)
+
+
+def load_cached_session_user(
+    db: Session,
+    token_hash: str,
+    *,
+    settings: Settings | None = None,
+) -> User | None:
+    """Return the active user behind ``token_hash`` without querying, if cached.
+
+    With Redis enabled it is the only tier: a logout or revocation on any worker
+    deletes the shared entry, which an in-process copy would outlive. Without Redis
+    the in-process LRU is used, which only sees this process's invalidations.
+    """
+    settings = settings or get_settings()
+    if settings.session_cache_ttl_seconds <= 0:
+        return None
+    if settings.session_cache_redis_enabled:
+        state = _read_redis_state(token_hash, settings=settings)
+    else:
+        state = _local_cache.get(token_hash)
+    if state is None:
+        return None
+    return _attach_user(db, state)
+
+
+def remember_session_user(
+    token_hash: str,
+    session: UserSession,
+    *,
+    settings: Settings | None = None,
+) -> None:
+    settings = settings or get_settings()
+    if settings.session_cache_ttl_seconds <= 0:
+        return
+    expires_at = session.expires_at
+    if expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=UTC)
+    now = time.time()
+    deadline = min(now + settings.session_cache_ttl_seconds, expires_at.timestamp())
+    if deadline <= now:
+        return
+    state = {field: getattr(session.user, field) for field in CACHED_USER_FIELDS}
+    if settings.session_cache_redis_enabled:
+        _write_redis_state(token_hash, state, ttl_seconds=deadline - now, settings=settings)
+    else:
+        _local_cache.set(token_hash, state, deadline=deadline)
+
+
+def invalidate_session_token(token_hash: str, *, settings: Settings | None = None) -> None:
+    _local_cache.invalidate_token(token_hash)
+    client = _redis_client(settings or get_settings())
+    if client is None:
+        return
+    try:
+        client.delete(f"{REDIS_TOKEN_KEY_PREFIX}{token_hash}")
+    except Exception:
+        return
+
+
+def invalidate_user_sessions(user_id: uuid.UUID, *, settings: Settings | None = None) -> None:
+    _local_cache.invalidate_user(user_id)
+    client = _redis_client(settings or get_settings())
+    if client is None:
+        return
+    user_key = f"{REDIS_USER_KEY_PREFIX}{user_id}"
+    try:
+        token_hashes = [
+            member.decode() if isinstance(member, bytes) else str(member)
+            for member in client.smembers(user_key)
+        ]
+        client.delete(
+            user_key,
+            *(f"{REDIS_TOKEN_KEY_PREFIX}{token_hash}" for token_hash in token_hashes),
+        )
+    except Exception:
+        return
+
+
+def clear_session_cache() -> None:
+    _local_cache.clear()
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_users(session: Session, _flush_context: Any) -> None:
+    changed = {
+        instance.id
+        for instance in (*session.dirty, *session.deleted)
+        if isinstance(instance, User)
+    }
+    if changed:
+        session.info.setdefault(CHANGED_USERS_INFO_KEY, set()).update(changed)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_changed_users(session: Session) -> None:
+    for user_id in session.info.pop(CHANGED_USERS_INFO_KEY, ()):
+        invalidate_user_sessions(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_changed_users(session: Session) -> None:
+    session.info.pop(CHANGED_USERS_INFO_KEY, None)
+
+
+def _attach_user(db: Session, state: dict[str, Any]) -> User:
+    existing = db.identity_map.get(db.identity_key(User, state["id"]))
+    if existing is not None:
+        return existing
+    user = User(**state)
+    make_transient_to_detached(user)
+    return db.merge(user, load=False)
+
+
+def _redis_client(settings: Settings):
+    if not settings.session_cache_redis_enabled:
+        return None
+    return shared_redis_client(settings.redis_url)
+
+
+def _read_redis_state(token_hash: str, *, settings: Settings) -> dict[str, Any] | None:
+    client = _redis_client(settings)
+    if client is None:
+        return None
+    try:
+        raw = client.get(f"{REDIS_TOKEN_KEY_PREFIX}{token_hash}")
+    except Exception:
+        return None
+    if raw is None:
+        return None
+    payload = json.loads(raw)
+    state: dict[str, Any] = dict(payload)
+    state["id"] = uuid.UUID(payload["id"])
+    for field in ("deleted_at", "created_at", "updated_at"):
+        if payload.get(field) is not None:
+            state[field] = datetime.fromisoformat(payload[field])
+    return state
+
+
+def _write_redis_state(
+    token_hash: str,
+    state: dict[str, Any],
+    *,
+    ttl_seconds: float,
+    settings: Settings,
+) -> None:
+    client = _redis_client(settings)
+    if client is None:
+        return
+    payload = {
+        field: value.isoformat() if isinstance(value, datetime) else value
+        for field, value in state.items()
+    }
+    payload["id"] = str(state["id"])
+    ttl = max(int(ttl_seconds), 1)
+    user_key = f"{REDIS_USER_KEY_PREFIX}{state['id']}"
+    try:
+        pipeline = client.pipeline()
+        pipeline.set(f"{REDIS_TOKEN_KEY_PREFIX}{token_hash}", json.dumps(payload), ex=ttl)
+        pipeline.sadd(user_key, token_hash)
+        pipeline.expire(user_key, settings.session_cache_ttl_seconds)
+        pipeline.execute()
+    except Exception:
+        return
@@ -6,8 +6,9 @@ import uuid
 from datetime import UTC, datetime
 from typing import Any
 
-from sqlalchemy import Select, func, or_, select
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import ColumnElement, Select, and_, func, literal, or_, select, union_all
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, aliased, selectinload
 
 from app.models import (
     CompanionAccountLink,
@@ -19,14 +20,20 @@ from app.models import (
     RoundComment,
     RoundGoal,
     RoundLike,
+    RoundSocialCounter,
     User,
 )
 from app.models.constants import (
     VISIBILITY_FOLLOWERS,
     VISIBILITY_LINK_ONLY,
-    VISIBILITY_PRIVATE,
     VISIBILITY_PUBLIC,
 )
+from app.models.mixins import utc_now
+from app.services.follow_graph import (
+    accepted_following_ids,
+    invalidate_following,
+    is_following,
+)
 from app.services.insight_i18n import render_insight_payload
 
 
@@ -120,7 +127,7 @@ def load_viewable_round(
     if round_.visibility == VISIBILITY_PUBLIC:
         return round_
 
-    if viewer is not None and round_.visibility == VISIBILITY_FOLLOWERS and _has_accepted_follow(
+    if viewer is not None and round_.visibility == VISIBILITY_FOLLOWERS and is_following(
         db,
         follower_id=viewer.id,
         following_id=round_.user_id,
@@ -134,11 +141,30 @@ def load_viewable_round(
 
 
 def can_react_to_round(db: Session, *, viewer: User, round_: Round) -> bool:
+    followed_owner_ids: set[uuid.UUID] = set()
+    if round_.user_id != viewer.id and is_following(
+        db,
+        follower_id=viewer.id,
+        following_id=round_.user_id,
+    ):
+        followed_owner_ids.add(round_.user_id)
+    return viewer_can_react_to_round(viewer, round_, followed_owner_ids=followed_owner_ids)
+
+
+def viewer_can_react_to_round(
+    viewer: User | None,
+    round_: Round,
+    *,
+    followed_owner_ids: set[uuid.UUID],
+) -> bool:
+    """Whether ``viewer`` may like or comment on ``round_``, given whom they follow."""
+    if viewer is None:
+        return False
     if round_.user_id == viewer.id:
         return True
     if round_.visibility not in {VISIBILITY_PUBLIC, VISIBILITY_FOLLOWERS}:
         return False
-    return _has_accepted_follow(db, follower_id=viewer.id, following_id=round_.user_id)
+    return round_.user_id in followed_owner_ids
 
 
 def list_public_rounds(
@@ -186,7 +212,7 @@ def get_public_round_detail(
         raise SocialNotFoundError
 
     comments = list_round_comments(db, viewer=None, round_=round_)
-    like_count = _like_count(db, round_.id)
+    like_count, _comment_count = _round_counts(db, [round_.id]).get(round_.id, (0, 0))
     comment_count = len(comments)
     return _public_round_detail(
         round_,
@@ -224,6 +250,7 @@ def create_follow(db: Session, *, viewer: User, following_id: uuid.UUID) -> Foll
         )
         db.add(existing)
     db.commit()
+    invalidate_following(db, viewer.id)
     db.refresh(existing)
     return existing
 
@@ -298,6 +325,7 @@ def update_follow(
         follow.accepted_at = None
         follow.blocked_at = None
     db.commit()
+    invalidate_following(db, follower_id)
     db.refresh(follow)
     return follow
 
@@ -331,6 +359,7 @@ def delete_follow(
         raise SocialAccessError("Cannot delete this follow relationship")
     db.delete(follow)
     db.commit()
+    invalidate_following(db, follower_id)
 
 
 def add_like(db: Session, *, viewer: User, round_id: uuid.UUID) -> dict[str, Any]:
@@ -342,9 +371,10 @@ def add_like(db: Session, *, viewer: User, round_id: uuid.UUID) -> dict[str, Any
     if like is None:
         like = RoundLike(round_id=round_.id, user_id=viewer.id)
         db.add(like)
+        _adjust_round_counter(db, round_.id, likes=1)
         db.commit()
 
-    return {"round_id": round_.id, "like_count": _like_count(db, round_.id), "liked": True}
+    return {"round_id": round_.id, "like_count": _round_like_count(db, round_.id), "liked": True}
 
 
 def remove_like(db: Session, *, viewer: User, round_id: uuid.UUID) -> dict[str, Any]:
@@ -352,8 +382,9 @@ def remove_like(db: Session, *, viewer: User, round_id: uuid.UUID) -> dict[str,
     like = db.get(RoundLike, (round_.id, viewer.id))
     if like is not None:
         db.delete(like)
+        _adjust_round_counter(db, round_.id, likes=-1)
         db.commit()
-    return {"round_id": round_.id, "like_count": _like_count(db, round_.id), "liked": False}
+    return {"round_id": round_.id, "like_count": _round_like_count(db, round_.id), "liked": False}
 
 
 def list_round_comments(
@@ -398,6 +429,7 @@ def add_comment(
         status="active",
     )
     db.add(comment)
+    _adjust_round_counter(db, round_.id, comments=1)
     db.commit()
     db.refresh(comment)
     return _comment_payload(db, comment)
@@ -416,13 +448,41 @@ def delete_comment(
         round_ = db.get(Round, comment.round_id)
         if round_ is None or round_.user_id != viewer.id:
             raise SocialAccessError("Cannot delete this comment")
+    was_active = comment.status == "active"
     comment.status = "deleted"
     comment.deleted_at = datetime.now(UTC)
+    if was_active:
+        _adjust_round_counter(db, comment.round_id, comments=-1)
     db.commit()
     db.refresh(comment)
     return _comment_payload(db, comment)
 
 
+def reconcile_round_counters(db: Session) -> dict[str, int]:
+    """Rebuild like/comment counters from the reaction tables; returns what changed."""
+    actual = _counted_round_reactions(db)
+    counters = {counter.round_id: counter for counter in db.scalars(select(RoundSocialCounter))}
+    corrected = 0
+    for round_id in actual.keys() | counters.keys():
+        like_count, comment_count = actual.get(round_id, (0, 0))
+        counter = counters.get(round_id)
+        if counter is None:
+            db.add(
+                RoundSocialCounter(
+                    round_id=round_id,
+                    like_count=like_count,
+                    comment_count=comment_count,
+                )
+            )
+            corrected += 1
+        elif (counter.like_count, counter.comment_count) != (like_count, comment_count):
+            counter.like_count = like_count
+            counter.comment_count = comment_count
+            corrected += 1
+    db.commit()
+    return {"checked": len(actual.keys() | counters.keys()), "corrected": corrected}
+
+
 def list_comparison_candidates(
     db: Session,
     *,
@@ -495,99 +555,261 @@ def list_social_feed(
         raise SocialAccessError("Login required for following feed")
 
     cursor_value = _decode_cursor(cursor)
-    items: list[dict[str, Any]] = []
-    items.extend(
-        _round_feed_items(
-            db,
-            viewer=viewer,
-            scope=scope,
-            locale=locale,
-            include_self=include_self,
-        )
-    )
-    items.extend(
-        _diary_feed_items(
-            db,
-            viewer=viewer,
-            scope=scope,
-            include_self=include_self,
-        )
+    page_keys = _feed_page_keys(
+        db,
+        viewer=viewer,
+        scope=scope,
+        cursor_value=cursor_value,
+        limit=limit + 1,
+        include_self=include_self,
     )
-    items.extend(
-        _goal_feed_items(
-            db,
-            viewer=viewer,
-            scope=scope,
-            include_self=include_self,
-        )
+    # Hydration may still drop a key (e.g. an owner that no longer exists), so the
+    # page boundary and the cursor come from the keys, not from the hydrated items.
+    has_more = len(page_keys) > limit
+    page_keys = page_keys[:limit]
+    items = _hydrate_feed_items(
+        db,
+        [(item_type, item_id) for item_type, item_id, _published_at in page_keys],
+        viewer=viewer,
+        locale=locale,
     )
-
     for item in items:
         item["social_published_at"] = _as_utc(item["social_published_at"])
-    items.sort(
-        key=lambda item: (
-            item["social_published_at"],
-            str(item["item_id"]),
-        ),
-        reverse=True,
-    )
-    if cursor_value is not None:
-        cursor_time, cursor_id = cursor_value
-        items = [
-            item
-            for item in items
-            if (
-                item["social_published_at"] < cursor_time
-                or (
-                    item["social_published_at"] == cursor_time
-                    and str(item["item_id"]) < cursor_id
-                )
-            )
-        ]
 
-    page = items[: limit + 1]
-    has_more = len(page) > limit
-    page = page[:limit]
-    next_cursor = _encode_cursor(page[-1]) if has_more and page else None
+    next_cursor = None
+    if has_more:
+        _item_type, last_item_id, last_published_at = page_keys[-1]
+        next_cursor = _encode_cursor(_as_utc(last_published_at), last_item_id)
     return {
-        "items": page,
+        "items": items,
         "next_cursor": next_cursor,
         "has_more": has_more,
     }
 
 
-def _round_feed_items(
+def _feed_page_keys(
     db: Session,
     *,
     viewer: User | None,
     scope: str,
-    locale: str | None,
+    cursor_value: tuple[datetime, uuid.UUID] | None,
+    limit: int,
     include_self: bool,
-) -> list[dict[str, Any]]:
-    rounds = db.scalars(
-        select(Round)
-        .options(
-            selectinload(Round.holes).selectinload(Hole.shots),
-            selectinload(Round.shared_insights),
+) -> list[tuple[str, uuid.UUID, datetime]]:
+    """Resolve one feed page to ``(item_type, item_id, social_published_at)`` keys.
+
+    Visibility, the follow graph, the keyset cursor and the limit are all applied
+    in the database over a UNION of published rounds, diary entries and goals.
+    """
+    sources = (
+        ("round", Round, (Round.deleted_at.is_(None),)),
+        ("practice_diary", PracticeDiaryEntry, ()),
+        ("round_goal", RoundGoal, ()),
+    )
+    branches = []
+    for item_type, model, extra_conditions in sources:
+        query = select(
+            literal(item_type).label("item_type"),
+            model.id.label("item_id"),
+            model.social_published_at.label("social_published_at"),
+        ).where(
+            *extra_conditions,
+            model.social_published_at.is_not(None),
+            model.visibility.in_([VISIBILITY_PUBLIC, VISIBILITY_FOLLOWERS]),
+            _feed_visibility_condition(
+                model,
+                viewer=viewer,
+                scope=scope,
+                include_self=include_self,
+            ),
         )
-        .where(
-            Round.deleted_at.is_(None),
-            Round.social_published_at.is_not(None),
-            Round.visibility.in_([VISIBILITY_PUBLIC, VISIBILITY_FOLLOWERS]),
+        if cursor_value is not None:
+            cursor_time, cursor_id = cursor_value
+            query = query.where(
+                or_(
+                    model.social_published_at < cursor_time,
+                    and_(
+                        model.social_published_at == cursor_time,
+                        model.id < cursor_id,
+                    ),
+                )
+            )
+        branches.append(
+            query.order_by(model.social_published_at.desc(), model.id.desc()).limit(limit)
         )
+
+    feed = union_all(*(branch.subquery().select() for branch in branches)).subquery()
+    rows = db.execute(
+        select(feed.c.item_type, feed.c.item_id, feed.c.social_published_at)
+        .order_by(feed.c.social_published_at.desc(), feed.c.item_id.desc())
+        .limit(limit)
     ).all()
+    return [
+        (item_type, item_id, published_at) for item_type, item_id, published_at in rows
+    ]
+
+
+def _feed_visibility_condition(
+    model: Any,
+    *,
+    viewer: User | None,
+    scope: str,
+    include_self: bool,
+) -> ColumnElement[bool]:
+    if viewer is None or scope == "public":
+        others = model.visibility == VISIBILITY_PUBLIC
+    else:
+        followed = select(Follow.following_id).where(
+            Follow.follower_id == viewer.id,
+            Follow.status == "accepted",
+        )
+        if scope == "following":
+            others = model.user_id.in_(followed)
+        else:
+            others = or_(
+                model.visibility == VISIBILITY_PUBLIC,
+                and_(model.visibility == VISIBILITY_FOLLOWERS, model.user_id.in_(followed)),
+            )
+    if viewer is None:
+        return others
+    if include_self:
+        return or_(model.user_id == viewer.id, others)
+    return and_(model.user_id != viewer.id, others)
+
+
+def _hydrate_feed_items(
+    db: Session,
+    page_keys: list[tuple[str, uuid.UUID]],
+    *,
+    viewer: User | None,
+    locale: str | None,
+) -> list[dict[str, Any]]:
+    ids_by_type: dict[str, list[uuid.UUID]] = {}
+    for item_type, item_id in page_keys:
+        ids_by_type.setdefault(item_type, []).append(item_id)
+
+    rounds = (
+        db.scalars(
+            select(Round)
+            .options(
+                selectinload(Round.holes),
+                selectinload(Round.shared_insights),
+            )
+            .where(Round.id.in_(ids_by_type["round"]))
+        ).all()
+        if "round" in ids_by_type
+        else []
+    )
+    entries = (
+        db.scalars(
+            select(PracticeDiaryEntry).where(
+                PracticeDiaryEntry.id.in_(ids_by_type["practice_diary"])
+            )
+        ).all()
+        if "practice_diary" in ids_by_type
+        else []
+    )
+    goals = (
+        db.scalars(select(RoundGoal).where(RoundGoal.id.in_(ids_by_type["round_goal"]))).all()
+        if "round_goal" in ids_by_type
+        else []
+    )
+
+    context = _feed_context(db, viewer=viewer, rounds=rounds, entries=entries, goals=goals)
+    items_by_key = {
+        (item["item_type"], item["item_id"]): item
+        for item in (
+            *_round_feed_items(rounds, context=context, viewer=viewer, locale=locale),
+            *_diary_feed_items(entries, context=context),
+            *_goal_feed_items(goals, context=context),
+        )
+    }
+    return [items_by_key[key] for key in page_keys if key in items_by_key]
+
+
+def _feed_context(
+    db: Session,
+    *,
+    viewer: User | None,
+    rounds: list[Round],
+    entries: list[PracticeDiaryEntry],
+    goals: list[RoundGoal],
+) -> dict[str, Any]:
+    """Everything a feed page needs beyond its own rows, one grouped query per kind."""
+    round_ids = [round_.id for round_ in rounds]
+    owner_ids = {item.user_id for item in (*rounds, *entries, *goals)}
+    linked_round_ids = {entry.round_id for entry in entries if entry.round_id is not None}
+    goal_ids = [goal.id for goal in goals]
+
+    context: dict[str, Any] = {
+        "owners": {},
+        "like_counts": {},
+        "comment_counts": {},
+        "liked_round_ids": set(),
+        "followed_owner_ids": set(),
+        "linked_rounds": {},
+        "latest_evaluations": {},
+    }
+    if owner_ids:
+        context["owners"] = {
+            user.id: user for user in db.scalars(select(User).where(User.id.in_(owner_ids)))
+        }
+    if round_ids:
+        counts = _round_counts(db, round_ids)
+        context["like_counts"] = {round_id: likes for round_id, (likes, _) in counts.items()}
+        context["comment_counts"] = {
+            round_id: comments for round_id, (_, comments) in counts.items()
+        }
+    if viewer is not None and round_ids:
+        context["liked_round_ids"] = set(
+            db.scalars(
+                select(RoundLike.round_id).where(
+                    RoundLike.round_id.in_(round_ids),
+                    RoundLike.user_id == viewer.id,
+                )
+            )
+        )
+    if viewer is not None and rounds:
+        context["followed_owner_ids"] = accepted_following_ids(db, viewer.id)
+    if linked_round_ids:
+        context["linked_rounds"] = {
+            round_.id: round_
+            for round_ in db.scalars(
+                select(Round).where(Round.id.in_(linked_round_ids), Round.deleted_at.is_(None))
+            )
+        }
+    if goal_ids:
+        ranked = (
+            select(
+                GoalEvaluation,
+                func.row_number()
+                .over(
+                    partition_by=GoalEvaluation.goal_id,
+                    order_by=(GoalEvaluation.evaluated_at.desc(), GoalEvaluation.created_at.desc()),
+                )
+                .label("rank"),
+            )
+            .where(GoalEvaluation.goal_id.in_(goal_ids))
+            .subquery()
+        )
+        latest = aliased(GoalEvaluation, ranked)
+        context["latest_evaluations"] = {
+            evaluation.goal_id: evaluation
+            for evaluation in db.scalars(select(latest).where(ranked.c.rank == 1))
+        }
+    return context
+
+
+def _round_feed_items(
+    rounds: list[Round],
+    *,
+    context: dict[str, Any],
+    viewer: User | None,
+    locale: str | None,
+) -> list[dict[str, Any]]:
     items = []
     for round_ in rounds:
-        if not _can_view_feed_item(
-            db,
-            viewer=viewer,
-            owner_id=round_.user_id,
-            visibility=round_.visibility,
-            scope=scope,
-            include_self=include_self,
-        ):
-            continue
-        owner = db.get(User, round_.user_id)
+        owner = context["owners"].get(round_.user_id)
         if owner is None:
             continue
         top_insights = _public_insights(round_, locale=locale)
@@ -607,13 +829,13 @@ def _round_feed_items(
                 "hole_count": round_.hole_count,
                 "metrics": _round_metrics(round_),
                 "top_insight": top_insights[0] if top_insights else None,
-                "like_count": _like_count(db, round_.id),
-                "comment_count": _comment_count(db, round_.id),
-                "liked_by_me": _liked_by_viewer(db, viewer=viewer, round_id=round_.id),
-                "viewer_can_react": (
-                    can_react_to_round(db, viewer=viewer, round_=round_)
-                    if viewer is not None
-                    else False
+                "like_count": context["like_counts"].get(round_.id, 0),
+                "comment_count": context["comment_counts"].get(round_.id, 0),
+                "liked_by_me": round_.id in context["liked_round_ids"],
+                "viewer_can_react": viewer_can_react_to_round(
+                    viewer,
+                    round_,
+                    followed_owner_ids=context["followed_owner_ids"],
                 ),
             }
         )
@@ -621,33 +843,16 @@ def _round_feed_items(
 
 
 def _diary_feed_items(
-    db: Session,
+    entries: list[PracticeDiaryEntry],
     *,
-    viewer: User | None,
-    scope: str,
-    include_self: bool,
+    context: dict[str, Any],
 ) -> list[dict[str, Any]]:
-    entries = db.scalars(
-        select(PracticeDiaryEntry).where(
-            PracticeDiaryEntry.social_published_at.is_not(None),
-            PracticeDiaryEntry.visibility.in_([VISIBILITY_PUBLIC, VISIBILITY_FOLLOWERS]),
-        )
-    ).all()
     items = []
     for entry in entries:
-        if not _can_view_feed_item(
-            db,
-            viewer=viewer,
-            owner_id=entry.user_id,
-            visibility=entry.visibility,
-            scope=scope,
-            include_self=include_self,
-        ):
-            continue
-        owner = db.get(User, entry.user_id)
+        owner = context["owners"].get(entry.user_id)
         if owner is None:
             continue
-        linked_round = _feed_linked_round(db, entry.round_id)
+        linked_round = context["linked_rounds"].get(entry.round_id)
         items.append(
             {
                 "item_type": "practice_diary",
@@ -660,39 +865,27 @@ def _diary_feed_items(
                 "body_preview": _preview(entry.body),
                 "category": entry.category,
                 "tags": entry.tags,
-                "linked_round": linked_round,
+                "linked_round": (
+                    {
+                        "round_id": linked_round.id,
+                        "course_name": linked_round.course_name,
+                        "play_month": linked_round.play_date.strftime("%Y-%m"),
+                    }
+                    if linked_round is not None
+                    else None
+                ),
             }
         )
     return items
 
 
-def _goal_feed_items(
-    db: Session,
-    *,
-    viewer: User | None,
-    scope: str,
-    include_self: bool,
-) -> list[dict[str, Any]]:
-    goals = db.scalars(
-        select(RoundGoal).where(
-            RoundGoal.social_published_at.is_not(None),
-            RoundGoal.visibility.in_([VISIBILITY_PUBLIC, VISIBILITY_FOLLOWERS]),
-        )
-    ).all()
+def _goal_feed_items(goals: list[RoundGoal], *, context: dict[str, Any]) -> list[dict[str, Any]]:
     items = []
     for goal in goals:
-        if not _can_view_feed_item(
-            db,
-            viewer=viewer,
-            owner_id=goal.user_id,
-            visibility=goal.visibility,
-            scope=scope,
-            include_self=include_self,
-        ):
-            continue
-        owner = db.get(User, goal.user_id)
+        owner = context["owners"].get(goal.user_id)
         if owner is None:
             continue
+        evaluation = context["latest_evaluations"].get(goal.id)
         items.append(
             {
                 "item_type": "round_goal",
@@ -711,37 +904,21 @@ def _goal_feed_items(
                 },
                 "status": goal.status,
                 "due_date": goal.due_date,
-                "latest_evaluation": _latest_goal_evaluation(db, goal.id),
+                "latest_evaluation": (
+                    {
+                        "round_id": evaluation.round_id,
+                        "evaluation_status": evaluation.evaluation_status,
+                        "actual_value": evaluation.actual_value,
+                        "evaluated_at": evaluation.evaluated_at,
+                    }
+                    if evaluation is not None
+                    else None
+                ),
             }
         )
     return items
 
 
-def _can_view_feed_item(
-    db: Session,
-    *,
-    viewer: User | None,
-    owner_id: uuid.UUID,
-    visibility: str,
-    scope: str,
-    include_self: bool,
-) -> bool:
-    if visibility in {VISIBILITY_PRIVATE, VISIBILITY_LINK_ONLY}:
-        return False
-    if viewer is not None and owner_id == viewer.id:
-        return include_self
-    if scope == "public":
-        return visibility == VISIBILITY_PUBLIC
-    if viewer is None:
-        return visibility == VISIBILITY_PUBLIC
-    is_followed = _has_accepted_follow(db, follower_id=viewer.id, following_id=owner_id)
-    if scope == "following":
-        return is_followed and visibility in {VISIBILITY_PUBLIC, VISIBILITY_FOLLOWERS}
-    return visibility == VISIBILITY_PUBLIC or (
-        visibility == VISIBILITY_FOLLOWERS and is_followed
-    )
-
-
 def _feed_owner(owner: User) -> dict[str, Any]:
     return {
         "id": owner.id,
@@ -750,72 +927,26 @@ def _feed_owner(owner: User) -> dict[str, Any]:
     }
 
 
-def _feed_linked_round(db: Session, round_id: uuid.UUID | None) -> dict[str, Any] | None:
-    if round_id is None:
-        return None
-    round_ = db.get(Round, round_id)
-    if round_ is None or round_.deleted_at is not None:
-        return None
-    return {
-        "round_id": round_.id,
-        "course_name": round_.course_name,
-        "play_month": round_.play_date.strftime("%Y-%m"),
-    }
-
-
-def _latest_goal_evaluation(db: Session, goal_id: uuid.UUID) -> dict[str, Any] | None:
-    evaluation = db.scalars(
-        select(GoalEvaluation)
-        .where(GoalEvaluation.goal_id == goal_id)
-        .order_by(GoalEvaluation.evaluated_at.desc(), GoalEvaluation.created_at.desc())
-    ).first()
-    if evaluation is None:
-        return None
-    return {
-        "round_id": evaluation.round_id,
-        "evaluation_status": evaluation.evaluation_status,
-        "actual_value": evaluation.actual_value,
-        "evaluated_at": evaluation.evaluated_at,
-    }
-
-
 def _preview(value: str, limit: int = 120) -> str:
     stripped = " ".join(value.split())
     return stripped if len(stripped) <= limit else f"{stripped[: limit - 1]}..."
 
 
-def _comment_count(db: Session, round_id: uuid.UUID) -> int:
-    return (
-        db.scalar(
-            select(func.count())
-            .select_from(RoundComment)
-            .where(RoundComment.round_id == round_id, RoundComment.status == "active")
-        )
-        or 0
-    )
-
-
-def _liked_by_viewer(db: Session, *, viewer: User | None, round_id: uuid.UUID) -> bool:
-    if viewer is None:
-        return False
-    return db.get(RoundLike, (round_id, viewer.id)) is not None
-
-
 def _as_utc(value: datetime) -> datetime:
     if value.tzinfo is None:
         return value.replace(tzinfo=UTC)
     return value.astimezone(UTC)
 
 
-def _encode_cursor(item: dict[str, Any]) -> str:
+def _encode_cursor(published_at: datetime, item_id: uuid.UUID) -> str:
     payload = {
-        "published_at": item["social_published_at"].isoformat(),
-        "item_id": str(item["item_id"]),
+        "published_at": published_at.isoformat(),
+        "item_id": str(item_id),
     }
     return base64.urlsafe_b64encode(json.dumps(payload).encode("utf-8")).decode("ascii")
 
 
-def _decode_cursor(cursor: str | None) -> tuple[datetime, str] | None:
+def _decode_cursor(cursor: str | None) -> tuple[datetime, uuid.UUID] | None:
     if not cursor:
         return None
     try:
@@ -823,7 +954,7 @@ def _decode_cursor(cursor: str | None) -> tuple[datetime, str] | None:
         published_at = datetime.fromisoformat(str(payload["published_at"]))
         if published_at.tzinfo is None:
             published_at = published_at.replace(tzinfo=UTC)
-        return published_at, str(payload["item_id"])
+        return published_at, uuid.UUID(str(payload["item_id"]))
     except (KeyError, TypeError, ValueError, json.JSONDecodeError) as exc:
         raise SocialAccessError("Invalid feed cursor") from exc
 
@@ -1130,26 +1261,103 @@ def _comment_payload(db: Session, comment: RoundComment) -> dict[str, Any]:
     }
 
 
-def _like_count(db: Session, round_id: uuid.UUID) -> int:
-    return (
-        db.scalar(
-            select(func.count()).select_from(RoundLike).where(RoundLike.round_id == round_id)
+def _round_counts(db: Session, round_ids: list[uuid.UUID]) -> dict[uuid.UUID, tuple[int, int]]:
+    return {
+        round_id: (like_count, comment_count)
+        for round_id, like_count, comment_count in db.execute(
+            select(
+                RoundSocialCounter.round_id,
+                RoundSocialCounter.like_count,
+                RoundSocialCounter.comment_count,
+            ).where(RoundSocialCounter.round_id.in_(round_ids))
         )
-        or 0
-    )
+    }
+
 
+def _round_like_count(db: Session, round_id: uuid.UUID) -> int:
+    like_count, _comment_count = _round_counts(db, [round_id]).get(round_id, (0, 0))
+    return like_count
 
-def _has_accepted_follow(db: Session, *, follower_id: uuid.UUID, following_id: uuid.UUID) -> bool:
-    return (
-        db.scalar(
-            select(Follow).where(
-                Follow.follower_id == follower_id,
-                Follow.following_id == following_id,
-                Follow.status == "accepted",
+
+def _adjust_round_counter(
+    db: Session,
+    round_id: uuid.UUID,
+    *,
+    likes: int = 0,
+    comments: int = 0,
+) -> RoundSocialCounter:
+    """Apply a like/comment delta in the caller's transaction.
+
+    A round without a counter row is seeded from the reaction tables, which
+    already include the pending change once it is flushed. The seed row is
+    inserted with ON CONFLICT DO NOTHING: when a concurrent first reaction seeded
+    it first, its count cannot include this change, so the delta is applied instead.
+    """
+    counter = db.get(RoundSocialCounter, round_id, with_for_update=True)
+    if counter is None:
+        db.flush()
+        like_count, comment_count = _counted_round_reactions(db, [round_id]).get(round_id, (0, 0))
+        if _insert_round_counter(db, round_id, like_count=like_count, comment_count=comment_count):
+            return db.get(RoundSocialCounter, round_id)
+        counter = db.get(
+            RoundSocialCounter,
+            round_id,
+            with_for_update=True,
+            populate_existing=True,
+        )
+    counter.like_count = RoundSocialCounter.like_count + likes
+    counter.comment_count = RoundSocialCounter.comment_count + comments
+    return counter
+
+
+def _insert_round_counter(
+    db: Session,
+    round_id: uuid.UUID,
+    *,
+    like_count: int,
+    comment_count: int,
+) -> bool:
+    """Insert a counter row unless one exists; return whether this call inserted it."""
+    connection = db.connection()
+    table = RoundSocialCounter.__table__
+    values = {
+        "round_id": round_id,
+        "like_count": like_count,
+        "comment_count": comment_count,
+        "updated_at": utc_now(),
+    }
+    dialect = connection.dialect.name
+    if dialect in {"postgresql", "sqlite"}:
+        dialect_insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        result = connection.execute(
+            dialect_insert(table).values(**values).on_conflict_do_nothing(
+                index_elements=[table.c.round_id]
             )
         )
-        is not None
+        return bool(result.rowcount)
+    connection.execute(table.insert().values(**values))
+    return True
+
+
+def _counted_round_reactions(
+    db: Session,
+    round_ids: list[uuid.UUID] | None = None,
+) -> dict[uuid.UUID, tuple[int, int]]:
+    like_query = select(RoundLike.round_id, func.count()).group_by(RoundLike.round_id)
+    comment_query = (
+        select(RoundComment.round_id, func.count())
+        .where(RoundComment.status == "active")
+        .group_by(RoundComment.round_id)
     )
+    if round_ids is not None:
+        like_query = like_query.where(RoundLike.round_id.in_(round_ids))
+        comment_query = comment_query.where(RoundComment.round_id.in_(round_ids))
+    likes = dict(db.execute(like_query).all())
+    comments = dict(db.execute(comment_query).all())
+    return {
+        round_id: (likes.get(round_id, 0), comments.get(round_id, 0))
+        for round_id in likes.keys() | comments.keys()
+    }
 
 
 def _can_view_for_comments(db: Session, *, viewer: User, round_: Round) -> bool:
@@ -1157,7 +1365,7 @@ def _can_view_for_comments(db: Session, *, viewer: User, round_: Round) -> bool:
         return True
     if round_.visibility not in {VISIBILITY_PUBLIC, VISIBILITY_FOLLOWERS}:
         return False
-    return _has_accepted_follow(db, follower_id=viewer.id, following_id=round_.user_id)
+    return is_following(db, follower_id=viewer.id, following_id=round_.user_id)
 
 
 def _can_view_round_for_viewer(db: Session, *, viewer: User, round_: Round) -> bool:
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import time
+from pathlib import Path
+from typing import BinaryIO
+from uuid import uuid4
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models import SourceFile
+
+BLOB_KEY_PREFIX = "blobs"
+BLOB_STREAM_CHUNK_BYTES = 64 * 1024
+BLOB_GC_QUERY_CHUNK = 500
+
+
+class BlobTooLargeError(Exception):
+    pass
+
+
+def blob_storage_key(content_hash: str) -> str:
+    """Key a blob by its SHA-256, sharded two levels deep so no directory grows huge."""
+    return f"{BLOB_KEY_PREFIX}/{content_hash[:2]}/{content_hash[2:4]}/{content_hash}"
+
+
+def write_blob(storage_dir: Path, content: bytes) -> tuple[str, str]:
+    """Store ``content`` once and return ``(storage_key, content_hash)``."""
+    content_hash = hashlib.sha256(content).hexdigest()
+    storage_key = blob_storage_key(content_hash)
+    target = storage_dir / storage_key
+    if not _reuse_blob(target):
+        incoming = _incoming_path(target)
+        try:
+            incoming.write_bytes(content)
+            os.replace(incoming, target)
+        finally:
+            incoming.unlink(missing_ok=True)
+    return storage_key, content_hash
+
+
+def write_blob_stream(
+    storage_dir: Path,
+    stream: BinaryIO,
+    *,
+    max_bytes: int,
+) -> tuple[str, str, int]:
+    """Copy ``stream`` to storage in chunks and return ``(storage_key, content_hash, size)``.
+
+    The hash is only known at the end, so the body lands in a temporary file that is
+    renamed into place, or dropped when an identical blob already exists.
+    """
+    incoming = _incoming_path(storage_dir / BLOB_KEY_PREFIX / ".incoming")
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with incoming.open("wb") as target:
+            while chunk := stream.read(BLOB_STREAM_CHUNK_BYTES):
+                size += len(chunk)
+                if size > max_bytes:
+                    raise BlobTooLargeError
+                digest.update(chunk)
+                target.write(chunk)
+        content_hash = digest.hexdigest()
+        storage_key = blob_storage_key(content_hash)
+        blob_path = storage_dir / storage_key
+        if not _reuse_blob(blob_path):
+            blob_path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(incoming, blob_path)
+    finally:
+        incoming.unlink(missing_ok=True)
+    return storage_key, content_hash, size
+
+
+def collect_unreferenced_blobs(
+    db: Session,
+    storage_dir: Path,
+    *,
+    grace_seconds: int,
+) -> dict[str, int]:
+    """Delete blobs no ``SourceFile`` references and nobody wrote within ``grace_seconds``.
+
+    Writers refresh the mtime of a blob they reuse, so an upload that found its blob
+    present but has not committed its ``SourceFile`` yet keeps the blob alive.
+    """
+    cutoff = time.time() - grace_seconds
+    candidates: dict[str, Path] = {}
+    for path in (storage_dir / BLOB_KEY_PREFIX).glob("*/*/*"):
+        if path.name.startswith(".incoming-") or _blob_mtime(path) >= cutoff:
+            continue
+        candidates[path.relative_to(storage_dir).as_posix()] = path
+
+    keys = list(candidates)
+    referenced: set[str] = set()
+    for offset in range(0, len(keys), BLOB_GC_QUERY_CHUNK):
+        chunk = keys[offset : offset + BLOB_GC_QUERY_CHUNK]
+        referenced.update(
+            db.scalars(select(SourceFile.storage_key).where(SourceFile.storage_key.in_(chunk)))
+        )
+
+    deleted = 0
+    for storage_key, path in candidates.items():
+        # Re-check the mtime: an upload may have reused the blob since the scan.
+        if storage_key in referenced or _blob_mtime(path) >= cutoff:
+            continue
+        path.unlink(missing_ok=True)
+        deleted += 1
+    return {"checked": len(candidates), "deleted": deleted}
+
+
+def _reuse_blob(path: Path) -> bool:
+    """Refresh an existing blob's mtime for blob GC; return whether the blob exists."""
+    try:
+        os.utime(path)
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def _blob_mtime(path: Path) -> float:
+    try:
+        return path.stat().st_mtime
+    except FileNotFoundError:
+        return float("inf")
+
+
+def _incoming_path(target: Path) -> Path:
+    # Inside the storage dir, so the rename never crosses filesystems.
+    target.parent.mkdir(parents=True, exist_ok=True)
+    return target.parent / f".incoming-{uuid4()}"
@@ -1,28 +1,45 @@
 from __future__ import annotations
 
-import hashlib
+import copy
 from datetime import date
 from pathlib import Path
-from typing import Any
-from uuid import UUID
+from typing import Any, BinaryIO
+from uuid import UUID, uuid4
 
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.core.config import Settings
-from app.models import Hole, Round, RoundCompanion, Shot, SourceFile, UploadReview, User
+from app.models import (
+    AnalysisJob,
+    Hole,
+    Round,
+    RoundCompanion,
+    Shot,
+    SourceFile,
+    UploadReview,
+    User,
+)
 from app.models.constants import (
     COMPUTED_STATUS_PENDING,
     SOURCE_FILE_STATUS_COMMITTED,
     SOURCE_FILE_STATUS_FAILED,
     SOURCE_FILE_STATUS_PARSED,
+    SOURCE_FILE_STATUS_UPLOADED,
     UPLOAD_REVIEW_STATUS_COMMITTED,
     UPLOAD_REVIEW_STATUS_FAILED,
     UPLOAD_REVIEW_STATUS_NEEDS_REVIEW,
+    UPLOAD_REVIEW_STATUS_PENDING,
     UPLOAD_REVIEW_STATUS_READY,
     VISIBILITY_PRIVATE,
 )
 from app.services.analytics import build_shot_facts_from_upload_preview, parse_upload_preview
+from app.services.bulk_writes import bulk_delete, bulk_insert
+from app.services.upload_storage import (
+    BlobTooLargeError,
+    write_blob,
+    write_blob_stream,
+)
 
 
 class UploadError(Exception):
@@ -44,6 +61,9 @@ ALLOWED_UPLOAD_CONTENT_TYPES = {
 }
 
 
+UPLOAD_PARSE_JOB_KIND = "parse_upload_file"
+
+
 def create_round_file_upload(
     db: Session,
     *,
@@ -55,65 +75,146 @@ def create_round_file_upload(
 ) -> UploadReview:
     if len(content) > settings.upload_max_bytes:
         raise UploadError("Uploaded file is too large")
-    normalized_content_type = content_type.split(";", 1)[0].strip().lower() if content_type else ""
-    if normalized_content_type and normalized_content_type not in ALLOWED_UPLOAD_CONTENT_TYPES:
-        raise UploadError("Uploaded file must be a text file")
+    _validate_upload_content_type(content_type)
 
     safe_filename = Path(filename).name or "round.txt"
-    content_hash = hashlib.sha256(content).hexdigest()
-    storage_dir = Path(settings.upload_storage_dir)
-    storage_dir.mkdir(parents=True, exist_ok=True)
-
+    storage_key, content_hash = write_blob(Path(settings.upload_storage_dir), content)
     source_file = SourceFile(
         user_id=owner.id,
         filename=safe_filename,
         content_type=content_type,
-        storage_key="",
+        storage_key=storage_key,
         file_size=len(content),
         content_hash=content_hash,
         status=SOURCE_FILE_STATUS_PARSED,
     )
+    reused = _reuse_parsed_upload(db, owner=owner, source_file=source_file)
+    if reused is not None:
+        return reused
+
     db.add(source_file)
     db.flush()
+    review = UploadReview(
+        user_id=owner.id,
+        source_file_id=source_file.id,
+        status=UPLOAD_REVIEW_STATUS_PENDING,
+        parsed_round={},
+        warnings=[],
+        user_edits={},
+    )
+    db.add(review)
+    _parse_upload_into_review(source_file, review, content)
+    db.commit()
+    if review.status == UPLOAD_REVIEW_STATUS_FAILED:
+        raise UploadError(source_file.parse_error or "Uploaded file could not be parsed")
+    db.refresh(review)
+    return review
 
-    storage_key = f"{owner.id}/{source_file.id}-{safe_filename}"
-    storage_path = storage_dir / storage_key
-    storage_path.parent.mkdir(parents=True, exist_ok=True)
-    storage_path.write_bytes(content)
-    source_file.storage_key = storage_key
 
+def create_pending_round_file_upload(
+    db: Session,
+    *,
+    owner: User,
+    filename: str,
+    content_type: str | None,
+    stream: BinaryIO,
+    settings: Settings,
+) -> UploadReview:
+    """Store an upload and create its review in the pending state, without parsing.
+
+    The body is copied to storage in chunks, so the request never holds the whole
+    file in memory; ``parse_pending_upload_review`` fills the review in later. A
+    pending review is only flushed: the caller commits it together with its parse
+    job. A file already parsed for this owner comes back parsed, with nothing to queue.
+    """
+    _validate_upload_content_type(content_type)
+    safe_filename = Path(filename).name or "round.txt"
     try:
-        parse_result = parse_upload_preview(
-            content.decode("utf-8"),
-            file_name=safe_filename,
+        storage_key, content_hash, file_size = write_blob_stream(
+            Path(settings.upload_storage_dir),
+            stream,
+            max_bytes=settings.upload_max_bytes,
         )
-    except UnicodeDecodeError as exc:
-        source_file.status = SOURCE_FILE_STATUS_FAILED
-        source_file.parse_error = "Uploaded file must be UTF-8 text"
-        review = UploadReview(
-            user_id=owner.id,
-            source_file_id=source_file.id,
-            status=UPLOAD_REVIEW_STATUS_FAILED,
-            parsed_round={},
-            warnings=[
-                {
-                    "code": "invalid_encoding",
-                    "message": "Uploaded file must be UTF-8 text.",
-                    "path": "file",
-                }
-            ],
-            user_edits={},
+    except BlobTooLargeError as exc:
+        raise UploadError("Uploaded file is too large") from exc
+
+    source_file = SourceFile(
+        user_id=owner.id,
+        filename=safe_filename,
+        content_type=content_type,
+        storage_key=storage_key,
+        file_size=file_size,
+        content_hash=content_hash,
+        status=SOURCE_FILE_STATUS_UPLOADED,
+    )
+    reused = _reuse_parsed_upload(db, owner=owner, source_file=source_file)
+    if reused is not None:
+        return reused
+
+    db.add(source_file)
+    db.flush()
+    review = UploadReview(
+        user_id=owner.id,
+        source_file_id=source_file.id,
+        status=UPLOAD_REVIEW_STATUS_PENDING,
+        parsed_round={},
+        warnings=[],
+        user_edits={},
+    )
+    db.add(review)
+    db.flush()
+    return review
+
+
+def _reuse_parsed_upload(
+    db: Session,
+    *,
+    owner: User,
+    source_file: SourceFile,
+) -> UploadReview | None:
+    """Short-circuit an upload whose content this owner has already parsed.
+
+    An open, unedited review of the same content is returned as is, so a retried
+    upload is idempotent. When the earlier review was committed, ``source_file`` gets
+    a new review carrying a copy of its parse result. Returns None when nothing
+    matches and the content still has to be parsed.
+    """
+    candidates = db.scalars(
+        select(UploadReview)
+        .join(UploadReview.source_file)
+        .where(
+            SourceFile.user_id == owner.id,
+            SourceFile.content_hash == source_file.content_hash,
+            UploadReview.status.in_(
+                (
+                    UPLOAD_REVIEW_STATUS_READY,
+                    UPLOAD_REVIEW_STATUS_NEEDS_REVIEW,
+                    UPLOAD_REVIEW_STATUS_COMMITTED,
+                )
+            ),
         )
-        db.add(review)
-        db.commit()
-        raise UploadError("Uploaded file must be UTF-8 text") from exc
+        .order_by(UploadReview.created_at.desc())
+    ).all()
+    # Edits are applied to parsed_round in place, so only unedited reviews hold
+    # the plain parse result of the stored content.
+    previous = next((review for review in candidates if not review.user_edits), None)
+    if previous is None:
+        return None
+    if previous.status != UPLOAD_REVIEW_STATUS_COMMITTED:
+        return previous
 
-    warnings = parse_result["warnings"]
+    source_file.status = SOURCE_FILE_STATUS_PARSED
+    db.add(source_file)
+    db.flush()
+    parsed_round = copy.deepcopy(previous.parsed_round)
+    if "file_name" in parsed_round:
+        parsed_round["file_name"] = source_file.filename
+    warnings = copy.deepcopy(previous.warnings)
     review = UploadReview(
         user_id=owner.id,
         source_file_id=source_file.id,
         status=UPLOAD_REVIEW_STATUS_NEEDS_REVIEW if warnings else UPLOAD_REVIEW_STATUS_READY,
-        parsed_round=parse_result["parsed_round"],
+        parsed_round=parsed_round,
         warnings=warnings,
         user_edits={},
     )
@@ -123,6 +224,65 @@ def create_round_file_upload(
     return review
 
 
+def parse_pending_upload_review(
+    db: Session,
+    *,
+    upload_review_id: UUID,
+    settings: Settings,
+) -> UploadReview:
+    """Parse the stored file of a pending review; reviews past pending are left as is."""
+    review = db.get(UploadReview, upload_review_id)
+    if review is None or review.source_file is None:
+        raise UploadNotFoundError
+    if review.status != UPLOAD_REVIEW_STATUS_PENDING:
+        return review
+
+    source_file = review.source_file
+    storage_path = Path(settings.upload_storage_dir) / source_file.storage_key
+    if not source_file.storage_key or not storage_path.exists():
+        raise UploadNotFoundError
+    _parse_upload_into_review(source_file, review, storage_path.read_bytes())
+    db.commit()
+    db.refresh(review)
+    return review
+
+
+def _validate_upload_content_type(content_type: str | None) -> None:
+    normalized_content_type = content_type.split(";", 1)[0].strip().lower() if content_type else ""
+    if normalized_content_type and normalized_content_type not in ALLOWED_UPLOAD_CONTENT_TYPES:
+        raise UploadError("Uploaded file must be a text file")
+
+
+def _parse_upload_into_review(
+    source_file: SourceFile,
+    review: UploadReview,
+    content: bytes,
+) -> None:
+    try:
+        text = content.decode("utf-8")
+    except UnicodeDecodeError:
+        source_file.status = SOURCE_FILE_STATUS_FAILED
+        source_file.parse_error = "Uploaded file must be UTF-8 text"
+        review.status = UPLOAD_REVIEW_STATUS_FAILED
+        review.parsed_round = {}
+        review.warnings = [
+            {
+                "code": "invalid_encoding",
+                "message": "Uploaded file must be UTF-8 text.",
+                "path": "file",
+            }
+        ]
+        return
+
+    parse_result = parse_upload_preview(text, file_name=source_file.filename)
+    warnings = parse_result["warnings"]
+    source_file.status = SOURCE_FILE_STATUS_PARSED
+    source_file.parse_error = None
+    review.status = UPLOAD_REVIEW_STATUS_NEEDS_REVIEW if warnings else UPLOAD_REVIEW_STATUS_READY
+    review.parsed_round = parse_result["parsed_round"]
+    review.warnings = warnings
+
+
 def get_upload_review(db: Session, *, owner: User, upload_review_id: UUID) -> UploadReview:
     review = db.scalars(
         select(UploadReview).where(
@@ -181,12 +341,13 @@ def update_upload_review_raw_content(
     if len(encoded) > settings.upload_max_bytes:
         raise UploadError("Uploaded file is too large")
 
-    storage_path = Path(settings.upload_storage_dir) / source_file.storage_key
-    storage_path.parent.mkdir(parents=True, exist_ok=True)
-    storage_path.write_bytes(encoded)
-
+    # Edits become a new blob; the previous one may still back other uploads and is
+    # left to collect_unreferenced_blobs.
+    source_file.storage_key, source_file.content_hash = write_blob(
+        Path(settings.upload_storage_dir),
+        encoded,
+    )
     source_file.file_size = len(encoded)
-    source_file.content_hash = hashlib.sha256(encoded).hexdigest()
     source_file.status = SOURCE_FILE_STATUS_PARSED
     source_file.parse_error = None
 
@@ -342,68 +503,90 @@ def _apply_parsed_round_to_round(
     round_.computed_status = COMPUTED_STATUS_PENDING
     db.flush()
 
-    for companion_name in parsed_round.get("companions", []):
-        db.add(RoundCompanion(round_id=round_.id, user_id=owner.id, name=companion_name))
-
+    # Client-generated hole ids let the shots be written in the same batch as the holes.
+    hole_rows: list[dict[str, Any]] = []
+    shot_rows: list[dict[str, Any]] = []
     for hole_payload in holes:
-        hole = Hole(
-            user_id=owner.id,
-            round_id=round_.id,
-            hole_number=hole_payload.get("hole_number"),
-            par=hole_payload.get("par"),
-            score=hole_payload.get("score"),
-            putts=hole_payload.get("putts"),
-            fairway_hit=hole_payload.get("fairway_hit")
-            if hole_payload.get("fairway_hit") is not None
-            else _derive_fairway_hit(hole_payload),
-            gir=hole_payload.get("gir"),
-            penalties=hole_payload.get("penalties") or 0,
+        hole_id = uuid4()
+        hole_rows.append(
+            {
+                "id": hole_id,
+                "user_id": owner.id,
+                "round_id": round_.id,
+                "hole_number": hole_payload.get("hole_number"),
+                "par": hole_payload.get("par"),
+                "score": hole_payload.get("score"),
+                "putts": hole_payload.get("putts"),
+                "fairway_hit": hole_payload.get("fairway_hit")
+                if hole_payload.get("fairway_hit") is not None
+                else _derive_fairway_hit(hole_payload),
+                "gir": hole_payload.get("gir"),
+                "penalties": hole_payload.get("penalties") or 0,
+            }
+        )
+        shot_rows.extend(
+            {
+                "user_id": owner.id,
+                "round_id": round_.id,
+                "hole_id": hole_id,
+                "shot_number": shot_payload.get("shot_number"),
+                "club": shot_payload.get("club"),
+                "club_normalized": shot_payload.get("club_normalized"),
+                "distance": shot_payload.get("distance"),
+                "start_lie": shot_payload.get("start_lie"),
+                "end_lie": shot_payload.get("end_lie"),
+                "result_grade": shot_payload.get("result_grade"),
+                "feel_grade": shot_payload.get("feel_grade"),
+                "penalty_type": shot_payload.get("penalty_type"),
+                "penalty_strokes": shot_payload.get("penalty_strokes") or 0,
+                "score_cost": shot_payload.get("score_cost") or 1,
+                "raw_text": shot_payload.get("raw_text"),
+            }
+            for shot_payload in hole_payload.get("shots", [])
         )
-        db.add(hole)
-        db.flush()
-
-        for shot_payload in hole_payload.get("shots", []):
-            db.add(
-                Shot(
-                    user_id=owner.id,
-                    round_id=round_.id,
-                    hole_id=hole.id,
-                    shot_number=shot_payload.get("shot_number"),
-                    club=shot_payload.get("club"),
-                    club_normalized=shot_payload.get("club_normalized"),
-                    distance=shot_payload.get("distance"),
-                    start_lie=shot_payload.get("start_lie"),
-                    end_lie=shot_payload.get("end_lie"),
-                    result_grade=shot_payload.get("result_grade"),
-                    feel_grade=shot_payload.get("feel_grade"),
-                    penalty_type=shot_payload.get("penalty_type"),
-                    penalty_strokes=shot_payload.get("penalty_strokes") or 0,
-                    score_cost=shot_payload.get("score_cost") or 1,
-                    raw_text=shot_payload.get("raw_text"),
-                )
-            )
+
+    bulk_insert(
+        db,
+        RoundCompanion,
+        [
+            {"round_id": round_.id, "user_id": owner.id, "name": companion_name}
+            for companion_name in parsed_round.get("companions", [])
+        ],
+    )
+    bulk_insert(db, Hole, hole_rows)
+    bulk_insert(db, Shot, shot_rows)
 
 
 def _clear_round_children(db: Session, round_: Round) -> None:
-    for companion in db.scalars(select(RoundCompanion).where(RoundCompanion.round_id == round_.id)):
-        db.delete(companion)
-    for hole in db.scalars(select(Hole).where(Hole.round_id == round_.id)):
-        db.delete(hole)
-    db.flush()
+    bulk_delete(db, Shot, Shot.round_id == round_.id)
+    bulk_delete(db, Hole, Hole.round_id == round_.id)
+    bulk_delete(db, RoundCompanion, RoundCompanion.round_id == round_.id)
+    db.expire(round_, ["holes", "companions"])
 
 
 def get_upload_job(db: Session, *, owner: User, job_id: UUID) -> dict[str, Any]:
-    review = get_upload_review(db, owner=owner, upload_review_id=job_id)
+    """Report upload parsing progress by parse job id, or by review id for sync uploads."""
+    job = db.scalars(
+        select(AnalysisJob).where(
+            AnalysisJob.id == job_id,
+            AnalysisJob.user_id == owner.id,
+            AnalysisJob.kind == UPLOAD_PARSE_JOB_KIND,
+        )
+    ).first()
+    review_id = UUID(job.payload["upload_review_id"]) if job is not None else job_id
+    review = get_upload_review(db, owner=owner, upload_review_id=review_id)
     if review.status == UPLOAD_REVIEW_STATUS_FAILED:
         status = "failed"
     elif review.status in {UPLOAD_REVIEW_STATUS_READY, UPLOAD_REVIEW_STATUS_NEEDS_REVIEW}:
         status = "completed"
+    elif review.status == UPLOAD_REVIEW_STATUS_PENDING and job is not None:
+        status = job.status
     else:
         status = review.status
     return {
-        "id": review.id,
+        "id": job_id,
         "status": status,
-        "kind": "parse_upload_file",
+        "kind": UPLOAD_PARSE_JOB_KIND,
         "resource_id": review.id,
     }
 
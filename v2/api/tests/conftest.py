@@ -11,6 +11,7 @@ from app.core.config import get_settings
 from app.db.base import Base
 from app.db.session import get_db
 from app.main import create_app
+from app.services.analytics_versions import track_analytics_versions
 
 
 @pytest.fixture
@@ -22,6 +23,7 @@ def db_session() -> Generator[Session, None, None]:
     )
     Base.metadata.create_all(engine)
     SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+    track_analytics_versions(SessionLocal)
 
     with SessionLocal() as session:
         yield session
@@ -0,0 +1,384 @@
+"""Headless load harness for the hot read endpoints.
+
+Seeds users with imported rounds, a follow graph and reactions into a throwaway
+database, then drives the endpoints through ``create_app()`` from concurrent
+clients and reports latency percentiles and queries per request:
+
+    cd v2/api
+    PYTHONPATH=../packages/analytics_core/src python -m tests.load_harness --users 50 --rounds 20
+
+Without ``--database-url`` everything runs against a temporary SQLite file; pass an
+empty Postgres database URL to measure against Postgres instead.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import random
+import re
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from collections import defaultdict
+from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import Engine, create_engine, update
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.config import get_settings
+from app.db.base import Base
+from app.db.session import get_db
+from app.main import create_app
+from app.models import Follow, Round, RoundComment, RoundLike
+from app.models.constants import VISIBILITY_FOLLOWERS, VISIBILITY_PRIVATE, VISIBILITY_PUBLIC
+from app.services.analytics import recalculate_user_rounds
+from app.services.analytics_versions import track_analytics_versions
+from app.services.bulk_writes import bulk_insert
+from app.services.early_import import bulk_import_raw_round_files, ensure_import_owner
+from app.services.social import reconcile_round_counters
+
+BENCHMARKS_DIR = Path(__file__).resolve().parents[2] / "packages" / "analytics_core" / "benchmarks"
+if str(BENCHMARKS_DIR) not in sys.path:
+    sys.path.insert(0, str(BENCHMARKS_DIR))
+
+from synthetic_rounds import generate_user_history  # noqa: E402
+
+LOAD_PASSWORD = "load-test-password"
+HOT_ENDPOINTS = (
+    "/api/v1/social/feed",
+    "/api/v1/rounds/public",
+    "/api/v1/analytics/trends",
+    "/api/v1/analytics/summary",
+    "/api/v1/rounds/{round_id}",
+)
+SERVER_TIMING_QUERIES_RE = re.compile(r'db;[^,]*desc="(\d+) queries"')
+
+
+@dataclass(frozen=True)
+class LoadUser:
+    email: str
+    round_ids: list[uuid.UUID]
+
+
+@dataclass(frozen=True)
+class LoadSample:
+    endpoint: str
+    status_code: int
+    duration_ms: float
+    query_count: int | None
+
+
+def create_load_engine(database_url: str | None, work_dir: Path) -> Engine:
+    if database_url:
+        engine = create_engine(database_url)
+    else:
+        engine = create_engine(
+            f"sqlite+pysqlite:///{work_dir / 'load.sqlite3'}",
+            connect_args={"check_same_thread": False, "timeout": 30},
+        )
+    Base.metadata.create_all(engine)
+    return engine
+
+
+def seed_load_dataset(
+    session_factory: sessionmaker[Session],
+    *,
+    users: int,
+    rounds_per_user: int,
+    follows_per_user: int,
+    reactions_per_round: int,
+    work_dir: Path,
+    seed: int = 0,
+) -> list[LoadUser]:
+    """Import synthetic rounds per user, then add follows, visibility and reactions."""
+    rng = random.Random(seed)
+    seeded: list[LoadUser] = []
+    user_ids: list[uuid.UUID] = []
+    with session_factory() as db:
+        for index in range(users):
+            owner = ensure_import_owner(
+                db,
+                email=f"load{index}@example.com",
+                display_name=f"Load {index}",
+                password=LOAD_PASSWORD,
+            )
+            owner.handle = f"load{index}"
+            user_dir = work_dir / f"user{index}"
+            user_dir.mkdir(parents=True, exist_ok=True)
+            file_paths = []
+            texts = generate_user_history(rounds=rounds_per_user, seed=seed * 10_000 + index)
+            for round_index, text in enumerate(texts):
+                file_path = user_dir / f"round{round_index}.txt"
+                file_path.write_text(text, encoding="utf-8")
+                file_paths.append(file_path)
+            outcomes = bulk_import_raw_round_files(
+                db,
+                owner=owner,
+                file_paths=file_paths,
+                max_workers=1,
+            )
+            round_ids = []
+            for outcome in outcomes:
+                if outcome.error is not None:
+                    raise outcome.error
+                round_ids.append(uuid.UUID(outcome.result.round_id))
+            recalculate_user_rounds(db, owner=owner, round_ids=round_ids)
+            db.commit()
+            seeded.append(LoadUser(email=owner.email, round_ids=round_ids))
+            user_ids.append(owner.id)
+
+        now = datetime.now(UTC)
+        visible: list[uuid.UUID] = []
+        visibility_rows = []
+        for load_user in seeded:
+            for round_id in load_user.round_ids:
+                visibility = rng.choices(
+                    (VISIBILITY_PUBLIC, VISIBILITY_FOLLOWERS, VISIBILITY_PRIVATE),
+                    weights=(2, 1, 1),
+                )[0]
+                published = visibility != VISIBILITY_PRIVATE
+                if published:
+                    visible.append(round_id)
+                visibility_rows.append(
+                    {
+                        "id": round_id,
+                        "visibility": visibility,
+                        "social_published_at": now if published else None,
+                    }
+                )
+        db.execute(update(Round), visibility_rows)
+
+        follow_rows = []
+        for follower_id in user_ids:
+            others = [user_id for user_id in user_ids if user_id != follower_id]
+            for following_id in rng.sample(others, min(follows_per_user, len(others))):
+                follow_rows.append(
+                    {
+                        "follower_id": follower_id,
+                        "following_id": following_id,
+                        "status": "accepted",
+                        "requested_at": now,
+                        "accepted_at": now,
+                    }
+                )
+        bulk_insert(db, Follow, follow_rows)
+
+        like_rows = []
+        comment_rows = []
+        for round_id in visible:
+            for user_id in rng.sample(user_ids, min(reactions_per_round, len(user_ids))):
+                like_rows.append({"round_id": round_id, "user_id": user_id})
+                comment_rows.append(
+                    {"id": uuid.uuid4(), "round_id": round_id, "user_id": user_id, "body": "Nice"}
+                )
+        bulk_insert(db, RoundLike, like_rows)
+        bulk_insert(db, RoundComment, comment_rows)
+        reconcile_round_counters(db)
+        db.commit()
+    return seeded
+
+
+def drive_load(
+    app: FastAPI,
+    users: list[LoadUser],
+    *,
+    requests: int,
+    concurrency: int,
+    seed: int = 0,
+) -> list[LoadSample]:
+    """Send ``requests`` calls spread over the hot endpoints from ``concurrency`` clients.
+
+    Each client is logged in as its own user and is only used by one thread.
+    """
+    rng = random.Random(seed)
+    client_users = [users[index % len(users)] for index in range(concurrency)]
+    plans: list[list[tuple[str, str]]] = [[] for _ in client_users]
+    for index in range(requests):
+        client_index = index % len(client_users)
+        endpoint = HOT_ENDPOINTS[index % len(HOT_ENDPOINTS)]
+        url = endpoint
+        if "{round_id}" in endpoint:
+            url = endpoint.format(round_id=rng.choice(client_users[client_index].round_ids))
+        plans[client_index].append((endpoint, url))
+
+    def run_client(load_user: LoadUser, plan: list[tuple[str, str]]) -> list[LoadSample]:
+        samples = []
+        with TestClient(app) as client:
+            login = client.post(
+                "/api/v1/auth/login",
+                json={"email": load_user.email, "password": LOAD_PASSWORD},
+            )
+            login.raise_for_status()
+            for endpoint, url in plan:
+                start = time.perf_counter()
+                response = client.get(url)
+                duration_ms = (time.perf_counter() - start) * 1000
+                match = SERVER_TIMING_QUERIES_RE.search(response.headers.get("Server-Timing", ""))
+                samples.append(
+                    LoadSample(
+                        endpoint=endpoint,
+                        status_code=response.status_code,
+                        duration_ms=duration_ms,
+                        query_count=int(match.group(1)) if match else None,
+                    )
+                )
+        return samples
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = [
+            executor.submit(run_client, load_user, plan)
+            for load_user, plan in zip(client_users, plans, strict=True)
+        ]
+        return [sample for future in futures for sample in future.result()]
+
+
+def summarize_samples(samples: list[LoadSample]) -> dict[str, dict[str, Any]]:
+    by_endpoint: dict[str, list[LoadSample]] = defaultdict(list)
+    for sample in samples:
+        by_endpoint[sample.endpoint].append(sample)
+
+    summary = {}
+    for endpoint in HOT_ENDPOINTS:
+        endpoint_samples = by_endpoint.get(endpoint)
+        if not endpoint_samples:
+            continue
+        durations = sorted(sample.duration_ms for sample in endpoint_samples)
+        queries = [
+            sample.query_count for sample in endpoint_samples if sample.query_count is not None
+        ]
+        summary[endpoint] = {
+            "requests": len(endpoint_samples),
+            "errors": sum(1 for sample in endpoint_samples if sample.status_code >= 400),
+            "p50_ms": round(_percentile(durations, 0.50), 2),
+            "p95_ms": round(_percentile(durations, 0.95), 2),
+            "p99_ms": round(_percentile(durations, 0.99), 2),
+            "avg_queries": round(statistics.fmean(queries), 2) if queries else None,
+            "max_queries": max(queries) if queries else None,
+        }
+    return summary
+
+
+def run_load_test(
+    *,
+    users: int = 10,
+    rounds_per_user: int = 5,
+    follows_per_user: int = 5,
+    reactions_per_round: int = 2,
+    requests: int = 200,
+    concurrency: int = 4,
+    database_url: str | None = None,
+    seed: int = 0,
+) -> dict[str, Any]:
+    with tempfile.TemporaryDirectory(prefix="lalagolf-load-") as tmp:
+        work_dir = Path(tmp)
+        engine = create_load_engine(database_url, work_dir)
+        session_factory = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+        track_analytics_versions(session_factory)
+        try:
+            seed_start = time.perf_counter()
+            load_users = seed_load_dataset(
+                session_factory,
+                users=users,
+                rounds_per_user=rounds_per_user,
+                follows_per_user=follows_per_user,
+                reactions_per_round=reactions_per_round,
+                work_dir=work_dir,
+                seed=seed,
+            )
+            seed_seconds = time.perf_counter() - seed_start
+
+            app = create_app()
+            settings = get_settings().model_copy(update={"analysis_inline_fallback": False})
+
+            def override_get_db() -> Generator[Session, None, None]:
+                with session_factory() as db:
+                    yield db
+
+            app.dependency_overrides[get_db] = override_get_db
+            app.dependency_overrides[get_settings] = lambda: settings
+            samples = drive_load(
+                app,
+                load_users,
+                requests=requests,
+                concurrency=concurrency,
+                seed=seed,
+            )
+        finally:
+            engine.dispose()
+
+    return {
+        "config": {
+            "users": users,
+            "rounds_per_user": rounds_per_user,
+            "follows_per_user": follows_per_user,
+            "reactions_per_round": reactions_per_round,
+            "requests": requests,
+            "concurrency": concurrency,
+            "database": engine.dialect.name,
+        },
+        "seed_seconds": round(seed_seconds, 2),
+        "endpoints": summarize_samples(samples),
+    }
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    # Nearest-rank percentile over an already sorted list.
+    rank = max(1, -(-len(ordered) * fraction // 1))
+    return ordered[int(rank) - 1]
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Load-test the hot API read endpoints.")
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--rounds", type=int, default=5, help="Rounds per user.")
+    parser.add_argument("--follows", type=int, default=5, help="Accepted follows per user.")
+    parser.add_argument("--reactions", type=int, default=2, help="Likes and comments per round.")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--database-url",
+        default=None,
+        help="Empty throwaway database to use instead of a temporary SQLite file.",
+    )
+    parser.add_argument("--output", type=Path, help="Write the JSON report here.")
+    args = parser.parse_args(argv)
+    # Per-request log lines would drown the report.
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    logging.getLogger("lalagolf.api").setLevel(logging.WARNING)
+
+    report = run_load_test(
+        users=args.users,
+        rounds_per_user=args.rounds,
+        follows_per_user=args.follows,
+        reactions_per_round=args.reactions,
+        requests=args.requests,
+        concurrency=args.concurrency,
+        database_url=args.database_url,
+        seed=args.seed,
+    )
+    print(f"seeded in {report['seed_seconds']}s on {report['config']['database']}")
+    print(f"{'endpoint':<28}{'n':>6}{'err':>5}{'p50':>10}{'p95':>10}{'p99':>10}{'queries':>9}")
+    for endpoint, row in report["endpoints"].items():
+        print(
+            f"{endpoint.removeprefix('/api/v1'):<28}{row['requests']:>6}{row['errors']:>5}"
+            f"{row['p50_ms']:>10.1f}{row['p95_ms']:>10.1f}{row['p99_ms']:>10.1f}"
+            f"{row['avg_queries'] if row['avg_queries'] is not None else '-':>9}"
+        )
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
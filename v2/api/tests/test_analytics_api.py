@@ -1,8 +1,11 @@
+import copy
+from datetime import UTC, datetime
 from uuid import UUID
 
+import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session, sessionmaker
 
 from app.models import (
     AnalysisJob,
@@ -10,10 +13,21 @@ from app.models import (
     ExpectedScoreTable,
     Insight,
     Round,
+    RoundAnalyticsContribution,
     RoundMetric,
     ShotValue,
+    User,
+    UserAnalyticsAggregate,
 )
+from app.services import analytics as analytics_service
 from app.services.analysis_jobs import run_analysis_job_in_session
+from app.services.analytics import (
+    _expected_window_counters,
+    _slide_prior_window,
+    recalculate_round_metrics,
+    recalculate_user_rounds,
+)
+from app.services.analytics_versions import current_analytics_version
 from app.services.insight_i18n import render_insight_payload
 from tests.test_rounds_api import create_committed_round
 from tests.test_uploads_api import register
@@ -63,10 +77,12 @@ def test_recalculate_persists_analysis_and_is_idempotent(
 
     assert {metric.metric_key for metric in metrics} >= {"total_score", "putts_total"}
     assert len(shot_values) > 0
-    assert len(expected_tables) == 1
-    assert expected_tables[0].scope_type == "round_baseline"
-    assert expected_tables[0].scope_key == f"round:{round_.id}:prior_recent:10"
-    assert {value.expected_source_scope for value in shot_values} == {expected_tables[0].scope_key}
+    baseline_tables = [table for table in expected_tables if table.scope_type == "round_baseline"]
+    content_tables = [table for table in expected_tables if table.content_hash is None]
+    assert len(baseline_tables) == 1
+    assert baseline_tables[0].scope_key == f"round:{round_.id}:prior_recent:10"
+    assert [table.scope_key for table in content_tables] == [baseline_tables[0].content_hash]
+    assert {value.expected_source_scope for value in shot_values} == {baseline_tables[0].scope_key}
     assert len([insight for insight in insights if insight.status == "active"]) <= 3
     assert len({insight.dedupe_key for insight in insights}) == len(insights)
     assert len(snapshots) == 1
@@ -128,6 +144,340 @@ def test_round_recalculation_uses_prior_recent_round_baseline(
     }
 
 
+def _trend_snapshot_payload(db_session: Session, user_id: UUID) -> dict:
+    snapshot = db_session.scalar(
+        select(AnalysisSnapshot)
+        .where(
+            AnalysisSnapshot.user_id == user_id,
+            AnalysisSnapshot.scope_type == "analytics_trends",
+            AnalysisSnapshot.scope_key == "all",
+        )
+        .order_by(AnalysisSnapshot.created_at.desc())
+    )
+    assert snapshot is not None
+    return snapshot.payload
+
+
+def test_recalculation_writes_metrics_and_shot_values_in_bulk(
+    client: TestClient,
+    db_session: Session,
+) -> None:
+    register(client)
+    owner = db_session.scalars(select(User)).one()
+    round_id = UUID(create_committed_round(client))
+    recalculate_round_metrics(db_session, owner=owner, round_id=round_id)
+
+    statements: list[str] = []
+
+    def record(_conn, _cursor, statement, *_args) -> None:
+        statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        recalculate_round_metrics(db_session, owner=owner, round_id=round_id)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    for table in ("shot_values", "round_metrics"):
+        assert len([sql for sql in statements if sql.startswith(f"INSERT INTO {table}")]) == 1
+        assert len([sql for sql in statements if sql.startswith(f"DELETE FROM {table}")]) == 1
+    assert db_session.query(ShotValue).filter(ShotValue.round_id == round_id).count() == 9
+    assert db_session.query(RoundMetric).filter(RoundMetric.round_id == round_id).count() == 6
+
+
+def test_incremental_recalculation_matches_full_history_rebuild(
+    client: TestClient,
+    db_session: Session,
+) -> None:
+    register(client)
+    round_ids = [create_committed_round(client) for _ in range(3)]
+    for round_id in round_ids:
+        response = client.post(f"/api/v1/rounds/{round_id}/recalculate")
+        run_analysis_job_in_session(
+            db_session,
+            UUID(response.json()["data"]["analytics_job_id"]),
+        )
+
+    last_round = db_session.get(Round, UUID(round_ids[-1]))
+    assert last_round is not None
+    owner = db_session.get(User, last_round.user_id)
+    assert owner is not None
+    contributions = db_session.scalars(
+        select(RoundAnalyticsContribution).where(
+            RoundAnalyticsContribution.user_id == owner.id
+        )
+    ).all()
+    assert len(contributions) == 3
+    incremental = _trend_snapshot_payload(db_session, owner.id)
+    incremental_table = db_session.scalar(
+        select(ExpectedScoreTable).where(
+            ExpectedScoreTable.scope_key == f"round:{last_round.id}:prior_recent:10"
+        )
+    )
+    assert incremental_table is not None
+    incremental_expected = incremental_table.content_hash
+
+    recalculate_round_metrics(db_session, owner=owner, round_id=last_round.id, incremental=False)
+    full = _trend_snapshot_payload(db_session, owner.id)
+    db_session.refresh(incremental_table)
+
+    assert incremental_table.content_hash == incremental_expected
+    assert db_session.scalar(select(UserAnalyticsAggregate)) is None
+    for key in ("kpis", "score_trend", "shot_quality_summary"):
+        assert incremental[key] == full[key]
+    assert sorted(incremental["category_summary"], key=lambda row: row["category"]) == sorted(
+        full["category_summary"], key=lambda row: row["category"]
+    )
+    assert sorted(
+        incremental["item_summary"], key=lambda row: (row["group"], row["item"])
+    ) == sorted(full["item_summary"], key=lambda row: (row["group"], row["item"]))
+
+
+def test_full_history_trend_payload_matches_per_shot_counters(
+    client: TestClient,
+    db_session: Session,
+) -> None:
+    register(client)
+    owner = db_session.scalars(select(User)).one()
+    round_ids = [UUID(create_committed_round(client)) for _ in range(3)]
+    for round_id in round_ids:
+        recalculate_round_metrics(db_session, owner=owner, round_id=round_id)
+    # One round without a stored contribution is recomputed on its own.
+    db_session.query(RoundAnalyticsContribution).filter(
+        RoundAnalyticsContribution.round_id == round_ids[0]
+    ).delete()
+    db_session.commit()
+
+    rounds = analytics_service._owned_rounds(db_session, owner)
+    reference = analytics_service._trend_payload_from_counters(
+        analytics_service._counters_for_rounds(
+            rounds,
+            db_session.scalars(select(ShotValue)).all(),
+        ),
+        score_trend=analytics_service._score_trend(rounds),
+    )
+    payload = analytics_service._trend_payload(db_session, owner)
+
+    assert payload["shot_quality_summary"]["sample_count"] > 0
+    for key in ("kpis", "score_trend", "shot_quality_summary"):
+        assert payload[key] == reference[key]
+    assert sorted(payload["category_summary"], key=lambda row: row["category"]) == sorted(
+        reference["category_summary"], key=lambda row: row["category"]
+    )
+    assert sorted(
+        payload["item_summary"], key=lambda row: (row["group"], row["item"])
+    ) == sorted(reference["item_summary"], key=lambda row: (row["group"], row["item"]))
+
+
+def test_prior_baseline_slides_from_previous_round_and_dedupes_payloads(
+    client: TestClient,
+    db_session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    register(client)
+    round_ids = [UUID(create_committed_round(client)) for _ in range(3)]
+    owner = db_session.scalars(select(User)).one()
+    slid: list[dict | None] = []
+
+    def recording_slide(*args, **kwargs):
+        counters = _slide_prior_window(*args, **kwargs)
+        slid.append(counters)
+        return counters
+
+    monkeypatch.setattr(analytics_service, "_slide_prior_window", recording_slide)
+    for round_id in round_ids:
+        recalculate_round_metrics(db_session, owner=owner, round_id=round_id)
+
+    assert slid[0] == {}
+    assert slid[2] is not None
+    prior_rounds = [db_session.get(Round, round_id) for round_id in round_ids[:2]]
+    assert slid[2] == _expected_window_counters(prior_rounds)
+
+    def content_hashes() -> list[str]:
+        return sorted(
+            db_session.scalars(
+                select(ExpectedScoreTable.scope_key).where(
+                    ExpectedScoreTable.scope_type == "round_baseline_content"
+                )
+            ).all()
+        )
+
+    per_round_hashes = content_hashes()
+    assert len(per_round_hashes) == 3
+    recalculate_round_metrics(db_session, owner=owner, round_id=round_ids[2])
+    recalculate_user_rounds(db_session, owner=owner)
+    assert content_hashes() == per_round_hashes
+
+
+def test_deleted_round_is_subtracted_from_running_aggregate(
+    client: TestClient,
+    db_session: Session,
+) -> None:
+    register(client)
+    round_ids = [create_committed_round(client) for _ in range(2)]
+    for round_id in round_ids:
+        response = client.post(f"/api/v1/rounds/{round_id}/recalculate")
+        run_analysis_job_in_session(
+            db_session,
+            UUID(response.json()["data"]["analytics_job_id"]),
+        )
+
+    aggregate = db_session.scalar(select(UserAnalyticsAggregate))
+    assert aggregate is not None
+    assert aggregate.payload["rounds"]["round_count"] == 2
+
+    assert client.delete(f"/api/v1/rounds/{round_ids[0]}").status_code == 204
+    db_session.refresh(aggregate)
+
+    assert aggregate.payload["rounds"]["round_count"] == 1
+    remaining = db_session.scalars(select(RoundAnalyticsContribution)).all()
+    assert [str(contribution.round_id) for contribution in remaining] == [round_ids[1]]
+
+
+def test_incremental_aggregate_counters_match_full_history_counters(
+    client: TestClient,
+    db_session: Session,
+) -> None:
+    register(client)
+    owner = db_session.scalars(select(User)).one()
+    round_ids = [UUID(create_committed_round(client)) for _ in range(3)]
+    for round_id in round_ids:
+        recalculate_round_metrics(db_session, owner=owner, round_id=round_id)
+    # A deleted round must leave both paths.
+    deleted = db_session.get(Round, round_ids[1])
+    assert deleted is not None
+    deleted.deleted_at = datetime.now(UTC)
+    db_session.commit()
+    recalculate_round_metrics(db_session, owner=owner, round_id=round_ids[2])
+
+    aggregate = db_session.scalar(select(UserAnalyticsAggregate))
+    assert aggregate is not None
+    incremental = copy.deepcopy(aggregate.payload)
+    recalculate_round_metrics(db_session, owner=owner, round_id=round_ids[2], incremental=False)
+    full = analytics_service._full_history_counters(db_session, owner)
+
+    assert db_session.scalar(select(UserAnalyticsAggregate)) is None
+    assert full["rounds"]["round_count"] == 2
+    # The running aggregate prunes counters that drop back to zero.
+    for key, counters in full.items():
+        assert _nonzero_counters(incremental[key]) == _approx_counters(
+            _nonzero_counters(counters)
+        ), key
+
+
+def _nonzero_counters(value):
+    if not isinstance(value, dict):
+        return value
+    counters = {key: _nonzero_counters(item) for key, item in value.items()}
+    return {key: item for key, item in counters.items() if item not in (0, {})}
+
+
+def _approx_counters(value):
+    if isinstance(value, dict):
+        return {key: _approx_counters(item) for key, item in value.items()}
+    if isinstance(value, float):
+        return pytest.approx(value)
+    return value
+
+
+def test_only_tracked_sessions_bump_analytics_versions(
+    client: TestClient,
+    db_session: Session,
+) -> None:
+    register(client)
+    round_id = UUID(create_committed_round(client))
+    round_ = db_session.get(Round, round_id)
+    assert round_ is not None
+    user_id = round_.user_id
+    before = current_analytics_version(db_session, user_id)
+    untracked = sessionmaker(bind=db_session.get_bind(), autoflush=False)
+
+    with untracked() as session:
+        session.get(Round, round_id).course_name = "Untracked Course"
+        session.commit()
+    untracked_version = current_analytics_version(db_session, user_id)
+    db_session.refresh(round_)
+    round_.course_name = "Tracked Course"
+    db_session.commit()
+
+    assert untracked_version == before
+    assert current_analytics_version(db_session, user_id) == before + 1
+
+
+def test_incremental_recalculation_merges_into_latest_committed_aggregate(
+    client: TestClient,
+    db_session: Session,
+) -> None:
+    register(client)
+    owner = db_session.scalars(select(User)).one()
+    round_ids = [UUID(create_committed_round(client)) for _ in range(2)]
+    recalculate_round_metrics(db_session, owner=owner, round_id=round_ids[0])
+
+    aggregate = db_session.scalar(select(UserAnalyticsAggregate))
+    assert aggregate is not None
+    # Another job folds its delta in behind this session's back.
+    concurrent_payload = copy.deepcopy(aggregate.payload)
+    concurrent_payload["holes"]["penalties"] = 1000
+    db_session.connection().execute(
+        UserAnalyticsAggregate.__table__.update().values(payload=concurrent_payload)
+    )
+
+    recalculate_round_metrics(db_session, owner=owner, round_id=round_ids[1])
+
+    db_session.refresh(aggregate)
+    assert aggregate.payload["rounds"]["round_count"] == 2
+    assert aggregate.payload["holes"]["penalties"] >= 1000
+
+
+def test_batch_recalculation_matches_per_round_recalculation(
+    client: TestClient,
+    db_session: Session,
+) -> None:
+    register(client)
+    round_ids = [create_committed_round(client) for _ in range(3)]
+    for round_id in round_ids:
+        response = client.post(f"/api/v1/rounds/{round_id}/recalculate")
+        run_analysis_job_in_session(
+            db_session,
+            UUID(response.json()["data"]["analytics_job_id"]),
+        )
+
+    def persisted_analysis() -> tuple[dict, dict]:
+        values = {
+            value.shot_id: (value.expected_before, value.shot_value, value.expected_source_scope)
+            for value in db_session.scalars(select(ShotValue)).all()
+        }
+        tables = {
+            table.scope_key: (table.content_hash, table.table_payload)
+            for table in db_session.scalars(
+                select(ExpectedScoreTable).where(
+                    ExpectedScoreTable.scope_type == "round_baseline"
+                )
+            ).all()
+        }
+        return values, tables
+
+    owner = db_session.get(User, db_session.get(Round, UUID(round_ids[0])).user_id)
+    per_round = persisted_analysis()
+    per_round_snapshot = _trend_snapshot_payload(db_session, owner.id)
+
+    result = recalculate_user_rounds(db_session, owner=owner)
+    db_session.expire_all()
+
+    assert [str(row["round_id"]) for row in result["rounds"]] == round_ids
+    assert {row["computed_status"] for row in result["rounds"]} == {"ready"}
+    assert persisted_analysis() == per_round
+    assert len(db_session.scalars(select(RoundMetric)).all()) == 3 * 6
+    assert len(db_session.scalars(select(RoundAnalyticsContribution)).all()) == 3
+    batch_snapshot = _trend_snapshot_payload(db_session, owner.id)
+    for key in ("kpis", "score_trend", "shot_quality_summary", "category_summary"):
+        assert batch_snapshot[key] == per_round_snapshot[key]
+    aggregate = db_session.scalar(select(UserAnalyticsAggregate))
+    assert aggregate is not None
+    assert aggregate.payload["rounds"]["round_count"] == 3
+
+
 def test_recalculate_reuses_pending_analysis_job(
     client: TestClient,
     db_session: Session,
@@ -185,6 +535,40 @@ def test_failed_analysis_job_can_be_retried(
     assert retried["status"] == "queued"
 
 
+def test_analysis_job_routes_handle_jobs_without_a_round(
+    client: TestClient,
+    db_session: Session,
+) -> None:
+    register(client)
+    user = db_session.scalars(select(User).where(User.email == "user@example.com")).one()
+    user.role = "admin"
+    failed_job = AnalysisJob(
+        user_id=user.id,
+        round_id=None,
+        kind="trend_snapshot",
+        status="failed",
+        error_message="boom",
+        payload={},
+    )
+    db_session.add(failed_job)
+    db_session.commit()
+
+    job_response = client.get(f"/api/v1/analysis-jobs/{failed_job.id}")
+    assert job_response.status_code == 200
+    assert job_response.json()["data"]["round_id"] is None
+
+    admin_jobs = client.get("/api/v1/admin/analysis/jobs").json()["data"]
+    assert [job["id"] for job in admin_jobs] == [str(failed_job.id)]
+    assert admin_jobs[0]["course_name"] is None
+
+    retry_response = client.post(f"/api/v1/analysis-jobs/{failed_job.id}/retry")
+    assert retry_response.status_code == 200
+    retried = retry_response.json()["data"]
+    assert retried["id"] != str(failed_job.id)
+    assert retried["round_id"] is None
+    assert retried["kind"] == "trend_snapshot"
+
+
 def test_analysis_endpoints_and_insight_dismissal(
     client: TestClient,
     db_session: Session,
@@ -233,6 +617,52 @@ def test_analysis_endpoints_and_insight_dismissal(
     assert dismiss_response.json()["data"]["status"] == "dismissed"
 
 
+def test_trends_and_compare_group_shot_values_in_sql(
+    client: TestClient,
+    db_session: Session,
+) -> None:
+    register(client)
+    owner = db_session.scalars(select(User)).one()
+    for _ in range(2):
+        round_id = create_committed_round(client)
+        recalculate_round_metrics(db_session, owner=owner, round_id=UUID(round_id))
+    db_session.query(AnalysisSnapshot).delete()
+    db_session.commit()
+
+    shot_values = db_session.scalars(select(ShotValue)).all()
+    assert all(value.club == value.payload.get("club") for value in shot_values)
+
+    def expected_groups(label_of) -> dict[str, tuple[int, float]]:
+        groups: dict[str, tuple[int, float]] = {}
+        for value in shot_values:
+            count, total = groups.get(label_of(value), (0, 0.0))
+            groups[label_of(value)] = (count + 1, total + (value.shot_value or 0))
+        return {label: (count, round(total, 3)) for label, (count, total) in groups.items()}
+
+    club_rows = client.get("/api/v1/analytics/compare?group_by=club").json()["data"]["rows"]
+    assert {
+        row["label"]: (row["sample_count"], row["total_shot_value"]) for row in club_rows
+    } == expected_groups(lambda value: value.club or "unknown")
+
+    # Without a snapshot the GET answers empty and stale and queues the rebuild.
+    pending = client.get("/api/v1/analytics/trends").json()["data"]
+    assert pending["stale"] is True
+    assert pending["category_summary"] == []
+    snapshot_job = db_session.scalars(
+        select(AnalysisJob).where(
+            AnalysisJob.kind == "trend_snapshot",
+            AnalysisJob.status == "queued",
+        )
+    ).one()
+    run_analysis_job_in_session(db_session, snapshot_job.id)
+
+    trends = client.get("/api/v1/analytics/trends").json()["data"]
+    assert {
+        row["category"]: (row["count"], row["total_shot_value"])
+        for row in trends["category_summary"]
+    } == expected_groups(lambda value: value.category)
+
+
 def test_trends_endpoint_prefers_latest_snapshot(
     client: TestClient,
     db_session: Session,
@@ -269,6 +699,104 @@ def test_trends_endpoint_prefers_latest_snapshot(
     assert trends_response.json()["data"]["kpis"]["round_count"] == 999
 
 
+def test_stale_trend_snapshot_is_flagged_and_rebuilt_by_worker_job(
+    client: TestClient,
+    db_session: Session,
+) -> None:
+    register(client)
+    round_id = create_committed_round(client)
+    recalculate_response = client.post(f"/api/v1/rounds/{round_id}/recalculate")
+    run_analysis_job_in_session(
+        db_session,
+        UUID(recalculate_response.json()["data"]["analytics_job_id"]),
+    )
+
+    fresh = client.get("/api/v1/analytics/trends").json()["data"]
+    assert fresh["stale"] is False
+    assert fresh["analytics_version"] is not None
+
+    client.patch(f"/api/v1/rounds/{round_id}", json={"course_name": "Edited Course"})
+    stale = client.get("/api/v1/analytics/trends").json()["data"]
+    assert stale["stale"] is True
+    assert stale["analytics_version"] == fresh["analytics_version"]
+
+    client.get("/api/v1/analytics/trends")
+    snapshot_jobs = db_session.scalars(
+        select(AnalysisJob).where(AnalysisJob.kind == "trend_snapshot")
+    ).all()
+    assert len(snapshot_jobs) == 1
+    assert snapshot_jobs[0].status == "queued"
+    assert snapshot_jobs[0].round_id is None
+
+    result = run_analysis_job_in_session(db_session, snapshot_jobs[0].id)
+    assert result["status"] == "succeeded"
+
+    # The job recalculates the edited round before stamping the snapshot.
+    rebuilt = client.get("/api/v1/analytics/trends").json()["data"]
+    assert rebuilt["stale"] is False
+    assert rebuilt["analytics_version"] > fresh["analytics_version"]
+    assert db_session.get(Round, UUID(round_id)).computed_status == "ready"
+
+
+def test_hole_edit_trend_snapshot_job_ends_fresh_and_matches_dashboard(
+    client: TestClient,
+    db_session: Session,
+) -> None:
+    register(client)
+    round_id = create_committed_round(client)
+    recalculate_response = client.post(f"/api/v1/rounds/{round_id}/recalculate")
+    run_analysis_job_in_session(
+        db_session,
+        UUID(recalculate_response.json()["data"]["analytics_job_id"]),
+    )
+    round_ = db_session.get(Round, UUID(round_id))
+    assert round_ is not None
+    hole_id = round_.holes[0].id
+
+    assert client.patch(f"/api/v1/holes/{hole_id}", json={"score": 9}).status_code == 200
+    assert client.get("/api/v1/analytics/trends").json()["data"]["stale"] is True
+    snapshot_job = db_session.scalars(
+        select(AnalysisJob).where(AnalysisJob.kind == "trend_snapshot")
+    ).one()
+    run_analysis_job_in_session(db_session, snapshot_job.id)
+
+    trends = client.get("/api/v1/analytics/trends").json()["data"]
+    dashboard = client.get("/api/v1/analytics/summary").json()["data"]
+    assert trends["stale"] is False
+    assert trends["kpis"]["average_score"] == dashboard["kpis"]["average_score"]
+    assert db_session.scalars(
+        select(AnalysisJob.status).where(AnalysisJob.kind == "trend_snapshot")
+    ).all() == ["succeeded"]
+
+
+def test_sharing_edits_keep_trend_snapshot_fresh(
+    client: TestClient,
+    db_session: Session,
+) -> None:
+    register(client)
+    round_id = create_committed_round(client)
+    recalculate_response = client.post(f"/api/v1/rounds/{round_id}/recalculate")
+    run_analysis_job_in_session(
+        db_session,
+        UUID(recalculate_response.json()["data"]["analytics_job_id"]),
+    )
+    fresh = client.get("/api/v1/analytics/trends").json()["data"]
+    before = client.get("/api/v1/analytics/summary").json()["data"]
+    assert before["recent_rounds"][0]["visibility"] == "private"
+
+    response = client.patch(
+        f"/api/v1/rounds/{round_id}",
+        json={"visibility": "public", "share_course": True},
+    )
+    assert response.status_code == 200
+
+    trends = client.get("/api/v1/analytics/trends").json()["data"]
+    assert trends["stale"] is False
+    assert trends["analytics_version"] == fresh["analytics_version"]
+    dashboard = client.get("/api/v1/analytics/summary").json()["data"]
+    assert dashboard["recent_rounds"][0]["visibility"] == "public"
+
+
 def test_insights_support_english_locale(client: TestClient, db_session: Session) -> None:
     register(client)
     round_id = create_committed_round(client)
@@ -283,7 +811,7 @@ def test_insights_support_english_locale(client: TestClient, db_session: Session
     assert trends_response.status_code == 200
     insights = trends_response.json()["data"]["insights"]
     assert insights
-    assert any("Penalties" in insight["problem"] for insight in insights)
+    assert any(insight["problem"] == "Penalty loss" for insight in insights)
 
 
 def test_insight_renderer_keeps_korean_default() -> None:
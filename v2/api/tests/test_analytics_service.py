@@ -1,4 +1,10 @@
+import uuid
+from types import SimpleNamespace
+
+from app.models import Hole, Round, Shot
 from app.services.analytics import (
+    _shot_summary_batch,
+    _summarize_shot_batch,
     build_shot_facts_from_upload_preview,
     build_shot_value_rows,
     parse_upload_preview,
@@ -74,3 +80,39 @@ def test_build_shot_value_rows_returns_persistence_payloads():
     assert rows[0]["hole_number"] == 1
     assert rows[0]["category"] == "off_the_tee"
     assert rows[0]["payload"]["shot_value"] == 0.2
+
+
+def test_shot_summary_batch_fills_every_counter_in_one_pass():
+    def shot(number, club, **fields):
+        return Shot(
+            id=uuid.uuid4(),
+            shot_number=number,
+            club=club,
+            score_cost=fields.pop("score_cost", 1),
+            **fields,
+        )
+
+    tee = shot(1, "d", distance=230, feel_grade="a", result_grade="c", end_lie="F")
+    bunker = shot(2, "56", distance=20, start_lie="B", feel_grade="B", result_grade="A")
+    first_putt = shot(3, "P", distance=5, raw_text="P 5")
+    last_putt = shot(4, "P", distance=1, raw_text="P 1")
+    hole = Hole(hole_number=1, par=4, score=4, shots=[tee, bunker, first_putt, last_putt])
+    round_ = Round(id=uuid.uuid4(), holes=[hole])
+
+    batch = _shot_summary_batch([round_])
+    summary = _summarize_shot_batch(
+        batch,
+        [SimpleNamespace(shot_id=tee.id, shot_value=-0.4)],
+    )
+
+    assert len(batch) == 4
+    assert summary["quality_denominator"] == 2
+    assert summary["quality"]["sample_count"] == 2
+    assert summary["quality"]["risk"]["strategy_issue_count"] == 1
+    assert summary["quality"]["risk"]["driver_result_c_count"] == 1
+    assert summary["items"]["off_the_tee"]["driver"]["total_shot_value"] == -0.4
+    assert summary["items"]["short_game"]["greenside_bunker"]["up_and_down_success_count"] == 1
+    assert summary["items"]["putting"]["putt_0_2"]["made_count"] == 1
+    assert summary["items"]["putting"]["putt_2_7"]["made_count"] == 0
+    assert summary["expected"]["off_the_tee"] == {"sample_count": 1, "remaining_total": 4}
+    assert summary["expected"]["putting"] == {"sample_count": 2, "remaining_total": 3}
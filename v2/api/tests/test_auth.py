@@ -1,17 +1,20 @@
+import time
 from collections.abc import Generator
+from uuid import uuid4
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, select
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from app.core.config import get_settings
-from app.core.security import hash_password
+from app.core.security import hash_password, hash_session_token
 from app.db.base import Base
 from app.db.session import get_db
 from app.main import create_app
 from app.models import User, UserProfile, UserSession
+from app.services import session_cache
 
 
 @pytest.fixture
@@ -217,3 +220,136 @@ def test_update_profile_requires_auth_and_updates_profile(client: TestClient) ->
     assert user["profile"]["bio"] == "Weekend rounds"
     assert user["profile"]["home_course"] == "Lala CC"
     assert user["profile"]["share_course_by_default"] is True
+
+
+def test_session_cache_skips_auth_query_and_honours_invalidation(db_session: Session) -> None:
+    engine = db_session.get_bind()
+    RequestSession = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+    app = create_app()
+
+    def override_get_db() -> Generator[Session, None, None]:
+        with RequestSession() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    session_queries: list[str] = []
+
+    def record(_conn, _cursor, statement, *_args) -> None:
+        if "FROM user_sessions JOIN users" in statement:
+            session_queries.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        with TestClient(app) as client:
+            client.post(
+                "/api/v1/auth/register",
+                json={
+                    "email": "cached@example.com",
+                    "password": "strong-password",
+                    "display_name": "Cached Golfer",
+                },
+            )
+            for _ in range(3):
+                me = client.get("/api/v1/me").json()["data"]["user"]
+                assert me["display_name"] == "Cached Golfer"
+            assert len(session_queries) == 1
+
+            renamed = client.patch("/api/v1/me/profile", json={"display_name": "Renamed"})
+            assert renamed.status_code == 200
+            assert client.get("/api/v1/me").json()["data"]["user"]["display_name"] == "Renamed"
+
+            with RequestSession() as admin_session:
+                user = admin_session.scalars(
+                    select(User).where(User.email == "cached@example.com")
+                ).one()
+                user.status = "disabled"
+                admin_session.commit()
+            assert client.get("/api/v1/me").status_code == 401
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+def test_logout_invalidates_cached_session(client: TestClient) -> None:
+    client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": "logout-cache@example.com",
+            "password": "strong-password",
+            "display_name": "Lala Golfer",
+        },
+    )
+    session_cookie = client.cookies.get("lalagolf_session")
+    assert client.get("/api/v1/me").status_code == 200
+
+    client.post("/api/v1/auth/logout")
+    client.cookies.set("lalagolf_session", session_cookie)
+    assert client.get("/api/v1/me").status_code == 401
+
+
+class InMemoryRedis:
+    """The few Redis commands the caches use, shared like a real server."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, object] = {}
+
+    def get(self, key: str) -> object:
+        return self.values.get(key)
+
+    def smembers(self, key: str) -> set:
+        return set(self.values.get(key, set()))
+
+    def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.values.pop(key, None)
+
+    def pipeline(self) -> "InMemoryRedis":
+        return self
+
+    def set(self, key: str, value: object, ex: int | None = None) -> None:
+        self.values[key] = value
+
+    def sadd(self, key: str, *members: str) -> None:
+        self.values.setdefault(key, set()).update(members)
+
+    def expire(self, key: str, seconds: int) -> None:
+        pass
+
+    def incr(self, key: str) -> int:
+        self.values[key] = int(self.values.get(key) or 0) + 1
+        return self.values[key]
+
+    def execute(self) -> None:
+        pass
+
+
+def test_redis_session_cache_rejects_a_token_revoked_by_another_worker(
+    client: TestClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    redis = InMemoryRedis()
+    settings = get_settings()
+    monkeypatch.setattr(settings, "session_cache_redis_enabled", True)
+    monkeypatch.setattr(session_cache, "shared_redis_client", lambda _url: redis)
+    client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": "shared-cache@example.com",
+            "password": "strong-password",
+            "display_name": "Lala Golfer",
+        },
+    )
+    session_cookie = client.cookies.get("lalagolf_session")
+    assert client.get("/api/v1/me").status_code == 200
+    token_hash = hash_session_token(session_cookie, settings.secret_key)
+    assert redis.get(f"{session_cache.REDIS_TOKEN_KEY_PREFIX}{token_hash}") is not None
+
+    client.post("/api/v1/auth/logout")
+    # Another worker's in-process cache still remembers the session.
+    session_cache._local_cache.set(
+        token_hash,
+        {"id": uuid4(), "email": "shared-cache@example.com", "status": "active"},
+        deadline=time.time() + 60,
+    )
+    client.cookies.set("lalagolf_session", session_cookie)
+
+    assert client.get("/api/v1/me").status_code == 401
@@ -10,6 +10,8 @@ from app.db.base import Base
 from app.models import Hole, Round, RoundCompanion, Shot, SourceFile, UploadReview
 from app.models.constants import VISIBILITY_PRIVATE
 from app.services.early_import import (
+    EarlyImportError,
+    bulk_import_raw_round_files,
     ensure_import_owner,
     import_raw_round_file,
     result_to_report_row,
@@ -150,3 +152,43 @@ def test_import_raw_round_file_reuses_existing_content_hash(tmp_path, db_session
     assert second.round_id == first.round_id
     assert db_session.scalar(select(func.count(Round.id))) == 1
     assert db_session.scalar(select(func.count(SourceFile.id))) == 1
+
+
+def test_bulk_import_parses_in_pool_dedupes_hashes_and_reports_failures(
+    tmp_path,
+    db_session: Session,
+) -> None:
+    round_lines = ["2026-04-14 13:30", "파인힐스", "조인", "1P4", "D B C", "I8 C B", "P B B 6 OK"]
+    first_file = tmp_path / "first.txt"
+    first_file.write_text("\n".join(round_lines), encoding="utf-8")
+    copy_file = tmp_path / "copy.txt"
+    copy_file.write_text("\n".join(round_lines), encoding="utf-8")
+    second_file = tmp_path / "second.txt"
+    second_lines = [*round_lines[:3], "1P3", "I7 A A", "P B B 5"]
+    second_file.write_text("\n".join(second_lines), encoding="utf-8")
+    broken_file = tmp_path / "broken.txt"
+    broken_file.write_text("not a round", encoding="utf-8")
+    owner = ensure_import_owner(db_session)
+    file_paths = [first_file, copy_file, broken_file, second_file]
+
+    outcomes = bulk_import_raw_round_files(
+        db_session,
+        owner=owner,
+        file_paths=file_paths,
+        max_workers=2,
+    )
+    db_session.commit()
+
+    assert [outcome.file_path for outcome in outcomes] == file_paths
+    assert isinstance(outcomes[2].error, EarlyImportError)
+    assert outcomes[1].result == outcomes[0].result
+    assert outcomes[3].result.shot_count == 2
+    assert db_session.scalar(select(func.count(Round.id))) == 2
+    assert db_session.scalar(select(func.count(Shot.id))) == 5
+    second_round = db_session.get(Round, UUID(outcomes[3].result.round_id))
+    assert [hole.par for hole in second_round.holes] == [3]
+
+    reimported = bulk_import_raw_round_files(db_session, owner=owner, file_paths=file_paths)
+
+    assert [outcome.result for outcome in reimported] == [outcome.result for outcome in outcomes]
+    assert db_session.scalar(select(func.count(SourceFile.id))) == 2
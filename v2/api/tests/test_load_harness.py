@@ -0,0 +1,20 @@
+from tests.load_harness import HOT_ENDPOINTS, run_load_test
+
+
+def test_load_harness_reports_latency_and_queries_for_hot_endpoints() -> None:
+    report = run_load_test(
+        users=3,
+        rounds_per_user=2,
+        follows_per_user=2,
+        reactions_per_round=1,
+        requests=15,
+        concurrency=2,
+    )
+
+    assert report["config"]["database"] == "sqlite"
+    assert list(report["endpoints"]) == list(HOT_ENDPOINTS)
+    for row in report["endpoints"].values():
+        assert row["requests"] == 3
+        assert row["errors"] == 0
+        assert row["p50_ms"] <= row["p95_ms"] <= row["p99_ms"]
+        assert row["avg_queries"] > 0
@@ -1,4 +1,6 @@
+from datetime import UTC, datetime
 from pathlib import Path
+from uuid import UUID
 
 from sqlalchemy import select
 from sqlalchemy.orm import Session
@@ -57,3 +59,46 @@ def test_migration_dry_run_import_compare_and_report(
     assert db_session.scalars(select(MigrationIdMap)).first() is not None
     assert db_session.scalars(select(MigrationIssue)).first() is None
     assert db_session.scalars(select(Round).where(Round.user_id == owner.id)).first() is not None
+
+
+def test_recalculate_imported_rounds_skips_deleted_rounds_and_keeps_import_order(
+    db_session: Session,
+    tmp_path: Path,
+) -> None:
+    file_paths = []
+    for name, played_at in (
+        ("c_round.txt", "2026-04-18 09:00"),
+        ("a_round.txt", "2026-04-04 09:00"),
+        ("b_round.txt", "2026-04-11 09:00"),
+    ):
+        raw_file = tmp_path / name
+        raw_file.write_text(
+            sample_round_text().replace("2026-04-11 13:23", played_at),
+            encoding="utf-8",
+        )
+        file_paths.append(raw_file)
+    owner = owner_for_cli(
+        db_session,
+        email="owner@example.com",
+        name="Import Owner",
+        password="password",
+    )
+    run = create_migration_run(db_session, owner=owner, label="pytest-deleted-round")
+    import_result = import_raw_files_for_run(
+        db_session,
+        owner=owner,
+        run=run,
+        file_paths=file_paths,
+    )
+    imported_ids = [row["round_id"] for row in import_result["rounds"]]
+    deleted = db_session.get(Round, UUID(imported_ids[1]))
+    assert deleted is not None
+    deleted.deleted_at = datetime.now(UTC)
+    db_session.flush()
+
+    result = recalculate_imported_rounds(db_session, owner=owner, run=run)
+
+    assert [row["round_id"] for row in result["rounds"]] == [imported_ids[0], imported_ids[2]]
+    assert {row["computed_status"] for row in result["rounds"]} == {"ready"}
+    issue = db_session.scalars(select(MigrationIssue)).one()
+    assert (issue.code, issue.payload["v2_round_id"]) == ("round_not_recalculated", str(deleted.id))
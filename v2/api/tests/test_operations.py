@@ -1,8 +1,21 @@
+import contextvars
 import logging
 
+import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import select, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
+from app.core.instrumentation import (
+    QUERY_START_INFO_KEY,
+    UNMATCHED_ROUTE,
+    RequestMetrics,
+    route_stats,
+    start_request_metrics,
+)
+from app.models import User
 from tests.test_uploads_api import register
 
 
@@ -39,3 +52,68 @@ def test_ollama_enabled_path_logs_deterministic_fallback(
     evidence = response.json()["data"]["assistant_message"]["evidence"]
     assert evidence["ollama"]["timeout_seconds"] == settings.ollama_timeout_seconds
     assert any("ollama wording skipped" in record.message for record in caplog.records)
+
+
+def test_request_instrumentation_reports_queries_and_slowest_routes(
+    client: TestClient,
+    db_session: Session,
+    caplog,
+) -> None:
+    route_stats.clear()
+    register(client, "admin@example.com")
+    admin = db_session.scalars(select(User).where(User.email == "admin@example.com")).one()
+    admin.role = "admin"
+    db_session.commit()
+
+    caplog.set_level(logging.INFO, logger="lalagolf.api")
+    summary = client.get("/api/v1/analytics/summary")
+
+    assert summary.status_code == 200
+    server_timing = summary.headers["Server-Timing"]
+    assert server_timing.startswith("db;dur=")
+    assert "analytics;dur=" in server_timing
+    record = next(
+        record
+        for record in caplog.records
+        if record.message == "request completed" and record.path == "/api/v1/analytics/summary"
+    )
+    assert record.sql_count > 0
+    assert record.slowest_sql is not None
+    assert f'desc="{record.sql_count} queries"' in server_timing
+
+    response = client.get("/api/v1/admin/performance/routes?limit=5")
+
+    assert response.status_code == 200
+    rows = response.json()["data"]
+    assert len(rows) <= 5
+    summary_row = next(row for row in rows if row["route"] == "/api/v1/analytics/summary")
+    assert summary_row["method"] == "GET"
+    assert summary_row["count"] == 1
+    assert summary_row["max_sql_count"] == record.sql_count
+    assert [row["avg_ms"] for row in rows] == sorted((row["avg_ms"] for row in rows), reverse=True)
+
+
+def test_unmatched_requests_share_one_route_stats_entry(client: TestClient) -> None:
+    route_stats.clear()
+
+    for path in ("/wp-login.php", "/.env", "/api/v1/nope"):
+        assert client.get(path).status_code == 404
+
+    rows = [row for row in route_stats.slowest(limit=10) if row["method"] == "GET"]
+    assert [(row["route"], row["count"]) for row in rows] == [(UNMATCHED_ROUTE, 3)]
+
+
+def test_failed_statement_does_not_leave_a_query_timer_behind(db_session: Session) -> None:
+    connection = db_session.connection()
+
+    def run_statements() -> RequestMetrics:
+        metrics = start_request_metrics()
+        with pytest.raises(OperationalError):
+            connection.execute(text("SELECT * FROM no_such_table"))
+        connection.execute(text("SELECT 1"))
+        return metrics
+
+    metrics = contextvars.copy_context().run(run_statements)
+
+    assert not connection.info.get(QUERY_START_INFO_KEY)
+    assert metrics.sql_count == 1
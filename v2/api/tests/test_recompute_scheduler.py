@@ -0,0 +1,121 @@
+from concurrent.futures import ThreadPoolExecutor
+from uuid import UUID
+
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.config import get_settings
+from app.models import AnalysisJob, Round
+from app.models.constants import COMPUTED_STATUS_PENDING
+from app.services.analysis_jobs import run_analysis_job_in_session
+from app.services.analytics_versions import track_analytics_versions
+from app.services.recompute_scheduler import run_job_shard, run_pending_analysis_jobs
+from tests.test_rounds_api import create_committed_round
+from tests.test_uploads_api import register
+
+
+def test_scheduler_runs_each_users_jobs_in_one_ordered_shard(
+    client: TestClient,
+    db_session: Session,
+) -> None:
+    round_ids = []
+    for email in ("first@example.com", "second@example.com"):
+        register(client, email)
+        round_id = create_committed_round(client)
+        assert client.post(f"/api/v1/rounds/{round_id}/recalculate").status_code == 200
+        round_ids.append(UUID(round_id))
+    # A bulk-imported round is pending without a job of its own.
+    imported = db_session.get(Round, round_ids[1])
+    assert imported is not None
+    for job in db_session.scalars(select(AnalysisJob).where(AnalysisJob.round_id == imported.id)):
+        job.status = "succeeded"
+    imported.computed_status = COMPUTED_STATUS_PENDING
+    db_session.commit()
+
+    queued = db_session.execute(
+        select(AnalysisJob.id, AnalysisJob.user_id)
+        .where(AnalysisJob.status == "queued")
+        .order_by(AnalysisJob.created_at)
+    ).all()
+    session_factory = sessionmaker(bind=db_session.get_bind(), autoflush=False)
+    track_analytics_versions(session_factory)
+    shards = []
+
+    def record_shard(job_ids: list[str]) -> list[dict]:
+        shards.append(job_ids)
+        return run_job_shard(job_ids, session_factory=session_factory)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        count = run_pending_analysis_jobs(
+            get_settings(),
+            executor=executor,
+            shard_runner=record_shard,
+            session_factory=session_factory,
+        )
+
+    db_session.expire_all()
+    jobs = db_session.scalars(select(AnalysisJob)).all()
+    jobs_by_id = {str(job.id): job for job in jobs}
+    assert count == len(queued) + 1
+    assert len(shards) == 2
+    for shard in shards:
+        assert len({jobs_by_id[job_id].user_id for job_id in shard}) == 1
+        created = [jobs_by_id[job_id].created_at for job_id in shard]
+        assert created == sorted(created)
+    assert {job.status for job in jobs} == {"succeeded"}
+    for round_id in round_ids:
+        round_ = db_session.get(Round, round_id)
+        assert round_ is not None
+        assert round_.computed_status == "ready"
+
+
+def test_job_claimed_by_another_runner_is_skipped(
+    client: TestClient,
+    db_session: Session,
+) -> None:
+    register(client)
+    round_id = create_committed_round(client)
+    response = client.post(f"/api/v1/rounds/{round_id}/recalculate")
+    job_id = UUID(response.json()["data"]["analytics_job_id"])
+
+    first = run_analysis_job_in_session(db_session, job_id)
+    second = run_analysis_job_in_session(db_session, job_id)
+
+    job = db_session.get(AnalysisJob, job_id)
+    assert job is not None
+    assert first["status"] == "succeeded"
+    assert second == {"job_id": str(job_id), "status": "succeeded", "skipped": True}
+    assert job.attempts == 1
+
+
+def test_scheduler_leaves_users_with_a_running_job_alone(
+    client: TestClient,
+    db_session: Session,
+) -> None:
+    register(client)
+    for _ in range(2):
+        round_id = create_committed_round(client)
+        assert client.post(f"/api/v1/rounds/{round_id}/recalculate").status_code == 200
+    running, queued = db_session.scalars(
+        select(AnalysisJob).order_by(AnalysisJob.created_at)
+    ).all()
+    # The API is running the first job inline.
+    running.status = "running"
+    db_session.commit()
+    session_factory = sessionmaker(bind=db_session.get_bind(), autoflush=False)
+    track_analytics_versions(session_factory)
+    shards = []
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        count = run_pending_analysis_jobs(
+            get_settings(),
+            executor=executor,
+            shard_runner=shards.append,
+            session_factory=session_factory,
+        )
+
+    db_session.refresh(queued)
+    assert count == 0
+    assert shards == []
+    assert queued.status == "queued"
@@ -1,10 +1,12 @@
 from uuid import UUID
 
 from fastapi.testclient import TestClient
+from sqlalchemy import event, select
 from sqlalchemy.orm import Session
 
-from app.models import Round
+from app.models import AnalysisJob, AnalysisSnapshot, Round, User
 from app.services.analysis_jobs import run_analysis_job_in_session
+from app.services.rounds import refresh_dashboard_document
 from tests.test_uploads_api import register, sample_round_text
 
 
@@ -24,7 +26,17 @@ def create_committed_round(client: TestClient) -> str:
     return commit_response.json()["data"]["round_id"]
 
 
-def test_round_list_detail_and_summary(client: TestClient) -> None:
+def run_queued_document_refresh(db_session: Session) -> None:
+    job = db_session.scalars(
+        select(AnalysisJob).where(
+            AnalysisJob.kind == "trend_snapshot",
+            AnalysisJob.status == "queued",
+        )
+    ).one()
+    run_analysis_job_in_session(db_session, job.id)
+
+
+def test_round_list_detail_and_summary(client: TestClient, db_session: Session) -> None:
     register(client)
     round_id = create_committed_round(client)
 
@@ -50,15 +62,138 @@ def test_round_list_detail_and_summary(client: TestClient) -> None:
     assert shots_response.status_code == 200
     assert len(shots_response.json()["data"]) > 0
 
+    # No document yet: the GET answers empty and stale and queues the worker refresh.
+    pending = client.get("/api/v1/analytics/summary").json()["data"]
+    assert pending["stale"] is True
+    assert pending["recent_rounds"] == []
+    run_queued_document_refresh(db_session)
+
     summary_response = client.get("/api/v1/analytics/summary")
     assert summary_response.status_code == 200
     summary = summary_response.json()["data"]
+    assert summary["stale"] is False
     assert summary["kpis"]["round_count"] == 1
     assert summary["recent_rounds"][0]["id"] == round_id
     assert summary["score_trend"]
     assert len(summary["priority_insights"]) <= 3
 
 
+def test_dashboard_summary_serves_worker_document_with_etag(
+    client: TestClient,
+    db_session: Session,
+) -> None:
+    register(client)
+    round_id = create_committed_round(client)
+    recalculate_response = client.post(f"/api/v1/rounds/{round_id}/recalculate")
+    run_analysis_job_in_session(
+        db_session,
+        UUID(recalculate_response.json()["data"]["analytics_job_id"]),
+    )
+    document = db_session.query(AnalysisSnapshot).filter_by(scope_type="dashboard_summary").one()
+    assert document.payload["recent_rounds"][0]["computed_status"] == "ready"
+
+    statements: list[str] = []
+
+    def record(_conn, _cursor, statement, *_args) -> None:
+        statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        response = client.get("/api/v1/analytics/summary")
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    assert response.status_code == 200
+    assert response.json()["data"]["kpis"]["round_count"] == 1
+    assert len([statement for statement in statements if "analysis_snapshots" in statement]) == 1
+    assert not [statement for statement in statements if "FROM rounds" in statement]
+
+    etag = response.headers["etag"]
+    not_modified = client.get("/api/v1/analytics/summary", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    english = client.get("/api/v1/analytics/summary?locale=en", headers={"If-None-Match": etag})
+    assert english.status_code == 200
+
+    client.patch(f"/api/v1/rounds/{round_id}", json={"course_name": "Dashboard Course"})
+    # The stored document is served as is until the worker refreshes it.
+    stale = client.get("/api/v1/analytics/summary")
+    assert stale.headers["etag"] == etag
+    assert stale.json()["data"]["stale"] is True
+    assert stale.json()["data"]["recent_rounds"][0]["course_name"] != "Dashboard Course"
+    run_queued_document_refresh(db_session)
+
+    changed = client.get("/api/v1/analytics/summary", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.json()["data"]["stale"] is False
+    assert changed.headers["etag"] != etag
+    assert changed.json()["data"]["recent_rounds"][0]["course_name"] == "Dashboard Course"
+
+
+def test_dashboard_document_goes_stale_on_round_status_change(
+    client: TestClient,
+    db_session: Session,
+) -> None:
+    register(client)
+    round_id = create_committed_round(client)
+    first = client.post(f"/api/v1/rounds/{round_id}/recalculate")
+    run_analysis_job_in_session(db_session, UUID(first.json()["data"]["analytics_job_id"]))
+    ready = client.get("/api/v1/analytics/summary").json()["data"]
+    assert ready["stale"] is False
+    assert ready["recent_rounds"][0]["computed_status"] == "ready"
+
+    # Queuing a recalculation only flips the status, which is analytics-version neutral.
+    client.post(f"/api/v1/rounds/{round_id}/recalculate")
+
+    pending = client.get("/api/v1/analytics/summary").json()["data"]
+    assert pending["stale"] is True
+
+
+def test_dashboard_best_score_ignores_zero_totals(client: TestClient, db_session: Session) -> None:
+    register(client)
+    owner = db_session.query(User).one()
+    round_ids = [create_committed_round(client) for _ in range(2)]
+    blank = db_session.get(Round, UUID(round_ids[0]))
+    assert blank is not None
+    blank.total_score = 0
+    db_session.commit()
+
+    document = refresh_dashboard_document(db_session, owner=owner)
+
+    scored = db_session.get(Round, UUID(round_ids[1]))
+    assert scored is not None
+    assert document.payload["kpis"]["best_score"] == scored.total_score
+
+
+def test_dashboard_kpis_use_constant_queries(client: TestClient, db_session: Session) -> None:
+    register(client)
+    owner = db_session.query(User).one()
+
+    def dashboard_statements() -> list[str]:
+        statements: list[str] = []
+
+        def record(_conn, _cursor, statement, *_args) -> None:
+            statements.append(statement)
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            document = refresh_dashboard_document(db_session, owner=owner)
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+        db_session.commit()
+        assert document.payload["kpis"]["average_putts"] is not None
+        return statements
+
+    create_committed_round(client)
+    single_round = dashboard_statements()
+    for _ in range(3):
+        create_committed_round(client)
+    many_rounds = dashboard_statements()
+
+    assert len(many_rounds) == len(single_round)
+    assert len([statement for statement in many_rounds if "FROM holes" in statement]) == 1
+
+
 def test_round_filters_update_and_recalculate(client: TestClient, db_session: Session) -> None:
     register(client)
     round_id = create_committed_round(client)
@@ -13,7 +13,7 @@ from app.core.security import (
     hash_password,
     verify_password,
 )
-from app.models import AnalysisJob, ShareLink, User
+from app.models import AnalysisJob, Round, ShareLink, User
 from tests.test_rounds_api import create_committed_round
 from tests.test_uploads_api import register
 
@@ -213,3 +213,24 @@ def test_admin_can_retry_failed_analysis_job(
     assert retried["id"] != str(failed_job_id)
     assert retried["round_id"] == round_id
     assert retried["status"] == "queued"
+
+
+def test_admin_can_backfill_a_users_analytics(
+    client: TestClient,
+    db_session: Session,
+) -> None:
+    register(client, "backfill@example.com")
+    user = db_session.scalars(select(User).where(User.email == "backfill@example.com")).one()
+    create_committed_round(client)
+    create_committed_round(client)
+
+    assert client.post(f"/api/v1/admin/analytics/users/{user.id}/recalculate").status_code == 403
+    user.role = "admin"
+    db_session.commit()
+
+    response = client.post(f"/api/v1/admin/analytics/users/{user.id}/recalculate")
+
+    assert response.status_code == 200
+    assert response.json()["data"] == {"user_id": str(user.id), "recalculated_rounds": 2}
+    rounds = db_session.scalars(select(Round).where(Round.user_id == user.id)).all()
+    assert {round_.computed_status for round_ in rounds} == {"ready"}
@@ -1,9 +1,21 @@
-from uuid import UUID
+from datetime import UTC, datetime
+from uuid import UUID, uuid4
 
+import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import event, insert, update
 from sqlalchemy.orm import Session
 
-from app.models import User
+from app.core.config import get_settings
+from app.models import Round, RoundSocialCounter, User
+from app.services import follow_graph
+from app.services import social as social_service
+from app.services.social import (
+    SocialNotFoundError,
+    list_social_feed,
+    load_viewable_round,
+)
+from tests.test_auth import InMemoryRedis
 from tests.test_rounds_api import create_committed_round
 from tests.test_uploads_api import register
 
@@ -211,6 +223,50 @@ def test_follow_requester_cannot_self_accept(
     assert self_accept.status_code == 400
 
 
+def test_follow_graph_loads_once_and_is_invalidated_on_unfollow(
+    client: TestClient,
+    db_session: Session,
+) -> None:
+    register(client, "graph-owner@example.com")
+    owner_id = _user_id(db_session, "graph-owner@example.com")
+    round_ids = [create_committed_round(client) for _ in range(3)]
+    for round_id in round_ids:
+        client.patch(f"/api/v1/rounds/{round_id}", json={"visibility": "followers"})
+    client.post("/api/v1/auth/logout")
+
+    register(client, "graph-viewer@example.com")
+    viewer_id = _user_id(db_session, "graph-viewer@example.com")
+    client.post("/api/v1/follows", json={"following_id": str(owner_id)})
+    client.post("/api/v1/auth/logout")
+    client.post(
+        "/api/v1/auth/login",
+        json={"email": "graph-owner@example.com", "password": "strong-password"},
+    )
+    client.patch(f"/api/v1/follows/{viewer_id}/{owner_id}", json={"status": "accepted"})
+
+    viewer = db_session.get(User, viewer_id)
+    db_session.commit()
+    follow_queries: list[str] = []
+
+    def record(_conn, _cursor, statement, *_args) -> None:
+        if "FROM follows" in statement:
+            follow_queries.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        for round_id in round_ids:
+            load_viewable_round(db_session, viewer=viewer, round_id=UUID(round_id))
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    assert len(follow_queries) == 1
+
+    unfollow = client.delete(f"/api/v1/follows/{viewer_id}/{owner_id}")
+    assert unfollow.status_code == 204
+    with pytest.raises(SocialNotFoundError):
+        load_viewable_round(db_session, viewer=viewer, round_id=UUID(round_ids[0]))
+
+
 def test_social_feed_pending_follow_does_not_expose_followers_round(
     client: TestClient,
     db_session: Session,
@@ -344,6 +400,114 @@ def test_social_feed_cursor_pagination_has_no_duplicates(
     assert set(round_ids).issubset(combined)
 
 
+def test_social_feed_keyset_cursor_breaks_publish_time_ties_by_id(
+    client: TestClient,
+    db_session: Session,
+) -> None:
+    register(client, "tie-breaker@example.com")
+    round_ids = []
+    for _ in range(4):
+        round_id = create_committed_round(client)
+        client.patch(f"/api/v1/rounds/{round_id}", json={"visibility": "public"})
+        round_ids.append(round_id)
+    db_session.execute(
+        update(Round)
+        .where(Round.id.in_([UUID(round_id) for round_id in round_ids]))
+        .values(social_published_at=datetime(2026, 5, 1, 9, 0, tzinfo=UTC))
+    )
+    db_session.commit()
+    client.post("/api/v1/auth/logout")
+
+    seen: list[str] = []
+    cursor = None
+    for _ in range(len(round_ids) + 1):
+        query = "/api/v1/social/feed?scope=public&limit=1"
+        response = client.get(f"{query}&cursor={cursor}" if cursor else query)
+        assert response.status_code == 200
+        body = response.json()
+        seen.extend(item["round_id"] for item in body["data"])
+        cursor = body["meta"]["next_cursor"]
+        if not body["meta"]["has_more"]:
+            break
+
+    assert seen == sorted(round_ids, reverse=True)
+    assert client.get("/api/v1/social/feed?cursor=bm90LWEtY3Vyc29y").status_code == 400
+
+
+def test_social_feed_keeps_paging_when_hydration_drops_an_item(
+    client: TestClient,
+    db_session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    register(client, "dropped-item@example.com")
+    round_ids = []
+    for _ in range(3):
+        round_id = create_committed_round(client)
+        client.patch(f"/api/v1/rounds/{round_id}", json={"visibility": "public"})
+        round_ids.append(round_id)
+    client.post("/api/v1/auth/logout")
+    dropped_id = UUID(round_ids[-1])
+    hydrate = social_service._hydrate_feed_items
+
+    def hydrate_without_dropped(db, page_keys, **kwargs):
+        return [item for item in hydrate(db, page_keys, **kwargs) if item["item_id"] != dropped_id]
+
+    monkeypatch.setattr(social_service, "_hydrate_feed_items", hydrate_without_dropped)
+
+    first = client.get("/api/v1/social/feed?scope=public&limit=2").json()
+    second = client.get(
+        f"/api/v1/social/feed?scope=public&limit=2&cursor={first['meta']['next_cursor']}"
+    ).json()
+
+    assert [item["round_id"] for item in first["data"]] == [round_ids[1]]
+    assert first["meta"]["has_more"] is True
+    assert [item["round_id"] for item in second["data"]] == [round_ids[0]]
+    assert second["meta"]["has_more"] is False
+    assert second["meta"]["next_cursor"] is None
+
+
+def _count_feed_queries(db_session: Session, viewer: User) -> tuple[list[dict], int]:
+    statements: list[str] = []
+
+    def record(_conn, _cursor, statement, *_args) -> None:
+        statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        feed = list_social_feed(db_session, viewer=viewer, scope="all", include_self=True)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    return feed["items"], len(statements)
+
+
+def test_social_feed_hydrates_a_page_in_constant_queries(
+    client: TestClient,
+    db_session: Session,
+) -> None:
+    register(client, "constant-feed@example.com")
+    viewer = db_session.get(User, _user_id(db_session, "constant-feed@example.com"))
+
+    def publish_round() -> None:
+        round_id = create_committed_round(client)
+        client.patch(f"/api/v1/rounds/{round_id}", json={"visibility": "public"})
+        client.post(f"/api/v1/rounds/{round_id}/likes")
+        client.post(f"/api/v1/rounds/{round_id}/comments", json={"body": "Nice round"})
+
+    publish_round()
+    small_page = _count_feed_queries(db_session, viewer)
+    for _ in range(4):
+        publish_round()
+    large_page = _count_feed_queries(db_session, viewer)
+
+    assert (len(small_page[0]), len(large_page[0])) == (1, 5)
+    assert large_page[1] == small_page[1]
+    assert {
+        (item["like_count"], item["comment_count"], item["liked_by_me"], item["viewer_can_react"])
+        for item in large_page[0]
+    } == {(1, 1, True, True)}
+
+
 def test_social_feed_public_followers_diary_and_goal(
     client: TestClient,
     db_session: Session,
@@ -427,3 +591,106 @@ def test_social_feed_public_followers_diary_and_goal(
     assert following_feed.status_code == 200
     following_items = following_feed.json()["data"]
     assert any(item.get("round_id") == follower_round_id for item in following_items)
+
+
+def test_round_reaction_counters_stay_consistent_and_reconcile(
+    client: TestClient,
+    db_session: Session,
+) -> None:
+    register(client, "counter-owner@example.com")
+    round_id = create_committed_round(client)
+    client.patch(f"/api/v1/rounds/{round_id}", json={"visibility": "public"})
+
+    like = client.post(f"/api/v1/rounds/{round_id}/likes")
+    comment = client.post(f"/api/v1/rounds/{round_id}/comments", json={"body": "First"})
+    client.post(f"/api/v1/rounds/{round_id}/comments", json={"body": "Second"})
+    assert like.json()["data"]["like_count"] == 1
+    assert client.post(f"/api/v1/rounds/{round_id}/likes").json()["data"]["like_count"] == 1
+
+    client.delete(f"/api/v1/rounds/{round_id}/comments/{comment.json()['data']['id']}")
+    unlike = client.delete(f"/api/v1/rounds/{round_id}/likes")
+    assert unlike.json()["data"]["like_count"] == 0
+
+    counter = db_session.get(RoundSocialCounter, UUID(round_id))
+    assert counter is not None
+    assert (counter.like_count, counter.comment_count) == (0, 1)
+    detail = client.get(f"/api/v1/rounds/public/{round_id}").json()["data"]
+    assert (detail["like_count"], detail["comment_count"]) == (0, 1)
+
+    counter.like_count = 7
+    counter.comment_count = 0
+    db_session.commit()
+    assert client.post("/api/v1/admin/social/counters/reconcile").status_code == 403
+    owner = db_session.get(User, _user_id(db_session, "counter-owner@example.com"))
+    owner.role = "admin"
+    db_session.commit()
+
+    reconcile = client.post("/api/v1/admin/social/counters/reconcile")
+
+    assert reconcile.status_code == 200
+    assert reconcile.json()["data"] == {"checked": 1, "corrected": 1}
+    db_session.refresh(counter)
+    assert (counter.like_count, counter.comment_count) == (0, 1)
+
+
+def test_first_like_applies_delta_when_a_concurrent_like_seeded_the_counter(
+    client: TestClient,
+    db_session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    register(client, "race-owner@example.com")
+    round_id = UUID(create_committed_round(client))
+    client.patch(f"/api/v1/rounds/{round_id}", json={"visibility": "public"})
+    counted_round_reactions = social_service._counted_round_reactions
+
+    def seed_concurrently(db: Session, round_ids: list[UUID]) -> dict:
+        # Another first reaction commits its seed row between our lookup and insert.
+        db.execute(
+            insert(RoundSocialCounter).values(
+                round_id=round_id,
+                like_count=1,
+                comment_count=0,
+                updated_at=datetime.now(UTC),
+            )
+        )
+        return counted_round_reactions(db, round_ids)
+
+    monkeypatch.setattr(social_service, "_counted_round_reactions", seed_concurrently)
+
+    response = client.post(f"/api/v1/rounds/{round_id}/likes")
+
+    assert response.status_code == 200
+    assert response.json()["data"]["like_count"] == 2
+
+
+def test_follow_graph_redis_cache_ignores_sets_loaded_before_a_change(
+    db_session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    redis = InMemoryRedis()
+    settings = get_settings()
+    monkeypatch.setattr(settings, "follow_graph_redis_enabled", True)
+    monkeypatch.setattr(follow_graph, "shared_redis_client", lambda _url: redis)
+    viewer_id = uuid4()
+    followed_id = uuid4()
+
+    missed, generation = follow_graph._read_redis_following(viewer_id, settings=settings)
+    assert missed is None
+    # A follow commits and is invalidated while this reader still holds the old rows.
+    follow_graph.invalidate_following(db_session, viewer_id, settings=settings)
+    follow_graph._write_redis_following(
+        viewer_id,
+        frozenset(),
+        generation=generation,
+        settings=settings,
+    )
+    following, current = follow_graph._read_redis_following(viewer_id, settings=settings)
+    assert following is None
+
+    follow_graph._write_redis_following(
+        viewer_id,
+        frozenset({followed_id}),
+        generation=current,
+        settings=settings,
+    )
+    assert follow_graph._read_redis_following(viewer_id, settings=settings)[0] == {followed_id}
@@ -1,4 +1,7 @@
+import os
+import time
 from collections.abc import Generator
+from hashlib import sha256
 from pathlib import Path
 from uuid import UUID
 
@@ -13,6 +16,12 @@ from app.db.base import Base
 from app.db.session import get_db
 from app.main import create_app
 from app.models import AnalysisJob, Hole, Round, Shot, SourceFile, UploadReview
+from app.services.analysis_jobs import run_analysis_job_in_session
+from app.services.upload_storage import (
+    blob_storage_key,
+    collect_unreferenced_blobs,
+    write_blob,
+)
 
 
 @pytest.fixture
@@ -112,6 +121,76 @@ def test_upload_round_file_creates_review_and_job(client: TestClient, db_session
     assert job_response.json()["data"]["status"] == "completed"
 
 
+def test_async_upload_returns_pending_review_and_parses_in_job(
+    client: TestClient,
+    db_session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    settings = get_settings()
+    monkeypatch.setattr(settings, "upload_async_enabled", True)
+    monkeypatch.setattr(settings, "analysis_inline_fallback", False)
+    register(client)
+
+    data = upload_round(client)
+
+    assert data["status"] == "pending"
+    assert data["job_id"] != data["upload_review_id"]
+    source_file = db_session.get(SourceFile, UUID(data["source_file_id"]))
+    assert source_file is not None
+    assert source_file.status == "uploaded"
+    assert source_file.file_size == len(sample_round_text().encode("utf-8"))
+    stored = Path(settings.upload_storage_dir) / source_file.storage_key
+    assert stored.read_text(encoding="utf-8") == sample_round_text()
+    job_response = client.get(f"/api/v1/jobs/{data['job_id']}")
+    assert job_response.json()["data"]["status"] == "queued"
+    assert job_response.json()["data"]["resource_id"] == data["upload_review_id"]
+    commit_response = client.post(
+        f"/api/v1/uploads/{data['upload_review_id']}/commit",
+        json={"share_course": False, "share_exact_date": False},
+    )
+    assert commit_response.status_code == 409
+
+    result = run_analysis_job_in_session(db_session, UUID(data["job_id"]))
+
+    assert result["review_status"] == "needs_review"
+    db_session.expire_all()
+    review = db_session.get(UploadReview, UUID(data["upload_review_id"]))
+    assert review is not None
+    assert review.parsed_round["course_name"] == "베르힐 영종"
+    assert review.source_file.status == "parsed"
+    job_response = client.get(f"/api/v1/jobs/{data['job_id']}")
+    assert job_response.json()["data"]["status"] == "completed"
+
+
+def test_failed_async_upload_parse_can_be_retried(
+    client: TestClient,
+    db_session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    settings = get_settings()
+    monkeypatch.setattr(settings, "upload_async_enabled", True)
+    monkeypatch.setattr(settings, "analysis_inline_fallback", False)
+    register(client)
+    data = upload_round(client)
+    failed_job = db_session.get(AnalysisJob, UUID(data["job_id"]))
+    assert failed_job is not None
+    failed_job.status = "failed"
+    failed_job.error_message = "worker crashed"
+    db_session.commit()
+
+    retry_response = client.post(f"/api/v1/analysis-jobs/{data['job_id']}/retry")
+
+    assert retry_response.status_code == 200
+    retried = retry_response.json()["data"]
+    assert retried["id"] != data["job_id"]
+    assert retried["kind"] == "parse_upload_file"
+    assert retried["status"] == "queued"
+    assert retried["payload"]["upload_review_id"] == data["upload_review_id"]
+    run_analysis_job_in_session(db_session, UUID(retried["id"]))
+    job_response = client.get(f"/api/v1/jobs/{retried['id']}")
+    assert job_response.json()["data"]["status"] == "completed"
+
+
 def test_upload_review_is_owner_scoped(client: TestClient) -> None:
     register(client, "a@example.com")
     data = upload_round(client)
@@ -230,6 +309,99 @@ def test_update_review_raw_content_reparses_source_file(
     assert stored_raw == edited_raw
 
 
+def test_duplicate_upload_reuses_blob_and_parse_result(
+    client: TestClient,
+    db_session: Session,
+) -> None:
+    register(client)
+    first = upload_round(client)
+
+    retry = upload_round(client)
+    assert retry == first
+
+    commit_response = client.post(
+        f"/api/v1/uploads/{first['upload_review_id']}/commit",
+        json={"share_course": False, "share_exact_date": False},
+    )
+    assert commit_response.status_code == 200
+    second = upload_round(client)
+
+    assert second["upload_review_id"] != first["upload_review_id"]
+    assert second["status"] == "needs_review"
+    first_source = db_session.get(SourceFile, UUID(first["source_file_id"]))
+    second_source = db_session.get(SourceFile, UUID(second["source_file_id"]))
+    assert first_source is not None and second_source is not None
+    assert second_source.storage_key == first_source.storage_key
+    assert second_source.storage_key.endswith(second_source.content_hash)
+    second_review = db_session.get(UploadReview, UUID(second["upload_review_id"]))
+    assert second_review is not None
+    assert second_review.parsed_round["course_name"] == "베르힐 영종"
+    blobs = [path for path in Path(get_settings().upload_storage_dir).rglob("*") if path.is_file()]
+    assert len(blobs) == 1
+
+
+def test_raw_edit_leaves_replaced_blobs_to_gc(
+    client: TestClient,
+    db_session: Session,
+) -> None:
+    register(client)
+    first = upload_round(client)
+    client.post(
+        f"/api/v1/uploads/{first['upload_review_id']}/commit",
+        json={"share_course": False, "share_exact_date": False},
+    )
+    second = upload_round(client)
+    source_file = db_session.get(SourceFile, UUID(second["source_file_id"]))
+    assert source_file is not None
+    storage_dir = Path(get_settings().upload_storage_dir)
+    original_blob = storage_dir / source_file.storage_key
+
+    edited_raw = sample_round_text().replace("베르힐 영종", "Edited Raw CC")
+    for raw_content in (edited_raw, edited_raw + "\n"):
+        response = client.patch(
+            f"/api/v1/uploads/{second['upload_review_id']}/review/raw",
+            json={"raw_content": raw_content},
+        )
+        assert response.status_code == 200
+    db_session.expire_all()
+    edited_source = db_session.get(SourceFile, UUID(second["source_file_id"]))
+    assert edited_source is not None
+    edited_blob = storage_dir / edited_source.storage_key
+    replaced_blob = storage_dir / blob_storage_key(sha256(edited_raw.encode()).hexdigest())
+    assert edited_blob.read_text() == edited_raw + "\n"
+    assert replaced_blob.exists()
+
+    assert collect_unreferenced_blobs(db_session, storage_dir, grace_seconds=3600) == {
+        "checked": 0,
+        "deleted": 0,
+    }
+    assert collect_unreferenced_blobs(db_session, storage_dir, grace_seconds=0) == {
+        "checked": 3,
+        "deleted": 1,
+    }
+    # The committed first upload still references the original blob.
+    assert original_blob.exists()
+    assert edited_blob.exists()
+    assert not replaced_blob.exists()
+
+
+def test_reusing_a_blob_protects_it_from_gc_until_its_upload_commits(
+    db_session: Session,
+    tmp_path: Path,
+) -> None:
+    content = sample_round_text().encode("utf-8")
+    storage_key, _ = write_blob(tmp_path, content)
+    blob = tmp_path / storage_key
+    day_ago = time.time() - 86_400
+    os.utime(blob, (day_ago, day_ago))
+
+    # A concurrent upload of the same content finds the blob and skips the write.
+    assert write_blob(tmp_path, content)[0] == storage_key
+
+    assert collect_unreferenced_blobs(db_session, tmp_path, grace_seconds=3600)["deleted"] == 0
+    assert blob.exists()
+
+
 def test_upload_review_raw_content_falls_back_when_source_file_missing(
     client: TestClient,
     db_session: Session,
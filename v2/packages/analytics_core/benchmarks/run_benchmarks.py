@@ -0,0 +1,228 @@
+"""Time the analytics_core full-history paths on a synthetic user history.
+
+    python benchmarks/run_benchmarks.py --rounds 200 --output results.json
+    python benchmarks/run_benchmarks.py --rounds 200 --baseline results.json --max-regression 1.25
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from lalagolf_analytics_core.boundary import upload_preview_to_analytics_payload  # noqa: E402
+from lalagolf_analytics_core.data_parser import parse_content  # noqa: E402
+from lalagolf_analytics_core.expected_value import build_expected_score_table  # noqa: E402
+from lalagolf_analytics_core.metrics import build_recent_summary  # noqa: E402
+from lalagolf_analytics_core.recommendations import (  # noqa: E402
+    build_recent_shot_value_window,
+    build_recommendations,
+)
+from lalagolf_analytics_core.shot_model import normalize_shot_states  # noqa: E402
+from lalagolf_analytics_core.strokes_gained import (  # noqa: E402
+    build_shot_values_with_fallback,
+    summarize_shot_values_by_round,
+)
+from lalagolf_analytics_core.upload_normalizer import normalize_upload_content  # noqa: E402
+from synthetic_rounds import generate_user_history  # noqa: E402
+
+
+def trend_rows_from_uploads(uploads):
+    """Flatten normalized uploads into the per-shot rows the trend functions read."""
+    rows = []
+    for round_id, upload in enumerate(uploads, start=1):
+        parsed_round = upload["parsed_round"]
+        overall = upload["stats"].get("overall") or {}
+        round_fields = {
+            "round_id": round_id,
+            "round_score": parsed_round["total_score"],
+            "round_gir": overall.get("gir"),
+            "gcname": parsed_round["course_name"],
+            "playdate": parsed_round["tee_off_time"],
+        }
+        for hole in parsed_round["holes"]:
+            hole_fields = {
+                **round_fields,
+                "holenum": hole["hole_number"],
+                "hole_par": hole["par"],
+                "hole_score": hole["score"],
+                "putt": hole["putts"],
+            }
+            for shot in hole["shots"]:
+                rows.append(
+                    {
+                        **hole_fields,
+                        "club": shot["club"],
+                        "shot_score": shot["score_cost"],
+                        "feelgrade": shot["feel_grade"],
+                        "penalty": shot["penalty_type"],
+                        "shotplace": shot["start_lie"],
+                        "retplace": shot["end_lie"],
+                        "distance": shot["distance"],
+                        "retgrade": shot["result_grade"],
+                    }
+                )
+    return rows
+
+
+def run_benchmarks(*, rounds, holes, shots_per_hole, repeat, seed):
+    texts = generate_user_history(
+        rounds=rounds,
+        holes=holes,
+        shots_per_hole=shots_per_hole,
+        seed=seed,
+    )
+    results = {}
+
+    def measure(name, func, items):
+        timings = []
+        value = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            value = func()
+            timings.append((time.perf_counter() - start) * 1000)
+        results[name] = {
+            "items": items,
+            "min_ms": round(min(timings), 3),
+            "median_ms": round(statistics.median(timings), 3),
+        }
+        return value
+
+    measure("parse_content", lambda: [parse_content(text) for text in texts], len(texts))
+    uploads = measure(
+        "normalize_upload_content",
+        lambda: [normalize_upload_content(text) for text in texts],
+        len(texts),
+    )
+    payloads = [
+        upload_preview_to_analytics_payload(upload["parsed_round"], round_ref=round_id)
+        for round_id, upload in enumerate(uploads, start=1)
+    ]
+    shot_facts = measure(
+        "normalize_shot_states",
+        lambda: [
+            fact
+            for payload in payloads
+            for fact in normalize_shot_states(
+                payload["round_info"],
+                payload["holes"],
+                payload["shots"],
+            )
+        ],
+        len(payloads),
+    )
+    expected_table = measure(
+        "build_expected_score_table",
+        lambda: build_expected_score_table(shot_facts),
+        len(shot_facts),
+    )
+    measure(
+        "build_expected_score_table_columnar",
+        lambda: build_expected_score_table(shot_facts, columnar=True),
+        len(shot_facts),
+    )
+    shot_values = measure(
+        "build_shot_values_with_fallback",
+        lambda: build_shot_values_with_fallback(
+            shot_facts,
+            [{"scope_type": "user", "table": expected_table}],
+        ),
+        len(shot_facts),
+    )
+    trend_rows = trend_rows_from_uploads(uploads)
+    recent_summary = measure(
+        "build_recent_summary",
+        lambda: build_recent_summary(trend_rows),
+        len(trend_rows),
+    )
+    shot_value_window = build_recent_shot_value_window(
+        trend_rows,
+        summarize_shot_values_by_round(shot_values),
+    )
+    measure(
+        "build_recommendations",
+        lambda: build_recommendations(recent_summary, shot_value_window),
+        1,
+    )
+    return {
+        "config": {
+            "rounds": rounds,
+            "holes": holes,
+            "shots_per_hole": shots_per_hole,
+            "repeat": repeat,
+            "seed": seed,
+        },
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "shot_count": len(shot_facts),
+        "results": results,
+    }
+
+
+def compare_to_baseline(report, baseline):
+    """Return ``{name: current median / baseline median}`` for the shared benchmarks."""
+    ratios = {}
+    for name, result in report["results"].items():
+        previous = baseline.get("results", {}).get(name)
+        if previous and previous["median_ms"] > 0:
+            ratios[name] = round(result["median_ms"] / previous["median_ms"], 3)
+    return ratios
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=50, help="Rounds in the user history.")
+    parser.add_argument("--holes", type=int, default=18, help="Holes per round.")
+    parser.add_argument(
+        "--shots-per-hole",
+        type=int,
+        default=None,
+        help="Fix the shot count of every hole (default: vary around par).",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per benchmark.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="Write the JSON report here.")
+    parser.add_argument("--baseline", type=Path, help="JSON report to compare against.")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=None,
+        help="Exit non-zero when a median exceeds baseline by this ratio (e.g. 1.25).",
+    )
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(
+        rounds=args.rounds,
+        holes=args.holes,
+        shots_per_hole=args.shots_per_hole,
+        repeat=args.repeat,
+        seed=args.seed,
+    )
+    ratios = {}
+    if args.baseline:
+        ratios = compare_to_baseline(report, json.loads(args.baseline.read_text()))
+        report["baseline_ratio"] = ratios
+
+    for name, result in report["results"].items():
+        ratio = f"  x{ratios[name]:.2f}" if name in ratios else ""
+        print(f"{name:<34}{result['median_ms']:>12.3f} ms  ({result['items']} items){ratio}")
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2, ensure_ascii=False) + "\n")
+
+    if args.max_regression is not None:
+        regressed = [name for name, ratio in ratios.items() if ratio > args.max_regression]
+        if regressed:
+            print(f"regressed beyond x{args.max_regression}: {', '.join(regressed)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,103 @@
+"""Synthetic round histories in the canonical round text format (docs/input_text_format.md)."""
+
+import random
+from datetime import datetime, timedelta
+
+COURSES = ["킹스데일", "남여주 가람", "베르힐", "레이크사이드", "아시아나"]
+COMPANIONS = ["바시공", "가족", "홍성걸 양명욱 임길수", "회사 동기"]
+PAR_LAYOUT = [4, 5, 4, 3, 4, 4, 3, 5, 4, 4, 4, 3, 5, 4, 4, 3, 4, 5]
+TEE_CLUBS = {3: ["I6", "I7", "I8", "U4"], 4: ["D", "D", "D", "W3", "UW"], 5: ["D", "D", "W3"]}
+APPROACH_CLUBS = [
+    (180, "U4"),
+    (165, "I5"),
+    (150, "I6"),
+    (140, "I7"),
+    (130, "I8"),
+    (120, "I9"),
+    (105, "IP"),
+    (90, "IW"),
+    (70, "52"),
+    (0, "56"),
+]
+# Feel/result grades, skewed towards B like real rounds.
+GRADES = "AABBBBBCC"
+
+
+def generate_round_text(rng, *, play_date, holes=18, shots_per_hole=None):
+    """Return one round as text; ``shots_per_hole`` fixes the shot count of every hole."""
+    lines = [
+        play_date.strftime("%Y.%m.%d %H:%M"),
+        rng.choice(COURSES),
+        rng.choice(COMPANIONS),
+    ]
+    for hole_index in range(holes):
+        par = PAR_LAYOUT[hole_index % len(PAR_LAYOUT)]
+        lines.append(f"{hole_index + 1} P{par}")
+        lines.extend(_hole_shot_lines(rng, par, shots_per_hole))
+    return "\n".join(lines) + "\n"
+
+
+def generate_user_history(
+    *,
+    rounds=20,
+    holes=18,
+    shots_per_hole=None,
+    seed=0,
+    start=datetime(2024, 3, 2, 6, 40),
+):
+    """Return ``rounds`` round texts for one user, played a few days apart."""
+    rng = random.Random(seed)
+    play_date = start
+    texts = []
+    for _ in range(rounds):
+        texts.append(
+            generate_round_text(rng, play_date=play_date, holes=holes, shots_per_hole=shots_per_hole)
+        )
+        play_date += timedelta(days=rng.randint(3, 10), minutes=rng.randint(-60, 60))
+    return texts
+
+
+def _hole_shot_lines(rng, par, shots_per_hole):
+    putts = rng.choice([1, 2, 2, 2, 3])
+    if shots_per_hole:
+        putts = min(shots_per_hole - 1, putts)
+        full_shots = shots_per_hole - putts
+    else:
+        # Green in regulation or a shot or two later.
+        full_shots = max(1, par - 2 + rng.choice([0, 0, 0, 1, 1, 2]))
+    lines = []
+    remaining = {3: 150, 4: 360, 5: 480}.get(par, 380) + rng.randint(-30, 30)
+    for index in range(full_shots):
+        if index == 0:
+            club = rng.choice(TEE_CLUBS.get(par, TEE_CLUBS[4]))
+            carry = 220 if club == "D" else 190 if club in {"W3", "UW"} else remaining
+        else:
+            club = next(club for limit, club in APPROACH_CLUBS if remaining >= limit)
+            carry = remaining if index == full_shots - 1 else min(remaining, 170)
+        distance = max(5, min(remaining, carry) + rng.randint(-15, 10))
+        code = _shot_code(rng, index)
+        lines.append(_shot_line(rng, club, distance, code))
+        remaining = max(5, remaining - distance)
+    for index in range(putts):
+        distance = rng.choice([1, 1.5, 2, 3, 4, 6, 8, 12])
+        code = "OK" if index == putts - 1 and distance <= 1.5 else ""
+        lines.append(_shot_line(rng, "P", distance, code))
+    return lines
+
+
+def _shot_code(rng, index):
+    roll = rng.random()
+    if index == 0 and roll < 0.04:
+        return "OB"
+    if roll < 0.06:
+        return "H"
+    if roll < 0.12:
+        return "B"
+    return ""
+
+
+def _shot_line(rng, club, distance, code):
+    parts = [club, rng.choice(GRADES), rng.choice(GRADES), f"{distance:g}"]
+    if code:
+        parts.append(code)
+    return " ".join(parts)
@@ -2,11 +2,19 @@
 import re
 import argparse
 import json
-from typing import List, Dict, Union
+from typing import Dict, Iterable, Iterator, List, Tuple, Union
 
 VALID_CLUBS = ["D", "W3", "W5", "UW", "U3", "U4", "I3", "I4", "I5", "I6", "I7", "I8", "I9", "IP", "IW", "IA", "48", "52", "56", "58", "P"]
 DEFAULT_DISTANCES = [220, 200, 180, 190, 180, 170, 175, 165, 155, 145, 135, 125, 115, 105, 100, 95, 95, 85, 75, 70, 7]
 
+HOLE_HEADER_RE = re.compile(r'(\d+)\s*P(\d+)')
+SHOT_PREFIX_RE = re.compile(
+    r'\s*(?P<club>' + '|'.join(sorted(VALID_CLUBS, key=len)) + r')'
+    r'\s*(?P<feel>[ABC])\s*(?P<result>[ABC])\s*(?P<rest>.*)',
+    re.DOTALL,
+)
+DISTANCE_RE = re.compile(r'\d+')
+
 def _parse_tee_off_time(original_line: str) -> Union[str, None]:
     """Parses a line to extract tee-off time in 'YYYY-MM-DD HH:MM' format and any remaining part of the line."""
     processed_line = original_line.strip()
@@ -47,44 +55,26 @@ def _parse_tee_off_time(original_line: str) -> Union[str, None]:
 
     return None
 
-def _find_club(line:str) -> str:
-    for i in range(1, 3):
-        prefix = line[:i]
-        if prefix in VALID_CLUBS:
-            return prefix
-    raise ValueError
-
-def _find_grade(line:str) -> str:
-    prefix = line[0]
-    if prefix in ['A', 'B', 'C']:
-        return prefix
-    raise ValueError
-
 def _find_distance(line:str) -> str:
-    match = re.search(r'\d+', line)
+    match = DISTANCE_RE.search(line)
     if match:
         return match.group()
     else:
         return ""
 
-def _find_etc(line:str) -> str:
-    return line
-
 def _parse_shot_components(shot_line:str) -> List[str]:
     """Parse a line to shot components."""
-    try:
-        components = []
-
-        for func in [_find_club, _find_grade, _find_grade, _find_distance, _find_etc]:
-            shot_line = shot_line.lstrip()
-            tmp = func(shot_line)
-            components.append(tmp)
-            shot_line = shot_line[len(tmp):]
-
-        return components
-    except (IndexError, ValueError):
+    match = SHOT_PREFIX_RE.match(shot_line)
+    if match is None:
         return None
 
+    rest = match.group('rest')
+    distance = _find_distance(rest)
+    # The distance is looked up anywhere in the remainder but consumed from its
+    # start, exactly like the original component-by-component parser did.
+    etc = rest[len(distance):].lstrip()
+    return [match.group('club'), match.group('feel'), match.group('result'), distance, etc]
+
 def _parse_shot(original_line:str) -> Dict:
     processed_line = original_line.upper()
     shot_components = _parse_shot_components(processed_line)
@@ -126,60 +116,104 @@ def _parse_shot(original_line:str) -> Dict:
 
     return shot_data
 
-def parse_content(raw_content: str, file_name: str = "<memory>") -> Dict[str, Union[str, List[Dict], List[str]]]:
-    lines = raw_content.splitlines()
+def tokenize_lines(lines: Iterable[Union[str, bytes]]) -> Iterator[Dict]:
+    """Classify each non-blank line in a single pass.
+
+    Accepts any iterable of lines (a list, a generator, or a text/binary file
+    object). Every token carries the 0-based line index and the byte offset of
+    the line in the UTF-8 encoded source. Offsets are exact when lines keep
+    their original terminators, as binary file objects and
+    ``splitlines(keepends=True)`` do.
+    """
+    byte_offset = 0
+    in_hole = False
+
+    for line_num, line in enumerate(lines):
+        if isinstance(line, bytes):
+            line_size = len(line)
+            line = line.decode('utf-8')
+        else:
+            line_size = len(line.encode('utf-8'))
+        offset = byte_offset
+        byte_offset += line_size
+
+        original_line = line.strip()
+        if not original_line:
+            continue
+        processed_line = original_line.upper()
+
+        token = {'line': line_num, 'byte_offset': offset, 'text': original_line}
+        hole_match = HOLE_HEADER_RE.match(processed_line)
+        if hole_match:
+            in_hole = True
+            token['kind'] = 'hole'
+            token['hole_num'] = int(hole_match.group(1))
+            token['par'] = int(hole_match.group(2))
+        elif in_hole:
+            shot_data = _parse_shot(original_line)
+            if shot_data is None:
+                token['kind'] = 'unparsed'
+            else:
+                shot_data['line'] = line_num
+                shot_data['byte_offset'] = offset
+                token['kind'] = 'shot'
+                token['shot'] = shot_data
+        else:
+            token['kind'] = 'unparsed'
+        yield token
+
+def parse_lines(lines: Iterable[Union[str, bytes]], file_name: str = "<memory>") -> Tuple[Dict, Dict]:
+    """Parse a round from a stream of lines; returns ``(round_data, stats)``."""
     round_data = {
         'file_name': file_name,
         'tee_off_time': None,
         'golf_course': None,
         'co_players': None,
         'holes': [],
-        'unparsed_lines': []
+        'unparsed_lines': [],
+        'unparsed_positions': []
     }
-    current_hole = None # Initialize current_hole here
-
-    for line_num, line in enumerate(lines):
-        original_line = line.strip()
-        processed_line = original_line.upper()
-
-        if not processed_line:
-            continue
-
-        hole_match = re.match(r'(\d+)\s*P(\d+)', processed_line)
+    current_hole = None
 
-        if hole_match:
+    for token in tokenize_lines(lines):
+        kind = token['kind']
+        if kind == 'hole':
             if current_hole:
                 round_data['holes'].append(current_hole)
 
             current_hole = {
-                'hole_num': int(hole_match.group(1)),
-                'par': int(hole_match.group(2)),
-                'shots': []
+                'hole_num': token['hole_num'],
+                'par': token['par'],
+                'shots': [],
+                'line': token['line'],
+                'byte_offset': token['byte_offset']
             }
-
-        elif current_hole:
-            shot_data = _parse_shot(original_line)
-            if shot_data is None:
-                round_data['unparsed_lines'].append(original_line)
-            else:
-                current_hole['shots'].append(shot_data)
-
+        elif kind == 'shot':
+            current_hole['shots'].append(token['shot'])
         else:
-            round_data['unparsed_lines'].append(original_line)
+            round_data['unparsed_lines'].append(token['text'])
+            round_data['unparsed_positions'].append(
+                {'line': token['line'], 'byte_offset': token['byte_offset']}
+            )
 
     if len(round_data['unparsed_lines']) >= 3:
         round_data['tee_off_time'] = _parse_tee_off_time(round_data['unparsed_lines'][0])
         round_data['golf_course'] = round_data['unparsed_lines'][1]
         round_data['co_players'] = round_data['unparsed_lines'][2]
         round_data['unparsed_lines'] = round_data['unparsed_lines'][3:]
+        round_data['unparsed_positions'] = round_data['unparsed_positions'][3:]
 
     if current_hole:
         round_data['holes'].append(current_hole)
 
     _post_process_shots(round_data)
-    return raw_content, round_data, calculate_scores_and_stats(round_data)
+    return round_data, calculate_scores_and_stats(round_data)
+
+def parse_content(raw_content: str, file_name: str = "<memory>") -> Tuple[str, Dict, Dict]:
+    round_data, stats = parse_lines(raw_content.splitlines(keepends=True), file_name)
+    return raw_content, round_data, stats
 
-def parse_file(file_path: str) -> Dict[str, Union[str, List[Dict], List[str]]]:
+def parse_file(file_path: str) -> Tuple[str, Dict, Dict]:
     with open(file_path, 'r') as f:
         raw_content = f.read()
     return parse_content(raw_content, file_path)
@@ -4,6 +4,7 @@ from lalagolf_analytics_core.analytics_config import (
     EXPECTED_SCORE_MIN_SAMPLES_BY_LEVEL,
     EXPECTED_SCORE_RECENCY_DECAY,
 )
+from lalagolf_analytics_core.shot_model import ShotFactBatch
 
 
 FALLBACK_LEVELS = [
@@ -14,6 +15,12 @@ FALLBACK_LEVELS = [
     ("start_only", ("start_state",)),
 ]
 
+STATE_FIELDS = FALLBACK_LEVELS[0][1]
+_LEVEL_STATE_POSITIONS = [
+    (level_name, tuple(STATE_FIELDS.index(field) for field in fields))
+    for level_name, fields in FALLBACK_LEVELS
+]
+
 EXPECTED_SCORE_SCOPE_ORDER = ("user", "global", "baseline")
 HIGH_CONFIDENCE_LOOKUP_LEVELS = {"full", "no_par", "no_distance"}
 
@@ -62,7 +69,25 @@ def build_round_recency_weights(raw_trend_data, decay=EXPECTED_SCORE_RECENCY_DEC
     }
 
 
-def build_expected_score_table(shot_facts, min_samples_by_level=None, prune_low_sample=True, round_weights=None):
+def build_expected_score_table(
+    shot_facts,
+    min_samples_by_level=None,
+    prune_low_sample=True,
+    round_weights=None,
+    columnar=False,
+):
+    if columnar:
+        # Imported lazily: the columnar module builds on this one's level definitions.
+        from lalagolf_analytics_core.expected_value_columnar import (
+            build_expected_score_table_columnar,
+        )
+
+        return build_expected_score_table_columnar(
+            shot_facts,
+            min_samples_by_level=min_samples_by_level,
+            prune_low_sample=prune_low_sample,
+            round_weights=round_weights,
+        )
     level_thresholds = min_samples_by_level or EXPECTED_SCORE_MIN_SAMPLES_BY_LEVEL
     remaining_map = _remaining_strokes_map(shot_facts)
     aggregates = {
@@ -97,9 +122,18 @@ def build_expected_score_table(shot_facts, min_samples_by_level=None, prune_low_
 
 
 def lookup_expected_score(fact, expected_table, min_samples=1, min_samples_by_level=None):
+    return _lookup_expected_state(
+        make_state_key(fact, STATE_FIELDS),
+        expected_table,
+        min_samples=min_samples,
+        min_samples_by_level=min_samples_by_level,
+    )
+
+
+def _lookup_expected_state(state, expected_table, min_samples=1, min_samples_by_level=None):
     level_thresholds = min_samples_by_level or EXPECTED_SCORE_MIN_SAMPLES_BY_LEVEL
-    for level_name, fields in FALLBACK_LEVELS:
-        key = make_state_key(fact, fields)
+    for level_name, positions in _LEVEL_STATE_POSITIONS:
+        key = tuple(state[position] for position in positions)
         level_table = expected_table.get(level_name, {})
         state_stats = level_table.get(key)
         required_samples = level_thresholds.get(level_name, min_samples)
@@ -154,36 +188,130 @@ def lookup_expected_score_with_fallback(
     return None
 
 
+class CompiledExpectedScoreLookup:
+    """Fallback lookup over a fixed set of scoped tables, compiled once.
+
+    Each level keeps only the (scope, state) entries that pass their sample
+    threshold, in scope order, and every resolved state tuple is memoized. Results
+    are shared between calls and must be treated as read-only.
+    """
+
+    __slots__ = ("_levels", "_cache")
+
+    def __init__(
+        self,
+        scoped_expected_tables,
+        min_samples=1,
+        min_samples_by_level=None,
+        scope_order=EXPECTED_SCORE_SCOPE_ORDER,
+    ):
+        level_thresholds = min_samples_by_level or EXPECTED_SCORE_MIN_SAMPLES_BY_LEVEL
+        tables_by_scope = _index_scoped_expected_tables(scoped_expected_tables)
+        scope_order = scope_order or EXPECTED_SCORE_SCOPE_ORDER
+
+        self._levels = []
+        for level_name, fields in FALLBACK_LEVELS:
+            positions = tuple(STATE_FIELDS.index(field) for field in fields)
+            candidates = []
+            for scope_type in scope_order:
+                candidate = tables_by_scope.get(scope_type)
+                if not candidate:
+                    continue
+                required_samples = level_thresholds.get(level_name, min_samples)
+                candidate_min_samples_by_level = candidate.get("min_samples_by_level")
+                if candidate_min_samples_by_level:
+                    required_samples = candidate_min_samples_by_level.get(
+                        level_name,
+                        required_samples,
+                    )
+                eligible = {
+                    key: state_stats
+                    for key, state_stats in candidate["table"].get(level_name, {}).items()
+                    if state_stats and state_stats["sample_count"] >= required_samples
+                }
+                if eligible:
+                    candidates.append((scope_type, eligible))
+            if candidates:
+                self._levels.append((level_name, positions, candidates))
+        self._cache = {}
+
+    def lookup(self, fact):
+        return self.lookup_state(make_state_key(fact, STATE_FIELDS))
+
+    def lookup_state(self, state):
+        """Look up a tuple of ``STATE_FIELDS`` values."""
+        try:
+            return self._cache[state]
+        except KeyError:
+            pass
+
+        result = None
+        for level_name, positions, candidates in self._levels:
+            key = tuple(state[position] for position in positions)
+            for scope_type, eligible in candidates:
+                state_stats = eligible.get(key)
+                if state_stats is not None:
+                    result = {
+                        "expected_strokes": state_stats["expected_strokes"],
+                        "sample_count": state_stats["sample_count"],
+                        "level": level_name,
+                        "key": key,
+                        "source_scope": scope_type,
+                        "confidence": _expected_lookup_confidence(
+                            source_scope=scope_type,
+                            level_name=level_name,
+                        ),
+                    }
+                    break
+            if result is not None:
+                break
+        self._cache[state] = result
+        return result
+
+
+def compile_expected_score_lookup(
+    scoped_expected_tables,
+    min_samples=1,
+    min_samples_by_level=None,
+    scope_order=EXPECTED_SCORE_SCOPE_ORDER,
+):
+    return CompiledExpectedScoreLookup(
+        scoped_expected_tables,
+        min_samples=min_samples,
+        min_samples_by_level=min_samples_by_level,
+        scope_order=scope_order,
+    )
+
+
 def annotate_expected_scores_with_fallback(
     shot_facts,
     scoped_expected_tables,
     min_samples=1,
     min_samples_by_level=None,
     scope_order=EXPECTED_SCORE_SCOPE_ORDER,
+    compiled_lookup=None,
 ):
-    scope_order = scope_order or EXPECTED_SCORE_SCOPE_ORDER
+    if compiled_lookup is None:
+        compiled_lookup = compile_expected_score_lookup(
+            scoped_expected_tables,
+            min_samples=min_samples,
+            min_samples_by_level=min_samples_by_level,
+            scope_order=scope_order,
+        )
+    if isinstance(shot_facts, ShotFactBatch):
+        _annotate_batch(shot_facts, compiled_lookup.lookup_state, with_source=True)
+        return shot_facts
+
     annotated = []
     grouped = _group_facts_by_hole(shot_facts)
 
     for facts in grouped.values():
         for idx, fact in enumerate(facts):
             annotated_fact = dict(fact)
-            before = lookup_expected_score_with_fallback(
-                fact,
-                scoped_expected_tables,
-                min_samples=min_samples,
-                min_samples_by_level=min_samples_by_level,
-                scope_order=scope_order,
-            )
+            before = compiled_lookup.lookup(fact)
             after = None
             if idx + 1 < len(facts):
-                after = lookup_expected_score_with_fallback(
-                    facts[idx + 1],
-                    scoped_expected_tables,
-                    min_samples=min_samples,
-                    min_samples_by_level=min_samples_by_level,
-                    scope_order=scope_order,
-                )
+                after = compiled_lookup.lookup(facts[idx + 1])
 
             annotated_fact["expected_before"] = before["expected_strokes"] if before else None
             annotated_fact["expected_after"] = after["expected_strokes"] if after else 0
@@ -197,6 +325,22 @@ def annotate_expected_scores_with_fallback(
 
 
 def annotate_expected_scores(shot_facts, expected_table, min_samples=1, min_samples_by_level=None):
+    if isinstance(shot_facts, ShotFactBatch):
+        cache = {}
+
+        def lookup_state(state):
+            if state not in cache:
+                cache[state] = _lookup_expected_state(
+                    state,
+                    expected_table,
+                    min_samples=min_samples,
+                    min_samples_by_level=min_samples_by_level,
+                )
+            return cache[state]
+
+        _annotate_batch(shot_facts, lookup_state, with_source=False)
+        return shot_facts
+
     annotated = []
     grouped = _group_facts_by_hole(shot_facts)
 
@@ -227,6 +371,42 @@ def annotate_expected_scores(shot_facts, expected_table, min_samples=1, min_samp
     return annotated
 
 
+def _annotate_batch(batch, lookup_state, with_source):
+    """Fill the expected-score columns of ``batch`` in place, one lookup per row."""
+    states = zip(*(batch.column(field) for field in STATE_FIELDS))
+    results = [lookup_state(state) for state in states]
+    size = len(results)
+    expected_before = [None] * size
+    expected_after = [0] * size
+    lookup_level = [None] * size
+    sample_count = [0] * size
+    source_scope = [None] * size
+    confidence = ["low"] * size
+
+    for indexes in batch.hole_groups():
+        for idx, row in enumerate(indexes):
+            before = results[row]
+            if idx + 1 < len(indexes):
+                after = results[indexes[idx + 1]]
+                if after:
+                    expected_after[row] = after["expected_strokes"]
+            if before:
+                expected_before[row] = before["expected_strokes"]
+                lookup_level[row] = before["level"]
+                sample_count[row] = before["sample_count"]
+                if with_source:
+                    source_scope[row] = before["source_scope"]
+                    confidence[row] = before["confidence"]
+
+    batch.fill_column("expected_before", expected_before)
+    batch.fill_column("expected_after", expected_after)
+    batch.fill_column("expected_lookup_level", lookup_level)
+    batch.fill_column("expected_sample_count", sample_count)
+    if with_source:
+        batch.fill_column("expected_source_scope", source_scope)
+        batch.fill_column("expected_confidence", confidence)
+
+
 def _index_scoped_expected_tables(scoped_expected_tables):
     indexed = {}
     for candidate in scoped_expected_tables:
@@ -0,0 +1,180 @@
+"""Columnar engine for building expected-score tables over long histories.
+
+Each state field is encoded once as integer codes, remaining strokes are derived
+from per-hole suffix sums, and every fallback level is reduced with grouped sums.
+NumPy is used when installed (``lalagolf-analytics-core[columnar]``); otherwise the
+same encoded columns are reduced in pure Python.
+"""
+
+from lalagolf_analytics_core.analytics_config import EXPECTED_SCORE_MIN_SAMPLES_BY_LEVEL
+from lalagolf_analytics_core.expected_value import FALLBACK_LEVELS, STATE_FIELDS
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when the optional extra is absent
+    np = None
+
+
+def encode_state_columns(shot_facts, round_weights=None):
+    vocabularies = {field: {} for field in STATE_FIELDS}
+    codes = {field: [] for field in STATE_FIELDS}
+    hole_codes = {}
+    hole_column = []
+    shot_numbers = []
+    costs = []
+    weights = []
+
+    for fact in shot_facts:
+        for field in STATE_FIELDS:
+            vocabulary = vocabularies[field]
+            value = fact.get(field)
+            code = vocabulary.get(value)
+            if code is None:
+                code = vocabulary[value] = len(vocabulary)
+            codes[field].append(code)
+
+        round_id = fact.get("round_id")
+        hole_key = (round_id, fact.get("hole_num"))
+        hole_code = hole_codes.get(hole_key)
+        if hole_code is None:
+            hole_code = hole_codes[hole_key] = len(hole_codes)
+        hole_column.append(hole_code)
+        shot_numbers.append(fact.get("shot_num") or 0)
+        costs.append((fact.get("score_cost") or 0) + (fact.get("penalty_strokes") or 0))
+        weights.append(1.0 if round_weights is None else round_weights.get(round_id, 1.0))
+
+    return {
+        "size": len(hole_column),
+        "codes": codes,
+        "values": {
+            field: list(vocabulary.keys()) for field, vocabulary in vocabularies.items()
+        },
+        "hole": hole_column,
+        "shot_num": shot_numbers,
+        "cost": costs,
+        "weight": weights,
+    }
+
+
+def build_expected_score_table_columnar(
+    shot_facts,
+    min_samples_by_level=None,
+    prune_low_sample=True,
+    round_weights=None,
+):
+    level_thresholds = min_samples_by_level or EXPECTED_SCORE_MIN_SAMPLES_BY_LEVEL
+    columns = encode_state_columns(shot_facts, round_weights=round_weights)
+    if np is not None:
+        aggregates = _reduce_levels_numpy(columns)
+    else:
+        aggregates = _reduce_levels_python(columns)
+
+    table = {}
+    for level_name, fields in FALLBACK_LEVELS:
+        table[level_name] = {}
+        for key_codes, (weighted_total, count, weighted_count) in aggregates[level_name].items():
+            if prune_low_sample and count < level_thresholds.get(level_name, 1):
+                continue
+            key = tuple(
+                columns["values"][field][code] for field, code in zip(fields, key_codes)
+            )
+            table[level_name][key] = {
+                "expected_strokes": weighted_total / weighted_count if weighted_count else 0,
+                "sample_count": count,
+                "weighted_sample_count": weighted_count,
+            }
+    return table
+
+
+def _remaining_strokes_python(columns):
+    order = sorted(
+        range(columns["size"]),
+        key=lambda idx: (columns["hole"][idx], columns["shot_num"][idx]),
+    )
+    remaining = [0] * columns["size"]
+    running_total = 0
+    previous_hole = None
+    for idx in reversed(order):
+        hole = columns["hole"][idx]
+        if hole != previous_hole:
+            running_total = 0
+            previous_hole = hole
+        running_total += columns["cost"][idx]
+        remaining[idx] = running_total
+    return remaining
+
+
+def _reduce_levels_python(columns):
+    remaining = _remaining_strokes_python(columns)
+    weights = columns["weight"]
+    field_codes = [columns["codes"][field] for field in STATE_FIELDS]
+    aggregates = {}
+    for level_name, fields in FALLBACK_LEVELS:
+        positions = [STATE_FIELDS.index(field) for field in fields]
+        buckets = {}
+        for idx in range(columns["size"]):
+            key = tuple(field_codes[position][idx] for position in positions)
+            weight = weights[idx]
+            bucket = buckets.get(key)
+            if bucket is None:
+                bucket = buckets[key] = [0.0, 0, 0.0]
+            bucket[0] += remaining[idx] * weight
+            bucket[1] += 1
+            bucket[2] += weight
+        aggregates[level_name] = buckets
+    return aggregates
+
+
+def _remaining_strokes_numpy(columns):
+    holes = np.asarray(columns["hole"], dtype=np.int64)
+    shot_numbers = np.asarray(columns["shot_num"], dtype=np.int64)
+    costs = np.asarray(columns["cost"], dtype=np.int64)
+
+    order = np.lexsort((shot_numbers, holes))
+    sorted_holes = holes[order]
+    sorted_costs = costs[order]
+    cumulative = np.cumsum(sorted_costs)
+    hole_ends = np.flatnonzero(np.append(sorted_holes[1:] != sorted_holes[:-1], True))
+    hole_totals = np.zeros(int(holes.max()) + 1, dtype=np.int64)
+    hole_totals[sorted_holes[hole_ends]] = cumulative[hole_ends]
+
+    remaining = np.empty_like(costs)
+    remaining[order] = hole_totals[sorted_holes] - (cumulative - sorted_costs)
+    return remaining
+
+
+def _reduce_levels_numpy(columns):
+    aggregates = {level_name: {} for level_name, _ in FALLBACK_LEVELS}
+    if not columns["size"]:
+        return aggregates
+
+    remaining = _remaining_strokes_numpy(columns).astype(np.float64)
+    weights = np.asarray(columns["weight"], dtype=np.float64)
+    weighted_remaining = remaining * weights
+    field_codes = {
+        field: np.asarray(columns["codes"][field], dtype=np.int64) for field in STATE_FIELDS
+    }
+    cardinality = {field: max(len(columns["values"][field]), 1) for field in STATE_FIELDS}
+
+    for level_name, fields in FALLBACK_LEVELS:
+        composite = np.zeros(columns["size"], dtype=np.int64)
+        for field in fields:
+            composite = composite * cardinality[field] + field_codes[field]
+        keys, inverse = np.unique(composite, return_inverse=True)
+        counts = np.bincount(inverse, minlength=len(keys))
+        weighted_totals = np.bincount(inverse, weights=weighted_remaining, minlength=len(keys))
+        weighted_counts = np.bincount(inverse, weights=weights, minlength=len(keys))
+
+        buckets = {}
+        for position, key in enumerate(keys.tolist()):
+            key_codes = []
+            for field in reversed(fields):
+                key, code = divmod(key, cardinality[field])
+                key_codes.append(code)
+            buckets[tuple(reversed(key_codes))] = (
+                float(weighted_totals[position]),
+                int(counts[position]),
+                float(weighted_counts[position]),
+            )
+        aggregates[level_name] = buckets
+    return aggregates
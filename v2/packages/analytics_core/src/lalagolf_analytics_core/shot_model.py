@@ -1,4 +1,6 @@
+from array import array
 from collections import defaultdict
+from math import nan as NAN
 
 
 DISTANCE_BANDS = [
@@ -20,6 +22,175 @@ LIE_MAP = {
 }
 
 
+SHOT_FACT_FIELDS = (
+    "round_id",
+    "hole_num",
+    "shot_num",
+    "par_type",
+    "club",
+    "club_group",
+    "start_state",
+    "end_state",
+    "distance",
+    "distance_bucket",
+    "is_tee_shot",
+    "is_putt",
+    "is_recovery",
+    "shot_category",
+    "penalty_strokes",
+    "score_cost",
+    "feel",
+    "result",
+    "expected_before",
+    "expected_after",
+    "shot_value",
+)
+
+# Added by annotate_expected_scores* / build_shot_values*, in the order they appear.
+SHOT_FACT_ANNOTATION_FIELDS = (
+    "expected_lookup_level",
+    "expected_sample_count",
+    "expected_source_scope",
+    "expected_confidence",
+    "shot_cost",
+)
+
+# Columns that always hold numbers are typed arrays; a missing float is stored as NaN.
+SHOT_FACT_TYPECODES = {
+    "shot_num": "l",
+    "is_tee_shot": "b",
+    "is_putt": "b",
+    "is_recovery": "b",
+    "penalty_strokes": "l",
+    "expected_before": "d",
+    "expected_after": "d",
+    "shot_value": "d",
+    "expected_sample_count": "l",
+}
+
+
+class ShotFactBatch:
+    """Shot facts stored column by column instead of as one dict per shot.
+
+    ``annotate_expected_scores*`` and ``build_shot_values*`` fill the expected and
+    value columns of a batch in place. Rows keep their insertion order; ``fact()``
+    and ``to_dicts()`` rebuild the dict rows the list-based pipeline produces.
+    """
+
+    __slots__ = ("_columns", "_length")
+
+    def __init__(self):
+        self._columns = {field: _empty_column(field) for field in SHOT_FACT_FIELDS}
+        self._length = 0
+
+    @classmethod
+    def from_facts(cls, shot_facts):
+        batch = cls()
+        shot_facts = list(shot_facts)
+        for field in SHOT_FACT_ANNOTATION_FIELDS:
+            if any(field in fact for fact in shot_facts):
+                batch._columns[field] = _empty_column(field)
+        fields = tuple(batch._columns)
+        for fact in shot_facts:
+            batch._append_values(fields, [fact.get(field) for field in fields])
+        return batch
+
+    def __len__(self):
+        return self._length
+
+    @property
+    def fields(self):
+        return tuple(self._columns)
+
+    def append_row(self, row):
+        """Append one row given in ``SHOT_FACT_FIELDS`` order."""
+        if len(self._columns) != len(SHOT_FACT_FIELDS):
+            raise ValueError("append_row() needs a batch without annotation columns")
+        self._append_values(SHOT_FACT_FIELDS, row)
+
+    def column(self, field):
+        """Return the stored column for ``field``; floats are NaN where missing."""
+        return self._columns[field]
+
+    def values(self, field):
+        """Return ``field`` as a list with the dict-row types (bools, ``None``)."""
+        column = self._columns[field]
+        typecode = SHOT_FACT_TYPECODES.get(field)
+        if typecode == "d":
+            return [None if value != value else value for value in column]
+        if typecode == "b":
+            return [bool(value) for value in column]
+        return list(column)
+
+    def fill_column(self, field, values):
+        """Overwrite (or add) ``field`` with one value per row."""
+        if len(values) != self._length:
+            raise ValueError(f"{field} needs {self._length} values, got {len(values)}")
+        column = self._columns.get(field)
+        if column is None:
+            column = self._columns[field] = _empty_column(field)
+        column[:] = _encode_column(field, values)
+
+    def fact(self, index):
+        return {
+            field: _decode_value(field, column[index])
+            for field, column in self._columns.items()
+        }
+
+    def to_dicts(self):
+        fields = tuple(self._columns)
+        columns = [self.values(field) for field in fields]
+        return [dict(zip(fields, row)) for row in zip(*columns)]
+
+    def hole_groups(self):
+        """Row indexes per (round_id, hole_num), each ordered by shot number."""
+        grouped = defaultdict(list)
+        for index, key in enumerate(zip(self._columns["round_id"], self._columns["hole_num"])):
+            grouped[key].append(index)
+        shot_nums = self._columns["shot_num"]
+        for indexes in grouped.values():
+            indexes.sort(key=shot_nums.__getitem__)
+        return list(grouped.values())
+
+    def _append_values(self, fields, values):
+        columns = self._columns
+        for field, value in zip(fields, values):
+            columns[field].append(_encode_value(field, value))
+        self._length += 1
+
+
+def _empty_column(field):
+    typecode = SHOT_FACT_TYPECODES.get(field)
+    return array(typecode) if typecode else []
+
+
+def _encode_value(field, value):
+    typecode = SHOT_FACT_TYPECODES.get(field)
+    if typecode == "d":
+        return NAN if value is None else value
+    if typecode == "b":
+        return bool(value)
+    if typecode == "l":
+        return value or 0
+    return value
+
+
+def _decode_value(field, value):
+    typecode = SHOT_FACT_TYPECODES.get(field)
+    if typecode == "d":
+        return None if value != value else value
+    if typecode == "b":
+        return bool(value)
+    return value
+
+
+def _encode_column(field, values):
+    typecode = SHOT_FACT_TYPECODES.get(field)
+    if typecode is None:
+        return list(values)
+    return array(typecode, [_encode_value(field, value) for value in values])
+
+
 def classify_club_group(club):
     if club == "D":
         return "D"
@@ -81,7 +252,7 @@ def _group_shots_by_hole(shots):
     return grouped
 
 
-def normalize_shot_states(round_info, holes, shots):
+def _iter_shot_state_rows(round_info, holes, shots):
     hole_map = {}
     for hole in holes:
         hole_num = hole.get("hole_num", hole.get("holenum"))
@@ -90,7 +261,7 @@ def normalize_shot_states(round_info, holes, shots):
         hole_map[hole_num] = hole
 
     grouped_shots = _group_shots_by_hole(shots)
-    shot_facts = []
+    round_id = round_info.get("id")
 
     for holenum in sorted(grouped_shots.keys()):
         hole = hole_map.get(holenum, {})
@@ -100,32 +271,44 @@ def normalize_shot_states(round_info, holes, shots):
             start_state = normalize_lie_state(shot.get("on"))
             end_state = normalize_lie_state(shot.get("retplace"))
             distance = shot.get("distance")
-            fact = {
-                "round_id": round_info.get("id"),
-                "hole_num": holenum,
-                "shot_num": idx,
-                "par_type": par,
-                "club": shot.get("club"),
-                "club_group": classify_club_group(shot.get("club")),
-                "start_state": start_state,
-                "end_state": end_state,
-                "distance": distance,
-                "distance_bucket": classify_distance_bucket(distance),
-                "is_tee_shot": idx == 1,
-                "is_putt": shot.get("club") == "P",
-                "is_recovery": start_state == "recovery" or bool(shot.get("penalty")),
-                "shot_category": categorize_shot(shot),
-                "penalty_strokes": 2 if shot.get("penalty") == "OB" else 1 if shot.get("penalty") in {"H", "UN"} else 0,
-                "score_cost": shot.get("score", 1),
-                "feel": shot.get("feel"),
-                "result": shot.get("result"),
-                "expected_before": None,
-                "expected_after": None,
-                "shot_value": None,
-            }
-            shot_facts.append(fact)
-
-    return shot_facts
+            # Same order as SHOT_FACT_FIELDS.
+            yield (
+                round_id,
+                holenum,
+                idx,
+                par,
+                shot.get("club"),
+                classify_club_group(shot.get("club")),
+                start_state,
+                end_state,
+                distance,
+                classify_distance_bucket(distance),
+                idx == 1,
+                shot.get("club") == "P",
+                start_state == "recovery" or bool(shot.get("penalty")),
+                categorize_shot(shot),
+                2 if shot.get("penalty") == "OB" else 1 if shot.get("penalty") in {"H", "UN"} else 0,
+                shot.get("score", 1),
+                shot.get("feel"),
+                shot.get("result"),
+                None,
+                None,
+                None,
+            )
+
+
+def normalize_shot_states(round_info, holes, shots):
+    return [
+        dict(zip(SHOT_FACT_FIELDS, row))
+        for row in _iter_shot_state_rows(round_info, holes, shots)
+    ]
+
+
+def normalize_shot_state_batch(round_info, holes, shots):
+    batch = ShotFactBatch()
+    for row in _iter_shot_state_rows(round_info, holes, shots):
+        batch.append_row(row)
+    return batch
 
 
 def build_shot_state_summary(shot_facts):
@@ -5,7 +5,7 @@ from lalagolf_analytics_core.expected_value import (
     annotate_expected_scores,
     annotate_expected_scores_with_fallback,
 )
-from lalagolf_analytics_core.shot_model import normalize_shot_states
+from lalagolf_analytics_core.shot_model import ShotFactBatch, normalize_shot_states
 
 
 CATEGORY_ORDER = [
@@ -80,6 +80,8 @@ def build_shot_values(shot_facts, expected_table, min_samples=1, min_samples_by_
         min_samples=min_samples,
         min_samples_by_level=min_samples_by_level,
     )
+    if isinstance(annotated_facts, ShotFactBatch):
+        return _value_batch(annotated_facts)
     enriched_facts = []
 
     for fact in annotated_facts:
@@ -110,6 +112,8 @@ def build_shot_values_with_fallback(
         min_samples_by_level=min_samples_by_level,
         scope_order=scope_order,
     )
+    if isinstance(annotated_facts, ShotFactBatch):
+        return _value_batch(annotated_facts)
     enriched_facts = []
 
     for fact in annotated_facts:
@@ -126,6 +130,27 @@ def build_shot_values_with_fallback(
     return enriched_facts
 
 
+def _value_batch(batch):
+    shot_costs = [
+        (score_cost or 0) + (penalty_strokes or 0)
+        for score_cost, penalty_strokes in zip(
+            batch.column("score_cost"),
+            batch.column("penalty_strokes"),
+        )
+    ]
+    shot_values = [
+        None if expected_before is None else expected_before - (shot_cost + (expected_after or 0))
+        for expected_before, expected_after, shot_cost in zip(
+            batch.values("expected_before"),
+            batch.values("expected_after"),
+            shot_costs,
+        )
+    ]
+    batch.fill_column("shot_cost", shot_costs)
+    batch.fill_column("shot_value", shot_values)
+    return batch
+
+
 def _summarize_group(values):
     count = len(values)
     total = sum(values)
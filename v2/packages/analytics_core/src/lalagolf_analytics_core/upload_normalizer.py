@@ -102,7 +102,11 @@ def build_upload_warnings(
                 )
             )
 
-    line_paths = _line_paths_for_unparsed(raw_content, parsed_data.get("unparsed_lines", []))
+    line_paths = _line_paths_for_unparsed(
+        raw_content,
+        parsed_data.get("unparsed_lines", []),
+        parsed_data.get("unparsed_positions"),
+    )
     for unparsed_index, original_line in enumerate(parsed_data.get("unparsed_lines", [])):
         warnings.append(
             _warning(
@@ -202,7 +206,17 @@ def _warning(
     return warning
 
 
-def _line_paths_for_unparsed(raw_content: str, unparsed_lines: list[str]) -> dict[int, str]:
+def _line_paths_for_unparsed(
+    raw_content: str,
+    unparsed_lines: list[str],
+    unparsed_positions: list[dict[str, int]] | None = None,
+) -> dict[int, str]:
+    if unparsed_positions is not None and len(unparsed_positions) == len(unparsed_lines):
+        return {
+            unparsed_index: f"raw_lines[{position['line']}]"
+            for unparsed_index, position in enumerate(unparsed_positions)
+        }
+
     line_paths = {}
     raw_lines = [line.strip() for line in raw_content.splitlines()]
     cursor = 0
@@ -0,0 +1,42 @@
+from lalagolf_analytics_core.upload_normalizer import normalize_upload_content
+from run_benchmarks import compare_to_baseline, run_benchmarks
+from synthetic_rounds import generate_user_history
+
+
+def test_generate_user_history_produces_clean_rounds():
+    texts = generate_user_history(rounds=3, holes=9, shots_per_hole=4, seed=7)
+
+    assert len(texts) == 3
+    assert texts == generate_user_history(rounds=3, holes=9, shots_per_hole=4, seed=7)
+    play_dates = []
+    for text in texts:
+        upload = normalize_upload_content(text)
+        parsed_round = upload["parsed_round"]
+        assert upload["warnings"] == []
+        assert parsed_round["hole_count"] == 9
+        assert {len(hole["shots"]) for hole in parsed_round["holes"]} == {4}
+        play_dates.append(parsed_round["play_date"])
+    assert play_dates == sorted(play_dates)
+
+
+def test_run_benchmarks_times_every_path_and_compares_to_baseline():
+    report = run_benchmarks(rounds=4, holes=18, shots_per_hole=None, repeat=1, seed=1)
+
+    assert list(report["results"]) == [
+        "parse_content",
+        "normalize_upload_content",
+        "normalize_shot_states",
+        "build_expected_score_table",
+        "build_expected_score_table_columnar",
+        "build_shot_values_with_fallback",
+        "build_recent_summary",
+        "build_recommendations",
+    ]
+    assert report["results"]["parse_content"]["items"] == 4
+    assert report["results"]["build_expected_score_table"]["items"] == report["shot_count"]
+
+    baseline = {"results": {"parse_content": {"median_ms": report["results"]["parse_content"]["median_ms"] / 2}}}
+    ratios = compare_to_baseline(report, baseline)
+
+    assert list(ratios) == ["parse_content"]
+    assert 1.9 < ratios["parse_content"] < 2.1
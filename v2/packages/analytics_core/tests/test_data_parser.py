@@ -1,6 +1,7 @@
+import io
 from pathlib import Path
 
-from lalagolf_analytics_core.data_parser import parse_content, parse_file
+from lalagolf_analytics_core.data_parser import parse_content, parse_file, parse_lines
 
 
 def test_parse_content_basic_round() -> None:
@@ -71,3 +72,35 @@ def test_parse_27_hole_fixture() -> None:
     assert parsed_data["unparsed_lines"] == []
     assert parsed_data["holes"][0]["hole_num"] == 1
     assert parsed_data["holes"][-1]["hole_num"] == 27
+
+
+def test_parse_lines_streams_file_objects_with_line_and_byte_positions() -> None:
+    raw_content = "\r\n".join(
+        [
+            "2024.07.13 10:00",
+            "라라 골프",
+            "Charlie",
+            "1P4",
+            "D B C",
+            "알 수 없음",
+            "",
+            "I5 A C 150 H",
+            "2P3",
+        ]
+    )
+    encoded = raw_content.encode("utf-8")
+
+    parsed_data, stats = parse_lines(io.BytesIO(encoded), "<stream>")
+
+    first_hole = parsed_data["holes"][0]
+    assert (first_hole["line"], first_hole["byte_offset"]) == (3, encoded.index(b"1P4"))
+    assert [(shot["line"], shot["byte_offset"]) for shot in first_hole["shots"]] == [
+        (4, encoded.index(b"D B C")),
+        (7, encoded.index(b"I5 A C")),
+    ]
+    assert parsed_data["golf_course"] == "라라 골프"
+    assert parsed_data["unparsed_lines"] == ["알 수 없음"]
+    assert parsed_data["unparsed_positions"] == [
+        {"line": 5, "byte_offset": encoded.index("알 수 없음".encode("utf-8"))}
+    ]
+    assert (parsed_data, stats) == parse_content(raw_content, "<stream>")[1:]
@@ -3,6 +3,7 @@ from lalagolf_analytics_core.expected_value import (
     annotate_expected_scores_with_fallback,
     build_round_recency_weights,
     build_expected_score_table,
+    compile_expected_score_lookup,
     lookup_expected_score,
     lookup_expected_score_with_fallback,
 )
@@ -352,3 +353,49 @@ def test_annotate_expected_scores_with_fallback_exposes_lookup_metadata():
     assert annotated[0]["expected_sample_count"] == 50
     assert annotated[0]["expected_source_scope"] == "global"
     assert annotated[0]["expected_confidence"] == "medium"
+
+
+def test_compiled_lookup_matches_per_shot_fallback_lookup():
+    shot_facts = _sample_shot_facts()
+    user_table = build_expected_score_table(shot_facts[:6])
+    global_table = build_expected_score_table(
+        shot_facts,
+        min_samples_by_level={
+            "full": 1,
+            "no_par": 1,
+            "no_distance": 1,
+            "start_category": 1,
+            "start_only": 1,
+        },
+    )
+    scoped_tables = [
+        {"scope_type": "user", "table": user_table},
+        {
+            "scope_type": "global",
+            "table": global_table,
+            "min_samples_by_level": {"full": 2, "start_only": 1},
+        },
+    ]
+    unseen_fact = {
+        "start_state": "fairway",
+        "distance_bucket": "80_120",
+        "par_type": 5,
+        "shot_category": "approach",
+    }
+
+    compiled = compile_expected_score_lookup(scoped_tables)
+
+    for fact in [*shot_facts, unseen_fact, {"start_state": "unknown"}]:
+        assert compiled.lookup(fact) == lookup_expected_score_with_fallback(fact, scoped_tables)
+
+
+def test_compiled_lookup_memoizes_resolved_states():
+    shot_facts = _sample_shot_facts()
+    table = build_expected_score_table(shot_facts)
+    compiled = compile_expected_score_lookup([{"scope_type": "user", "table": table}])
+
+    first = compiled.lookup(shot_facts[0])
+    second = compiled.lookup(dict(shot_facts[0], round_id=99, hole_num=7))
+
+    assert first is second
+    assert first["source_scope"] == "user"
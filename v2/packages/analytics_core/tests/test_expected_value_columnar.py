@@ -0,0 +1,125 @@
+import pytest
+
+from lalagolf_analytics_core import expected_value_columnar
+from lalagolf_analytics_core.expected_value import build_expected_score_table
+from lalagolf_analytics_core.expected_value_columnar import (
+    build_expected_score_table_columnar,
+    encode_state_columns,
+)
+from lalagolf_analytics_core.shot_model import normalize_shot_states
+from lalagolf_analytics_core.strokes_gained import build_shot_values
+from tests.test_expected_value import _sample_shot_facts
+
+
+def _penalty_round_facts():
+    holes = [{"holenum": 1, "par": 5}, {"holenum": 2, "par": 3}]
+    shots = [
+        {"holenum": 1, "club": "D", "on": "T", "retplace": "R", "distance": 230, "score": 1, "penalty": "OB", "feel": "C", "result": "C"},
+        {"holenum": 1, "club": "U4", "on": "R", "retplace": "F", "distance": 170, "score": 1, "penalty": None, "feel": "B", "result": "B"},
+        {"holenum": 1, "club": "52", "on": "F", "retplace": "G", "distance": 35, "score": 1, "penalty": None, "feel": "A", "result": "A"},
+        {"holenum": 1, "club": "P", "on": "G", "retplace": "H", "distance": 3, "score": 1, "penalty": None, "feel": "A", "result": "A"},
+        {"holenum": 2, "club": "I7", "on": "T", "retplace": "G", "distance": 140, "score": 1, "penalty": None, "feel": "B", "result": "A"},
+        {"holenum": 2, "club": "P", "on": "G", "retplace": "H", "distance": 6, "score": 2, "penalty": None, "feel": "A", "result": "B"},
+    ]
+    return normalize_shot_states({"id": 3}, holes, shots)
+
+
+def _assert_tables_match(actual, expected):
+    assert actual.keys() == expected.keys()
+    for level_name, level_table in expected.items():
+        assert actual[level_name].keys() == level_table.keys()
+        for key, stats in level_table.items():
+            assert actual[level_name][key]["sample_count"] == stats["sample_count"]
+            assert actual[level_name][key]["expected_strokes"] == pytest.approx(
+                stats["expected_strokes"]
+            )
+            assert actual[level_name][key]["weighted_sample_count"] == pytest.approx(
+                stats["weighted_sample_count"]
+            )
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+@pytest.mark.parametrize("round_weights", [None, {1: 0.9, 2: 1.0, 3: 0.81}])
+def test_columnar_table_matches_reference_builder(monkeypatch, use_numpy, round_weights):
+    if use_numpy and expected_value_columnar.np is None:
+        pytest.skip("numpy is not installed")
+    if not use_numpy:
+        monkeypatch.setattr(expected_value_columnar, "np", None)
+    shot_facts = _sample_shot_facts() + _penalty_round_facts()
+
+    for prune_low_sample in (True, False):
+        expected = build_expected_score_table(
+            shot_facts,
+            prune_low_sample=prune_low_sample,
+            round_weights=round_weights,
+        )
+        actual = build_expected_score_table_columnar(
+            shot_facts,
+            prune_low_sample=prune_low_sample,
+            round_weights=round_weights,
+        )
+
+        _assert_tables_match(actual, expected)
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_columnar_table_matches_reference_builder_without_shot_numbers(monkeypatch, use_numpy):
+    if use_numpy and expected_value_columnar.np is None:
+        pytest.skip("numpy is not installed")
+    if not use_numpy:
+        monkeypatch.setattr(expected_value_columnar, "np", None)
+    shot_facts = _penalty_round_facts()
+    # A one-shot hole whose shot number was never recorded.
+    shot_facts.append({**shot_facts[-1], "hole_num": 3, "shot_num": None})
+
+    expected = build_expected_score_table(shot_facts, prune_low_sample=False)
+    actual = build_expected_score_table_columnar(shot_facts, prune_low_sample=False)
+
+    _assert_tables_match(actual, expected)
+
+
+def test_reference_builder_delegates_to_columnar_engine_when_opted_in(monkeypatch):
+    shot_facts = _sample_shot_facts() + _penalty_round_facts()
+    calls = []
+    columnar_builder = expected_value_columnar.build_expected_score_table_columnar
+
+    def spy(*args, **kwargs):
+        calls.append(kwargs)
+        return columnar_builder(*args, **kwargs)
+
+    monkeypatch.setattr(expected_value_columnar, "build_expected_score_table_columnar", spy)
+
+    table = build_expected_score_table(shot_facts, prune_low_sample=False, columnar=True)
+
+    assert calls == [
+        {"min_samples_by_level": None, "prune_low_sample": False, "round_weights": None}
+    ]
+    _assert_tables_match(table, build_expected_score_table(shot_facts, prune_low_sample=False))
+
+
+def test_columnar_table_feeds_shot_values():
+    shot_facts = _sample_shot_facts()
+    table = build_expected_score_table_columnar(shot_facts)
+
+    values = build_shot_values(shot_facts, table, min_samples=1)
+
+    assert values[0]["expected_before"] == 3
+    assert values[0]["expected_lookup_level"] == "full"
+
+
+def test_encode_state_columns_shares_codes_per_value():
+    shot_facts = _sample_shot_facts()
+
+    columns = encode_state_columns(shot_facts)
+
+    assert columns["size"] == len(shot_facts)
+    tee_code = columns["values"]["start_state"].index("tee")
+    assert [code == tee_code for code in columns["codes"]["start_state"]] == [
+        fact["start_state"] == "tee" for fact in shot_facts
+    ]
+
+
+def test_columnar_table_handles_empty_history():
+    table = build_expected_score_table_columnar([])
+
+    assert table == build_expected_score_table([])
@@ -1,9 +1,11 @@
 from lalagolf_analytics_core.shot_model import (
+    ShotFactBatch,
     build_shot_state_summary,
     categorize_shot,
     classify_club_group,
     classify_distance_bucket,
     normalize_lie_state,
+    normalize_shot_state_batch,
     normalize_shot_states,
 )
 
@@ -73,6 +75,20 @@ def test_normalize_shot_states_creates_fact_rows():
     assert facts[5]["is_putt"] is True
 
 
+def test_normalize_shot_state_batch_matches_dict_rows():
+    round_info, holes, shots = _sample_inputs()
+    facts = normalize_shot_states(round_info, holes, shots)
+
+    batch = normalize_shot_state_batch(round_info, holes, shots)
+
+    assert len(batch) == 6
+    assert batch.to_dicts() == facts
+    assert batch.fact(3) == facts[3]
+    assert batch.fact(0)["is_tee_shot"] is True
+    assert batch.fact(0)["expected_before"] is None
+    assert ShotFactBatch.from_facts(facts).to_dicts() == facts
+
+
 def test_build_shot_state_summary():
     round_info, holes, shots = _sample_inputs()
 
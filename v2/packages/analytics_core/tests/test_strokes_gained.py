@@ -1,5 +1,5 @@
 from lalagolf_analytics_core.expected_value import build_expected_score_table
-from lalagolf_analytics_core.shot_model import normalize_shot_states
+from lalagolf_analytics_core.shot_model import normalize_shot_state_batch, normalize_shot_states
 from lalagolf_analytics_core.strokes_gained import (
     summarize_approach_strategy_comparison,
     build_historical_shot_facts,
@@ -168,6 +168,32 @@ def test_build_shot_values_with_fallback_preserves_lookup_metadata():
     assert valued_facts[0]["shot_value"] is not None
 
 
+def test_build_shot_values_fills_batch_in_place():
+    round_info = {"id": 2}
+    holes = [{"holenum": 1, "par": 4}, {"holenum": 2, "par": 3}]
+    current_shots = [
+        {"holenum": 1, "club": "D", "on": "T", "retplace": "R", "distance": 220, "score": 1, "penalty": "OB", "feel": "C", "result": "C"},
+        {"holenum": 1, "club": "52", "on": "R", "retplace": "G", "distance": 25, "score": 1, "penalty": None, "feel": "B", "result": "B"},
+        {"holenum": 1, "club": "P", "on": "G", "retplace": "H", "distance": 3, "score": 1, "penalty": None, "feel": "A", "result": "A"},
+        {"holenum": 2, "club": "I7", "on": "T", "retplace": "G", "distance": 140, "score": 1, "penalty": None, "feel": "A", "result": "A"},
+        {"holenum": 2, "club": "P", "on": "G", "retplace": "H", "distance": 5, "score": 1, "penalty": None, "feel": "A", "result": "A"},
+    ]
+    history_facts = build_historical_shot_facts(_sample_history_rows())
+    expected_table = build_expected_score_table(history_facts)
+    facts = normalize_shot_states(round_info, holes, current_shots)
+    batch = normalize_shot_state_batch(round_info, holes, current_shots)
+
+    valued = build_shot_values(batch, expected_table, min_samples=1)
+    fallback_batch = normalize_shot_state_batch(round_info, holes, current_shots)
+    scoped_tables = [{"scope_type": "user", "table": expected_table}]
+    fallback_valued = build_shot_values_with_fallback(fallback_batch, scoped_tables)
+
+    assert valued is batch
+    assert batch.to_dicts() == build_shot_values(facts, expected_table, min_samples=1)
+    assert fallback_valued is fallback_batch
+    assert fallback_batch.to_dicts() == build_shot_values_with_fallback(facts, scoped_tables)
+
+
 def test_summarize_shot_values():
     history_facts = build_historical_shot_facts(_sample_history_rows())
     expected_table = build_expected_score_table(history_facts)
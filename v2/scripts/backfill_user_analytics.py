@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+
+V2_ROOT = Path(__file__).resolve().parents[1]
+API_ROOT = V2_ROOT / "api"
+if str(API_ROOT) not in sys.path:
+    sys.path.insert(0, str(API_ROOT))
+
+from sqlalchemy import select  # noqa: E402
+
+from app.core.config import get_settings  # noqa: E402
+from app.db.session import SessionLocal  # noqa: E402
+from app.models import Round, User  # noqa: E402
+from app.services.analytics import recalculate_user_rounds  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Recalculate analytics for every round of each user in one batch per user."
+    )
+    parser.add_argument("--email", action="append", help="Only backfill these users.")
+    args = parser.parse_args()
+
+    settings = get_settings()
+    results = {}
+    with SessionLocal() as db:
+        query = (
+            select(User)
+            .where(User.id.in_(select(Round.user_id).where(Round.deleted_at.is_(None))))
+            .order_by(User.created_at.asc())
+        )
+        if args.email:
+            query = query.where(User.email.in_(args.email))
+        for user in db.scalars(query).all():
+            result = recalculate_user_rounds(
+                db,
+                owner=user,
+                incremental=settings.analysis_incremental_enabled,
+            )
+            results[user.email] = len(result["rounds"])
+    print(json.dumps({"recalculated_rounds": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
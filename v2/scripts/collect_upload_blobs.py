@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+
+V2_ROOT = Path(__file__).resolve().parents[1]
+API_ROOT = V2_ROOT / "api"
+if str(API_ROOT) not in sys.path:
+    sys.path.insert(0, str(API_ROOT))
+
+from app.core.config import get_settings  # noqa: E402
+from app.db.session import SessionLocal  # noqa: E402
+from app.services.upload_storage import collect_unreferenced_blobs  # noqa: E402
+
+
+def main() -> None:
+    settings = get_settings()
+    with SessionLocal() as db:
+        result = collect_unreferenced_blobs(
+            db,
+            Path(settings.upload_storage_dir),
+            grace_seconds=settings.upload_blob_gc_grace_seconds,
+        )
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
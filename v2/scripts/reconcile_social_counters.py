@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+
+V2_ROOT = Path(__file__).resolve().parents[1]
+API_ROOT = V2_ROOT / "api"
+if str(API_ROOT) not in sys.path:
+    sys.path.insert(0, str(API_ROOT))
+
+from app.db.session import SessionLocal  # noqa: E402
+from app.services.social import reconcile_round_counters  # noqa: E402
+
+
+def main() -> None:
+    with SessionLocal() as db:
+        result = reconcile_round_counters(db)
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
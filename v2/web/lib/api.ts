@@ -331,6 +331,7 @@ export type DashboardSummary = {
     next_action?: string;
     confidence?: string;
   }>;
+  stale: boolean;
 };
 
 export type InsightUnit = {
@@ -2,6 +2,7 @@ import logging
 import os
 import signal
 import time
+from collections.abc import Callable
 
 from redis import Redis
 from rq import Worker
@@ -30,6 +31,7 @@ def run() -> None:
     poll_interval = int(os.getenv("WORKER_POLL_INTERVAL_SECONDS", "5"))
     run_once = os.getenv("WORKER_RUN_ONCE", "").lower() in {"1", "true", "yes"}
     use_rq = os.getenv("WORKER_USE_RQ", "").lower() in {"1", "true", "yes"}
+    use_pool = os.getenv("WORKER_USE_POOL", "").lower() in {"1", "true", "yes"}
     running = True
 
     def stop(_signum: int, _frame: object) -> None:
@@ -49,6 +51,11 @@ def run() -> None:
         create_worker().work()
         return
 
+    if use_pool:
+        _run_recompute_pool(lambda: running, poll_interval=poll_interval)
+        logger.info("worker stopped", extra={"job_id": None})
+        return
+
     while running:
         time.sleep(poll_interval)
     logger.info("worker stopped", extra={"job_id": None})
@@ -64,5 +71,25 @@ def _enqueue_pending_analysis_jobs() -> None:
         logger.info("queued pending analysis jobs", extra={"job_id": None, "count": count})
 
 
+def _run_recompute_pool(is_running: Callable[[], bool], *, poll_interval: int) -> None:
+    try:
+        from app.core.config import get_settings
+        from app.services.recompute_scheduler import (
+            create_recompute_executor,
+            run_pending_analysis_jobs,
+        )
+    except ImportError:
+        return
+    settings = get_settings()
+    with create_recompute_executor(settings) as executor:
+        logger.info("recompute pool started", extra={"job_id": None})
+        while is_running():
+            count = run_pending_analysis_jobs(settings, executor=executor)
+            if count:
+                logger.info("ran analysis jobs", extra={"job_id": None, "count": count})
+            else:
+                time.sleep(poll_interval)
+
+
 if __name__ == "__main__":
     run()